@@ -14,7 +14,8 @@ import json
 import random
 from pathlib import Path
 from typing import Dict, List
-from engine.bidding_engine_v2 import BiddingEngineV2
+from engine.v2 import BiddingEngineV2Schema
+from engine.ai.feature_cache import get_feature_cache_stats, set_feature_monitor
 from engine.hand import Hand, Card
 from engine.performance_monitor import PerformanceMonitor
 
@@ -23,8 +24,9 @@ class BiddingBenchmark:
     
     def __init__(self, num_hands: int = 100):
         self.num_hands = num_hands
-        self.engine = BiddingEngineV2()
+        self.engine = BiddingEngineV2Schema()
         self.monitor = PerformanceMonitor()
+        set_feature_monitor(self.monitor)  # Feature layer compute/saved timings
         
     def generate_random_hand(self) -> Hand:
         """Generate a random 13-card bridge hand"""
@@ -122,7 +124,8 @@ class BiddingBenchmark:
                 'min_ms': round(hand_proc_stats.get('min', 0), 3),
                 'max_ms': round(hand_proc_stats.get('max', 0), 3),
                 'count': hand_proc_stats.get('count', 0)
-            }
+            },
+            'feature_cache': get_feature_cache_stats()
         }
         
         # Print results
@@ -140,6 +143,10 @@ class BiddingBenchmark:
         print(f"  Average: {results['bid_generation']['avg_ms']:.3f}ms")
         print(f"  Min: {results['bid_generation']['min_ms']:.3f}ms")
         print(f"  Max: {results['bid_generation']['max_ms']:.3f}ms")
+        print(f"\nFeature Layer Cache:")
+        for layer, layer_stats in results['feature_cache'].items():
+            print(f"  {layer}: {layer_stats['hit_rate']:.1%} hits, "
+                  f"{layer_stats['saved_ms']:.1f}ms saved")
         
         return results
     
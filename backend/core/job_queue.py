@@ -0,0 +1,387 @@
+"""
+Durable job queue for background analysis (post-game hands, tournaments).
+
+Jobs live in the analysis_jobs table (migration 022), so they survive a
+restart of the web process. The web process only enqueues; jobs are run by
+a separate pool of worker processes (core/job_worker.py):
+
+    python -m core.job_worker --concurrency 2
+
+Lifecycle: queued -> running -> done | failed. A worker claims a job with
+SELECT ... FOR UPDATE SKIP LOCKED, so any number of workers can share the
+table. A failed attempt goes back to queued with an exponential backoff
+until max_attempts is reached. Running jobs are heartbeated; a job whose
+worker died (no heartbeat for the lease time) is claimed again.
+
+Dedupe: at most one queued/running job exists per (kind, dedupe_key);
+enqueueing a duplicate returns the id of the active job.
+
+Worker liveness: pool workers upsert a row in job_workers (migration 023)
+every WORKER_BEAT_SECONDS. has_live_worker() tells the web process whether
+anyone will pick a job up; without one it runs the job itself (see
+core.job_worker.run_in_process_if_no_worker).
+
+Usage:
+    from core.job_queue import get_job_queue
+
+    job_id = get_job_queue().enqueue('post_game_analysis', payload,
+                                     dedupe_key=str(session_hand_id))
+
+Environment:
+    JOB_LEASE_SECONDS: heartbeat age after which a running job is reclaimed (default 120)
+    JOB_MAX_ATTEMPTS: default attempts per job (default 3)
+    JOB_WORKER_STALE_SECONDS: worker heartbeat age after which the worker counts as gone (default 45)
+"""
+
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional
+
+
+DEFAULT_LEASE_SECONDS = int(os.environ.get('JOB_LEASE_SECONDS', '120'))
+DEFAULT_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', '3'))
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 900
+WORKER_BEAT_SECONDS = 15
+WORKER_STALE_SECONDS = int(os.environ.get('JOB_WORKER_STALE_SECONDS', '45'))
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+def retry_delay(attempts: int) -> int:
+    """Seconds to wait before retrying a job that has failed `attempts` times."""
+    return min(RETRY_BASE_SECONDS * 2 ** max(attempts - 1, 0), RETRY_MAX_SECONDS)
+
+
+@dataclass
+class Job:
+    """A claimed job. `attempts` counts this attempt and fences later updates."""
+    id: int
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 1
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    dedupe_key: Optional[str] = None
+    wait_seconds: float = 0.0
+
+    @property
+    def is_last_attempt(self) -> bool:
+        return self.attempts >= self.max_attempts
+
+
+# ----------------------------------------------------------------------
+# Handler registry
+# ----------------------------------------------------------------------
+
+# kind -> handler(payload, progress); progress(done, total=None) reports progress
+_handlers: Dict[str, Callable] = {}
+
+
+def register_job_handler(kind: str, handler: Callable):
+    """Register the function a worker runs for jobs of this kind."""
+    _handlers[kind] = handler
+
+
+def get_job_handlers() -> Dict[str, Callable]:
+    """All registered handlers (kind -> function)."""
+    return dict(_handlers)
+
+
+# ----------------------------------------------------------------------
+# Queue
+# ----------------------------------------------------------------------
+
+class JobQueue:
+    """SQL operations on the analysis_jobs table."""
+
+    def _connection(self):
+        # Imported lazily: db refuses to import without DATABASE_URL
+        from db import get_connection
+        return get_connection()
+
+    # Producer side ----------------------------------------------------
+
+    def enqueue(self, kind: str, payload: Dict[str, Any],
+                dedupe_key: Optional[str] = None, priority: int = 0,
+                max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+                delay: float = 0) -> Optional[int]:
+        """
+        Add a job to the queue.
+
+        Returns:
+            The new job id, or the id of the queued/running job with the same
+            (kind, dedupe_key) if there already is one
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO analysis_jobs
+                    (kind, dedupe_key, payload, priority, max_attempts, run_after)
+                VALUES (?, ?, ?, ?, ?, NOW() + ? * INTERVAL '1 second')
+                ON CONFLICT (kind, dedupe_key) WHERE status IN ('queued', 'running')
+                DO NOTHING
+                RETURNING id
+            """, (kind, dedupe_key, json.dumps(payload), priority, max_attempts, delay))
+            if cursor.lastrowid is not None or dedupe_key is None:
+                return cursor.lastrowid
+
+            cursor.execute("""
+                SELECT id FROM analysis_jobs
+                WHERE kind = ? AND dedupe_key = ? AND status IN ('queued', 'running')
+                ORDER BY id DESC LIMIT 1
+            """, (kind, dedupe_key))
+            row = cursor.fetchone()
+            return row['id'] if row else None
+
+    def get_latest(self, kind: str, dedupe_key: str) -> Optional[Dict[str, Any]]:
+        """Status and progress of the most recent job for (kind, dedupe_key)."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT id, status, attempts, max_attempts, progress_done,
+                       progress_total, last_error, enqueued_at, started_at,
+                       finished_at
+                FROM analysis_jobs
+                WHERE kind = ? AND dedupe_key = ?
+                ORDER BY id DESC LIMIT 1
+            """, (kind, dedupe_key))
+            row = cursor.fetchone()
+        if not row:
+            return None
+        job = dict(row)
+        for key in ('enqueued_at', 'started_at', 'finished_at'):
+            if job[key] is not None:
+                job[key] = job[key].isoformat()
+        return job
+
+    # Worker side ------------------------------------------------------
+
+    def claim(self, worker_id: str, kinds: Optional[Iterable[str]] = None,
+              lease: float = DEFAULT_LEASE_SECONDS) -> Optional[Job]:
+        """
+        Take the next runnable job: queued and due, or running with an expired
+        lease (its worker died). Returns None when there is nothing to do.
+        """
+        kind_filter = ''
+        params = [worker_id, lease]
+        if kinds:
+            kinds = list(kinds)
+            kind_filter = 'AND kind IN (' + ', '.join('?' * len(kinds)) + ')'
+            params.extend(kinds)
+
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                UPDATE analysis_jobs SET
+                    status = 'running',
+                    attempts = attempts + 1,
+                    worker_id = ?,
+                    started_at = NOW(),
+                    heartbeat_at = NOW()
+                WHERE id = (
+                    SELECT id FROM analysis_jobs
+                    WHERE ((status = 'queued' AND run_after <= NOW())
+                           OR (status = 'running' AND attempts < max_attempts
+                               AND heartbeat_at < NOW() - ? * INTERVAL '1 second'))
+                      {kind_filter}
+                    ORDER BY priority DESC, id
+                    LIMIT 1
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING id, kind, dedupe_key, payload, attempts, max_attempts,
+                          EXTRACT(EPOCH FROM (NOW() - enqueued_at)) AS wait_seconds
+            """, params)
+            row = cursor.fetchone()
+
+        if not row:
+            return None
+        return Job(
+            id=row['id'],
+            kind=row['kind'],
+            payload=json.loads(row['payload'] or '{}'),
+            attempts=row['attempts'],
+            max_attempts=row['max_attempts'],
+            dedupe_key=row['dedupe_key'],
+            wait_seconds=float(row['wait_seconds'] or 0),
+        )
+
+    def heartbeat(self, job: Job, done: Optional[int] = None,
+                  total: Optional[int] = None) -> bool:
+        """
+        Extend the job's lease and optionally record progress.
+
+        Returns:
+            False if the job is no longer ours (it was reclaimed after a lapse)
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE analysis_jobs SET
+                    heartbeat_at = NOW(),
+                    progress_done = COALESCE(?, progress_done),
+                    progress_total = COALESCE(?, progress_total)
+                WHERE id = ? AND attempts = ? AND status = 'running'
+            """, (done, total, job.id, job.attempts))
+            return cursor.rowcount > 0
+
+    def complete(self, job: Job) -> bool:
+        """Mark a claimed job done."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE analysis_jobs SET
+                    status = 'done',
+                    finished_at = NOW(),
+                    heartbeat_at = NOW()
+                WHERE id = ? AND attempts = ? AND status = 'running'
+            """, (job.id, job.attempts))
+            return cursor.rowcount > 0
+
+    def fail(self, job: Job, error: str, retry: bool = True) -> str:
+        """
+        Record a failed attempt.
+
+        Returns:
+            'queued' if the job will be retried, otherwise 'failed'
+        """
+        status = 'queued' if retry and not job.is_last_attempt else 'failed'
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE analysis_jobs SET
+                    status = ?,
+                    last_error = ?,
+                    run_after = NOW() + ? * INTERVAL '1 second',
+                    finished_at = CASE WHEN ? = 'failed' THEN NOW() ELSE NULL END
+                WHERE id = ? AND attempts = ? AND status = 'running'
+            """, (status, error[:2000], retry_delay(job.attempts), status,
+                  job.id, job.attempts))
+        return status
+
+    def fail_abandoned(self, lease: float = DEFAULT_LEASE_SECONDS) -> int:
+        """Fail running jobs whose worker died on their last attempt."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE analysis_jobs SET
+                    status = 'failed',
+                    last_error = COALESCE(last_error, 'Worker stopped responding'),
+                    finished_at = NOW()
+                WHERE status = 'running' AND attempts >= max_attempts
+                  AND heartbeat_at < NOW() - ? * INTERVAL '1 second'
+            """, (lease,))
+            return cursor.rowcount
+
+    # Worker liveness --------------------------------------------------
+
+    def worker_heartbeat(self, worker_id: str, kinds: Optional[Iterable[str]] = None):
+        """Record that a pool worker (for these kinds, or all) is alive."""
+        kinds_text = ','.join(kinds) if kinds else None
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                INSERT INTO job_workers (worker_id, kinds, beat_at)
+                VALUES (?, ?, NOW())
+                ON CONFLICT (worker_id) DO UPDATE SET
+                    kinds = EXCLUDED.kinds,
+                    beat_at = NOW()
+            """, (worker_id, kinds_text))
+
+    def remove_worker(self, worker_id: str):
+        """Forget a worker that is shutting down."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM job_workers WHERE worker_id = ?", (worker_id,))
+
+    def has_live_worker(self, kind: str, max_age: float = WORKER_STALE_SECONDS) -> bool:
+        """Whether a pool worker that runs this kind has beaten within max_age seconds."""
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT 1 FROM job_workers
+                WHERE beat_at > NOW() - ? * INTERVAL '1 second'
+                  AND (kinds IS NULL OR ? = ANY(string_to_array(kinds, ',')))
+                LIMIT 1
+            """, (max_age, kind))
+            return cursor.fetchone() is not None
+
+    # Monitoring -------------------------------------------------------
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Queue depth and latency for monitoring.
+
+        by_kind covers active jobs plus those finished in the last day;
+        last_hour latencies cover jobs finished in the last hour (wait is
+        enqueue to start of the final attempt).
+        """
+        with self._connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT kind, status, COUNT(*) AS count
+                FROM analysis_jobs
+                WHERE status IN ('queued', 'running')
+                   OR finished_at > NOW() - INTERVAL '1 day'
+                GROUP BY kind, status
+            """)
+            by_kind: Dict[str, Dict[str, int]] = {}
+            for row in cursor.fetchall():
+                by_kind.setdefault(row['kind'], {})[row['status']] = row['count']
+
+            cursor.execute("""
+                SELECT COUNT(*) AS due,
+                       EXTRACT(EPOCH FROM (NOW() - MIN(enqueued_at))) AS oldest
+                FROM analysis_jobs
+                WHERE status = 'queued' AND run_after <= NOW()
+            """)
+            backlog = cursor.fetchone()
+
+            cursor.execute("""
+                SELECT
+                    COUNT(*) FILTER (WHERE status = 'done') AS completed,
+                    COUNT(*) FILTER (WHERE status = 'failed') AS failed,
+                    AVG(EXTRACT(EPOCH FROM (started_at - enqueued_at))) AS avg_wait,
+                    PERCENTILE_CONT(0.95) WITHIN GROUP (
+                        ORDER BY EXTRACT(EPOCH FROM (started_at - enqueued_at))
+                    ) AS p95_wait,
+                    AVG(EXTRACT(EPOCH FROM (finished_at - started_at)))
+                        FILTER (WHERE status = 'done') AS avg_run
+                FROM analysis_jobs
+                WHERE status IN ('done', 'failed')
+                  AND finished_at > NOW() - INTERVAL '1 hour'
+            """)
+            recent = cursor.fetchone()
+
+        def seconds(value):
+            return round(float(value), 3) if value is not None else None
+
+        return {
+            'queued': sum(s.get('queued', 0) for s in by_kind.values()),
+            'running': sum(s.get('running', 0) for s in by_kind.values()),
+            'due': backlog['due'],
+            'oldest_due_seconds': seconds(backlog['oldest']),
+            'by_kind': by_kind,
+            'last_hour': {
+                'completed': recent['completed'],
+                'failed': recent['failed'],
+                'avg_wait_seconds': seconds(recent['avg_wait']),
+                'p95_wait_seconds': seconds(recent['p95_wait']),
+                'avg_run_seconds': seconds(recent['avg_run']),
+            },
+        }
+
+
+_queue = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """Get the process-wide job queue."""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = JobQueue()
+    return _queue
@@ -0,0 +1,334 @@
+"""
+Worker pool for the durable job queue (core/job_queue.py).
+
+Runs outside the web server so DDS-heavy analysis never competes with
+request handling, and a crash (endplay can segfault) only takes down one
+worker process:
+
+    python -m core.job_worker                    # ANALYSIS_WORKERS processes
+    python -m core.job_worker --concurrency 4    # at most 4 jobs at a time
+    python -m core.job_worker --kinds tournament_analysis
+    python -m core.job_worker --drain            # run until the queue is empty, then exit
+
+The supervisor starts `concurrency` worker processes and replaces any that
+die. Each worker claims one job at a time, heartbeats it while the handler
+runs, and records success or failure (failures are retried with backoff by
+the queue). SIGTERM/SIGINT let running jobs finish before exiting; a job cut
+short by a hard kill is reclaimed once its lease expires.
+
+Pool workers also heartbeat themselves (job_workers table). When no worker
+is alive - a deploy without the bridge-analysis-worker service, or the pool
+is down - the web process drains the queue in a background thread instead
+(run_in_process_if_no_worker), so jobs never wait on a pool that isn't there.
+
+Environment:
+    ANALYSIS_WORKERS: default number of worker processes (default 2)
+    JOB_POLL_SECONDS: idle wait between claims when the queue is empty (default 1)
+"""
+
+import argparse
+import importlib
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+import traceback
+from typing import Callable, Dict, Iterable, Optional
+
+from core.job_queue import (
+    DEFAULT_LEASE_SECONDS,
+    WORKER_BEAT_SECONDS,
+    Job,
+    JobQueue,
+    get_job_handlers,
+    get_job_queue,
+)
+
+# Modules that register job handlers when imported
+HANDLER_MODULES = (
+    'engine.analysis.analysis_jobs',
+)
+
+DEFAULT_WORKERS = int(os.environ.get('ANALYSIS_WORKERS', '2'))
+DEFAULT_POLL_SECONDS = float(os.environ.get('JOB_POLL_SECONDS', '1'))
+ABANDONED_CHECK_SECONDS = 60
+
+
+def load_handlers() -> Dict[str, Callable]:
+    """Import the handler modules and return the registered handlers."""
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+    return get_job_handlers()
+
+
+class _Heartbeat:
+    """Keeps a running job's lease alive and carries its progress updates."""
+
+    def __init__(self, queue: JobQueue, job: Job, interval: float):
+        self._queue = queue
+        self._job = job
+        self._interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f'job-{job.id}-heartbeat',
+                                        daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join(self._interval)
+
+    def progress(self, done: int, total: Optional[int] = None):
+        self._beat(done, total)
+
+    def _run(self):
+        while not self._stop.wait(self._interval):
+            self._beat()
+
+    def _beat(self, done=None, total=None):
+        try:
+            self._queue.heartbeat(self._job, done, total)
+        except Exception as e:
+            # A missed beat only matters if it outlasts the lease
+            print(f"⚠️  Job {self._job.id} heartbeat failed: {e}")
+
+
+class JobWorker:
+    """Claims and runs jobs one at a time."""
+
+    def __init__(self, queue: JobQueue, handlers: Dict[str, Callable],
+                 worker_id: Optional[str] = None, kinds: Optional[Iterable[str]] = None,
+                 lease: float = DEFAULT_LEASE_SECONDS,
+                 poll_interval: float = DEFAULT_POLL_SECONDS):
+        self.queue = queue
+        self.handlers = handlers
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.kinds = list(kinds) if kinds else None
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.stats = {'completed': 0, 'retried': 0, 'failed': 0}
+
+    def run_once(self) -> bool:
+        """
+        Run the next job, if any.
+
+        Returns:
+            True if a job was claimed (whatever its outcome)
+        """
+        job = self.queue.claim(self.worker_id, self.kinds, self.lease)
+        if job is None:
+            return False
+
+        handler = self.handlers.get(job.kind)
+        if handler is None:
+            self.queue.fail(job, f"No handler registered for job kind '{job.kind}'", retry=False)
+            self.stats['failed'] += 1
+            return True
+
+        started = time.monotonic()
+        try:
+            with _Heartbeat(self.queue, job, max(self.lease / 4, 1)) as heartbeat:
+                handler(job.payload, heartbeat.progress)
+        except Exception as e:
+            status = self.queue.fail(job, f"{type(e).__name__}: {e}")
+            self.stats['retried' if status == 'queued' else 'failed'] += 1
+            print(f"⚠️  Job {job.id} ({job.kind}) attempt {job.attempts}/{job.max_attempts} "
+                  f"failed, {status}: {e}")
+            traceback.print_exc()
+            return True
+
+        self.queue.complete(job)
+        self.stats['completed'] += 1
+        print(f"✅ Job {job.id} ({job.kind}) done in {time.monotonic() - started:.1f}s "
+              f"(waited {job.wait_seconds:.1f}s)")
+        return True
+
+    def run(self, stop: threading.Event, drain: bool = False):
+        """
+        Run jobs until stop is set (or, with drain, until the queue is empty).
+
+        A long-running worker heartbeats itself so the web process knows the
+        pool is up; a draining one doesn't.
+        """
+        if drain:
+            self._run(stop, drain)
+            return
+
+        beat_stop = threading.Event()
+        beat = threading.Thread(target=self._beat_worker, args=(beat_stop,),
+                                name='job-worker-heartbeat', daemon=True)
+        beat.start()
+        try:
+            self._run(stop, drain)
+        finally:
+            beat_stop.set()
+            beat.join(WORKER_BEAT_SECONDS)
+            try:
+                self.queue.remove_worker(self.worker_id)
+            except Exception as e:
+                print(f"⚠️  Job worker deregistration failed: {e}")
+
+    def _beat_worker(self, stop: threading.Event):
+        while True:
+            try:
+                self.queue.worker_heartbeat(self.worker_id, self.kinds)
+            except Exception as e:
+                print(f"⚠️  Job worker heartbeat failed: {e}")
+            if stop.wait(WORKER_BEAT_SECONDS):
+                return
+
+    def _run(self, stop: threading.Event, drain: bool):
+        last_check = 0.0
+        while not stop.is_set():
+            if time.monotonic() - last_check > ABANDONED_CHECK_SECONDS:
+                last_check = time.monotonic()
+                try:
+                    self.queue.fail_abandoned(self.lease)
+                except Exception as e:
+                    print(f"⚠️  Abandoned job check failed: {e}")
+
+            try:
+                ran = self.run_once()
+            except Exception as e:
+                # Database unavailable etc.: back off and keep the worker alive
+                print(f"⚠️  Job worker error: {e}")
+                ran = False
+                if drain:
+                    raise
+            if not ran:
+                if drain:
+                    return
+                stop.wait(self.poll_interval)
+
+
+# kind -> True while an in-process drain thread runs (value: rerun requested)
+_inline_runs: Dict[str, bool] = {}
+_inline_lock = threading.Lock()
+
+
+def run_in_process_if_no_worker(kind: str, queue: Optional[JobQueue] = None) -> bool:
+    """
+    Drain queued jobs of this kind in a background thread of this process,
+    unless a pool worker for the kind is alive.
+
+    Call after the enqueue is committed. At most one drain thread runs per
+    kind; a call while it runs makes it check the queue once more before
+    exiting, so no job is left behind.
+
+    Returns:
+        True if the jobs run (or will run) in this process
+    """
+    queue = queue or get_job_queue()
+    try:
+        if queue.has_live_worker(kind):
+            return False
+    except Exception as e:
+        # Can't tell (e.g. migration 023 not applied yet): run it here
+        print(f"⚠️  Job worker check failed, running {kind} in-process: {e}")
+
+    with _inline_lock:
+        if kind in _inline_runs:
+            _inline_runs[kind] = True
+            return True
+        _inline_runs[kind] = False
+
+    worker = JobWorker(queue, load_handlers(), kinds=[kind],
+                       worker_id=f"{socket.gethostname()}:{os.getpid()}:inline")
+
+    def drain():
+        while True:
+            try:
+                worker.run(threading.Event(), drain=True)
+            except Exception as e:
+                print(f"⚠️  In-process {kind} jobs stopped: {e}")
+            with _inline_lock:
+                if not _inline_runs[kind]:
+                    del _inline_runs[kind]
+                    return
+                _inline_runs[kind] = False
+
+    threading.Thread(target=drain, name=f'inline-{kind}-jobs', daemon=True).start()
+    return True
+
+
+def _worker_process(kinds, lease, poll_interval):
+    """Entry point of one pool process."""
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+    worker = JobWorker(get_job_queue(), load_handlers(), kinds=kinds,
+                       lease=lease, poll_interval=poll_interval)
+    worker.run(stop)
+
+
+def run_pool(concurrency: int = DEFAULT_WORKERS, kinds: Optional[Iterable[str]] = None,
+             lease: float = DEFAULT_LEASE_SECONDS,
+             poll_interval: float = DEFAULT_POLL_SECONDS):
+    """Run `concurrency` worker processes until SIGTERM/SIGINT, replacing any that die."""
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    args = (list(kinds) if kinds else None, lease, poll_interval)
+    ctx = multiprocessing.get_context('spawn')  # No inherited DB connections or threads
+
+    def start():
+        process = ctx.Process(target=_worker_process, args=args, daemon=False)
+        process.start()
+        return process
+
+    processes = [start() for _ in range(concurrency)]
+    print(f"🔧 Job worker pool started: {concurrency} process(es), kinds={args[0] or 'all'}")
+
+    restarts = 0
+    while not stop.wait(1.0):
+        for slot, process in enumerate(processes):
+            if not process.is_alive():
+                restarts += 1
+                print(f"⚠️  Job worker {process.pid} exited ({process.exitcode}), "
+                      f"restarting (restart #{restarts})")
+                processes[slot] = start()
+
+    print("🛑 Stopping job workers (running jobs finish first)...")
+    for process in processes:
+        if process.is_alive():
+            process.terminate()  # SIGTERM: finish the current job, then exit
+    for process in processes:
+        process.join()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run background analysis jobs")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_WORKERS,
+                        help="Worker processes, i.e. max jobs running at once")
+    parser.add_argument('--kinds', help="Comma-separated job kinds to run (default: all)")
+    parser.add_argument('--lease', type=float, default=DEFAULT_LEASE_SECONDS,
+                        help="Seconds without a heartbeat before a job is reclaimed")
+    parser.add_argument('--poll', type=float, default=DEFAULT_POLL_SECONDS,
+                        help="Idle seconds between queue checks")
+    parser.add_argument('--drain', action='store_true',
+                        help="Run jobs in this process until the queue is empty, then exit")
+    args = parser.parse_args(argv)
+
+    kinds = [k.strip() for k in args.kinds.split(',')] if args.kinds else None
+
+    if args.drain:
+        worker = JobWorker(get_job_queue(), load_handlers(), kinds=kinds,
+                           lease=args.lease, poll_interval=args.poll)
+        worker.run(threading.Event(), drain=True)
+        print(f"✓ Queue drained: {worker.stats}")
+        return 0 if not worker.stats['failed'] else 1
+
+    run_pool(max(args.concurrency, 1), kinds, args.lease, args.poll)
+    return 0
+
+
+if __name__ == '__main__':
+    from dotenv import load_dotenv
+    load_dotenv()
+    sys.exit(main())
@@ -11,8 +11,12 @@ Room Architecture:
 - AI: Controls East and West positions
 
 Redis Key Schema:
-- room:{room_code}         -> JSON-serialized RoomState (TTL: 3600s)
-- session:{session_id}     -> room_code string (TTL: 3600s)
+- room:{room_code}           -> JSON-serialized RoomState (TTL: 3600s)
+- session:{session_id}       -> room_code string (TTL: 3600s)
+- room_heartbeat:{room_code} -> hash session_id -> last-seen ISO time (TTL: 3600s)
+
+Pub/Sub:
+- room_updates:{room_code}   <- new room version, published with every commit
 
 Usage:
     # Initialize at app startup
@@ -29,11 +33,12 @@ Usage:
 import json
 import os
 import random
+import time
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
 
 import redis
 import fakeredis
@@ -50,6 +55,23 @@ ROOM_TTL = 3600
 # Max OCC retries before raising conflict
 MAX_OCC_RETRIES = 3
 
+# Longest a poll may block waiting for a room change (seconds)
+LONG_POLL_MAX_WAIT = 25.0
+
+# Polls one worker process lets block at once. Each holds a gunicorn thread
+# for up to LONG_POLL_MAX_WAIT, so keep this below --threads (32 in deploy/)
+# to leave threads for game requests; further polls answer at once
+LONG_POLL_SLOTS = int(os.environ.get('ROOM_LONG_POLL_SLOTS', 24))
+
+# Push streams: idle tick (keepalive + heartbeat) and lifetime before the
+# client reconnects. A reconnecting stream still holds a thread for as long
+# as the client stays, so streams are only served when ROOM_STREAM_ENABLED=1:
+# set it where /api/room/stream runs on an async worker class (gevent) or in
+# a separate process, never on the gthread game workers
+STREAM_KEEPALIVE = 15.0
+STREAM_MAX_DURATION = 300.0
+ROOM_STREAM_ENABLED = os.environ.get('ROOM_STREAM_ENABLED', '0') == '1'
+
 
 @dataclass
 class RoomSettings:
@@ -536,8 +558,13 @@ class RoomStateManager:
     GET with automatic TTL refresh.
 
     Key schema:
-        room:{room_code}       -> JSON RoomState (TTL: 3600s)
-        session:{session_id}   -> room_code string (TTL: 3600s)
+        room:{room_code}           -> JSON RoomState (TTL: 3600s)
+        session:{session_id}       -> room_code string (TTL: 3600s)
+        room_heartbeat:{room_code} -> hash session_id -> ISO time (TTL: 3600s)
+
+    Every committed mutation publishes the new version on
+    room_updates:{room_code} so wait_for_change() can block until then.
+    Heartbeats live outside the room JSON so polling never rewrites it.
     """
 
     def __init__(self, redis_url: Optional[str] = None, redis_client=None):
@@ -579,16 +606,40 @@ class RoomStateManager:
     def _session_key(session_id: str) -> str:
         return f'session:{session_id}'
 
+    @staticmethod
+    def _heartbeat_key(room_code: str) -> str:
+        return f'room_heartbeat:{room_code.upper().strip()}'
+
+    @staticmethod
+    def _updates_channel(room_code: str) -> str:
+        return f'room_updates:{room_code.upper().strip()}'
+
     # =========================================================================
     # Low-level Redis operations
     # =========================================================================
 
     def _load_room(self, room_code: str) -> Optional[RoomState]:
-        """Load and deserialize a room from Redis"""
-        data = self._redis.get(self._room_key(room_code))
+        """Load and deserialize a room (with heartbeats) from Redis"""
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.get(self._room_key(room_code))
+        pipe.hgetall(self._heartbeat_key(room_code))
+        data, heartbeats = pipe.execute()
         if data is None:
             return None
-        return RoomState.from_storage_dict(json.loads(data))
+        room = RoomState.from_storage_dict(json.loads(data))
+        self._merge_heartbeats(room, heartbeats)
+        return room
+
+    @staticmethod
+    def _merge_heartbeats(room: RoomState, heartbeats: Dict[str, str]):
+        """Fold the heartbeat hash into room.last_seen (newest time wins)"""
+        for session_id, seen in heartbeats.items():
+            if seen > room.last_seen.get(session_id, ''):
+                room.last_seen[session_id] = seen
+
+    def _publish_update(self, room: RoomState, pipe):
+        """Queue a version notification in a MULTI block (sent on EXEC)"""
+        pipe.publish(self._updates_channel(room.room_code), room.version)
 
     def _save_room(self, room: RoomState, pipe=None):
         """Serialize and save a room to Redis (with TTL refresh)"""
@@ -607,9 +658,9 @@ class RoomStateManager:
         r.delete(self._session_key(session_id))
 
     def _delete_room(self, room_code: str, pipe=None):
-        """Remove room key"""
+        """Remove room and heartbeat keys"""
         r = pipe or self._redis
-        r.delete(self._room_key(room_code))
+        r.delete(self._room_key(room_code), self._heartbeat_key(room_code))
 
     def _get_room_code_for_session(self, session_id: str) -> Optional[str]:
         """Look up which room a session belongs to"""
@@ -650,6 +701,7 @@ class RoomStateManager:
                     raise KeyError(f'Room {room_code} not found')
 
                 room = RoomState.from_storage_dict(json.loads(raw))
+                self._merge_heartbeats(room, self._redis.hgetall(self._heartbeat_key(room_code)))
 
                 # Run the caller's mutation
                 result = mutation_fn(room)
@@ -657,6 +709,7 @@ class RoomStateManager:
                 # Commit atomically
                 pipe.multi()
                 pipe.set(room_key, json.dumps(room.to_storage_dict()), ex=ROOM_TTL)
+                self._publish_update(room, pipe)
 
                 # Refresh session TTLs
                 if room.host_session_id:
@@ -714,12 +767,14 @@ class RoomStateManager:
                 raise KeyError(f'Room {room_code} not found')
 
             room = RoomState.from_storage_dict(json.loads(raw))
+            self._merge_heartbeats(room, self._redis.hgetall(self._heartbeat_key(room_code)))
 
             yield room
 
             # Commit the mutation atomically
             pipe.multi()
             pipe.set(room_key, json.dumps(room.to_storage_dict()), ex=ROOM_TTL)
+            self._publish_update(room, pipe)
 
             if room.host_session_id:
                 pipe.set(
@@ -838,6 +893,7 @@ class RoomStateManager:
 
                 pipe.multi()
                 pipe.set(room_key, json.dumps(room.to_storage_dict()), ex=ROOM_TTL)
+                self._publish_update(room, pipe)
                 pipe.set(self._session_key(guest_session_id), room_code, ex=ROOM_TTL)
                 # Refresh host session TTL
                 pipe.set(
@@ -881,8 +937,8 @@ class RoomStateManager:
                 pipe.multi()
 
                 if session_id == room.host_session_id:
-                    # Host leaving — destroy room
-                    pipe.delete(room_key)
+                    # Host leaving — destroy room (waiters wake and find it gone)
+                    self._delete_room(room_code, pipe)
                     pipe.delete(self._session_key(session_id))
                     if room.guest_session_id:
                         pipe.delete(self._session_key(room.guest_session_id))
@@ -893,6 +949,8 @@ class RoomStateManager:
                     room.increment_version()
                     pipe.set(room_key, json.dumps(room.to_storage_dict()), ex=ROOM_TTL)
                     pipe.delete(self._session_key(session_id))
+                    pipe.hdel(self._heartbeat_key(room_code), session_id)
+                self._publish_update(room, pipe)
 
                 pipe.execute()
                 return True
@@ -903,6 +961,87 @@ class RoomStateManager:
 
         return False
 
+    # =========================================================================
+    # Presence and change notification (no OCC needed)
+    # =========================================================================
+
+    def record_heartbeat(self, room_code: str, session_id: str):
+        """Record that a player is still connected (one HSET, room JSON untouched)"""
+        key = self._heartbeat_key(room_code)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hset(key, session_id, datetime.now().isoformat())
+        pipe.expire(key, ROOM_TTL)
+        pipe.execute()
+
+    def wait_for_change(self, room_code: str, known_version: int,
+                        timeout: float) -> Optional[RoomState]:
+        """
+        Block until the room's version differs from known_version.
+
+        Subscribes to the room's update channel, then re-reads the room so a
+        commit landing before the subscription is not missed.
+
+        Args:
+            room_code: Room to watch
+            known_version: Version the caller already has
+            timeout: Max seconds to wait (capped at LONG_POLL_MAX_WAIT)
+
+        Returns:
+            The room (unchanged if the timeout expired), or None if the
+            room no longer exists.
+        """
+        room_code = room_code.upper().strip()
+        deadline = time.monotonic() + min(timeout, LONG_POLL_MAX_WAIT)
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(self._updates_channel(room_code))
+            room = self._load_room(room_code)
+            while room is not None and room.version == known_version:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if pubsub.get_message(timeout=remaining) is not None:
+                    room = self._load_room(room_code)
+            return room
+        finally:
+            pubsub.close()
+
+    def watch_room(self, room_code: str, known_version: int,
+                   duration: float = STREAM_MAX_DURATION,
+                   tick: float = STREAM_KEEPALIVE) -> Iterator[Optional[RoomState]]:
+        """
+        Yield the room each time a commit moves its version past known_version.
+
+        Fans out via the room's pub/sub channel, so commits from any worker
+        or node arrive here. Yields None after each idle `tick` seconds so
+        the caller can send a keepalive. Stops after `duration` seconds or
+        once the room is deleted.
+
+        Pass known_version=-1 to get the current room first.
+        """
+        room_code = room_code.upper().strip()
+        deadline = time.monotonic() + duration
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(self._updates_channel(room_code))
+            room = self._load_room(room_code)
+            idle_since = time.monotonic()
+            while room is not None:
+                if room.version != known_version:
+                    known_version = room.version
+                    yield room
+                    idle_since = time.monotonic()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                if pubsub.get_message(timeout=min(tick, remaining)) is not None:
+                    room = self._load_room(room_code)
+                elif time.monotonic() - idle_since >= tick:
+                    yield None
+                    idle_since = time.monotonic()
+        finally:
+            pubsub.close()
+
     # =========================================================================
     # Read operations (no OCC needed)
     # =========================================================================
@@ -17,20 +17,47 @@ Usage:
     state.vulnerability = "Both"
     state.play_state = play_state_obj
 
+    # Persist changes at the end of the request (no-op in memory)
+    state_manager.save(state)
+
+Multi-worker deployments use RedisSessionStateManager (picked by
+create_state_manager() when REDIS_URL or REDIS_HOST is set), so any
+gunicorn worker or node can serve any session.
+
+Redis Key Schema:
+- solo_session:{session_id} -> hash {version, data: JSON SessionState} (TTL: 24h)
+
 Environment Variables:
     DEFAULT_AI_DIFFICULTY: Set default AI difficulty level
         - Options: beginner, intermediate, advanced, expert
         - Default (dev): intermediate
         - Recommended (production): expert
+    REDIS_URL / REDIS_HOST: Store session state in Redis (shared by workers)
 """
 
+import json
 import os
 import threading
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
+import redis
+
+from engine.hand import Hand, Card
 from engine.play_engine import PlayState
 from engine.session_manager import GameSession
+from engine.v2.bidding_engine_v2_schema import AuctionContext
+
+# TTL for solo session keys (seconds) — matches the in-memory 24h cleanup
+SESSION_TTL = 24 * 3600
+
+# Max OCC retries before raising conflict
+MAX_OCC_RETRIES = 3
+
+# Deserialized sessions kept per process by RedisSessionStateManager
+SESSION_CACHE_SIZE = 1000
 
 # Get default AI difficulty from environment variable
 #
@@ -114,6 +141,11 @@ class SessionState:
     # Bidding state — backend is source of truth for whose turn it is
     dealer: str = 'North'
     auction_history: list = field(default_factory=list)  # List of bid strings
+    # Forcing state for this session's auction (the bidding engine is shared)
+    bid_context: AuctionContext = field(default_factory=AuctionContext)
+
+    # Storage version for optimistic concurrency (RedisSessionStateManager)
+    version: int = 0
 
     def touch(self):
         """Update last accessed time"""
@@ -126,6 +158,7 @@ class SessionState:
         self.play_state = None
         self.hand_start_time = None
         self.auction_history = []
+        self.bid_context.reset()
 
     def to_dict(self) -> dict:
         """Serialize state for debugging"""
@@ -140,6 +173,109 @@ class SessionState:
             'has_game_session': self.game_session is not None,
         }
 
+    # =========================================================================
+    # Storage serialization (Redis persistence — full state)
+    # =========================================================================
+
+    def to_storage_dict(self) -> dict:
+        """
+        Serialize full SessionState for Redis storage.
+
+        last_accessed is not stored (the key TTL tracks inactivity), so an
+        unchanged session serializes identically and needs no write.
+        """
+        return {
+            'session_id': self.session_id,
+            'created_at': self.created_at.isoformat(),
+            'deal': _deal_to_cards(self.deal),
+            'original_deal': _deal_to_cards(self.original_deal),
+            'vulnerability': self.vulnerability,
+            'play_state': self.play_state.to_dict() if self.play_state else None,
+            'game_session': _game_session_to_dict(self.game_session),
+            'ai_difficulty': self.ai_difficulty,
+            'hand_start_time': self.hand_start_time.isoformat() if self.hand_start_time else None,
+            'dealer': self.dealer,
+            'auction_history': self.auction_history,
+            'bid_context': self.bid_context.to_dict(),
+        }
+
+    @classmethod
+    def from_storage_dict(cls, d: dict, version: int = 0) -> 'SessionState':
+        """Deserialize SessionState from Redis storage"""
+        hand_start_time = d.get('hand_start_time')
+        return cls(
+            session_id=d['session_id'],
+            created_at=datetime.fromisoformat(d['created_at']),
+            deal=_deal_from_cards(d.get('deal')) or {
+                'North': None, 'East': None, 'South': None, 'West': None
+            },
+            original_deal=_deal_from_cards(d.get('original_deal')),
+            vulnerability=d.get('vulnerability', 'None'),
+            play_state=PlayState.from_dict(d['play_state']) if d.get('play_state') else None,
+            game_session=_game_session_from_dict(d.get('game_session')),
+            ai_difficulty=d.get('ai_difficulty', DEFAULT_AI_DIFFICULTY),
+            hand_start_time=datetime.fromisoformat(hand_start_time) if hand_start_time else None,
+            dealer=d.get('dealer', 'North'),
+            auction_history=d.get('auction_history', []),
+            bid_context=AuctionContext.from_dict(d.get('bid_context', {})),
+            version=version,
+        )
+
+
+# GameSession fields that hold database timestamps (datetime once loaded)
+_GAME_SESSION_TIMES = ('started_at', 'completed_at')
+
+
+def _game_session_to_dict(game_session: Optional[GameSession]) -> Optional[dict]:
+    """GameSession as JSON-safe values (timestamps as ISO strings)"""
+    if game_session is None:
+        return None
+    d = asdict(game_session)
+    for key in _GAME_SESSION_TIMES:
+        if isinstance(d.get(key), datetime):
+            d[key] = d[key].isoformat()
+    return d
+
+
+def _game_session_from_dict(d: Optional[dict]) -> Optional[GameSession]:
+    """Inverse of _game_session_to_dict"""
+    if not d:
+        return None
+    d = dict(d)
+    for key in _GAME_SESSION_TIMES:
+        if isinstance(d.get(key), str):
+            try:
+                d[key] = datetime.fromisoformat(d[key])
+            except ValueError:
+                pass  # Not a timestamp we wrote; keep the string
+    return GameSession(**d)
+
+
+def _deal_to_cards(deal: Optional[Dict[str, Any]]) -> Optional[dict]:
+    """Convert {position: Hand} to {position: card dict list} for storage"""
+    if deal is None:
+        return None
+    return {
+        pos: [{'rank': c.rank, 'suit': c.suit} for c in hand.cards] if hand is not None else None
+        for pos, hand in deal.items()
+    }
+
+
+def _deal_from_cards(deal: Optional[dict]) -> Optional[Dict[str, Any]]:
+    """Inverse of _deal_to_cards"""
+    if deal is None:
+        return None
+    return {
+        pos: Hand([Card(rank=c['rank'], suit=c['suit']) for c in cards], _skip_validation=True)
+        if cards is not None else None
+        for pos, cards in deal.items()
+    }
+
+
+class SessionConflictError(Exception):
+    """Raised when a session was saved by another request since it was loaded"""
+    pass
+
 
 class SessionStateManager:
     """
@@ -194,6 +330,10 @@ class SessionStateManager:
         with self._lock:
             return session_id in self._states
 
+    def save(self, state: SessionState):
+        """Persist changes to state (states live in this process: nothing to do)"""
+        pass
+
     def get_session_count(self) -> int:
         """Get number of active sessions"""
         with self._lock:
@@ -246,6 +386,216 @@ class SessionStateManager:
             return [state.to_dict() for state in self._states.values()]
 
 
+class RedisSessionStateManager(SessionStateManager):
+    """
+    Redis-backed session state shared by all workers and nodes.
+
+    Each session is one Redis hash holding a version counter and the JSON
+    state. save() writes with WATCH/MULTI and only if the stored version is
+    still the one this state was loaded at, so two requests racing on one
+    session can't silently overwrite each other.
+
+    Deserialized states are kept in a small per-process LRU cache. A read
+    fetches only the stored version and reuses the cached state when it
+    matches, so most requests skip the JSON decode and object rebuild.
+
+    Key schema:
+        solo_session:{session_id} -> hash {version, data} (TTL: 24h)
+    """
+
+    def __init__(self, redis_url: Optional[str] = None, redis_client=None,
+                 cache_size: int = SESSION_CACHE_SIZE):
+        """
+        Args:
+            redis_url: Redis connection URL (default: from REDIS_URL env or localhost)
+            redis_client: Pre-built Redis client (for testing with fakeredis)
+            cache_size: Deserialized sessions kept in this process
+        """
+        super().__init__()
+        if redis_client is not None:
+            self._redis = redis_client
+        else:
+            url = redis_url or os.environ.get('REDIS_URL') or 'redis://localhost:6379/0'
+            self._redis = redis.Redis.from_url(url, decode_responses=True)
+        self._cache_size = cache_size
+        # session_id -> (state, JSON last loaded/saved); _states is unused here
+        self._cache: 'OrderedDict[str, tuple]' = OrderedDict()
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f'solo_session:{session_id}'
+
+    # =========================================================================
+    # Per-process read-through cache
+    # =========================================================================
+
+    def _cache_put(self, state: SessionState, data: Optional[str]):
+        with self._lock:
+            self._cache[state.session_id] = (state, data)
+            self._cache.move_to_end(state.session_id)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _cache_get(self, session_id: str, version: int) -> Optional[SessionState]:
+        with self._lock:
+            entry = self._cache.get(session_id)
+            if entry is None or entry[0].version != version:
+                return None
+            self._cache.move_to_end(session_id)
+            return entry[0]
+
+    def _cache_drop(self, session_id: str):
+        with self._lock:
+            self._cache.pop(session_id, None)
+
+    # =========================================================================
+    # SessionStateManager API
+    # =========================================================================
+
+    def _load(self, session_id: str) -> Optional[SessionState]:
+        key = self._key(session_id)
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hget(key, 'version')
+        pipe.expire(key, SESSION_TTL)
+        version, _ = pipe.execute()
+        if version is None:
+            # Created in this process and not saved yet, or expired/deleted
+            state = self._cache_get(session_id, 0)
+            if state is None:
+                self._cache_drop(session_id)
+                return None
+            state.touch()
+            return state
+
+        version = int(version)
+        state = self._cache_get(session_id, version)
+        if state is None:
+            # Re-read version with the data so the pair is consistent
+            version, data = self._redis.hmget(key, 'version', 'data')
+            if data is None:
+                return None
+            state = SessionState.from_storage_dict(json.loads(data), version=int(version))
+            self._cache_put(state, data)
+        state.touch()
+        return state
+
+    def get_or_create(self, session_id: str) -> SessionState:
+        """Get existing state or create new one (stored on first save())"""
+        state = self._load(session_id)
+        if state is None:
+            state = SessionState(session_id=session_id)
+            self._cache_put(state, None)
+        return state
+
+    def get(self, session_id: str) -> Optional[SessionState]:
+        """Get state if it exists, otherwise None"""
+        return self._load(session_id)
+
+    def save(self, state: SessionState):
+        """
+        Write state back to Redis if it changed since it was loaded.
+
+        Raises:
+            SessionConflictError: Another request saved this session first.
+                The stale state is dropped from the cache; the next read
+                loads the winner's state.
+        """
+        data = json.dumps(state.to_storage_dict())
+        key = self._key(state.session_id)
+        with self._lock:
+            entry = self._cache.get(state.session_id)
+        if entry is not None and entry[0] is state and entry[1] == data:
+            return  # Unchanged: _load() already refreshed the TTL
+
+        for attempt in range(MAX_OCC_RETRIES):
+            pipe = self._redis.pipeline()
+            try:
+                pipe.watch(key)
+                stored = pipe.hget(key, 'version')
+                if int(stored or 0) != state.version:
+                    pipe.unwatch()
+                    self._cache_drop(state.session_id)
+                    raise SessionConflictError(
+                        f'Session {state.session_id} was saved concurrently '
+                        f'(version {stored}, expected {state.version})'
+                    )
+
+                pipe.multi()
+                pipe.hset(key, mapping={'version': state.version + 1, 'data': data})
+                pipe.expire(key, SESSION_TTL)
+                pipe.execute()
+                state.version += 1
+                self._cache_put(state, data)
+                return
+            except redis.WatchError:
+                # Key touched between WATCH and EXEC: re-check the version
+                continue
+            finally:
+                pipe.reset()
+
+        self._cache_drop(state.session_id)
+        raise SessionConflictError(
+            f'Session {state.session_id} was modified concurrently after {MAX_OCC_RETRIES} retries'
+        )
+
+    def delete(self, session_id: str):
+        """Remove state for session"""
+        self._redis.delete(self._key(session_id))
+        self._cache_drop(session_id)
+
+    def exists(self, session_id: str) -> bool:
+        """Check if session state exists"""
+        return bool(self._redis.exists(self._key(session_id)))
+
+    def get_session_count(self) -> int:
+        """Get number of stored sessions (approximate — uses Redis SCAN)"""
+        return sum(1 for _ in self._redis.scan_iter(match='solo_session:*', count=100))
+
+    def cleanup_inactive(self, hours: int = 24):
+        """
+        Inactive sessions expire via their Redis TTL; this only empties
+        this process's cache.
+        """
+        with self._lock:
+            count = len(self._cache)
+            self._cache.clear()
+        return count
+
+    def get_all_session_info(self) -> list:
+        """Get info about all stored sessions (for debugging/monitoring)"""
+        info = []
+        for key in self._redis.scan_iter(match='solo_session:*', count=100):
+            data = self._redis.hget(key, 'data')
+            if data:
+                info.append(SessionState.from_storage_dict(json.loads(data)).to_dict())
+        return info
+
+
+def create_state_manager() -> SessionStateManager:
+    """
+    Session state manager for this deployment.
+
+    Uses Redis when REDIS_URL or REDIS_HOST is set, so all gunicorn workers
+    share session state. Otherwise (or if Redis is unreachable) states are
+    kept in this process.
+    """
+    url = os.environ.get('REDIS_URL') or os.environ.get('REDIS_HOST')
+    if not url:
+        return SessionStateManager()
+
+    # Normalize bare host to URL format
+    if not url.startswith('redis://'):
+        url = f'redis://{url}:6379/0'
+    try:
+        manager = RedisSessionStateManager(redis_url=url)
+        manager._redis.ping()
+        return manager
+    except redis.exceptions.ConnectionError as e:
+        print(f"⚠️  Redis connection failed ({url}): {e}")
+        print("    Session state falls back to this process (not shared between workers)")
+        return SessionStateManager()
+
+
 # Helper function to extract session ID from request
 def get_session_id_from_request(request) -> Optional[str]:
     """
@@ -297,7 +647,7 @@ def require_session_state(f):
     session ID in the request (header, body, or query param).
     """
     from functools import wraps
-    from flask import jsonify
+    from flask import jsonify, g
 
     @wraps(f)
     def decorated_function(*args, **kwargs):
@@ -317,6 +667,7 @@ def require_session_state(f):
             return jsonify({'error': 'State manager not initialized'}), 500
 
         state = state_manager.get_or_create(session_id)
+        g.session_state = state  # Saved after the request (see server.save_session_state)
 
         # Inject state into function
         return f(*args, state=state, **kwargs)
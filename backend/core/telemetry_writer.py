@@ -0,0 +1,232 @@
+"""
+Asynchronous, batched writer for telemetry rows (ai_play_log, play_decisions,
+bidding_decisions).
+
+Request handlers call submit(), which only appends to an in-memory queue;
+a background thread writes queued rows with multi-row INSERTs every
+batch_size rows or flush_interval seconds, whichever comes first. Logging
+therefore never puts a database round trip on the request path.
+
+Backpressure: the queue is bounded. When it is full, submit() drops the row
+and counts it rather than blocking gameplay. Rows are flushed on shutdown
+(atexit) and on demand via flush().
+
+Environment:
+    TELEMETRY_QUEUE_SIZE: max queued rows before dropping (default 10000)
+    TELEMETRY_BATCH_SIZE: rows per INSERT batch (default 200)
+    TELEMETRY_FLUSH_MS: max time a row waits before being written (default 250)
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque, OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence
+
+
+class TelemetryWriter:
+    """Bounded in-process queue with a background batch flusher."""
+
+    def __init__(self, max_queue: int = 10000, batch_size: int = 200,
+                 flush_interval: float = 0.25,
+                 insert: Optional[Callable] = None):
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._insert = insert or self._insert_rows
+        self._insert_hooks: List[Callable] = []
+        self._reset_state()
+
+    def _reset_state(self):
+        self._pid = os.getpid()
+        self._cond = threading.Condition()
+        self._rows = deque()  # (table, columns, row)
+        self._in_flight = 0
+        self._flush_waiters = 0
+        self._closing = False
+        self._thread = None
+        self._stats = {
+            'submitted': 0,
+            'written': 0,
+            'dropped': 0,
+            'failed': 0,
+            'batches': 0,
+            'max_queue_depth': 0,
+        }
+        self._dropped_by_table: Dict[str, int] = {}
+        self._last_error: Optional[str] = None
+
+    # ------------------------------------------------------------------
+    # Producer side (request path)
+    # ------------------------------------------------------------------
+
+    def submit(self, table: str, columns: Sequence[str], row: Sequence) -> bool:
+        """
+        Queue one row for insertion. Never blocks and never raises.
+
+        Returns:
+            False if the queue was full (or the writer closed) and the row was dropped
+        """
+        if self._pid != os.getpid():
+            # Forked after the writer started; the parent's thread and rows aren't ours
+            self._reset_state()
+
+        with self._cond:
+            if self._closing or len(self._rows) >= self.max_queue:
+                self._stats['dropped'] += 1
+                self._dropped_by_table[table] = self._dropped_by_table.get(table, 0) + 1
+                return False
+            self._rows.append((table, tuple(columns), tuple(row)))
+            self._stats['submitted'] += 1
+            depth = len(self._rows)
+            self._stats['max_queue_depth'] = max(self._stats['max_queue_depth'], depth)
+            if depth == 1 or depth >= self.batch_size:
+                self._cond.notify_all()
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name='telemetry-writer', daemon=True
+                )
+                self._thread.start()
+        return True
+
+    def add_insert_hook(self, hook: Callable):
+        """
+        Run hook(cursor, table, columns, rows) after each batch insert, in the
+        same transaction, e.g. to keep summary tables in step with the rows.
+        """
+        if hook not in self._insert_hooks:
+            self._insert_hooks.append(hook)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Write everything queued so far, waiting up to timeout seconds.
+
+        Returns:
+            True if the queue drained in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                return not self._rows
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                while self._rows or self._in_flight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                return True
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """Stop accepting rows, flush what is queued, and stop the flusher thread."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify_all()
+        drained = self.flush(timeout)
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return drained
+
+    def stats(self) -> Dict:
+        """Counters for monitoring (queued, written, dropped, failed, ...)."""
+        with self._cond:
+            return {
+                **self._stats,
+                'queued': len(self._rows),
+                'max_queue': self.max_queue,
+                'dropped_by_table': dict(self._dropped_by_table),
+                'last_error': self._last_error,
+            }
+
+    # ------------------------------------------------------------------
+    # Consumer side (background thread)
+    # ------------------------------------------------------------------
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._rows and not self._closing:
+                    self._cond.wait()
+                if not self._rows:
+                    return  # Closing and drained
+                if (len(self._rows) < self.batch_size and not self._closing
+                        and not self._flush_waiters):
+                    # Give the batch up to flush_interval to fill
+                    self._cond.wait(self.flush_interval)
+                count = min(self.batch_size, len(self._rows))
+                batch = [self._rows.popleft() for _ in range(count)]
+                self._in_flight = count
+
+            try:
+                self._write(batch)
+            finally:
+                with self._cond:
+                    self._in_flight = 0
+                    self._cond.notify_all()
+
+    def _write(self, batch):
+        groups = OrderedDict()
+        for table, columns, row in batch:
+            groups.setdefault((table, columns), []).append(row)
+
+        written = failed = 0
+        for (table, columns), rows in groups.items():
+            try:
+                self._insert(table, columns, rows)
+                written += len(rows)
+            except Exception as e:
+                self._note_error(table, e)
+                if len(rows) == 1:
+                    failed += 1
+                    continue
+                # One bad row (e.g. a CHECK violation) shouldn't sink the batch
+                for row in rows:
+                    try:
+                        self._insert(table, columns, [row])
+                        written += 1
+                    except Exception as row_error:
+                        self._note_error(table, row_error)
+                        failed += 1
+
+        with self._cond:
+            self._stats['written'] += written
+            self._stats['failed'] += failed
+            self._stats['batches'] += 1
+
+    def _insert_rows(self, table, columns, rows):
+        # Imported lazily: db refuses to import without DATABASE_URL
+        from db import get_connection, insert_rows
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            insert_rows(cursor, table, columns, rows, page_size=self.batch_size)
+            for hook in self._insert_hooks:
+                hook(cursor, table, columns, rows)
+
+    def _note_error(self, table, error):
+        message = f"{table}: {error}"
+        with self._cond:
+            self._last_error = message
+        print(f"⚠️  Telemetry write failed ({message})")
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_telemetry_writer() -> TelemetryWriter:
+    """Get the process-wide telemetry writer (flushed automatically at exit)."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = TelemetryWriter(
+                    max_queue=int(os.environ.get('TELEMETRY_QUEUE_SIZE', '10000')),
+                    batch_size=int(os.environ.get('TELEMETRY_BATCH_SIZE', '200')),
+                    flush_interval=int(os.environ.get('TELEMETRY_FLUSH_MS', '250')) / 1000.0,
+                )
+                atexit.register(_writer.close)
+    return _writer
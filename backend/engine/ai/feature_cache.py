@@ -0,0 +1,133 @@
+"""
+Feature Layer Cache
+
+Bidding features fall into layers by what they depend on. Hand-only
+features (quick tricks, stoppers, suit texture, LTC, suit quality...)
+don't change during an auction, and the auction parse (opening bid,
+forcing status, balancing seat, replayed BiddingState...) doesn't
+depend on the hand, yet both were recomputed for every bid. Each layer
+is memoized in a FeatureLayerCache keyed by exactly what it depends on:
+a full auction costs one hand pass, and an auction state seen before
+(another hand at the same point, or evaluating the user's bid after
+computing the AI's) costs a lookup. Layers over a growing auction can
+peek() at the entry for the auction minus its last bid and extend it
+by one bid instead of re-parsing the whole history.
+
+Cached values are shared between callers: treat them as read-only.
+
+Every hit is credited with the time its entry took to compute, so the
+time saved is known per layer. It is always counted (see
+get_feature_cache_stats) and, if a PerformanceMonitor is registered,
+recorded there as '<layer>' (compute) and '<layer>_saved' (hit) timings.
+
+Usage:
+    _HAND_LAYER = FeatureLayerCache('hand_features')
+    metrics = _HAND_LAYER.get(hand_key(hand), lambda: compute(hand))
+
+    set_feature_monitor(monitor)    # opt in to PerformanceMonitor timings
+    get_feature_cache_stats()       # {'hand_features': {'hits': ..., 'saved_ms': ...}}
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from engine.hand import Hand
+from engine.performance_monitor import PerformanceMonitor
+
+_LAYERS: Dict[str, 'FeatureLayerCache'] = {}
+_monitor: Optional[PerformanceMonitor] = None
+
+
+def hand_key(hand: Hand) -> tuple:
+    """Cache key for hand-layer features: the cards held (sorted by Hand)"""
+    return tuple(hand.cards)
+
+
+class FeatureLayerCache:
+    """LRU of computed feature layers with hit and time-saved counters"""
+
+    def __init__(self, name: str, maxsize: int = 1024):
+        self.name = name
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.saved_ms = 0.0
+        _LAYERS[name] = self
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Cached layer for key, computing (and timing) it on a miss"""
+        try:
+            hash(key)
+        except TypeError:
+            return compute()  # e.g. an auction holding non-string bids
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self.saved_ms += entry[1]
+
+        if entry is not None:
+            if _monitor is not None:
+                _monitor.record(f'{self.name}_saved', entry[1])
+            return entry[0]
+
+        start = time.perf_counter()
+        value = compute()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (value, elapsed_ms)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        if _monitor is not None:
+            _monitor.record(self.name, elapsed_ms)
+        return value
+
+    def peek(self, key: Hashable) -> Any:
+        """Cached value for key or None, without computing or counting a lookup"""
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            return None
+        return entry[0] if entry is not None else None
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'saved_ms': self.saved_ms,
+            'size': len(self._entries),
+        }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.saved_ms = 0.0
+
+
+def set_feature_monitor(monitor: Optional[PerformanceMonitor]):
+    """Record layer compute and saved times into monitor (None to stop)"""
+    global _monitor
+    _monitor = monitor
+
+
+def get_feature_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Hit, miss and time-saved counters per feature layer"""
+    return {name: layer.stats() for name, layer in _LAYERS.items()}
+
+
+def clear_feature_caches():
+    """Drop every cached layer and reset counters"""
+    for layer in _LAYERS.values():
+        layer.clear()
@@ -1,5 +1,6 @@
 from engine.hand import Hand
 from engine.ai.bidding_state import BiddingStateBuilder
+from engine.ai.feature_cache import FeatureLayerCache, hand_key
 from typing import Dict
 
 # Seat utilities - for partner/opponent calculations
@@ -778,6 +779,72 @@ def count_partnership_bids(auction_history: list, positions: list, my_index: int
 
 def extract_features(hand: Hand, auction_history: list, my_position: str, vulnerability: str, dealer: str = 'North'):
     """Extract features from a hand and auction for bidding decision."""
+    hand_layer = extract_hand_layer(hand)
+    auction_layer = extract_auction_layer(auction_history, my_position, vulnerability, dealer)
+    auction_features = auction_layer['auction_features']
+
+    partner_last_bid = auction_features['partner_last_bid']
+    partner_suit = get_suit_from_bid(partner_last_bid) if partner_last_bid else None
+    support_points = calculate_support_points(hand, partner_suit)
+
+    return {
+        'hand_features': {
+            'hcp': hand.hcp,
+            'dist_points': hand.dist_points,
+            'total_points': hand.total_points,
+            'suit_lengths': hand.suit_lengths,
+            'is_balanced': hand.is_balanced,
+            'quick_tricks': hand_layer['quick_tricks'],
+            'stoppers': hand_layer['stoppers'],
+            'stopper_quality': hand_layer['stopper_quality'],
+            'stopper_count': hand_layer['stopper_count'],
+            'support_points': support_points,
+            'losing_trick_count': hand_layer['losing_trick_count'],
+        },
+        'auction_features': dict(auction_features),
+        'auction_history': auction_history,
+        'hand': hand,
+        'my_index': auction_layer['my_index'],
+        'positions': auction_layer['positions'],
+        'bidding_state': auction_layer['bidding_state']
+    }
+
+
+# =============================================================================
+# FEATURE LAYERS
+# Hand-only metrics are computed once per hand and the auction parse once per
+# auction state, then shared between bids (see engine/ai/feature_cache.py).
+# =============================================================================
+
+_HAND_LAYER = FeatureLayerCache('hand_features')
+_AUCTION_LAYER = FeatureLayerCache('auction_features')
+
+
+def extract_hand_layer(hand: Hand) -> Dict:
+    """Hand-only metrics (quick tricks, stoppers, LTC, texture), memoized per hand."""
+    return _HAND_LAYER.get(hand_key(hand), lambda: _compute_hand_layer(hand))
+
+
+def _compute_hand_layer(hand: Hand) -> Dict:
+    return {
+        'quick_tricks': calculate_quick_tricks(hand),
+        'stoppers': calculate_stoppers(hand),
+        'stopper_quality': calculate_stopper_quality(hand),
+        'stopper_count': count_stoppers(hand),
+        'losing_trick_count': calculate_losing_trick_count(hand),
+        'suit_texture': calculate_suit_texture(hand),
+    }
+
+
+def extract_auction_layer(auction_history: list, my_position: str, vulnerability: str,
+                          dealer: str = 'North') -> Dict:
+    """Hand-independent auction features, memoized per auction state and seat."""
+    key = (tuple(auction_history), my_position, vulnerability, dealer)
+    return _AUCTION_LAYER.get(
+        key, lambda: _compute_auction_layer(list(auction_history), my_position, vulnerability, dealer))
+
+
+def _compute_auction_layer(auction_history: list, my_position: str, vulnerability: str, dealer: str) -> Dict:
     base_positions = list(SEAT_NAMES.values())
     # Handle None dealer (when frontend doesn't send it) - default to North
     if dealer is None:
@@ -816,15 +883,6 @@ def extract_features(hand: Hand, auction_history: list, my_position: str, vulner
     interference = _detect_interference(auction_history, positions, my_index, opener_relationship, opener_index)
     bidding_state = BiddingStateBuilder().build(auction_history, dealer)
 
-    # Calculate fundamental bridge metrics
-    quick_tricks = calculate_quick_tricks(hand)
-    stoppers = calculate_stoppers(hand)
-    stopper_quality = calculate_stopper_quality(hand)
-    stopper_count = count_stoppers(hand)
-    losing_trick_count = calculate_losing_trick_count(hand)
-    partner_suit = get_suit_from_bid(partner_last_bid) if partner_last_bid else None
-    support_points = calculate_support_points(hand, partner_suit)
-
     # NEW: Calculate forcing status, balancing, agreed suit, bid counts
     forcing_status = analyze_forcing_status(auction_history, positions, my_index)
     balancing_info = detect_balancing_seat(auction_history, positions, my_index)
@@ -832,19 +890,6 @@ def extract_features(hand: Hand, auction_history: list, my_position: str, vulner
     bid_counts = count_partnership_bids(auction_history, positions, my_index)
 
     return {
-        'hand_features': {
-            'hcp': hand.hcp,
-            'dist_points': hand.dist_points,
-            'total_points': hand.total_points,
-            'suit_lengths': hand.suit_lengths,
-            'is_balanced': hand.is_balanced,
-            'quick_tricks': quick_tricks,
-            'stoppers': stoppers,
-            'stopper_quality': stopper_quality,
-            'stopper_count': stopper_count,
-            'support_points': support_points,
-            'losing_trick_count': losing_trick_count,
-        },
         'auction_features': {
             'num_bids': len(auction_history),
             'opening_bid': opening_bid,
@@ -866,8 +911,6 @@ def extract_features(hand: Hand, auction_history: list, my_position: str, vulner
             # NEW: Partnership bid counts
             'bid_counts': bid_counts,
         },
-        'auction_history': auction_history,
-        'hand': hand,
         'my_index': my_index,
         'positions': positions,
         'bidding_state': bidding_state
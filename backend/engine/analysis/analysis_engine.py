@@ -901,6 +901,10 @@ class BridgeAnalysisEngine:
                 opening_lead_quality = result.opening_lead.quality.value
                 opening_lead_cost = result.opening_lead.cost
 
+            # Snapshot the row so the user's dashboard summary can apply the difference
+            from engine.learning.analytics_summary import fetch_hand_for_update, record_hand_update
+            before = fetch_hand_for_update(cursor, session_hand_id)
+
             cursor.execute("""
                 UPDATE session_hands SET
                     quadrant = ?,
@@ -932,6 +936,16 @@ class BridgeAnalysisEngine:
                 session_hand_id,
             ))
 
+            if before:
+                after = dict(before,
+                             quadrant=result.quadrant.value,
+                             bid_efficiency=result.bid_efficiency.value,
+                             points_left_on_table=result.points_left_on_table)
+                for column in ('par_score', 'dd_tricks'):
+                    if after[column] is None:
+                        after[column] = getattr(result, column)
+                record_hand_update(cursor, before, after)
+
             conn.commit()
             return True
 
@@ -0,0 +1,143 @@
+"""
+Background analysis jobs: post-game hand analysis and tournament analysis.
+
+The web process enqueues these on the durable job queue (core/job_queue.py)
+and returns immediately; worker processes (python -m core.job_worker) run
+them, or a thread of the web process when no worker is alive
+(core.job_worker.run_in_process_if_no_worker). Payloads are plain JSON so a job can outlive the process that queued it.
+
+Usage:
+    from engine.analysis.analysis_jobs import enqueue_post_game_analysis
+
+    enqueue_post_game_analysis(session_hand_id, state.original_deal, contract, ...)
+"""
+
+from typing import Dict, List, Optional
+
+from core.job_queue import get_job_queue, register_job_handler
+
+POST_GAME_ANALYSIS = 'post_game_analysis'
+TOURNAMENT_ANALYSIS = 'tournament_analysis'
+
+# Single-position names used by the analysis engine
+_NAME_TO_POS = {'North': 'N', 'East': 'E', 'South': 'S', 'West': 'W'}
+
+
+# ============================================================================
+# Post-game analysis (one completed session hand)
+# ============================================================================
+
+def enqueue_post_game_analysis(
+    session_hand_id: int,
+    original_deal: dict,
+    contract,
+    play_history: List[Dict],
+    actual_tricks: int,
+    actual_score: int,
+    vulnerability: str,
+    dealer: str,
+) -> Optional[int]:
+    """
+    Queue analysis of a saved hand (deduplicated by session_hand_id).
+
+    Args:
+        session_hand_id: ID of the session_hands row to update
+        original_deal: Dict of position -> Hand (full names, from state.original_deal)
+        contract: Contract object
+        play_history: List of plays [{trick, position, rank, suit, ...}]
+        actual_tricks: Tricks taken by declarer
+        actual_score: Score achieved
+        vulnerability: Vulnerability string
+        dealer: Dealer position
+
+    Returns:
+        Job id
+    """
+    hands = {
+        _NAME_TO_POS.get(name, name): [{'rank': c.rank, 'suit': c.suit} for c in hand.cards]
+        for name, hand in original_deal.items()
+    }
+    payload = {
+        'session_hand_id': session_hand_id,
+        'hands': hands,
+        'contract': contract.to_dict(),
+        'play_history': play_history,
+        'actual_tricks': actual_tricks,
+        'actual_score': actual_score,
+        'vulnerability': vulnerability,
+        'dealer': dealer,
+    }
+    return get_job_queue().enqueue(POST_GAME_ANALYSIS, payload,
+                                   dedupe_key=str(session_hand_id))
+
+
+def run_post_game_analysis(payload: Dict, progress=None):
+    """
+    Analyze a completed hand and store the results on its session_hands row.
+
+    Covers bidding efficiency, quadrant classification, points left on the
+    table and opening lead quality. Raises if the results can't be stored so
+    the job is retried.
+    """
+    from engine.analysis.analysis_engine import get_analysis_engine
+    from engine.hand import Hand, Card
+    from engine.play_engine import Contract
+
+    session_hand_id = payload['session_hand_id']
+    hands = {
+        pos: Hand([Card(rank=c['rank'], suit=c['suit']) for c in cards], _skip_validation=True)
+        for pos, cards in payload['hands'].items()
+    }
+
+    engine = get_analysis_engine()
+    # Runs without DDS too: the quadrant then falls back to made/down
+    result = engine.analyze_hand(
+        hands=hands,
+        contract=Contract.from_dict(payload['contract']),
+        play_history=payload['play_history'],
+        actual_tricks=payload['actual_tricks'],
+        actual_score=payload['actual_score'],
+        vulnerability=payload['vulnerability'],
+        dealer=payload['dealer'],
+    )
+
+    if not engine.store_analysis(session_hand_id, result):
+        raise RuntimeError(f"Failed to store analysis for hand {session_hand_id}")
+
+    print(f"✅ Post-game analysis stored for hand {session_hand_id}")
+    print(f"   Quadrant: {result.quadrant.value}, Efficiency: {result.bid_efficiency.value}")
+    if result.points_left_on_table > 0:
+        print(f"   Points left on table: {result.points_left_on_table}")
+
+
+# ============================================================================
+# Tournament analysis (every pending hand of an imported tournament)
+# ============================================================================
+
+def enqueue_tournament_analysis(tournament_id: int, hero_position: str = 'S') -> Optional[int]:
+    """Queue V3 analysis of an imported tournament (deduplicated by tournament)."""
+    return get_job_queue().enqueue(
+        TOURNAMENT_ANALYSIS,
+        {'tournament_id': tournament_id, 'hero_position': hero_position},
+        dedupe_key=str(tournament_id),
+    )
+
+
+def get_tournament_analysis_job(tournament_id: int) -> Optional[Dict]:
+    """Status and progress of the latest analysis job for a tournament."""
+    return get_job_queue().get_latest(TOURNAMENT_ANALYSIS, str(tournament_id))
+
+
+def run_tournament_analysis(payload: Dict, progress=None):
+    """Analyze the tournament's pending hands, reporting per-hand progress."""
+    from engine.imports.acbl_import_api import analyze_tournament_hands
+
+    analyze_tournament_hands(
+        payload['tournament_id'],
+        payload.get('hero_position', 'S'),
+        progress=progress,
+    )
+
+
+register_job_handler(POST_GAME_ANALYSIS, run_post_game_analysis)
+register_job_handler(TOURNAMENT_ANALYSIS, run_tournament_analysis)
@@ -11,7 +11,14 @@ Physics:
 - Defensive Leaks: Potential increases when NS defense makes mistakes
 
 Implementation Notes:
-- Uses DDS solve_board() for each state (52 calls per hand)
+- Uses DDS solve_board() for each state; the cards already played to the
+  current trick are passed to DDS so mid-trick states can be solved.
+  Without endplay the pure-Python solver (engine/play/dd_solver.py)
+  answers the same queries, more slowly
+- Incremental mode (default) reuses each solve's per-card scores: the
+  score of the card actually played is the DD value of the next state,
+  so that state needs no solve of its own; a forced card (only legal
+  play) keeps the value unchanged. Roughly halves the solve_board calls
 - Runs asynchronously to avoid blocking game flow
 - Results stored in decay_curve column as JSON array
 - Major errors extracted and stored in major_errors column
@@ -20,6 +27,7 @@ Implementation Notes:
 
 import json
 import logging
+import os
 from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass, asdict
 
@@ -41,6 +49,14 @@ except ImportError:
     EndplayCard = None
     solve_board = None
 
+from engine.bitboard import BIT_CARD, CARD_BIT, SUIT_INDEX
+from engine.hand import Card
+from engine.play import dd_solver
+
+# Seconds the Python fallback may spend on one state; a state it gives up on
+# repeats the last known value, as for a failed DDS query
+DECAY_SOLVER_TIME_LIMIT = float(os.environ.get('DECAY_SOLVER_TIME_LIMIT', 2))
+
 
 # Position utilities - imported from utils.seats
 # Using SEATS as POSITION_ORDER for backward compatibility
@@ -157,6 +173,22 @@ class StateReconstructor:
             return True
         return False
 
+    def is_forced(self, position: str, trick_cards: List[Dict]) -> bool:
+        """
+        Check if position has exactly one legal card.
+
+        Args:
+            position: Position to play next
+            trick_cards: Cards already played to the current trick
+        """
+        hand = self.current_hands.get(position, [])
+        if trick_cards:
+            led_suit = trick_cards[0]['card'][0]
+            following = [card for card in hand if card[0] == led_suit]
+            if following:
+                return len(following) == 1
+        return len(hand) == 1
+
     def is_ns_side(self, position: str) -> bool:
         """Check if position is on NS side (user's side)."""
         return position in NS_SIDE
@@ -171,12 +203,13 @@ class StateReconstructor:
 
         Args:
             dds_result: Max tricks DDS says leader's side can take
-            leader: Position currently on lead
+            leader: Position currently on lead (or next to play mid-trick)
 
         Returns:
             Max tricks NS can take from this position
         """
-        tricks_remaining = self.get_tricks_remaining()
+        # DDS counts the trick in progress, so round partial tricks up
+        tricks_remaining = (self.get_total_cards_remaining() + 3) // 4
 
         if self.is_ns_side(leader):
             # DDS result is already from NS perspective
@@ -186,15 +219,25 @@ class StateReconstructor:
             # NS's potential = Total tricks - EW's potential
             return tricks_remaining - dds_result
 
-    def get_pbn_string(self) -> str:
+    def get_pbn_string(self, trick_cards: Optional[List[Dict]] = None) -> str:
         """
         Build PBN deal string from current hands.
 
         Format: "N:AKQJ.T98.765.432 EJT9.AKQ.J98.765 ..."
+
+        Args:
+            trick_cards: Cards played to the trick in progress
+                ({'card': 'SA', 'position': 'W'}); they are put back in
+                their owners' hands, since DDS needs equal hand lengths
+                and replays the trick itself
         """
+        hands = {pos: list(cards) for pos, cards in self.current_hands.items()}
+        for play in trick_cards or []:
+            hands.setdefault(play['position'], []).append(play['card'])
+
         parts = []
         for pos in POSITION_ORDER:
-            hand = self.current_hands.get(pos, [])
+            hand = hands.get(pos, [])
             # Group cards by suit
             suits = {'S': [], 'H': [], 'D': [], 'C': []}
             for card in hand:
@@ -230,13 +273,14 @@ class DecayCurveGenerator:
         self.stats = {
             'curves_generated': 0,
             'dds_calls': 0,
+            'dds_calls_saved': 0,
             'errors': 0,
         }
 
     @property
     def is_available(self) -> bool:
-        """Check if DDS is available."""
-        return DDS_AVAILABLE
+        """Check if DDS (or the Python fallback solver) is available."""
+        return DDS_AVAILABLE or dd_solver.FALLBACK_ENABLED
 
     def generate(
         self,
@@ -245,7 +289,8 @@ class DecayCurveGenerator:
         declarer: str,
         trump_suit: str,
         contract_level: int = 0,
-        skip_interval: int = 1
+        skip_interval: int = 1,
+        incremental: bool = True
     ) -> DecayCurveResult:
         """
         Generate decay curve for a hand.
@@ -257,6 +302,10 @@ class DecayCurveGenerator:
             trump_suit: Trump suit ('S', 'H', 'D', 'C', 'NT')
             contract_level: Contract level (1-7) for calculating required tricks
             skip_interval: Query DDS every N cards (1=all, 4=every trick)
+            incremental: Take a state's value from the previous solve's
+                score for the card played instead of solving it again.
+                The curve is identical; stats['dds_calls_saved'] counts
+                the solves skipped
 
         Returns:
             DecayCurveResult with curve and detected errors, all from NS perspective
@@ -291,7 +340,7 @@ class DecayCurveGenerator:
                 error_message=error_msg
             )
 
-        if not DDS_AVAILABLE:
+        if not self.is_available:
             return empty_result("DDS not available on this platform", is_valid=False)
 
         if not play_history:
@@ -309,6 +358,9 @@ class DecayCurveGenerator:
             current_trick_leader = None
             ns_tricks_count = 0
 
+            # NS value of the next state, known from the last solve
+            next_value = None
+
             for i, play in enumerate(play_history):
                 card = play['card']
                 position = play['position']
@@ -329,32 +381,52 @@ class DecayCurveGenerator:
                         decay_points.append(0)
                     reconstructor.play_card(card, position)
                     ns_tricks_cumulative.append(ns_tricks_count)
+                    next_value = None
                     continue
 
-                # Query DDS BEFORE removing the card
-                try:
-                    dds_result = self._query_dds(
-                        reconstructor,
-                        position,
-                        trump_denom
-                    )
-                    self.stats['dds_calls'] += 1
-
-                    # Normalize to NS perspective (not declarer)
-                    normalized = reconstructor.normalize_tricks_to_ns(dds_result, position)
-                    decay_points.append(normalized)
-                except Exception as e:
-                    logger.warning(f"DDS query failed at card {i}: {e}")
-                    # Use last known value
-                    if decay_points:
-                        decay_points.append(decay_points[-1])
-                    else:
-                        decay_points.append(0)
+                if incremental and next_value is not None:
+                    # Value already known from the previous solve
+                    decay_points.append(next_value)
+                    self.stats['dds_calls_saved'] += 1
+                    # A forced card keeps the DD value, so the chain continues
+                    if not reconstructor.is_forced(position, current_trick_cards[:-1]):
+                        next_value = None
+                else:
+                    # Query DDS BEFORE removing the card
+                    try:
+                        scores = self._query_dds(
+                            reconstructor,
+                            current_trick_cards[:-1],
+                            position,
+                            trump_denom,
+                            card
+                        )
+                        self.stats['dds_calls'] += 1
+
+                        # Normalize to NS perspective (not declarer)
+                        normalized = reconstructor.normalize_tricks_to_ns(
+                            max(scores.values()), position
+                        )
+                        decay_points.append(normalized)
+
+                        # The played card's score is the DD value after it
+                        if incremental and card in scores:
+                            next_value = reconstructor.normalize_tricks_to_ns(
+                                scores[card], position
+                            )
+                    except Exception as e:
+                        logger.warning(f"DDS query failed at card {i}: {e}")
+                        # Use last known value
+                        if decay_points:
+                            decay_points.append(decay_points[-1])
+                        else:
+                            decay_points.append(0)
 
                 # Mutate state: remove the played card
                 success = reconstructor.play_card(card, position)
                 if not success:
                     logger.warning(f"Card {card} not found in {position}'s hand at play {i}")
+                    next_value = None
 
                 # Determine trick winner when trick is complete
                 if (i + 1) % 4 == 0 and len(current_trick_cards) == 4:
@@ -366,6 +438,9 @@ class DecayCurveGenerator:
                     trick_winners.append(winner)
                     if winner in NS_SIDE:
                         ns_tricks_count += 1
+                        # Next value counts only the tricks still to play
+                        if next_value is not None:
+                            next_value -= 1
 
                 ns_tricks_cumulative.append(ns_tricks_count)
 
@@ -406,36 +481,87 @@ class DecayCurveGenerator:
     def _query_dds(
         self,
         reconstructor: StateReconstructor,
-        leader: str,
-        trump_denom: Any
-    ) -> int:
+        trick_cards: List[Dict],
+        next_player: str,
+        trump_denom: Any,
+        card: Optional[str] = None
+    ) -> Dict[str, int]:
         """
-        Query DDS for max tricks from current position.
+        Query DDS for the trick count of each legal card at the current position.
 
         Args:
             reconstructor: Current state
-            leader: Position on lead
-            trump_denom: Trump denomination for endplay
+            trick_cards: Cards already played to the current trick
+            next_player: Position to play next
+            trump_denom: Trump denomination for endplay (strain letter for
+                the Python solver)
+            card: The card about to be played
 
         Returns:
-            Max tricks the leader's side can take
+            Dict of card string ('SA') -> max tricks the side to play can
+            take from the remaining tricks (including the current one).
+            Every legal card with endplay; the Python solver returns just
+            `card` and an optimal card
         """
-        # Build PBN and create Deal
-        pbn = reconstructor.get_pbn_string()
+        if not DDS_AVAILABLE:
+            return self._query_solver(reconstructor, trick_cards, next_player, trump_denom, card)
+
+        # Build the deal at the start of the trick, then replay the trick
+        pbn = reconstructor.get_pbn_string(trick_cards)
         deal = Deal(pbn)
         deal.trump = trump_denom
+        leader = trick_cards[0]['position'] if trick_cards else next_player
         deal.first = self._convert_position(leader)
+        for play in trick_cards:
+            deal.play(EndplayCard(play['card']))
 
-        # solve_board returns optimal plays with trick counts
+        # solve_board returns every legal card with its trick count
         solved = solve_board(deal)
 
-        # Get the max tricks from the solution
-        if solved:
-            # Each item is (card, tricks) - tricks is for the side on lead
-            max_tricks = max(tricks for card, tricks in solved)
-            return max_tricks
+        scores = {f"{'SHDC'[c.suit.value]}{c.rank.abbr}": tricks for c, tricks in solved}
+        if not scores:
+            raise ValueError("DDS returned no playable cards")
+        return scores
 
-        return 0
+    def _query_solver(
+        self,
+        reconstructor: StateReconstructor,
+        trick_cards: List[Dict],
+        next_player: str,
+        trump: str,
+        card: Optional[str]
+    ) -> Dict[str, int]:
+        """
+        _query_dds on the pure-Python solver.
+
+        Scores only what generate() reads - one optimal card (for the
+        maximum) and the card played - since every extra card is another
+        search. Raises SolverTimeout if the state takes too long.
+        """
+        def to_bit(card_str: str) -> int:
+            return CARD_BIT[Card(card_str[1:], dd_solver.STRAIN_SYMBOLS[card_str[0]])]
+
+        def to_str(bit: int) -> str:
+            c = BIT_CARD[bit]
+            return f"{'SHDC'[SUIT_INDEX[c.suit]]}{c.rank}"
+
+        hands = [
+            sum(1 << to_bit(c) for c in reconstructor.current_hands.get(pos, []))
+            for pos in POSITION_ORDER
+        ]
+        leader = trick_cards[0]['position'] if trick_cards else next_player
+        trick = [to_bit(play['card']) for play in trick_cards]
+        solver = dd_solver.DoubleDummySolver(
+            hands, dd_solver.trump_index(trump), time_limit=DECAY_SOLVER_TIME_LIMIT
+        )
+        seat = dd_solver.SEAT_INDEX[leader]
+
+        best, optimal = solver.optimal_moves(seat, trick, first_only=True)
+        scores = {to_str(optimal[0]): best}
+        if card and card not in scores:
+            bit = to_bit(card)
+            scores[card] = solver.score_moves(seat, trick, [bit])[bit]
+        return scores
 
     def _detect_errors(
         self,
@@ -608,9 +734,9 @@ class DecayCurveGenerator:
         return trick_cards[winner_idx]['position']
 
     def _convert_trump(self, trump_suit: str) -> Any:
-        """Convert trump suit string to endplay Denom."""
+        """Convert trump suit string to endplay Denom (a strain letter without DDS)."""
         if not DDS_AVAILABLE:
-            return None
+            return trump_suit.upper()
 
         mapping = {
             'S': Denom.spades,
@@ -0,0 +1,219 @@
+"""
+Bitboard Card Representation
+
+A set of cards is stored as a single int with 13 bits per suit (52 bits
+total). Suits use PBN order (♠ ♥ ♦ ♣ = suit index 0-3) and within a suit
+bit 0 is the deuce and bit 12 is the ace:
+
+    bit = suit_index * 13 + rank_index      (rank_index: '2' = 0 ... 'A' = 12)
+
+This gives:
+- O(1) follow-suit masks: hand & SUIT_MASKS[led_suit]
+- Suit lengths via popcount lookup table (13-bit suit -> length)
+- HCP via lookup table (13-bit suit -> A=4 K=3 Q=2 J=1)
+- Highest / lowest card of a suit from bit_length() and (x & -x)
+
+Example:
+    >>> mask = Hand.from_pbn("AKQJ.T987.654.32").to_bitmask()
+    >>> hcp(mask)
+    10
+    >>> suit_lengths(mask)
+    {'♠': 4, '♥': 4, '♦': 3, '♣': 2}
+    >>> legal = legal_mask(mask, '♥')   # hearts only
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from engine.hand import Card
+
+
+# === LAYOUT ===
+
+SUITS = ['♠', '♥', '♦', '♣']
+RANKS = '23456789TJQKA'
+
+SUIT_INDEX: Dict[str, int] = {suit: i for i, suit in enumerate(SUITS)}
+RANK_INDEX: Dict[str, int] = {rank: i for i, rank in enumerate(RANKS)}
+
+SUIT_BITS = 13
+SUIT_FULL = (1 << SUIT_BITS) - 1
+FULL_DECK = (1 << (SUIT_BITS * 4)) - 1
+
+# Mask of all 13 bits of each suit, indexed by suit index and by symbol
+SUIT_MASKS: List[int] = [SUIT_FULL << (i * SUIT_BITS) for i in range(4)]
+SUIT_MASK: Dict[str, int] = {suit: SUIT_MASKS[i] for i, suit in enumerate(SUITS)}
+
+# Card <-> bit lookups
+CARD_BIT: Dict[Card, int] = {}
+BIT_CARD: List[Card] = [None] * 52
+for _s, _suit in enumerate(SUITS):
+    for _r, _rank in enumerate(RANKS):
+        _bit = _s * SUIT_BITS + _r
+        CARD_BIT[Card(_rank, _suit)] = _bit
+        BIT_CARD[_bit] = Card(_rank, _suit)
+
+# Per-suit lookup tables over all 8192 possible 13-bit holdings
+_HONOR_POINTS = {12: 4, 11: 3, 10: 2, 9: 1}
+SUIT_LENGTH_TABLE: List[int] = [bin(h).count('1') for h in range(1 << SUIT_BITS)]
+SUIT_HCP_TABLE: List[int] = [
+    sum(points for rank, points in _HONOR_POINTS.items() if h >> rank & 1)
+    for h in range(1 << SUIT_BITS)
+]
+
+
+# === CONVERSION ===
+
+def card_mask(card: Card) -> int:
+    """Single-bit mask for a card"""
+    return 1 << CARD_BIT[card]
+
+
+def cards_to_mask(cards: Iterable[Card]) -> int:
+    """Pack cards into a bitmask"""
+    mask = 0
+    for card in cards:
+        mask |= 1 << CARD_BIT[card]
+    return mask
+
+
+def mask_to_cards(mask: int) -> List[Card]:
+    """
+    Unpack a bitmask into cards
+
+    Cards come out in Hand order: suits ♠ ♥ ♦ ♣, highest rank first.
+    """
+    cards = []
+    for s in range(4):
+        holding = (mask >> (s * SUIT_BITS)) & SUIT_FULL
+        base = s * SUIT_BITS
+        while holding:
+            top = holding.bit_length() - 1
+            cards.append(BIT_CARD[base + top])
+            holding ^= 1 << top
+    return cards
+
+
+def suit_cards(mask: int, suit: str) -> List[Card]:
+    """Cards held in one suit, highest rank first"""
+    base = SUIT_INDEX[suit] * SUIT_BITS
+    holding = (mask >> base) & SUIT_FULL
+    cards = []
+    while holding:
+        top = holding.bit_length() - 1
+        cards.append(BIT_CARD[base + top])
+        holding ^= 1 << top
+    return cards
+
+
+def suit_holding(mask: int, suit: str) -> int:
+    """13-bit holding of one suit, shifted down to bits 0-12"""
+    return (mask >> (SUIT_INDEX[suit] * SUIT_BITS)) & SUIT_FULL
+
+
+# === EVALUATION ===
+
+def suit_length(mask: int, suit: str) -> int:
+    """Number of cards held in a suit"""
+    return SUIT_LENGTH_TABLE[(mask >> (SUIT_INDEX[suit] * SUIT_BITS)) & SUIT_FULL]
+
+
+def suit_lengths(mask: int) -> Dict[str, int]:
+    """Suit lengths keyed by suit symbol"""
+    return {
+        suit: SUIT_LENGTH_TABLE[(mask >> (s * SUIT_BITS)) & SUIT_FULL]
+        for s, suit in enumerate(SUITS)
+    }
+
+
+def shape(mask: int) -> Tuple[int, int, int, int]:
+    """Suit lengths in PBN order (♠, ♥, ♦, ♣)"""
+    return tuple(SUIT_LENGTH_TABLE[(mask >> (s * SUIT_BITS)) & SUIT_FULL] for s in range(4))
+
+
+def card_count(mask: int) -> int:
+    """Total number of cards in the mask"""
+    return bin(mask).count('1')
+
+
+def hcp(mask: int) -> int:
+    """High card points (A=4, K=3, Q=2, J=1)"""
+    return (SUIT_HCP_TABLE[mask & SUIT_FULL]
+            + SUIT_HCP_TABLE[(mask >> 13) & SUIT_FULL]
+            + SUIT_HCP_TABLE[(mask >> 26) & SUIT_FULL]
+            + SUIT_HCP_TABLE[(mask >> 39) & SUIT_FULL])
+
+
+def suit_hcp(mask: int, suit: str) -> int:
+    """High card points held in one suit"""
+    return SUIT_HCP_TABLE[(mask >> (SUIT_INDEX[suit] * SUIT_BITS)) & SUIT_FULL]
+
+
+# === PLAY ===
+
+def legal_mask(hand_mask: int, led_suit: Optional[str]) -> int:
+    """
+    Legal cards as a bitmask
+
+    Must follow suit if able; if leading (led_suit None) or void in the
+    led suit, every card in the hand is legal.
+    """
+    if led_suit is None:
+        return hand_mask
+    follow = hand_mask & SUIT_MASK[led_suit]
+    return follow if follow else hand_mask
+
+
+def legal_cards(cards: List[Card], current_trick: List[Tuple[Card, str]]) -> List[Card]:
+    """
+    Legal cards from a card list and the current trick
+
+    Follow-suit is decided on the bitmask; the result preserves the order
+    of `cards`, so callers holding a Hand's card list keep Hand ordering.
+    """
+    if not current_trick:
+        return list(cards)
+    hand_mask = cards_to_mask(cards)
+    allowed = legal_mask(hand_mask, current_trick[0][0].suit)
+    if allowed == hand_mask:
+        return list(cards)
+    return [c for c in cards if allowed >> CARD_BIT[c] & 1]
+
+
+def highest_card(mask: int, suit: str) -> Optional[Card]:
+    """Highest card held in a suit, or None if void"""
+    holding = suit_holding(mask, suit)
+    if not holding:
+        return None
+    return BIT_CARD[SUIT_INDEX[suit] * SUIT_BITS + holding.bit_length() - 1]
+
+
+def lowest_card(mask: int, suit: str) -> Optional[Card]:
+    """Lowest card held in a suit, or None if void"""
+    holding = suit_holding(mask, suit)
+    if not holding:
+        return None
+    return BIT_CARD[SUIT_INDEX[suit] * SUIT_BITS + (holding & -holding).bit_length() - 1]
+
+
+def trick_winner_bit(trick_bits: List[int], trump: Optional[str]) -> int:
+    """
+    Index (0-3) of the winning card in a complete trick given as bit numbers
+
+    Highest trump wins, otherwise the highest card of the led suit. Because
+    ranks increase with bit number inside a suit, comparing bit numbers of
+    cards in the same suit compares their ranks.
+    """
+    led = trick_bits[0] // SUIT_BITS
+    trump_index = SUIT_INDEX[trump] if trump else -1
+    best = 0
+    best_bit = trick_bits[0]
+    best_suit = led
+    for i in range(1, len(trick_bits)):
+        bit = trick_bits[i]
+        suit = bit // SUIT_BITS
+        if suit == best_suit:
+            if bit > best_bit:
+                best, best_bit = i, bit
+        elif suit == trump_index:
+            best, best_bit, best_suit = i, bit, suit
+    return best
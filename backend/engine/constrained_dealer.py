@@ -0,0 +1,368 @@
+"""
+Constrained Hand Dealer
+
+Deals one 13-card hand from a deck that meets a constraints dict (HCP
+window and shape requirements) without shuffle-and-check loops.
+
+Shuffling the deck and rejecting hands that miss the constraints takes
+thousands of tries for narrow requests (e.g. 6+ spades with 5-10 HCP)
+and can still give up. This dealer works the other way round:
+
+1. Enumerate the suit-length patterns (♠-♥-♦-♣ lengths) that meet the
+   shape constraints and fit the cards left in the deck.
+2. For each pattern, count the hands that reach each HCP total from the
+   honors still in the deck, and keep the patterns that can hit the HCP
+   window. If none can, the constraints are infeasible, and that is
+   reported before any dealing.
+3. Pick a pattern, then the HCP of each suit, then the honors and spot
+   cards of each suit, each weighted by the number of hands it leads to.
+
+Every hand meeting the constraints is equally likely (the distribution
+rejection sampling would give), and a deal costs the same however rare
+the hand is. Steps 1-2 are cached per (deck, constraints), so repeated
+requests from a full deck only pay for step 3. A few plain random draws
+are tried before counting: when the constraints are loose (e.g. dummy's
+HCP window in a play deal, a new deck every time) one of them usually
+fits, which is cheaper than counting. An accepted random draw is as
+uniform as a counted deal, so the mix keeps the distribution exact.
+
+Supported constraint keys (as used by the skill generators, convention
+specialists and bidding scenarios):
+    hcp_range, is_balanced, suit_length_req (suits, min_length,
+    'any_of' | 'all_of'), short_suit_req (suits, max_length), void_suit, singleton_suit, doubleton_suit,
+    max_suit_length, min_longest_suit, unique_longest_suit
+Other keys are ignored.
+
+Example:
+    >>> hand, remaining = deal_constrained_hand(
+    ...     {'hcp_range': (5, 10), 'suit_length_req': (['♠'], 6, 'any_of')}, deck)
+    >>> count_matching_hands({'hcp_range': (38, 40)}, create_deck())
+    0
+"""
+
+import random
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Optional, Tuple
+
+from engine.bitboard import (
+    SUITS, SUIT_BITS, SUIT_FULL, CARD_BIT, SUIT_LENGTH_TABLE, SUIT_HCP_TABLE,
+)
+from engine.hand import Hand, Card
+
+
+HONOR_POINTS = {12: 4, 11: 3, 10: 2, 9: 1}  # Rank index -> HCP (A K Q J)
+HONOR_HOLDING = sum(1 << rank for rank in HONOR_POINTS)
+MAX_SUIT_HCP = 10
+PLAN_CACHE_SIZE = 256
+QUICK_DRAWS = 16  # Plain random draws tried before counting
+
+
+class InfeasibleConstraints(ValueError):
+    """No hand that can be dealt from the deck meets the constraints"""
+
+
+# === CONSTRAINTS ===
+
+def _constraint_key(constraints: Dict) -> tuple:
+    """Hashable form of the constraint keys the dealer understands"""
+    hcp_range = constraints.get('hcp_range') or (0, 40)
+    suit_length_req = constraints.get('suit_length_req')
+    if suit_length_req:
+        suits, min_length, mode = suit_length_req
+        suit_length_req = (tuple(suits), min_length, mode)
+    short_suit_req = constraints.get('short_suit_req')
+    if short_suit_req:
+        suits, max_length = short_suit_req
+        short_suit_req = (tuple(suits), max_length)
+    return (
+        (hcp_range[0], hcp_range[1]),
+        constraints.get('is_balanced'),
+        suit_length_req or None,
+        short_suit_req or None,
+        constraints.get('void_suit') or None,
+        constraints.get('singleton_suit') or None,
+        constraints.get('doubleton_suit') or None,
+        constraints.get('max_suit_length') or None,
+        constraints.get('min_longest_suit') or None,
+        bool(constraints.get('unique_longest_suit', False)),
+    )
+
+
+def _shape_ok(lengths: Tuple[int, int, int, int], key: tuple) -> bool:
+    """Check a suit-length pattern against the shape part of a constraint key"""
+    (_, is_balanced, suit_length_req, short_suit_req, void_suit, singleton_suit,
+     doubleton_suit, max_suit_length, min_longest_suit, unique_longest_suit) = key
+    by_suit = dict(zip(SUITS, lengths))
+
+    if is_balanced is not None:
+        balanced = 0 not in lengths and 1 not in lengths and lengths.count(2) <= 1
+        if balanced != is_balanced:
+            return False
+
+    if suit_length_req:
+        suits, min_length, mode = suit_length_req
+        if mode == 'any_of' and not any(by_suit[s] >= min_length for s in suits):
+            return False
+        if mode == 'all_of' and not all(by_suit[s] >= min_length for s in suits):
+            return False
+
+    if short_suit_req:
+        suits, max_length = short_suit_req
+        if any(by_suit[s] > max_length for s in suits):
+            return False
+
+    if void_suit and by_suit[void_suit] != 0:
+        return False
+    if singleton_suit and by_suit[singleton_suit] != 1:
+        return False
+    if doubleton_suit and by_suit[doubleton_suit] != 2:
+        return False
+
+    longest = max(lengths)
+    if max_suit_length and longest > max_suit_length:
+        return False
+    if min_longest_suit and longest < min_longest_suit:
+        return False
+    if unique_longest_suit and lengths.count(longest) > 1:
+        return False
+    return True
+
+
+# === COUNTING ===
+
+def _suit_counts(holding: int) -> List[List[int]]:
+    """
+    Holdings that can be drawn from one suit's available cards
+
+    Returns:
+        counts[length][hcp] = number of distinct holdings
+    """
+    honors = [rank for rank in HONOR_POINTS if holding >> rank & 1]
+    spots = SUIT_LENGTH_TABLE[holding & ~HONOR_HOLDING]
+    counts = [[0] * (MAX_SUIT_HCP + 1) for _ in range(SUIT_LENGTH_TABLE[holding] + 1)]
+    for k in range(len(honors) + 1):
+        for combo in combinations(honors, k):
+            points = sum(HONOR_POINTS[rank] for rank in combo)
+            for extra in range(spots + 1):
+                counts[k + extra][points] += comb(spots, extra)
+    return counts
+
+
+def _convolve(a: List[int], b: List[int]) -> List[int]:
+    """HCP distribution of two independent holdings"""
+    out = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                out[i + j] += x * y
+    return out
+
+
+def _window_sum(dist: List[int], lo: int, hi: int) -> int:
+    """Ways dist reaches a total in [lo, hi]"""
+    if hi < 0 or lo >= len(dist):
+        return 0
+    return sum(dist[max(lo, 0):hi + 1])
+
+
+_plan_cache: OrderedDict = OrderedDict()
+
+
+def _plan(deck_mask: int, key: tuple):
+    """Cached _count_patterns"""
+    cache_key = (deck_mask, key)
+    plan = _plan_cache.get(cache_key)
+    if plan is not None:
+        _plan_cache.move_to_end(cache_key)
+        return plan
+    plan = _count_patterns(deck_mask, key)
+    _plan_cache[cache_key] = plan
+    if len(_plan_cache) > PLAN_CACHE_SIZE:
+        _plan_cache.popitem(last=False)
+    return plan
+
+
+def _count_patterns(deck_mask: int, key: tuple):
+    """
+    Count the matching hands of every feasible pattern
+
+    Returns:
+        (per-suit counts, patterns, cumulative hand counts of the patterns)
+    """
+    hcp_min, hcp_max = key[0]
+    holdings = [(deck_mask >> (i * SUIT_BITS)) & SUIT_FULL for i in range(4)]
+    counts = [_suit_counts(holding) for holding in holdings]
+    available = [len(suit) - 1 for suit in counts]
+
+    # HCP distributions of the ♦/♣ half, shared by every ♠/♥ split
+    low_pairs = {}
+    for c in range(available[2] + 1):
+        for d in range(min(available[3], 13 - c) + 1):
+            dist = _convolve(counts[2][c], counts[3][d])
+            prefix = [0]
+            for n in dist:
+                prefix.append(prefix[-1] + n)
+            low_pairs[c, d] = prefix
+
+    patterns = []
+    cumulative = []
+    total = 0
+    for a in range(min(13, available[0]) + 1):
+        for b in range(min(13 - a, available[1]) + 1):
+            high = _convolve(counts[0][a], counts[1][b])
+            for c in range(min(13 - a - b, available[2]) + 1):
+                d = 13 - a - b - c
+                if d > available[3] or not _shape_ok((a, b, c, d), key):
+                    continue
+                prefix = low_pairs[c, d]
+                top = len(prefix) - 1
+                weight = 0
+                for points, n in enumerate(high):
+                    if n:
+                        lo = max(hcp_min - points, 0)
+                        hi = min(hcp_max - points, top - 1)
+                        if hi >= lo:
+                            weight += n * (prefix[hi + 1] - prefix[lo])
+                if weight:
+                    total += weight
+                    patterns.append((a, b, c, d))
+                    cumulative.append(total)
+
+    return counts, tuple(patterns), tuple(cumulative)
+
+
+def _deck_mask(deck: List[Card]) -> int:
+    mask = 0
+    for card in deck:
+        mask |= 1 << CARD_BIT[card]
+    return mask
+
+
+def count_matching_hands(constraints: Dict, deck: List[Card]) -> int:
+    """Number of distinct 13-card hands from deck that meet constraints (0 = infeasible)"""
+    _, _, cumulative = _plan(_deck_mask(deck), _constraint_key(constraints))
+    return cumulative[-1] if cumulative else 0
+
+
+# === DEALING ===
+
+def _weighted_index(weights: List[int], rng) -> int:
+    """Index drawn with probability proportional to its (integer) weight"""
+    r = rng.randrange(sum(weights))
+    for i, weight in enumerate(weights):
+        r -= weight
+        if r < 0:
+            return i
+    return len(weights) - 1
+
+
+def _quick_draw(deck_mask: int, key: tuple, rng) -> Optional[int]:
+    """Hand mask from up to QUICK_DRAWS plain random draws, None if none fit"""
+    hcp_min, hcp_max = key[0]
+    bits = [1 << bit for bit in range(52) if deck_mask >> bit & 1]
+    if len(bits) < 13:
+        return None
+    for _ in range(QUICK_DRAWS):
+        mask = 0
+        for bit in rng.sample(bits, 13):
+            mask |= bit
+        holdings = [(mask >> (i * SUIT_BITS)) & SUIT_FULL for i in range(4)]
+        if not hcp_min <= sum(SUIT_HCP_TABLE[h] for h in holdings) <= hcp_max:
+            continue
+        if _shape_ok(tuple(SUIT_LENGTH_TABLE[h] for h in holdings), key):
+            return mask
+    return None
+
+
+def _deal_suit(holding: int, length: int, points: int, rng) -> int:
+    """Random holding of length cards with points HCP from one suit's available cards"""
+    honors = [rank for rank in HONOR_POINTS if holding >> rank & 1]
+    spots = [rank for rank in range(SUIT_BITS) if holding >> rank & 1 and rank not in HONOR_POINTS]
+
+    options = []
+    weights = []
+    for k in range(min(len(honors), length) + 1):
+        if length - k > len(spots):
+            continue
+        for combo in combinations(honors, k):
+            if sum(HONOR_POINTS[rank] for rank in combo) == points:
+                options.append(combo)
+                weights.append(comb(len(spots), length - k))
+
+    combo = options[_weighted_index(weights, rng)]
+    ranks = list(combo) + rng.sample(spots, length - len(combo))
+    return sum(1 << rank for rank in ranks)
+
+
+def _deal_counted(deck_mask: int, key: tuple, rng) -> Optional[int]:
+    """Hand mask dealt pattern -> suit HCP -> cards, None if infeasible"""
+    counts, patterns, cumulative = _plan(deck_mask, key)
+    if not patterns:
+        return None
+
+    lengths = patterns[bisect_right(cumulative, rng.randrange(cumulative[-1]))]
+    rows = [counts[i][lengths[i]] for i in range(4)]
+
+    # suffix[i] = HCP distribution of suits i..3, to weight each suit's share
+    suffix = [[1]]
+    for row in reversed(rows):
+        suffix.insert(0, _convolve(row, suffix[0]))
+
+    hcp_min, hcp_max = key[0]
+    points_so_far = 0
+    hand_mask = 0
+    for i in range(4):
+        weights = [
+            n * _window_sum(suffix[i + 1], hcp_min - points_so_far - points,
+                            hcp_max - points_so_far - points)
+            for points, n in enumerate(rows[i])
+        ]
+        points = _weighted_index(weights, rng)
+        points_so_far += points
+        holding = (deck_mask >> (i * SUIT_BITS)) & SUIT_FULL
+        hand_mask |= _deal_suit(holding, lengths[i], points, rng) << (i * SUIT_BITS)
+    return hand_mask
+
+
+def deal_constrained_hand(constraints: Dict, deck: List[Card],
+                          rng: Optional[random.Random] = None) -> Tuple[Hand, List[Card]]:
+    """
+    Deal a hand meeting constraints from deck
+
+    Args:
+        constraints: Constraint dict (see module docstring)
+        deck: Cards available; not modified
+        rng: Random source (defaults to the random module, so random.seed()
+            makes deals reproducible)
+
+    Returns:
+        (hand, remaining_deck) - the remaining cards are shuffled, ready to
+        deal the other hands from
+
+    Raises:
+        InfeasibleConstraints: If no hand from deck meets the constraints
+    """
+    rng = rng or random
+    deck_mask = _deck_mask(deck)
+    key = _constraint_key(constraints)
+
+    hand_mask = _quick_draw(deck_mask, key, rng)
+    if hand_mask is None:
+        hand_mask = _deal_counted(deck_mask, key, rng)
+        if hand_mask is None:
+            raise InfeasibleConstraints(
+                f"No hand from the {len(deck)}-card deck meets constraints {constraints}"
+            )
+
+    hand_cards = []
+    remaining = []
+    for card in deck:
+        if hand_mask >> CARD_BIT[card] & 1:
+            hand_cards.append(card)
+        else:
+            remaining.append(card)
+    rng.shuffle(remaining)
+    return Hand(hand_cards), remaining
@@ -19,7 +19,7 @@ from typing import Optional, List, Dict
 
 # Database abstraction layer (PostgreSQL in production)
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from db import get_connection
+from core.telemetry_writer import get_telemetry_writer
 
 
 class CorrectnessLevel(Enum):
@@ -145,25 +145,26 @@ class BiddingFeedbackGenerator:
                        hand_analysis_id: Optional[int],
                        hand_number: Optional[int] = None,
                        deal_data: Optional[Dict] = None):
-        """Store feedback in bidding_decisions table"""
-        # Always use get_connection() for consistency with analytics queries.
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("""
-                INSERT INTO bidding_decisions (
-                    hand_analysis_id, user_id, session_id, hand_number,
-                    bid_number, position, dealer, vulnerability,
-                    user_bid, optimal_bid, auction_before,
-                    correctness, score, impact,
-                    error_category, error_subcategory,
-                    key_concept, difficulty,
-                    helpful_hint, reasoning,
-                    deal_data,
-                    timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (
+        """
+        Store feedback in bidding_decisions table.
+
+        The row is queued for the background telemetry writer (the database
+        default timestamps it); call get_telemetry_writer().flush() to wait
+        until it is in the database. Write failures are logged by the writer.
+        """
+        queued = get_telemetry_writer().submit(
+            'bidding_decisions',
+            (
+                'hand_analysis_id', 'user_id', 'session_id', 'hand_number',
+                'bid_number', 'position', 'dealer', 'vulnerability',
+                'user_bid', 'optimal_bid', 'auction_before',
+                'correctness', 'score', 'impact',
+                'error_category', 'error_subcategory',
+                'key_concept', 'difficulty',
+                'helpful_hint', 'reasoning',
+                'deal_data',
+            ),
+            (
                 hand_analysis_id,
                 user_id,
                 session_id,
@@ -184,19 +185,14 @@ class BiddingFeedbackGenerator:
                 feedback.difficulty,
                 feedback.helpful_hint,
                 feedback.reasoning,
-                json.dumps(deal_data) if deal_data else None
-            ))
-
-            conn.commit()
-            print(f"✅ Stored bidding decision: {feedback.user_bid} (correctness: {feedback.correctness.value}, score: {feedback.score})")
-        except Exception as e:
-            print(f"❌ Error storing bidding feedback: {e}")
-            import traceback
-            traceback.print_exc()
-            conn.rollback()
-            raise  # Re-raise so the API endpoint can catch it
-        finally:
-            conn.close()
+                json.dumps(deal_data) if deal_data else None,
+            )
+        )
+        if queued:
+            print(f"✅ Queued bidding decision: {feedback.user_bid} (correctness: {feedback.correctness.value}, score: {feedback.score})")
+        else:
+            print(f"⚠️  Telemetry write failed (bidding_decisions: queue full, "
+                  f"dropped {feedback.user_bid} for user {user_id})")
 
 
 
@@ -13,11 +13,14 @@ Features:
 - Database storage for dashboard analytics
 
 Performance: <1ms per solve on Linux (production)
-Fallback: Minimax heuristics on macOS (development)
+Fallback: the pure-Python double dummy solver where endplay is unusable
+(exact, but only for the last FEEDBACK_SOLVER_MAX_TRICKS tricks, which it
+solves within FEEDBACK_SOLVER_TIME_LIMIT seconds), then Minimax heuristics
 
 This module does NOT modify play state - it only evaluates and provides feedback.
 """
 
+import os
 import sys
 import platform
 from pathlib import Path
@@ -28,7 +31,7 @@ from datetime import datetime
 
 # Database abstraction layer
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from db import get_connection
+from core.telemetry_writer import get_telemetry_writer
 
 from engine.hand import Hand, Card
 from engine.play_engine import PlayState, Contract
@@ -41,6 +44,22 @@ except ImportError:
     DDS_AVAILABLE = False
     DDSPlayAI = None
 
+# Pure-Python double dummy solver where endplay is missing or unsafe
+try:
+    from engine.bitboard import CARD_BIT
+    from engine.play.ai.solver_ai import SolverPlayAI
+    from engine.play.dd_solver import SolverTimeout, FALLBACK_ENABLED as SOLVER_FALLBACK_ENABLED
+except ImportError:
+    SolverPlayAI = None
+    SOLVER_FALLBACK_ENABLED = False
+
+# Seconds the Python solver may spend on one play before Minimax takes over
+FEEDBACK_SOLVER_TIME_LIMIT = float(os.environ.get('FEEDBACK_SOLVER_TIME_LIMIT', 0.5))
+
+# Tricks left in the deal from which the Python solver is tried at all.
+# Earlier positions would spend the whole time limit and then use Minimax
+FEEDBACK_SOLVER_MAX_TRICKS = int(os.environ.get('FEEDBACK_SOLVER_MAX_TRICKS', 7))
+
 # Always have Minimax available as fallback
 from engine.play.ai.minimax_ai import MinimaxPlayAI
 
@@ -216,7 +235,8 @@ class PlayFeedbackGenerator:
         Initialize the feedback generator.
 
         Args:
-            use_dds: If True, use DDS when available. If False, always use Minimax.
+            use_dds: If True, use DDS when available (endplay, else the Python
+                solver). If False, always use Minimax.
         """
         # DDS only works reliably on Linux
         self.platform_allows_dds = platform.system() == 'Linux'
@@ -230,6 +250,10 @@ class PlayFeedbackGenerator:
                 print(f"PlayFeedbackGenerator: DDS init failed ({e}), using Minimax")
                 self.dds_available = False
                 self._dds_ai = None
+        elif use_dds and SOLVER_FALLBACK_ENABLED:
+            self._dds_ai = SolverPlayAI(time_limit=FEEDBACK_SOLVER_TIME_LIMIT)
+            self.dds_available = True
+            print("PlayFeedbackGenerator: Using Python double dummy solver (endplay unavailable)")
         else:
             self._dds_ai = None
 
@@ -553,6 +577,11 @@ class PlayFeedbackGenerator:
             - analysis_source: "dds" for exact analysis, "heuristic" for Minimax
         """
         if self.dds_available and self._dds_ai:
+            if SolverPlayAI is not None and isinstance(self._dds_ai, SolverPlayAI):
+                tricks_left = 13 - state.tricks_taken_ns - state.tricks_taken_ew
+                if tricks_left <= FEEDBACK_SOLVER_MAX_TRICKS:
+                    return self._analyze_with_solver(state, position, user_card, legal_cards)
+                return self._analyze_with_minimax(state, position, user_card, legal_cards)
             return self._analyze_with_dds(state, position, user_card, legal_cards)
         else:
             return self._analyze_with_minimax(state, position, user_card, legal_cards)
@@ -631,6 +660,42 @@ class PlayFeedbackGenerator:
             print(f"DDS analysis failed: {e}, falling back to Minimax")
             return self._analyze_with_minimax(state, position, user_card, legal_cards)
 
+    def _analyze_with_solver(self, state: PlayState, position: str,
+                             user_card: Card, legal_cards: List[Card]
+                             ) -> Tuple[List[Card], int, int, str]:
+        """
+        Use the pure-Python solver to find optimal plays.
+
+        Finds the optimal cards without scoring every card, then scores the
+        user's card only if it isn't one of them. Only called for the last
+        FEEDBACK_SOLVER_MAX_TRICKS tricks; positions the solver still can't
+        finish within its time limit are analyzed with Minimax.
+
+        Returns:
+            (optimal_cards, user_tricks, optimal_tricks, analysis_source)
+            - analysis_source is "dds" as for endplay: the values are exact
+        """
+        try:
+            solver, leader, trick = self._dds_ai._build_solver(state, position)
+            max_tricks, optimal = solver.optimal_moves(leader, trick)
+
+            user_bit = CARD_BIT[user_card]
+            if user_bit in optimal:
+                user_tricks = max_tricks
+            else:
+                user_tricks = solver.score_moves(leader, trick, [user_bit])[user_bit]
+
+            optimal_bits = set(optimal)
+            optimal_cards = [c for c in legal_cards if CARD_BIT[c] in optimal_bits]
+
+            return optimal_cards, user_tricks, max_tricks, "dds"
+
+        except SolverTimeout:
+            return self._analyze_with_minimax(state, position, user_card, legal_cards)
+        except Exception as e:
+            print(f"Solver analysis failed: {e}, falling back to Minimax")
+            return self._analyze_with_minimax(state, position, user_card, legal_cards)
+
     def _analyze_with_minimax(self, state: PlayState, position: str,
                                user_card: Card, legal_cards: List[Card]
                                ) -> Tuple[List[Card], int, int, str]:
@@ -1261,22 +1326,22 @@ class PlayFeedbackGenerator:
 
     def _store_feedback(self, user_id: int, feedback: PlayFeedback,
                         session_id: Optional[str], hand_number: Optional[int] = None):
-        """Store feedback in play_decisions table"""
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        try:
-            cursor.execute("""
-                INSERT INTO play_decisions (
-                    user_id, session_id, hand_number, position, trick_number,
-                    user_card, optimal_card, score, rating,
-                    tricks_cost, tricks_with_user_card, tricks_with_optimal,
-                    contract, is_declarer_side, play_category,
-                    key_concept, difficulty, feedback, helpful_hint,
-                    analysis_source, signal_reason, signal_heuristic,
-                    signal_context, is_signal_optimal, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """, (
+        """
+        Store feedback in play_decisions table (queued for the background
+        telemetry writer; the database default timestamps the row)
+        """
+        get_telemetry_writer().submit(
+            'play_decisions',
+            (
+                'user_id', 'session_id', 'hand_number', 'position', 'trick_number',
+                'user_card', 'optimal_card', 'score', 'rating',
+                'tricks_cost', 'tricks_with_user_card', 'tricks_with_optimal',
+                'contract', 'is_declarer_side', 'play_category',
+                'key_concept', 'difficulty', 'feedback', 'helpful_hint',
+                'analysis_source', 'signal_reason', 'signal_heuristic',
+                'signal_context', 'is_signal_optimal',
+            ),
+            (
                 user_id,
                 session_id,
                 hand_number,
@@ -1300,17 +1365,9 @@ class PlayFeedbackGenerator:
                 feedback.signal_reason,
                 feedback.signal_heuristic,
                 feedback.signal_context,
-                bool(feedback.is_signal_optimal)
-            ))
-
-            conn.commit()
-        except Exception as e:
-            print(f"Error storing play feedback: {e}")
-            import traceback
-            traceback.print_exc()
-            conn.rollback()
-        finally:
-            conn.close()
+                bool(feedback.is_signal_optimal),
+            )
+        )
 
 
 # Singleton instance
@@ -1322,8 +1379,8 @@ def get_play_feedback_generator(use_dds: bool = True) -> PlayFeedbackGenerator:
     Get singleton feedback generator instance.
 
     Args:
-        use_dds: If True, use DDS when available (Linux production).
-                 If False, always use Minimax fallback.
+        use_dds: If True, use DDS when available (endplay on Linux production,
+                 else the Python solver). If False, always use Minimax fallback.
 
     Returns:
         PlayFeedbackGenerator instance
@@ -179,6 +179,21 @@ class Hand:
 
         return cls(cards)
 
+    # =========================================================================
+    # Bitboard Support (see engine.bitboard)
+    # =========================================================================
+
+    def to_bitmask(self) -> int:
+        """Export the current cards as a 52-bit mask (13 bits per suit)."""
+        from engine.bitboard import cards_to_mask
+        return cards_to_mask(self.cards)
+
+    @classmethod
+    def from_bitmask(cls, mask: int, _skip_validation=False) -> 'Hand':
+        """Create a Hand from a 52-bit mask produced by to_bitmask()."""
+        from engine.bitboard import mask_to_cards
+        return cls(mask_to_cards(mask), _skip_validation=_skip_validation)
+
     def __repr__(self):
         """Return a detailed representation for debugging."""
         return f"Hand(pbn='{self.to_pbn()}', hcp={self.hcp}, shape={self.shape_string})"
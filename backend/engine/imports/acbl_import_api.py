@@ -20,7 +20,7 @@ import logging
 import tempfile
 import os
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from flask import request, jsonify, Flask
 import sys
 from pathlib import Path
@@ -50,6 +50,12 @@ from .acbl_audit_service import (
     AuditResult,
     TournamentAuditSummary
 )
+from engine.analysis.analysis_jobs import (
+    TOURNAMENT_ANALYSIS,
+    enqueue_tournament_analysis,
+    get_tournament_analysis_job
+)
+from core.job_worker import run_in_process_if_no_worker
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +104,180 @@ def get_content_hash(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()
 
 
+# =============================================================================
+# TOURNAMENT ANALYSIS (run by the job worker)
+# =============================================================================
+
+def analyze_tournament_hands(tournament_id: int, hero_position: str = 'S',
+                             progress: Optional[Callable] = None) -> Dict[str, Any]:
+    """
+    Run V3 engine analysis for all pending hands in a tournament.
+
+    This runs the comparison between tournament results and engine logic,
+    populating the audit columns for each hand. Each hand is committed as
+    soon as it is analyzed, so a retried job picks up where it stopped.
+
+    Args:
+        tournament_id: imported_tournaments.id
+        hero_position: Position whose hand is analyzed
+        progress: Optional callback progress(done, total)
+
+    Returns:
+        Dict with hands_analyzed, errors, alignment_rate, total_potential_savings
+    """
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Update tournament status
+            cursor.execute("""
+                UPDATE imported_tournaments
+                SET import_status = 'analyzing', import_error = NULL
+                WHERE id = ?
+            """, (tournament_id,))
+
+            # Get all pending hands
+            cursor.execute("""
+                SELECT id, hand_south, auction_history, vulnerability, dealer,
+                       contract_level, contract_strain, contract_doubled,
+                       tricks_taken, score_ns, board_number
+                FROM imported_hands
+                WHERE tournament_id = ? AND analysis_status = 'pending'
+                ORDER BY board_number
+            """, (tournament_id,))
+            hands = cursor.fetchall()
+
+        if progress:
+            progress(0, len(hands))
+
+        errors = []
+        for done, hand_row in enumerate(hands, 1):
+            hand_id = hand_row['id']
+            try:
+                # Create PBNHand object
+                pbn_hand = PBNHand(
+                    board_number=hand_row['board_number'],
+                    dealer=hand_row['dealer'] or 'N',
+                    vulnerability=hand_row['vulnerability'] or 'None',
+                    hands={hero_position: hand_row['hand_south'] or ''},
+                    auction_history=json.loads(hand_row['auction_history']) if hand_row['auction_history'] else [],
+                    contract_level=hand_row['contract_level'] or 0,
+                    contract_strain=hand_row['contract_strain'] or '',
+                    contract_doubled=hand_row['contract_doubled'] or 0,
+                    tricks_taken=hand_row['tricks_taken'] or 0,
+                    score_ns=hand_row['score_ns'] or 0
+                )
+
+                # Run V3 analysis
+                v3_result = analyze_pbn_hand_with_v3(pbn_hand, hero_position)
+
+                # Generate audit report
+                audit = generate_audit_report(pbn_hand, v3_result)
+
+            except Exception as e:
+                errors.append(f"Board {hand_row['board_number']}: {str(e)}")
+                with get_connection() as conn:
+                    conn.cursor().execute("""
+                        UPDATE imported_hands SET
+                            analysis_status = 'failed',
+                            analysis_error = ?
+                        WHERE id = ?
+                    """, (str(e), hand_id))
+
+            else:
+                # Update hand record
+                with get_connection() as conn:
+                    conn.cursor().execute("""
+                        UPDATE imported_hands SET
+                            optimal_bid = ?,
+                            matched_rule = ?,
+                            rule_tier = ?,
+                            theoretical_score = ?,
+                            panic_index = ?,
+                            survival_status = ?,
+                            rescue_action = ?,
+                            is_logic_aligned = ?,
+                            is_falsified = ?,
+                            score_delta = ?,
+                            potential_savings = ?,
+                            bidding_efficiency = ?,
+                            audit_category = ?,
+                            educational_feedback = ?,
+                            quadrant = ?,
+                            analysis_status = 'complete',
+                            analyzed_at = CURRENT_TIMESTAMP
+                        WHERE id = ?
+                    """, (
+                        audit.optimal_bid,
+                        audit.matched_rule,
+                        audit.rule_tier,
+                        audit.theoretical_score,
+                        audit.panic_index,
+                        audit.survival_status,
+                        audit.rescue_action,
+                        1 if audit.is_logic_aligned else 0,
+                        1 if audit.is_falsified else 0,
+                        audit.score_delta,
+                        audit.potential_savings,
+                        audit.bidding_efficiency,
+                        audit.audit_category,
+                        audit.educational_feedback,
+                        audit.quadrant,
+                        hand_id
+                    ))
+
+            if progress:
+                progress(done, len(hands))
+
+        with get_connection() as conn:
+            cursor = conn.cursor()
+
+            # Update tournament statistics (includes hands from earlier attempts)
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as total,
+                    SUM(CASE WHEN is_logic_aligned = 1 THEN 1 ELSE 0 END) as aligned,
+                    SUM(potential_savings) as savings,
+                    AVG(score_delta) as avg_delta
+                FROM imported_hands
+                WHERE tournament_id = ? AND analysis_status = 'complete'
+            """, (tournament_id,))
+
+            stats = cursor.fetchone()
+            total = stats['total']
+            savings = stats['savings'] or 0
+            avg_delta = float(stats['avg_delta'] or 0)
+
+            alignment_rate = (stats['aligned'] / total * 100) if total > 0 else 0
+
+            cursor.execute("""
+                UPDATE imported_tournaments SET
+                    import_status = 'complete',
+                    hands_analyzed = ?,
+                    alignment_rate = ?,
+                    total_potential_savings = ?,
+                    average_score_delta = ?,
+                    completed_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            """, (total, alignment_rate, savings, avg_delta, tournament_id))
+
+    except Exception as e:
+        # Leave the reason where get_import_status can show it; the job retries
+        with get_connection() as conn:
+            conn.cursor().execute("""
+                UPDATE imported_tournaments SET import_error = ? WHERE id = ?
+            """, (str(e), tournament_id))
+        raise
+
+    return {
+        'tournament_id': tournament_id,
+        'hands_analyzed': total,
+        'errors': errors[:10],
+        'alignment_rate': alignment_rate,
+        'total_potential_savings': savings,
+    }
+
+
 # =============================================================================
 # API ENDPOINT REGISTRATION
 # =============================================================================
@@ -858,12 +1038,18 @@ def register_acbl_import_endpoints(app: Flask):
     @app.route('/api/tournaments/<int:tournament_id>/analyze', methods=['POST'])
     def analyze_tournament(tournament_id: int):
         """
-        Trigger V3 engine analysis for all hands in a tournament.
+        Queue V3 engine analysis for all hands in a tournament.
 
-        This runs the comparison between tournament results and engine logic,
-        populating the audit columns for each hand.
+        The analysis runs in the background job worker; poll
+        GET /api/import-status/<id> for progress. Requesting analysis
+        again while a job is queued or running returns the same job.
 
-        Note: For production, this should be queued as a background job.
+        Returns (202):
+        {
+            "tournament_id": 1,
+            "job_id": 42,
+            "status": "queued"
+        }
         """
         try:
             data = request.get_json() or {}
@@ -872,142 +1058,39 @@ def register_acbl_import_endpoints(app: Flask):
             conn = get_connection()
             cursor = conn.cursor()
 
-            # Update tournament status
             cursor.execute("""
-                UPDATE imported_tournaments
-                SET import_status = 'analyzing'
-                WHERE id = ?
+                SELECT id FROM imported_tournaments WHERE id = ?
             """, (tournament_id,))
 
-            # Get all pending hands
-            cursor.execute("""
-                SELECT id, hand_south, auction_history, vulnerability, dealer,
-                       contract_level, contract_strain, contract_doubled,
-                       tricks_taken, score_ns, board_number
-                FROM imported_hands
-                WHERE tournament_id = ? AND analysis_status = 'pending'
-            """, (tournament_id,))
-
-            hands = cursor.fetchall()
-            analyzed_count = 0
-            errors = []
-
-            for hand_row in hands:
-                hand_id = hand_row[0]
-                try:
-                    # Create PBNHand object
-                    pbn_hand = PBNHand(
-                        board_number=hand_row[10],
-                        dealer=hand_row[4] or 'N',
-                        vulnerability=hand_row[3] or 'None',
-                        hands={hero_position: hand_row[1] or ''},
-                        auction_history=json.loads(hand_row[2]) if hand_row[2] else [],
-                        contract_level=hand_row[5] or 0,
-                        contract_strain=hand_row[6] or '',
-                        contract_doubled=hand_row[7] or 0,
-                        tricks_taken=hand_row[8] or 0,
-                        score_ns=hand_row[9] or 0
-                    )
-
-                    # Run V3 analysis
-                    v3_result = analyze_pbn_hand_with_v3(pbn_hand, hero_position)
-
-                    # Generate audit report
-                    audit = generate_audit_report(pbn_hand, v3_result)
-
-                    # Update hand record
-                    cursor.execute("""
-                        UPDATE imported_hands SET
-                            optimal_bid = ?,
-                            matched_rule = ?,
-                            rule_tier = ?,
-                            theoretical_score = ?,
-                            panic_index = ?,
-                            survival_status = ?,
-                            rescue_action = ?,
-                            is_logic_aligned = ?,
-                            is_falsified = ?,
-                            score_delta = ?,
-                            potential_savings = ?,
-                            bidding_efficiency = ?,
-                            audit_category = ?,
-                            educational_feedback = ?,
-                            quadrant = ?,
-                            analysis_status = 'complete',
-                            analyzed_at = CURRENT_TIMESTAMP
-                        WHERE id = ?
-                    """, (
-                        audit.optimal_bid,
-                        audit.matched_rule,
-                        audit.rule_tier,
-                        audit.theoretical_score,
-                        audit.panic_index,
-                        audit.survival_status,
-                        audit.rescue_action,
-                        1 if audit.is_logic_aligned else 0,
-                        1 if audit.is_falsified else 0,
-                        audit.score_delta,
-                        audit.potential_savings,
-                        audit.bidding_efficiency,
-                        audit.audit_category,
-                        audit.educational_feedback,
-                        audit.quadrant,
-                        hand_id
-                    ))
-
-                    analyzed_count += 1
-
-                except Exception as e:
-                    errors.append(f"Board {hand_row[10]}: {str(e)}")
-                    cursor.execute("""
-                        UPDATE imported_hands SET
-                            analysis_status = 'failed',
-                            analysis_error = ?
-                        WHERE id = ?
-                    """, (str(e), hand_id))
-
-            # Update tournament statistics
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN is_logic_aligned = 1 THEN 1 ELSE 0 END) as aligned,
-                    SUM(potential_savings) as savings,
-                    AVG(score_delta) as avg_delta
-                FROM imported_hands
-                WHERE tournament_id = ? AND analysis_status = 'complete'
-            """, (tournament_id,))
-
-            stats = cursor.fetchone()
-            total, aligned, savings, avg_delta = stats
+            if not cursor.fetchone():
+                cursor.close()
+                conn.close()
+                return jsonify({'error': 'Tournament not found'}), 404
 
-            alignment_rate = (aligned / total * 100) if total > 0 else 0
+            job_id = enqueue_tournament_analysis(tournament_id, hero_position)
 
+            # Update tournament status
             cursor.execute("""
-                UPDATE imported_tournaments SET
-                    import_status = 'complete',
-                    hands_analyzed = ?,
-                    alignment_rate = ?,
-                    total_potential_savings = ?,
-                    average_score_delta = ?,
-                    completed_at = CURRENT_TIMESTAMP
+                UPDATE imported_tournaments
+                SET import_status = 'analyzing', import_error = NULL
                 WHERE id = ?
-            """, (analyzed_count, alignment_rate, savings or 0, avg_delta or 0, tournament_id))
+            """, (tournament_id,))
 
             conn.commit()
             cursor.close()
             conn.close()
 
+            # No analysis worker running: analyze in a thread of this process
+            run_in_process_if_no_worker(TOURNAMENT_ANALYSIS)
+
             return jsonify({
                 'tournament_id': tournament_id,
-                'hands_analyzed': analyzed_count,
-                'errors': errors[:10],
-                'alignment_rate': alignment_rate,
-                'total_potential_savings': savings or 0,
-                'status': 'complete'
-            })
+                'job_id': job_id,
+                'status': 'queued'
+            }), 202
 
         except Exception as e:
-            logger.exception(f"Error analyzing tournament: {e}")
+            logger.exception(f"Error queueing tournament analysis: {e}")
             return jsonify({'error': str(e)}), 500
 
     # =========================================================================
@@ -1036,7 +1119,8 @@ def register_acbl_import_endpoints(app: Flask):
                 conn.close()
                 return jsonify({'error': 'Tournament not found'}), 404
 
-            # Get analysis status breakdown
+            # Get analysis status breakdown (hands are committed one by one
+            # while the job runs, so this is live progress)
             cursor.execute("""
                 SELECT analysis_status, COUNT(*) as count
                 FROM imported_hands
@@ -1046,19 +1130,29 @@ def register_acbl_import_endpoints(app: Flask):
 
             status_breakdown = {}
             for status_row in cursor.fetchall():
-                status_breakdown[status_row[0] or 'unknown'] = status_row[1]
+                status_breakdown[status_row['analysis_status'] or 'unknown'] = status_row['count']
 
             cursor.close()
             conn.close()
 
+            total_hands = row['total_hands'] or 0
+            hands_done = status_breakdown.get('complete', 0) + status_breakdown.get('failed', 0)
+
+            try:
+                job = get_tournament_analysis_job(tournament_id)
+            except Exception as e:
+                logger.warning(f"Could not load analysis job status: {e}")
+                job = None
+
             return jsonify({
                 'tournament_id': tournament_id,
-                'import_status': row[0],
-                'total_hands': row[1],
-                'hands_analyzed': row[2],
-                'import_error': row[3],
+                'import_status': row['import_status'],
+                'total_hands': total_hands,
+                'hands_analyzed': row['hands_analyzed'],
+                'import_error': row['import_error'],
                 'analysis_breakdown': status_breakdown,
-                'progress_percent': (row[2] / row[1] * 100) if row[1] > 0 else 0
+                'progress_percent': (hands_done / total_hands * 100) if total_hands > 0 else 0,
+                'job': job
             })
 
         except Exception as e:
@@ -24,6 +24,7 @@ from engine.learning.user_manager import get_user_manager
 from engine.learning.error_categorizer import get_error_categorizer
 from engine.learning.mistake_analyzer import get_mistake_analyzer
 from engine.learning.celebration_manager import get_celebration_manager
+from engine.learning import analytics_summary
 from engine.hand import Hand
 
 # Signal integrity auditor for deduction confidence scoring
@@ -34,7 +35,7 @@ from utils.seats import partner
 
 # Database abstraction layer
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-from db import get_connection, date_subtract, date_between
+from db import get_connection, date_subtract, date_between, scoped_connection
 
 
 
@@ -828,11 +829,17 @@ def get_recent_play_decisions_for_user(user_id: int, limit: int = 10) -> List[Di
         conn.close()
 
 
+@scoped_connection
 def get_dashboard():
     """
     GET /api/analytics/dashboard?user_id=<id>
     Get comprehensive dashboard summary
 
+    All helper queries share one pooled connection (see db.connection_scope).
+    Aggregate stats come from the user's incrementally maintained summary
+    (engine/learning/analytics_summary.py); the live queries below are the
+    fallback when the summary tables are unavailable.
+
     Returns:
         - Insight summary (patterns, trends, growth areas)
         - Recent wins
@@ -855,24 +862,31 @@ def get_dashboard():
         # Get user stats (bidding)
         user_stats = user_manager.get_user_stats(user_id)
 
-        # Get gameplay stats
-        gameplay_stats = get_gameplay_stats_for_user(user_id)
+        summary_stats = analytics_summary.get_dashboard_stats(user_id)
+        if summary_stats:
+            gameplay_stats = summary_stats['gameplay_stats']
+            bidding_feedback_stats = summary_stats['bidding_feedback_stats']
+            play_feedback_stats = summary_stats['play_feedback_stats']
+            bidding_analysis_stats = summary_stats['bidding_analysis']
+        else:
+            # Get gameplay stats
+            gameplay_stats = get_gameplay_stats_for_user(user_id)
 
-        # Get bidding feedback stats (Phase 1)
-        bidding_feedback_stats = get_bidding_feedback_stats_for_user(user_id)
+            # Get bidding feedback stats (Phase 1)
+            bidding_feedback_stats = get_bidding_feedback_stats_for_user(user_id)
+
+            # Get play feedback stats (DDS-based evaluation)
+            play_feedback_stats = get_play_feedback_stats_for_user(user_id)
+
+            # Get bidding analysis stats (quadrant/efficiency from AnalysisEngine)
+            bidding_analysis_stats = get_bidding_analysis_stats_for_user(user_id)
 
         # Get recent bidding decisions (Phase 1)
         recent_decisions = get_recent_bidding_decisions_for_user(user_id, limit=10)
 
-        # Get play feedback stats (DDS-based evaluation)
-        play_feedback_stats = get_play_feedback_stats_for_user(user_id)
-
         # Get recent play decisions
         recent_play_decisions = get_recent_play_decisions_for_user(user_id, limit=10)
 
-        # Get bidding analysis stats (quadrant/efficiency from AnalysisEngine)
-        bidding_analysis_stats = get_bidding_analysis_stats_for_user(user_id)
-
         # Get recent analyzed hands for quadrant chart
         recent_analyzed_hands = get_recent_analyzed_hands_for_user(user_id, limit=20)
 
@@ -4149,6 +4163,10 @@ def register_analytics_endpoints(app):
         register_analytics_endpoints(app)
     """
 
+    # Keep dashboard summaries current as decisions are logged
+    from core.telemetry_writer import get_telemetry_writer
+    analytics_summary.install(get_telemetry_writer())
+
     # Practice recording
     app.route('/api/practice/record', methods=['POST'])(record_practice)
     app.route('/api/practice/recommended', methods=['GET'])(get_practice_recommended)
@@ -0,0 +1,895 @@
+"""
+Analytics Summary - Incrementally maintained per-user dashboard aggregates
+
+Manages:
+- Per-user hand counters (user_analytics_summary): declarer/defender/dummy
+  counts, made/failed, running sums for averages, quadrant and bidding
+  efficiency counts, and the last-20 declarer results
+- Per-day decision counters (user_decision_daily) for bidding and play,
+  so 30-day stats and the 7-day trend are sums over at most 30 rows
+- Incremental updates in the same transaction as the rows they summarize:
+  telemetry batches (bidding_decisions, play_decisions), new session_hands
+  rows, and analysis updates to session_hands
+- Backfill and a consistency check against the source tables
+
+The dashboard reads a user's summary only once it is marked complete
+(backfilled); a user without one is backfilled on first view. If an
+incremental update fails, the user is marked incomplete and rebuilt on the
+next view instead of serving drifted numbers.
+
+Windows use day granularity: "last 30 days" covers whole calendar days,
+so it can include up to one day more than the NOW() - INTERVAL queries.
+
+Usage:
+    python -m engine.learning.analytics_summary backfill [--user ID]
+    python -m engine.learning.analytics_summary check [--user ID]
+"""
+
+import argparse
+import json
+import sys
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+# Database abstraction layer
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from db import get_connection
+
+
+RECENT_DECLARER_WINDOW = 20
+STATS_WINDOW_DAYS = 30
+TREND_WINDOW_DAYS = 7
+
+# Hand counters in user_analytics_summary (everything except the rolling list)
+HAND_COUNTERS = (
+    'hands_recorded', 'declarer_hands', 'contracts_made', 'contracts_failed',
+    'declarer_tricks_sum', 'declarer_tricks_count', 'defender_hands', 'dummy_hands',
+    'analyzed_hands', 'q1_count', 'q2_count', 'q3_count', 'q4_count',
+    'efficiency_rated', 'optimal_bids', 'underbids', 'overbids',
+    'points_left_sum', 'underbid_points_sum', 'underbid_points_count',
+    'tricks_vs_dd_sum', 'tricks_vs_dd_count', 'score_vs_par_sum', 'score_vs_par_count',
+)
+
+# Counters in user_decision_daily
+DECISION_COUNTERS = (
+    'decisions', 'score_sum', 'optimal_count', 'acceptable_count', 'good_count',
+    'suboptimal_count', 'error_count', 'blunder_count', 'critical_count',
+    'tricks_cost_sum', 'tricks_cost_count', 'hands',
+)
+
+# Columns a session_hands row needs for hand_contribution()
+HAND_FIELDS = (
+    'contract_level', 'tricks_taken', 'made', 'hand_score', 'user_was_declarer',
+    'user_was_dummy', 'quadrant', 'bid_efficiency', 'points_left_on_table',
+    'dd_tricks', 'par_score',
+)
+
+DECISION_TABLES = {'bidding_decisions': 'bidding', 'play_decisions': 'play'}
+
+PLAY_CATEGORY_NAMES = {
+    'opening_lead': 'Opening Leads',
+    'following_suit': 'Following Suit',
+    'discarding': 'Discarding',
+    'trumping': 'Trumping',
+    'overruffing': 'Overruffing',
+    'sluffing': 'Sluff vs Ruff',
+    'finessing': 'Finessing',
+    'cashing': 'Cashing Winners',
+    'hold_up': 'Hold-up Plays',
+    'ducking': 'Ducking'
+}
+
+
+def _raw(cursor):
+    """
+    Unwrap a db.CursorWrapper. Summary statements run on the raw psycopg2
+    cursor: the wrapper's INSERT ... RETURNING id retry would roll back the
+    whole transaction on these id-less tables.
+    """
+    return cursor._cursor if hasattr(cursor, '_cursor') else cursor
+
+
+def _is_true(value) -> bool:
+    return value is not None and bool(value)
+
+
+def _is_false(value) -> bool:
+    return value is not None and not bool(value)
+
+
+# ============================================================================
+# Contributions (what one source row adds to the counters)
+# ============================================================================
+
+def hand_contribution(hand: Dict) -> Dict[str, float]:
+    """
+    Counter deltas for one session_hands row.
+
+    Mirrors the SQL in get_gameplay_stats_for_user and v_user_analysis_stats
+    (NULL-aware: a NULL made counts as neither made nor failed).
+    """
+    delta = {name: 0 for name in HAND_COUNTERS}
+    delta['hands_recorded'] = 1
+
+    has_contract = hand.get('contract_level') is not None
+    declarer = _is_true(hand.get('user_was_declarer'))
+    tricks = hand.get('tricks_taken')
+
+    if has_contract and declarer:
+        delta['declarer_hands'] = 1
+        delta['contracts_made'] = 1 if _is_true(hand.get('made')) else 0
+        delta['contracts_failed'] = 1 if _is_false(hand.get('made')) else 0
+        if tricks is not None:
+            delta['declarer_tricks_sum'] = tricks
+            delta['declarer_tricks_count'] = 1
+    if (has_contract and _is_false(hand.get('user_was_declarer'))
+            and _is_false(hand.get('user_was_dummy'))):
+        delta['defender_hands'] = 1
+    if has_contract and _is_true(hand.get('user_was_dummy')):
+        delta['dummy_hands'] = 1
+
+    quadrant = hand.get('quadrant')
+    if quadrant is not None:
+        delta['analyzed_hands'] = 1
+        if quadrant in ('Q1', 'Q2', 'Q3', 'Q4'):
+            delta[f'{quadrant.lower()}_count'] = 1
+
+    efficiency = hand.get('bid_efficiency')
+    if efficiency is not None:
+        delta['efficiency_rated'] = 1
+        if efficiency == 'optimal':
+            delta['optimal_bids'] = 1
+        elif efficiency == 'underbid':
+            delta['underbids'] = 1
+        elif efficiency == 'overbid':
+            delta['overbids'] = 1
+
+    points_left = hand.get('points_left_on_table')
+    if points_left is not None:
+        delta['points_left_sum'] = points_left
+        if points_left > 0:
+            delta['underbid_points_sum'] = points_left
+            delta['underbid_points_count'] = 1
+
+    if hand.get('dd_tricks') is not None and tricks is not None:
+        delta['tricks_vs_dd_sum'] = tricks - hand['dd_tricks']
+        delta['tricks_vs_dd_count'] = 1
+    if hand.get('par_score') is not None and hand.get('hand_score') is not None:
+        delta['score_vs_par_sum'] = hand['hand_score'] - hand['par_score']
+        delta['score_vs_par_count'] = 1
+
+    return delta
+
+
+def decision_contributions(kind: str, row: Dict) -> Dict[tuple, Dict[str, float]]:
+    """
+    Counter deltas for one bidding/play decision, keyed by
+    (category, day). Play decisions also count toward their category row.
+    """
+    day = _as_date(row.get('timestamp'))
+    if day is None:
+        return {}
+
+    rating = row.get('correctness') if kind == 'bidding' else row.get('rating')
+    delta = {name: 0 for name in DECISION_COUNTERS}
+    delta['decisions'] = 1
+    delta['score_sum'] = row.get('score') or 0
+    if rating in ('optimal', 'acceptable', 'good', 'suboptimal', 'error', 'blunder'):
+        delta[f'{rating}_count'] = 1
+    if kind == 'bidding' and row.get('impact') == 'critical':
+        delta['critical_count'] = 1
+    if row.get('tricks_cost') is not None:
+        delta['tricks_cost_sum'] = row['tricks_cost']
+        delta['tricks_cost_count'] = 1
+
+    contributions = {('', day): delta}
+    if kind == 'play' and row.get('play_category'):
+        contributions[(row['play_category'], day)] = dict(delta)
+    return contributions
+
+
+def _hand_key(row: Dict) -> str:
+    """Same key as the COUNT(DISTINCT session_id || ':' || hand_number) query."""
+    session_id = row.get('session_id')
+    hand_number = row.get('hand_number')
+    return f"{'' if session_id is None else session_id}:{-1 if hand_number is None else hand_number}"
+
+
+def _as_date(value) -> Optional[date]:
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    return None
+
+
+# ============================================================================
+# Incremental updates
+# ============================================================================
+
+def _lock_users(raw_cursor, user_ids: Iterable[int]):
+    """
+    Create (if needed) and row-lock each user's summary, in user_id order.
+
+    Backfill takes the same lock, so an incremental update either lands
+    before a rebuild reads the source tables or after it has written.
+    """
+    for user_id in sorted(set(user_ids)):
+        raw_cursor.execute(
+            "INSERT INTO user_analytics_summary (user_id) VALUES (%s) ON CONFLICT (user_id) DO NOTHING",
+            (user_id,))
+        raw_cursor.execute(
+            "SELECT user_id FROM user_analytics_summary WHERE user_id = %s FOR UPDATE",
+            (user_id,))
+
+
+def _guarded(raw_cursor, user_ids, update):
+    """
+    Run update() inside a savepoint. A summary failure must never lose the
+    row being logged: roll back just the summary changes and mark the users
+    incomplete so their summaries are rebuilt on next read.
+    """
+    raw_cursor.execute("SAVEPOINT analytics_summary")
+    try:
+        update()
+        raw_cursor.execute("RELEASE SAVEPOINT analytics_summary")
+    except Exception as e:
+        raw_cursor.execute("ROLLBACK TO SAVEPOINT analytics_summary")
+        print(f"⚠️  Analytics summary update failed, will rebuild: {e}")
+        try:
+            raw_cursor.execute("SAVEPOINT analytics_summary")
+            raw_cursor.execute(
+                "UPDATE user_analytics_summary SET complete = FALSE WHERE user_id = ANY(%s)",
+                (sorted(set(user_ids)),))
+            raw_cursor.execute("RELEASE SAVEPOINT analytics_summary")
+        except Exception:
+            raw_cursor.execute("ROLLBACK TO SAVEPOINT analytics_summary")
+
+
+def _add_hand_counters(raw_cursor, user_id: int, delta: Dict[str, float]):
+    changed = [name for name in HAND_COUNTERS if delta.get(name)]
+    if not changed:
+        return
+    assignments = ', '.join(f"{name} = {name} + %s" for name in changed)
+    raw_cursor.execute(
+        f"UPDATE user_analytics_summary SET {assignments}, updated_at = CURRENT_TIMESTAMP "
+        f"WHERE user_id = %s",
+        [delta[name] for name in changed] + [user_id])
+
+
+def _add_decision_counters(raw_cursor, user_id: int, kind: str, category: str,
+                           day: date, delta: Dict[str, float]):
+    columns = ', '.join(DECISION_COUNTERS)
+    placeholders = ', '.join(['%s'] * len(DECISION_COUNTERS))
+    updates = ', '.join(
+        f"{name} = user_decision_daily.{name} + EXCLUDED.{name}" for name in DECISION_COUNTERS)
+    raw_cursor.execute(
+        f"INSERT INTO user_decision_daily (user_id, kind, category, day, {columns}) "
+        f"VALUES (%s, %s, %s, %s, {placeholders}) "
+        f"ON CONFLICT (user_id, kind, category, day) DO UPDATE SET {updates}",
+        [user_id, kind, category, day] + [delta[name] for name in DECISION_COUNTERS])
+
+
+def apply_decision_rows(cursor, table: str, columns, rows):
+    """
+    Telemetry writer insert hook: fold a batch of bidding_decisions /
+    play_decisions rows into the per-day counters.
+
+    Rows logged without a timestamp got the column default; CURRENT_TIMESTAMP
+    is fixed for the transaction, so reading it here gives their value.
+    """
+    kind = DECISION_TABLES.get(table)
+    if kind is None:
+        return
+    records = [dict(zip(columns, row)) for row in rows]
+    records = [r for r in records if r.get('user_id') is not None]
+    if not records:
+        return
+    raw_cursor = _raw(cursor)
+    if 'timestamp' not in columns:
+        raw_cursor.execute("SELECT CURRENT_TIMESTAMP::timestamp AS now")
+        now = raw_cursor.fetchone()['now']
+        for record in records:
+            record['timestamp'] = now
+    user_ids = [r['user_id'] for r in records]
+
+    def update():
+        _lock_users(raw_cursor, user_ids)
+        buckets = defaultdict(lambda: {name: 0 for name in DECISION_COUNTERS})
+        for record in records:
+            for (category, day), delta in decision_contributions(kind, record).items():
+                bucket = buckets[(record['user_id'], category, day)]
+                for name in DECISION_COUNTERS:
+                    bucket[name] += delta[name]
+            if kind == 'bidding':
+                day = _as_date(record.get('timestamp'))
+                if day is None:
+                    continue
+                raw_cursor.execute(
+                    "INSERT INTO user_decision_hands (user_id, kind, hand_key, first_day) "
+                    "VALUES (%s, %s, %s, %s) ON CONFLICT DO NOTHING",
+                    (record['user_id'], kind, _hand_key(record), day))
+                if raw_cursor.rowcount == 1:
+                    buckets[(record['user_id'], '', day)]['hands'] += 1
+        for (user_id, category, day), delta in sorted(buckets.items()):
+            _add_decision_counters(raw_cursor, user_id, kind, category, day, delta)
+
+    _guarded(raw_cursor, user_ids, update)
+
+
+def record_hand(cursor, user_id: Optional[int], hand: Dict):
+    """Fold a newly inserted session_hands row into the user's counters."""
+    if user_id is None:
+        return
+    raw_cursor = _raw(cursor)
+
+    def update():
+        _lock_users(raw_cursor, [user_id])
+        _add_hand_counters(raw_cursor, user_id, hand_contribution(hand))
+        if (hand.get('contract_level') is not None
+                and _is_true(hand.get('user_was_declarer'))):
+            raw_cursor.execute(
+                "SELECT recent_declarer_results FROM user_analytics_summary WHERE user_id = %s",
+                (user_id,))
+            recent = json.loads(raw_cursor.fetchone()['recent_declarer_results'] or '[]')
+            recent = (recent + [_is_true(hand.get('made'))])[-RECENT_DECLARER_WINDOW:]
+            raw_cursor.execute(
+                "UPDATE user_analytics_summary SET recent_declarer_results = %s WHERE user_id = %s",
+                (json.dumps(recent), user_id))
+
+    _guarded(raw_cursor, [user_id], update)
+
+
+def fetch_hand_for_update(cursor, session_hand_id: int) -> Optional[Dict]:
+    """
+    Read (and lock) a session_hands row's summary fields plus its user_id,
+    before an update, so record_hand_update() can apply the difference.
+    """
+    raw_cursor = _raw(cursor)
+    raw_cursor.execute(
+        f"SELECT gs.user_id, {', '.join('sh.' + f for f in HAND_FIELDS)} "
+        f"FROM session_hands sh JOIN game_sessions gs ON sh.session_id = gs.id "
+        f"WHERE sh.id = %s FOR UPDATE OF sh",
+        (session_hand_id,))
+    row = raw_cursor.fetchone()
+    return dict(row) if row else None
+
+
+def record_hand_update(cursor, before: Optional[Dict], after: Dict):
+    """Apply the counter difference between two versions of a session_hands row."""
+    if not before or before.get('user_id') is None:
+        return
+    user_id = before['user_id']
+    old, new = hand_contribution(before), hand_contribution(after)
+    delta = {name: new[name] - old[name] for name in HAND_COUNTERS}
+    raw_cursor = _raw(cursor)
+
+    def update():
+        _lock_users(raw_cursor, [user_id])
+        _add_hand_counters(raw_cursor, user_id, delta)
+
+    _guarded(raw_cursor, [user_id], update)
+
+
+def install(writer):
+    """Keep summaries current for decisions logged through the telemetry writer."""
+    writer.add_insert_hook(apply_decision_rows)
+
+
+# ============================================================================
+# Recomputation from the source tables (backfill / consistency check)
+# ============================================================================
+
+_HAND_TOTALS_SQL = """
+    SELECT
+        COUNT(*) AS hands_recorded,
+        SUM(CASE WHEN sh.user_was_declarer = TRUE AND sh.contract_level IS NOT NULL THEN 1 ELSE 0 END) AS declarer_hands,
+        SUM(CASE WHEN sh.user_was_declarer = TRUE AND sh.contract_level IS NOT NULL AND sh.made = TRUE THEN 1 ELSE 0 END) AS contracts_made,
+        SUM(CASE WHEN sh.user_was_declarer = TRUE AND sh.contract_level IS NOT NULL AND sh.made = FALSE THEN 1 ELSE 0 END) AS contracts_failed,
+        SUM(CASE WHEN sh.user_was_declarer = TRUE AND sh.contract_level IS NOT NULL THEN COALESCE(sh.tricks_taken, 0) ELSE 0 END) AS declarer_tricks_sum,
+        SUM(CASE WHEN sh.user_was_declarer = TRUE AND sh.contract_level IS NOT NULL AND sh.tricks_taken IS NOT NULL THEN 1 ELSE 0 END) AS declarer_tricks_count,
+        SUM(CASE WHEN sh.user_was_declarer = FALSE AND sh.user_was_dummy = FALSE AND sh.contract_level IS NOT NULL THEN 1 ELSE 0 END) AS defender_hands,
+        SUM(CASE WHEN sh.user_was_dummy = TRUE AND sh.contract_level IS NOT NULL THEN 1 ELSE 0 END) AS dummy_hands,
+        SUM(CASE WHEN sh.quadrant IS NOT NULL THEN 1 ELSE 0 END) AS analyzed_hands,
+        SUM(CASE WHEN sh.quadrant = 'Q1' THEN 1 ELSE 0 END) AS q1_count,
+        SUM(CASE WHEN sh.quadrant = 'Q2' THEN 1 ELSE 0 END) AS q2_count,
+        SUM(CASE WHEN sh.quadrant = 'Q3' THEN 1 ELSE 0 END) AS q3_count,
+        SUM(CASE WHEN sh.quadrant = 'Q4' THEN 1 ELSE 0 END) AS q4_count,
+        SUM(CASE WHEN sh.bid_efficiency IS NOT NULL THEN 1 ELSE 0 END) AS efficiency_rated,
+        SUM(CASE WHEN sh.bid_efficiency = 'optimal' THEN 1 ELSE 0 END) AS optimal_bids,
+        SUM(CASE WHEN sh.bid_efficiency = 'underbid' THEN 1 ELSE 0 END) AS underbids,
+        SUM(CASE WHEN sh.bid_efficiency = 'overbid' THEN 1 ELSE 0 END) AS overbids,
+        SUM(COALESCE(sh.points_left_on_table, 0)) AS points_left_sum,
+        SUM(CASE WHEN sh.points_left_on_table > 0 THEN sh.points_left_on_table ELSE 0 END) AS underbid_points_sum,
+        SUM(CASE WHEN sh.points_left_on_table > 0 THEN 1 ELSE 0 END) AS underbid_points_count,
+        SUM(CASE WHEN sh.dd_tricks IS NOT NULL AND sh.tricks_taken IS NOT NULL THEN sh.tricks_taken - sh.dd_tricks ELSE 0 END) AS tricks_vs_dd_sum,
+        SUM(CASE WHEN sh.dd_tricks IS NOT NULL AND sh.tricks_taken IS NOT NULL THEN 1 ELSE 0 END) AS tricks_vs_dd_count,
+        SUM(CASE WHEN sh.par_score IS NOT NULL AND sh.hand_score IS NOT NULL THEN sh.hand_score - sh.par_score ELSE 0 END) AS score_vs_par_sum,
+        SUM(CASE WHEN sh.par_score IS NOT NULL AND sh.hand_score IS NOT NULL THEN 1 ELSE 0 END) AS score_vs_par_count
+    FROM session_hands sh
+    JOIN game_sessions gs ON sh.session_id = gs.id
+    WHERE gs.user_id = %s
+"""
+
+_RECENT_DECLARER_SQL = """
+    SELECT made
+    FROM session_hands sh
+    JOIN game_sessions gs ON sh.session_id = gs.id
+    WHERE gs.user_id = %s
+      AND sh.user_was_declarer = TRUE
+      AND sh.contract_level IS NOT NULL
+    ORDER BY sh.played_at DESC
+    LIMIT %s
+"""
+
+_BIDDING_DAILY_SQL = """
+    SELECT
+        '' AS category,
+        CAST(timestamp AS DATE) AS day,
+        COUNT(*) AS decisions,
+        SUM(CAST(score AS DOUBLE PRECISION)) AS score_sum,
+        SUM(CASE WHEN correctness = 'optimal' THEN 1 ELSE 0 END) AS optimal_count,
+        SUM(CASE WHEN correctness = 'acceptable' THEN 1 ELSE 0 END) AS acceptable_count,
+        SUM(CASE WHEN correctness = 'good' THEN 1 ELSE 0 END) AS good_count,
+        SUM(CASE WHEN correctness = 'suboptimal' THEN 1 ELSE 0 END) AS suboptimal_count,
+        SUM(CASE WHEN correctness = 'error' THEN 1 ELSE 0 END) AS error_count,
+        SUM(CASE WHEN correctness = 'blunder' THEN 1 ELSE 0 END) AS blunder_count,
+        SUM(CASE WHEN impact = 'critical' THEN 1 ELSE 0 END) AS critical_count,
+        0 AS tricks_cost_sum,
+        0 AS tricks_cost_count
+    FROM bidding_decisions
+    WHERE user_id = %s AND timestamp IS NOT NULL
+    GROUP BY CAST(timestamp AS DATE)
+"""
+
+_PLAY_DAILY_SQL = """
+    SELECT
+        {category} AS category,
+        CAST(timestamp AS DATE) AS day,
+        COUNT(*) AS decisions,
+        SUM(CAST(score AS DOUBLE PRECISION)) AS score_sum,
+        SUM(CASE WHEN rating = 'optimal' THEN 1 ELSE 0 END) AS optimal_count,
+        SUM(CASE WHEN rating = 'acceptable' THEN 1 ELSE 0 END) AS acceptable_count,
+        SUM(CASE WHEN rating = 'good' THEN 1 ELSE 0 END) AS good_count,
+        SUM(CASE WHEN rating = 'suboptimal' THEN 1 ELSE 0 END) AS suboptimal_count,
+        SUM(CASE WHEN rating = 'error' THEN 1 ELSE 0 END) AS error_count,
+        SUM(CASE WHEN rating = 'blunder' THEN 1 ELSE 0 END) AS blunder_count,
+        0 AS critical_count,
+        SUM(COALESCE(tricks_cost, 0)) AS tricks_cost_sum,
+        SUM(CASE WHEN tricks_cost IS NOT NULL THEN 1 ELSE 0 END) AS tricks_cost_count
+    FROM play_decisions
+    WHERE user_id = %s AND timestamp IS NOT NULL {where}
+    GROUP BY {group}
+"""
+
+_BIDDING_HANDS_SQL = """
+    SELECT
+        COALESCE(CAST(session_id AS TEXT), '') || ':' || CAST(COALESCE(hand_number, -1) AS TEXT) AS hand_key,
+        MIN(CAST(timestamp AS DATE)) AS first_day
+    FROM bidding_decisions
+    WHERE user_id = %s AND timestamp IS NOT NULL
+    GROUP BY 1
+"""
+
+
+def compute_user_summary(cursor, user_id: int) -> Dict:
+    """
+    Recompute a user's summary from the source tables.
+
+    Returns:
+        {'hand': {counter: value, 'recent_declarer_results': [...]},
+         'daily': {(kind, category, day): {counter: value}},
+         'hands': {hand_key: first_day}}
+    """
+    raw_cursor = _raw(cursor)
+
+    raw_cursor.execute(_HAND_TOTALS_SQL, (user_id,))
+    totals = raw_cursor.fetchone() or {}
+    hand = {name: _number(totals.get(name)) for name in HAND_COUNTERS}
+    raw_cursor.execute(_RECENT_DECLARER_SQL, (user_id, RECENT_DECLARER_WINDOW))
+    hand['recent_declarer_results'] = [
+        _is_true(row['made']) for row in reversed(raw_cursor.fetchall())
+    ]
+
+    daily = {}
+    queries = [
+        ('bidding', _BIDDING_DAILY_SQL),
+        ('play', _PLAY_DAILY_SQL.format(
+            category="''", where='', group='CAST(timestamp AS DATE)')),
+        ('play', _PLAY_DAILY_SQL.format(
+            category='play_category', where='AND play_category IS NOT NULL',
+            group='play_category, CAST(timestamp AS DATE)')),
+    ]
+    for kind, sql in queries:
+        raw_cursor.execute(sql, (user_id,))
+        for row in raw_cursor.fetchall():
+            counters = {name: _number(row.get(name)) for name in DECISION_COUNTERS if name != 'hands'}
+            counters['hands'] = 0
+            daily[(kind, row['category'], row['day'])] = counters
+
+    raw_cursor.execute(_BIDDING_HANDS_SQL, (user_id,))
+    hands = {row['hand_key']: row['first_day'] for row in raw_cursor.fetchall()}
+    for first_day in hands.values():
+        key = ('bidding', '', first_day)
+        if key not in daily:  # Every hand has a decision that day, but be safe
+            daily[key] = {name: 0 for name in DECISION_COUNTERS}
+        daily[key]['hands'] += 1
+
+    return {'hand': hand, 'daily': daily, 'hands': hands}
+
+
+def _number(value):
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+def load_user_summary(cursor, user_id: int) -> Optional[Dict]:
+    """Read a user's stored summary, in compute_user_summary()'s shape (None if absent)."""
+    raw_cursor = _raw(cursor)
+    raw_cursor.execute("SELECT * FROM user_analytics_summary WHERE user_id = %s", (user_id,))
+    row = raw_cursor.fetchone()
+    if not row:
+        return None
+    hand = {name: _number(row[name]) for name in HAND_COUNTERS}
+    hand['recent_declarer_results'] = json.loads(row['recent_declarer_results'] or '[]')
+
+    raw_cursor.execute(
+        f"SELECT kind, category, day, {', '.join(DECISION_COUNTERS)} "
+        f"FROM user_decision_daily WHERE user_id = %s",
+        (user_id,))
+    daily = {
+        (r['kind'], r['category'], r['day']): {name: _number(r[name]) for name in DECISION_COUNTERS}
+        for r in raw_cursor.fetchall()
+    }
+
+    raw_cursor.execute(
+        "SELECT hand_key, first_day FROM user_decision_hands WHERE user_id = %s",
+        (user_id,))
+    hands = {r['hand_key']: r['first_day'] for r in raw_cursor.fetchall()}
+
+    return {'hand': hand, 'daily': daily, 'hands': hands, 'complete': row['complete']}
+
+
+def backfill_user(cursor, user_id: int):
+    """Rebuild one user's summary from the source tables and mark it complete."""
+    raw_cursor = _raw(cursor)
+    _lock_users(raw_cursor, [user_id])
+    summary = compute_user_summary(cursor, user_id)
+
+    hand = summary['hand']
+    assignments = ', '.join(f"{name} = %s" for name in HAND_COUNTERS)
+    raw_cursor.execute(
+        f"UPDATE user_analytics_summary SET {assignments}, recent_declarer_results = %s, "
+        f"complete = TRUE, updated_at = CURRENT_TIMESTAMP WHERE user_id = %s",
+        [hand[name] for name in HAND_COUNTERS]
+        + [json.dumps(hand['recent_declarer_results']), user_id])
+
+    raw_cursor.execute("DELETE FROM user_decision_daily WHERE user_id = %s", (user_id,))
+    for (kind, category, day), counters in sorted(summary['daily'].items()):
+        _add_decision_counters(raw_cursor, user_id, kind, category, day, counters)
+
+    raw_cursor.execute("DELETE FROM user_decision_hands WHERE user_id = %s", (user_id,))
+    for hand_key, first_day in summary['hands'].items():
+        raw_cursor.execute(
+            "INSERT INTO user_decision_hands (user_id, kind, hand_key, first_day) "
+            "VALUES (%s, 'bidding', %s, %s)",
+            (user_id, hand_key, first_day))
+
+
+def diff_summaries(expected: Dict, actual: Optional[Dict]) -> List[str]:
+    """Human-readable differences between a recomputed and a stored summary."""
+    if actual is None:
+        return ['summary missing']
+    problems = []
+    for name, value in expected['hand'].items():
+        if not _close(value, actual['hand'].get(name)):
+            problems.append(f"{name}: stored {actual['hand'].get(name)!r}, expected {value!r}")
+    zero = {name: 0 for name in DECISION_COUNTERS}
+    for key in sorted(set(expected['daily']) | set(actual['daily']), key=str):
+        want, have = expected['daily'].get(key, zero), actual['daily'].get(key, zero)
+        for name in DECISION_COUNTERS:
+            if not _close(want[name], have[name]):
+                kind, category, day = key
+                label = f"{kind}/{category or 'all'}/{day}"
+                problems.append(f"{label} {name}: stored {have[name]!r}, expected {want[name]!r}")
+    missing = set(expected['hands']) - set(actual['hands'])
+    extra = set(actual['hands']) - set(expected['hands'])
+    if missing or extra:
+        problems.append(f"bid hands: {len(missing)} missing, {len(extra)} unexpected")
+    return problems
+
+
+def _close(a, b) -> bool:
+    if isinstance(a, list) or isinstance(b, list):
+        return a == b
+    a, b = a or 0, b or 0
+    return abs(a - b) <= 1e-6 * max(1.0, abs(a), abs(b))
+
+
+def check_user(cursor, user_id: int) -> List[str]:
+    """Compare a user's stored summary with a fresh recomputation."""
+    return diff_summaries(compute_user_summary(cursor, user_id), load_user_summary(cursor, user_id))
+
+
+def _all_user_ids(cursor) -> List[int]:
+    raw_cursor = _raw(cursor)
+    raw_cursor.execute("""
+        SELECT user_id FROM bidding_decisions
+        UNION SELECT user_id FROM play_decisions
+        UNION SELECT user_id FROM game_sessions WHERE user_id IS NOT NULL
+        UNION SELECT user_id FROM user_analytics_summary
+    """)
+    return sorted(row['user_id'] for row in raw_cursor.fetchall())
+
+
+# ============================================================================
+# Dashboard views built from a summary (same shapes as analytics_api)
+# ============================================================================
+
+def _window(daily: Dict, kind: str, category: str, start: date, end: Optional[date] = None) -> Dict:
+    totals = {name: 0 for name in DECISION_COUNTERS}
+    for (k, c, day), counters in daily.items():
+        if k == kind and c == category and day >= start and (end is None or day < end):
+            for name in DECISION_COUNTERS:
+                totals[name] += counters[name]
+    return totals
+
+
+def _trend(daily: Dict, kind: str, today: date) -> str:
+    recent = _window(daily, kind, '', today - timedelta(days=TREND_WINDOW_DAYS))
+    previous = _window(daily, kind, '', today - timedelta(days=2 * TREND_WINDOW_DAYS),
+                       today - timedelta(days=TREND_WINDOW_DAYS))
+    recent_avg = recent['score_sum'] / recent['decisions'] if recent['decisions'] else 0
+    previous_avg = previous['score_sum'] / previous['decisions'] if previous['decisions'] else 0
+    if previous_avg == 0:
+        return 'stable'
+    if recent_avg > previous_avg + 0.3:
+        return 'improving'
+    if recent_avg < previous_avg - 0.3:
+        return 'declining'
+    return 'stable'
+
+
+def bidding_feedback_stats(summary: Dict, today: date) -> Dict:
+    """Summary-backed get_bidding_feedback_stats_for_user()."""
+    window = _window(summary['daily'], 'bidding', '', today - timedelta(days=STATS_WINDOW_DAYS))
+    total = window['decisions']
+    if total == 0:
+        return {
+            'avg_score': 0,
+            'total_decisions': 0,
+            'total_hands_bid': 0,
+            'optimal_rate': 0,
+            'acceptable_rate': 0,
+            'good_rate': 0,
+            'suboptimal_rate': 0,
+            'error_rate': 0,
+            'critical_errors': 0,
+            'recent_trend': 'stable'
+        }
+    optimal_rate = window['optimal_count'] / total
+    acceptable_rate = window['acceptable_count'] / total
+    return {
+        'avg_score': round(window['score_sum'] / total, 1),
+        'total_decisions': total,
+        'total_hands_bid': window['hands'],
+        'optimal_rate': round(optimal_rate, 3),
+        'acceptable_rate': round(acceptable_rate, 3),
+        'good_rate': round(optimal_rate + acceptable_rate, 3),
+        'suboptimal_rate': round(window['suboptimal_count'] / total, 3),
+        'error_rate': round(window['error_count'] / total, 3),
+        'critical_errors': window['critical_count'],
+        'recent_trend': _trend(summary['daily'], 'bidding', today)
+    }
+
+
+def play_category_stats(summary: Dict, today: date) -> Dict:
+    """Summary-backed get_play_category_stats_for_user()."""
+    start = today - timedelta(days=STATS_WINDOW_DAYS)
+    names = {c for (k, c, day) in summary['daily'] if k == 'play' and c and day >= start}
+    windows = {c: _window(summary['daily'], 'play', c, start) for c in names}
+
+    categories = {}
+    total_tricks_lost = 0
+    for cat, w in sorted(windows.items(), key=lambda item: -item[1]['decisions']):
+        attempts = w['decisions']
+        if not attempts:
+            continue
+        optimal, good, blunders = w['optimal_count'], w['good_count'], w['blunder_count']
+        avg_cost = w['tricks_cost_sum'] / w['tricks_cost_count'] if w['tricks_cost_count'] else 0
+        total_cost = float(w['tricks_cost_sum'])
+        total_tricks_lost += total_cost
+
+        accuracy = (optimal + good) / attempts * 100
+        if accuracy >= 85:
+            skill_level = 'strong'
+        elif accuracy >= 70:
+            skill_level = 'good'
+        elif accuracy >= 55:
+            skill_level = 'developing'
+        else:
+            skill_level = 'focus_area'
+
+        categories[cat] = {
+            'attempts': attempts,
+            'avg_score': round(w['score_sum'] / attempts, 1),
+            'optimal_rate': round(optimal / attempts * 100, 1),
+            'good_rate': round(good / attempts * 100, 1),
+            'blunder_rate': round(blunders / attempts * 100, 1),
+            'accuracy': round(accuracy, 1),
+            'avg_tricks_cost': round(avg_cost, 2),
+            'total_tricks_cost': total_cost,
+            'skill_level': skill_level,
+            'display_name': PLAY_CATEGORY_NAMES.get(cat, cat.replace('_', ' ').title()),
+        }
+
+    return {
+        'categories': categories,
+        'total_tricks_lost': total_tricks_lost,
+        'category_count': len(categories)
+    }
+
+
+def play_feedback_stats(summary: Dict, today: date) -> Dict:
+    """Summary-backed get_play_feedback_stats_for_user()."""
+    window = _window(summary['daily'], 'play', '', today - timedelta(days=STATS_WINDOW_DAYS))
+    total = window['decisions']
+    if total == 0:
+        return {
+            'avg_score': 0,
+            'total_decisions': 0,
+            'optimal_rate': 0,
+            'good_rate': 0,
+            'combined_good_rate': 0,
+            'suboptimal_rate': 0,
+            'blunder_rate': 0,
+            'recent_trend': 'stable'
+        }
+    category_stats = play_category_stats(summary, today)
+    optimal_rate = window['optimal_count'] / total
+    good_rate = window['good_count'] / total
+    return {
+        'avg_score': round(window['score_sum'] / total, 1),
+        'total_decisions': total,
+        'optimal_rate': round(optimal_rate, 3),
+        'good_rate': round(good_rate, 3),
+        'combined_good_rate': round(optimal_rate + good_rate, 3),
+        'suboptimal_rate': round(window['suboptimal_count'] / total, 3),
+        'blunder_rate': round(window['blunder_count'] / total, 3),
+        'recent_trend': _trend(summary['daily'], 'play', today),
+        'category_breakdown': category_stats['categories'],
+        'total_tricks_lost': category_stats['total_tricks_lost']
+    }
+
+
+def gameplay_stats(summary: Dict) -> Dict:
+    """Summary-backed get_gameplay_stats_for_user()."""
+    hand = summary['hand']
+    declarer = hand['declarer_hands']
+    recent = hand['recent_declarer_results']
+    return {
+        'total_hands_played': declarer + hand['defender_hands'] + hand['dummy_hands'],
+        'hands_as_declarer': declarer,
+        'hands_as_defender': hand['defender_hands'],
+        'hands_as_dummy': hand['dummy_hands'],
+        'contracts_made': hand['contracts_made'],
+        'contracts_failed': hand['contracts_failed'],
+        'declarer_success_rate': hand['contracts_made'] / declarer if declarer else 0.0,
+        'avg_tricks_as_declarer': round(
+            hand['declarer_tricks_sum'] / hand['declarer_tricks_count'], 1
+        ) if hand['declarer_tricks_count'] else 0.0,
+        'recent_declarer_success_rate': sum(recent) / len(recent) if recent else 0.0
+    }
+
+
+def bidding_analysis_stats(summary: Dict) -> Dict:
+    """Summary-backed get_bidding_analysis_stats_for_user()."""
+    hand = summary['hand']
+
+    def pct(count, denominator):
+        return round(100.0 * count / denominator, 1) if denominator else None
+
+    analyzed, rated = hand['analyzed_hands'], hand['efficiency_rated']
+    return {
+        'total_analyzed_hands': analyzed,
+        'quadrant_distribution': {q: hand[f'{q.lower()}_count'] for q in ('Q1', 'Q2', 'Q3', 'Q4')},
+        'quadrant_percentages': {
+            q: pct(hand[f'{q.lower()}_count'], analyzed) for q in ('Q1', 'Q2', 'Q3', 'Q4')
+        },
+        'bidding_efficiency': {
+            'optimal': hand['optimal_bids'],
+            'underbid': hand['underbids'],
+            'overbid': hand['overbids'],
+        },
+        'efficiency_percentages': {
+            'optimal': pct(hand['optimal_bids'], rated),
+            'underbid': pct(hand['underbids'], rated),
+            'overbid': pct(hand['overbids'], rated),
+        },
+        'total_points_left': hand['points_left_sum'],
+        'avg_points_left_when_underbid': (
+            hand['underbid_points_sum'] / hand['underbid_points_count']
+            if hand['underbid_points_count'] else None),
+        'avg_tricks_vs_dd': (
+            hand['tricks_vs_dd_sum'] / hand['tricks_vs_dd_count']
+            if hand['tricks_vs_dd_count'] else None),
+        'avg_score_vs_par': (
+            hand['score_vs_par_sum'] / hand['score_vs_par_count']
+            if hand['score_vs_par_count'] else None),
+    }
+
+
+def get_dashboard_stats(user_id: int) -> Optional[Dict]:
+    """
+    Dashboard aggregates for a user from their summary, backfilling it first
+    if it isn't complete yet.
+
+    Returns:
+        Dict with gameplay_stats, bidding_feedback_stats, play_feedback_stats
+        and bidding_analysis, or None if the summary tables are unavailable
+        (the caller falls back to the live queries).
+    """
+    try:
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            summary = load_user_summary(cursor, user_id)
+            if summary is None or not summary['complete']:
+                backfill_user(cursor, user_id)
+                summary = load_user_summary(cursor, user_id)
+    except Exception as e:
+        print(f"Could not read analytics summary, using live queries: {e}")
+        return None
+
+    today = datetime.now().date()
+    return {
+        'gameplay_stats': gameplay_stats(summary),
+        'bidding_feedback_stats': bidding_feedback_stats(summary, today),
+        'play_feedback_stats': play_feedback_stats(summary, today),
+        'bidding_analysis': bidding_analysis_stats(summary),
+    }
+
+
+# ============================================================================
+# CLI: backfill / consistency check
+# ============================================================================
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Maintain per-user analytics summaries")
+    parser.add_argument('command', choices=['backfill', 'check'])
+    parser.add_argument('--user', type=int, action='append',
+                        help="Only this user (repeatable); default: every user")
+    args = parser.parse_args(argv)
+
+    with get_connection() as conn:
+        user_ids = args.user or _all_user_ids(conn.cursor())
+
+    failures = 0
+    for user_id in user_ids:
+        # One transaction per user keeps row locks short
+        with get_connection() as conn:
+            cursor = conn.cursor()
+            if args.command == 'backfill':
+                backfill_user(cursor, user_id)
+                continue
+            problems = check_user(cursor, user_id)
+        if problems:
+            failures += 1
+            print(f"✗ user {user_id}: {len(problems)} mismatch(es)")
+            for problem in problems[:20]:
+                print(f"    {problem}")
+
+    if args.command == 'backfill':
+        print(f"✓ Backfilled {len(user_ids)} user(s)")
+        return 0
+    print(f"{'✓' if not failures else '✗'} {len(user_ids) - failures}/{len(user_ids)} user summaries consistent")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
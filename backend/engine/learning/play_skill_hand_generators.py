@@ -21,6 +21,7 @@ from typing import Dict, List, Optional, Tuple, Any
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 
+from engine.constrained_dealer import InfeasibleConstraints, deal_constrained_hand
 from engine.hand import Hand, Card
 from utils.dealing import create_deck
 
@@ -223,21 +224,16 @@ def generate_nt_deal_with_winners(target_winners: int,
     max_attempts = 500
     for _ in range(max_attempts):
         deck = shuffle_deck()
+        declarer = Hand(deck[0:13])
 
-        # Deal 4 hands
-        declarer_cards = deck[0:13]
-        dummy_cards = deck[13:26]
-        lho_cards = deck[26:39]
-        rho_cards = deck[39:52]
-
-        declarer = Hand(declarer_cards)
-        dummy = Hand(dummy_cards)
-        lho = Hand(lho_cards)
-        rho = Hand(rho_cards)
-
-        combined_hcp = declarer.hcp + dummy.hcp
-        if not (min_hcp <= combined_hcp <= max_hcp):
+        # Deal dummy straight into the combined HCP window
+        try:
+            dummy, rest = deal_constrained_hand(
+                {'hcp_range': (min_hcp - declarer.hcp, max_hcp - declarer.hcp)}, deck[13:])
+        except InfeasibleConstraints:
             continue
+        lho = Hand(rest[0:13])
+        rho = Hand(rest[13:26])
 
         # Check for stoppers in all suits if required
         if require_all_stoppers and not has_stopper_in_all_suits(declarer, dummy):
@@ -433,62 +429,45 @@ class CountingLosersGenerator(PlaySkillHandGenerator):
     practice_format = 'single_decision'
 
     def generate(self) -> Tuple[PlayDeal, Dict]:
-        # Generate a deal for a suit contract
-        max_attempts = 500
-        for _ in range(max_attempts):
-            deck = shuffle_deck()
-            declarer = Hand(deck[0:13])
-            dummy = Hand(deck[13:26])
-
-            # Need a trump suit with 8+ cards combined
-            for trump_suit in ['♠', '♥']:
-                combined_trumps = (declarer.suit_lengths[trump_suit] +
-                                  dummy.suit_lengths[trump_suit])
-                if combined_trumps >= 8:
-                    # Good trump fit found
-                    deal = PlayDeal(
-                        declarer_hand=declarer,
-                        dummy_hand=dummy,
-                        lho_hand=Hand(deck[26:39]),
-                        rho_hand=Hand(deck[39:52]),
-                        contract=f'4{trump_suit}',
-                        declarer_position='South'
-                    )
-
-                    # Count losers in declarer's hand
-                    total_losers = 0
-                    loser_breakdown = {}
-                    for suit in ['♠', '♥', '♦', '♣']:
-                        losers = count_losers_in_suit(declarer, suit)
-                        total_losers += losers
-                        loser_breakdown[suit] = losers
-
-                    situation = {
-                        'question': f'In a {deal.contract} contract, how many losers do you have in the South hand?',
-                        'question_type': 'count_losers',
-                        'expected_response': {
-                            'losers': int(total_losers),
-                            'breakdown': loser_breakdown,
-                            'explanation': 'Count losers in each suit (first 3 cards). Void=0, Ace=0, Kx=1 loser, etc.',
-                            'acceptable_range': (max(0, int(total_losers) - 1), int(total_losers) + 1)
-                        },
-                        'accepts_multiple': False,
-                        'trump_suit': trump_suit
-                    }
-
-                    return deal, situation
-
-        # Fallback
+        # Deal dummy into an 8+ card fit in declarer's longer major
         deck = shuffle_deck()
+        declarer = Hand(deck[0:13])
+        trump_suit = '♠' if declarer.suit_lengths['♠'] >= declarer.suit_lengths['♥'] else '♥'
+        trumps_needed = 8 - declarer.suit_lengths[trump_suit]
+        dummy, rest = deal_constrained_hand(
+            {'suit_length_req': ([trump_suit], trumps_needed, 'any_of')}, deck[13:])
+
         deal = PlayDeal(
-            declarer_hand=Hand(deck[0:13]),
-            dummy_hand=Hand(deck[13:26]),
-            lho_hand=Hand(deck[26:39]),
-            rho_hand=Hand(deck[39:52]),
-            contract='4♠',
+            declarer_hand=declarer,
+            dummy_hand=dummy,
+            lho_hand=Hand(rest[0:13]),
+            rho_hand=Hand(rest[13:26]),
+            contract=f'4{trump_suit}',
             declarer_position='South'
         )
-        return deal, {'question': 'Count your losers', 'expected_response': {'losers': 4}}
+
+        # Count losers in declarer's hand
+        total_losers = 0
+        loser_breakdown = {}
+        for suit in ['♠', '♥', '♦', '♣']:
+            losers = count_losers_in_suit(declarer, suit)
+            total_losers += losers
+            loser_breakdown[suit] = losers
+
+        situation = {
+            'question': f'In a {deal.contract} contract, how many losers do you have in the South hand?',
+            'question_type': 'count_losers',
+            'expected_response': {
+                'losers': int(total_losers),
+                'breakdown': loser_breakdown,
+                'explanation': 'Count losers in each suit (first 3 cards). Void=0, Ace=0, Kx=1 loser, etc.',
+                'acceptable_range': (max(0, int(total_losers) - 1), int(total_losers) + 1)
+            },
+            'accepts_multiple': False,
+            'trump_suit': trump_suit
+        }
+
+        return deal, situation
 
 
 class AnalyzingTheLeadGenerator(PlaySkillHandGenerator):
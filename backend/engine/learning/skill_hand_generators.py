@@ -15,6 +15,7 @@ import random
 from typing import Dict, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
+from engine.constrained_dealer import InfeasibleConstraints, deal_constrained_hand
 from engine.hand import Hand, Card
 from utils.dealing import create_deck
 
@@ -81,78 +82,22 @@ def generate_hand_with_constraints(constraints: dict, deck: List[Card]) -> Tuple
         - is_balanced: True/False/None
         - suit_length_req: (suits_list, min_length, mode)
           mode: 'any_of' or 'all_of'
+        - short_suit_req: (suits_list, max_length) - every listed suit at most max_length
         - void_suit: suit that must have 0 cards
         - singleton_suit: suit that must have 1 card
         - doubleton_suit: suit that must have 2 cards
         - max_suit_length: maximum cards in any suit
         - unique_longest_suit: True requires exactly one suit with max length (no ties)
-    """
-    hcp_range = constraints.get('hcp_range', (0, 40))
-    is_balanced = constraints.get('is_balanced')
-    suit_length_req = constraints.get('suit_length_req')
-    void_suit = constraints.get('void_suit')
-    singleton_suit = constraints.get('singleton_suit')
-    doubleton_suit = constraints.get('doubleton_suit')
-    max_suit_length = constraints.get('max_suit_length')
-    min_longest_suit = constraints.get('min_longest_suit')
-    unique_longest_suit = constraints.get('unique_longest_suit', False)
-
-    max_attempts = 20000
-    for _ in range(max_attempts):
-        random.shuffle(deck)
-        hand_cards = deck[:13]
-        temp_hand = Hand(hand_cards)
-
-        # Check HCP
-        if not (hcp_range[0] <= temp_hand.hcp <= hcp_range[1]):
-            continue
-
-        # Check balanced
-        if is_balanced is not None and temp_hand.is_balanced != is_balanced:
-            continue
-
-        # Check suit length requirements
-        if suit_length_req:
-            suits_list, min_length, mode = suit_length_req
-            if mode == 'any_of':
-                if not any(temp_hand.suit_lengths[suit] >= min_length for suit in suits_list):
-                    continue
-            elif mode == 'all_of':
-                if not all(temp_hand.suit_lengths[suit] >= min_length for suit in suits_list):
-                    continue
-
-        # Check void
-        if void_suit and temp_hand.suit_lengths[void_suit] != 0:
-            continue
-
-        # Check singleton
-        if singleton_suit and temp_hand.suit_lengths[singleton_suit] != 1:
-            continue
-
-        # Check doubleton
-        if doubleton_suit and temp_hand.suit_lengths[doubleton_suit] != 2:
-            continue
 
-        # Check max suit length
-        if max_suit_length and max(temp_hand.suit_lengths.values()) > max_suit_length:
-            continue
-
-        # Check min longest suit
-        if min_longest_suit and max(temp_hand.suit_lengths.values()) < min_longest_suit:
-            continue
-
-        # Check unique longest suit (no ties for longest)
-        if unique_longest_suit:
-            suit_lengths_list = list(temp_hand.suit_lengths.values())
-            max_length = max(suit_lengths_list)
-            if suit_lengths_list.count(max_length) > 1:
-                continue  # Multiple suits tied for longest, reject
-
-        # All checks passed
-        return temp_hand, deck[13:]
-
-    print(f"Warning: Could not generate hand with constraints after {max_attempts} attempts")
-    return None, deck
+    The hand is dealt directly by the constrained dealer (shape first, then
+    honors), so generation time does not depend on how rare the hand is.
+    Returns (None, deck) if no hand in deck meets the constraints.
+    """
+    try:
+        return deal_constrained_hand(constraints, deck)
+    except InfeasibleConstraints as e:
+        print(f"Warning: {e}")
+        return None, deck
 
 
 # ============================================================================
@@ -654,7 +599,7 @@ class SingleRaiseGenerator(SkillHandGenerator):
         else:  # no_support
             return {
                 'hcp_range': (6, 10),
-                'max_suit_length': 2,  # No 3+ card support
+                'short_suit_req': (['♠'], 2),  # No 3+ card support
             }
 
     def _get_trump_suit(self) -> Optional[str]:
@@ -925,7 +870,7 @@ class DustbinNTResponseGenerator(SkillHandGenerator):
         return {
             'hcp_range': (6, 10),
             'is_balanced': True,
-            'max_suit_length': 3,  # No 4+ card suit
+            'short_suit_req': (['♠'], 2),  # No support for partner's spades
         }
 
     def get_expected_response(self, hand: Hand, auction: List[str] = None) -> Dict:
@@ -1643,7 +1588,7 @@ class RespondingToMajorGenerator(SkillHandGenerator):
                 'suit_length_req': (['♠'], 3, 'any_of')  # Support for spades
             }
         elif self.variant == 'no_support':
-            return {'hcp_range': (6, 12), 'max_suit_length': 2}  # Max 2 in partner's major
+            return {'hcp_range': (6, 12), 'short_suit_req': (['♥'], 2)}  # Max 2 in partner's major
         else:  # weak
             return {'hcp_range': (0, 5)}
 
@@ -1742,7 +1687,7 @@ class RespondingToMinorGenerator(SkillHandGenerator):
                 'suit_length_req': (['♠', '♥'], 4, 'any_of')
             }
         elif self.variant == 'no_major':
-            return {'hcp_range': (6, 10), 'is_balanced': True, 'max_suit_length': 3}  # No 4-card major
+            return {'hcp_range': (6, 10), 'is_balanced': True, 'short_suit_req': (['♠', '♥'], 3)}  # No 4-card major
         else:  # weak
             return {'hcp_range': (0, 5)}
 
@@ -11,6 +11,9 @@ Accuracy: 100% for perfect information scenarios
 
 The implementation uses endplay's solve_board() which directly returns
 optimal plays with trick counts, avoiding the need for simulation.
+One solve_board call scores every legal card for the current trump and
+leader; score_cards_batch() scores several positions with a single
+solve_all_boards call.
 
 NEW: Tactical Signal Overlay Integration
 - When multiple cards have the same DDS trick count (equivalence set),
@@ -30,6 +33,7 @@ Platform Notes:
 from engine.hand import Hand, Card
 from engine.play_engine import PlayState, Contract, PlayEngine
 from engine.play.ai.base_ai import BasePlayAI
+from engine.bitboard import legal_cards as bitboard_legal_cards
 from typing import List, Optional, Tuple, Dict, Any
 import time
 
@@ -44,7 +48,7 @@ except ImportError:
 
 try:
     from endplay.types import Deal, Player as EndplayPlayer, Denom, Card as EndplayCard
-    from endplay.dds import calc_dd_table, solve_board
+    from endplay.dds import solve_board, solve_all_boards
     DDS_AVAILABLE = True
 except ImportError as e:
     DDS_AVAILABLE = False
@@ -54,7 +58,7 @@ except ImportError as e:
     Denom = None
     EndplayCard = None
     solve_board = None
-    calc_dd_table = None
+    solve_all_boards = None
     # Only print warning if running as main
     if __name__ == '__main__':
         print(f"⚠️  Warning: endplay not installed. DDS AI will not work.")
@@ -62,6 +66,10 @@ except ImportError as e:
         print(f"   Error: {e}")
 
 
+# Boards per solve_all_boards call (DDS MAXNOOFBOARDS limit)
+MAX_BATCH_BOARDS = 200
+
+
 class DDSPlayAI(BasePlayAI):
     """
     Double Dummy Solver AI - Expert Level Play
@@ -75,9 +83,12 @@ class DDSPlayAI(BasePlayAI):
         >>> # Returns optimal card based on double dummy analysis
     """
 
+    # Subclasses that solve without endplay (SolverPlayAI) clear this
+    requires_endplay = True
+
     def __init__(self):
         """Initialize DDS AI"""
-        if not DDS_AVAILABLE:
+        if self.requires_endplay and not DDS_AVAILABLE:
             raise ImportError(f"endplay library required for DDS AI. DDS_AVAILABLE={DDS_AVAILABLE}")
 
         # Statistics
@@ -159,27 +170,7 @@ class DDSPlayAI(BasePlayAI):
             raise ValueError(f"Position {position} has no cards in hand")
 
         try:
-            # Build PBN with current trick cards added back to hands
-            # This is required because endplay needs cards in hands before deal.play()
-            pbn = self._get_pbn_string(state, include_current_trick=True)
-            debug_pbn = pbn  # For debugging output
-
-            deal = Deal(pbn)
-            deal.trump = self._convert_trump(state.contract.trump_suit)
-
-            # Set deal.first to the TRICK LEADER (not current player)
-            # endplay requires us to play cards in order from the leader
-            if state.current_trick:
-                trick_leader = state.current_trick[0][1]  # Position of first card played
-                deal.first = self._convert_position(trick_leader)
-
-                # Play all cards already in the current trick
-                for played_card, played_pos in state.current_trick:
-                    endplay_card = self._convert_card_to_endplay(played_card)
-                    deal.play(endplay_card)
-            else:
-                # No current trick - set first to the position that needs to play
-                deal.first = self._convert_position(position)
+            deal = self._build_solver_deal(state, position)
 
             # solve_board returns a SolvedBoard with (card, tricks) pairs
             # The tricks value is the number of tricks the CURRENT SIDE can make
@@ -197,16 +188,13 @@ class DDSPlayAI(BasePlayAI):
                 trick_num = len(state.trick_history) + 1
                 current_trick_str = ' '.join([f"{p}:{c.rank}{c.suit}" for c, p in state.current_trick])
                 dds_results = [(str(card), tricks) for card, tricks in solved]
+                debug_pbn = self._get_pbn_string(state, include_current_trick=True)
                 print(f"[DDS DEBUG T{trick_num}] {position} discards | PBN: {debug_pbn}")
                 print(f"[DDS DEBUG T{trick_num}] Current trick: {current_trick_str}")
                 print(f"[DDS DEBUG T{trick_num}] DDS options: {dds_results}")
 
             # Collect all cards with their trick counts
-            card_options = []
-            for endplay_card, tricks in solved:
-                our_card = self._convert_endplay_card_to_ours(endplay_card, legal_cards)
-                if our_card is not None:
-                    card_options.append((our_card, tricks))
+            card_options = self._card_options(solved, legal_cards)
 
             if not card_options:
                 # Fallback if no cards matched
@@ -307,6 +295,87 @@ class DDSPlayAI(BasePlayAI):
             print(f"Tricks played: {len(state.trick_history)}")
             raise ValueError(f"Invalid PBN string '{pbn}': {e}") from e
 
+    def _build_solver_deal(self, state: PlayState, position: str) -> Deal:
+        """
+        Build the endplay Deal that solve_board needs for the player to move
+
+        Cards of the current trick are put back in their hands and replayed
+        from the trick leader, so the deal has balanced hands.
+        """
+        # Build PBN with current trick cards added back to hands
+        # This is required because endplay needs cards in hands before deal.play()
+        deal = Deal(self._get_pbn_string(state, include_current_trick=True))
+        deal.trump = self._convert_trump(state.contract.trump_suit)
+
+        # Set deal.first to the TRICK LEADER (not current player)
+        # endplay requires us to play cards in order from the leader
+        if state.current_trick:
+            trick_leader = state.current_trick[0][1]  # Position of first card played
+            deal.first = self._convert_position(trick_leader)
+
+            # Play all cards already in the current trick
+            for played_card, played_pos in state.current_trick:
+                deal.play(self._convert_card_to_endplay(played_card))
+        else:
+            # No current trick - set first to the position that needs to play
+            deal.first = self._convert_position(position)
+
+        return deal
+
+    def _card_options(self, solved, legal_cards: List[Card]) -> List[Tuple[Card, int]]:
+        """Convert a SolvedBoard into (our card, tricks) pairs for legal cards"""
+        card_options = []
+        for endplay_card, tricks in solved:
+            our_card = self._convert_endplay_card_to_ours(endplay_card, legal_cards)
+            if our_card is not None:
+                card_options.append((our_card, tricks))
+        return card_options
+
+    def score_cards(self, state: PlayState, position: str) -> List[Tuple[Card, int]]:
+        """
+        Score every legal card for the player to move with one solve_board call
+
+        Args:
+            state: Current play state
+            position: Position to play (must be next to play)
+
+        Returns:
+            (card, tricks) pairs - tricks the mover's side takes from the
+            remaining tricks (including the current one) after that card
+        """
+        legal_cards = self._get_legal_cards(state, position)
+        start_time = time.time()
+        solved = solve_board(self._build_solver_deal(state, position))
+        self.solve_time += time.time() - start_time
+        self.solves_count += 1
+        return self._card_options(solved, legal_cards)
+
+    def score_cards_batch(self, positions: List[Tuple[PlayState, str]]) -> List[List[Tuple[Card, int]]]:
+        """
+        Score the legal cards of several positions with batched solving
+
+        Uses solve_all_boards (DDS solves the boards in parallel threads)
+        instead of one solve_board call per position.
+
+        Args:
+            positions: (state, position to play) pairs
+
+        Returns:
+            One list of (card, tricks) pairs per input, as score_cards()
+        """
+        results = []
+        start_time = time.time()
+        for offset in range(0, len(positions), MAX_BATCH_BOARDS):
+            chunk = positions[offset:offset + MAX_BATCH_BOARDS]
+            deals = [self._build_solver_deal(state, position) for state, position in chunk]
+            solved_boards = solve_all_boards(deals)
+            for (state, position), solved in zip(chunk, solved_boards):
+                legal_cards = self._get_legal_cards(state, position)
+                results.append(self._card_options(solved, legal_cards))
+        self.solve_time += time.time() - start_time
+        self.solves_count += len(positions)
+        return results
+
     def _convert_trump(self, trump_suit: Optional[str]) -> Denom:
         """Convert trump suit to endplay Denom"""
         if not trump_suit:
@@ -382,56 +451,44 @@ class DDSPlayAI(BasePlayAI):
 
     def _evaluate_position_with_dds(self, state: PlayState, trump: Denom,
                                     declarer: EndplayPlayer) -> float:
-        """Evaluate position using DDS"""
+        """
+        Evaluate position using DDS
+
+        Uses one solve_board call for the player to move (the contract's
+        trump is already known) rather than a full 5 strain x 4 declarer
+        DD table.
+
+        Returns:
+            Declarer's final trick margin (declarer tricks - defender tricks)
+        """
+        declarer_is_ns = declarer in [EndplayPlayer.north, EndplayPlayer.south]
+        if declarer_is_ns:
+            already_won = state.tricks_taken_ns
+            opp_already_won = state.tricks_taken_ew
+        else:
+            already_won = state.tricks_taken_ew
+            opp_already_won = state.tricks_taken_ns
+
         if state.is_complete:
             # Game over - return definitive result
-            if declarer in [EndplayPlayer.north, EndplayPlayer.south]:
-                return float(state.tricks_taken_ns - state.tricks_taken_ew)
-            else:
-                return float(state.tricks_taken_ew - state.tricks_taken_ns)
+            return float(already_won - opp_already_won)
 
         try:
-            # Convert to endplay format
-            deal = self._convert_to_endplay_deal(state)
-
-            # Calculate DD table - wrapped in additional error handling
+            mover = state.next_to_play
             try:
-                dd_table = calc_dd_table(deal)
-                data = dd_table.to_list()
+                solved = solve_board(self._build_solver_deal(state, mover))
+                mover_tricks = max(tricks for _, tricks in solved)
             except (RuntimeError, OSError, SystemError) as dds_error:
                 # DDS library crashed or failed
-                print(f"⚠️  DDS calc_dd_table failed: {dds_error}")
+                print(f"⚠️  DDS solve_board failed: {dds_error}")
                 raise  # Re-raise to trigger outer fallback
 
-            # Get tricks for declarer in trump suit
-            # data[denom_idx][player_idx]
-            # Denoms: clubs=0, diamonds=1, hearts=2, spades=3, NT=4
-            # Players: N=0, E=1, S=2, W=3
-
-            denom_idx = {
-                Denom.clubs: 0,
-                Denom.diamonds: 1,
-                Denom.hearts: 2,
-                Denom.spades: 3,
-                Denom.nt: 4
-            }[trump]
-
-            player_idx = {
-                EndplayPlayer.north: 0,
-                EndplayPlayer.east: 1,
-                EndplayPlayer.south: 2,
-                EndplayPlayer.west: 3
-            }[declarer]
-
-            declarer_tricks = data[denom_idx][player_idx]
-
-            # Already played tricks
-            if declarer in [EndplayPlayer.north, EndplayPlayer.south]:
-                already_won = state.tricks_taken_ns
-                opp_already_won = state.tricks_taken_ew
+            # solve_board counts tricks for the side to move
+            remaining = 13 - already_won - opp_already_won
+            if (mover in ['N', 'S']) == declarer_is_ns:
+                declarer_tricks = mover_tricks
             else:
-                already_won = state.tricks_taken_ew
-                opp_already_won = state.tricks_taken_ns
+                declarer_tricks = remaining - mover_tricks
 
             # Total tricks declarer will make
             total_tricks = already_won + declarer_tricks
@@ -442,10 +499,7 @@ class DDSPlayAI(BasePlayAI):
         except Exception as e:
             # Fallback to trick count if DDS fails
             # This prevents crashes from propagating up
-            if declarer in [EndplayPlayer.north, EndplayPlayer.south]:
-                return float(state.tricks_taken_ns - state.tricks_taken_ew)
-            else:
-                return float(state.tricks_taken_ew - state.tricks_taken_ns)
+            return float(already_won - opp_already_won)
 
     def _break_tie(self, tied_cards: List[Tuple[Card, int]], state: PlayState,
                    position: str, all_legal_cards: List[Card]) -> Card:
@@ -803,22 +857,8 @@ class DDSPlayAI(BasePlayAI):
         return False
 
     def _get_legal_cards(self, state: PlayState, position: str) -> List[Card]:
-        """Get all legal cards for current position"""
-        hand = state.hands[position]
-
-        if not state.current_trick:
-            # Leading - any card is legal
-            return list(hand.cards)
-
-        # Following - must follow suit if able
-        led_suit = state.current_trick[0][0].suit
-        cards_in_suit = [c for c in hand.cards if c.suit == led_suit]
-
-        if cards_in_suit:
-            return cards_in_suit
-        else:
-            # Void - any card is legal
-            return list(hand.cards)
+        """Get all legal cards for current position (follow suit via bitmask)"""
+        return bitboard_legal_cards(state.hands[position].cards, state.current_trick)
 
     def _simulate_play(self, state: PlayState, card: Card, position: str) -> PlayState:
         """Simulate playing a card and return resulting state"""
@@ -0,0 +1,342 @@
+"""
+Persistent Worker Pool for DDS Card Play
+
+DDS (endplay library) can segfault, so expert play runs it outside the
+server process. Starting a new process for every card costs a fork,
+re-importing endplay and rebuilding DDSPlayAI each time. This pool keeps
+a fixed number of long-lived worker processes instead:
+
+- Segfault isolation is kept: a crash only kills one worker, which is
+  counted and replaced in the background.
+- Requests wait in a bounded queue with a per-request deadline; a request
+  that is still queued when its deadline passes is not sent to a worker,
+  and a worker that overruns the deadline is killed and replaced.
+- Queue depth, crash/restart counts and per-call latency are available
+  from get_statistics().
+
+The task run in the workers keeps the fork-per-move contract:
+task(*args, result_queue) puts one result dict on result_queue.
+
+Example:
+    >>> pool = DDSWorkerPool(_dds_worker, size=2, initializer=_dds_worker_init)
+    >>> result = pool.submit(state_dict, 'S', timeout=15)
+    >>> result['status']    # 'success', 'error', 'timeout', 'crash' or 'rejected'
+"""
+
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+
+DEFAULT_POOL_SIZE = 2
+DEFAULT_MAX_QUEUE = 32
+LATENCY_WINDOW = 500  # Recent calls kept for latency percentiles
+
+
+class _PipeResultQueue:
+    """Stand-in for multiprocessing.Queue that answers over the worker pipe"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.sent = False
+
+    def put(self, item):
+        self._conn.send(item)
+        self.sent = True
+
+
+def _worker_main(conn, task: Callable, initializer: Optional[Callable]):
+    """Worker process loop: run one task per request until told to stop"""
+    if initializer is not None:
+        try:
+            initializer()
+        except Exception:
+            pass  # Task reports its own errors per request
+
+    while True:
+        try:
+            args = conn.recv()
+        except (EOFError, OSError):
+            break
+        if args is None:
+            break
+
+        result_queue = _PipeResultQueue(conn)
+        try:
+            task(*args, result_queue)
+        except Exception as e:
+            if not result_queue.sent:
+                result_queue.put({'status': 'error', 'error': str(e)})
+        if not result_queue.sent:
+            conn.send({'status': 'error', 'error': 'Worker returned no result'})
+
+
+class _Job:
+    __slots__ = ('args', 'deadline', 'submitted', 'future')
+
+    def __init__(self, args: tuple, deadline: float):
+        self.args = args
+        self.deadline = deadline
+        self.submitted = time.monotonic()
+        self.future = Future()
+
+
+class _Worker:
+    """One worker process and the parent end of its pipe"""
+
+    def __init__(self, ctx, task: Callable, initializer: Optional[Callable]):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main,
+                                   args=(child_conn, task, initializer),
+                                   daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    def kill(self):
+        try:
+            self.conn.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(1)
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join(1)
+
+    def stop(self):
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(1)
+        self.kill()
+
+
+class DDSWorkerPool:
+    """
+    Fixed-size pool of long-lived DDS worker processes
+
+    Each worker slot has a dispatcher thread in the server process that
+    takes requests from the shared queue, sends them to its worker and
+    waits for the answer until the request's deadline.
+    """
+
+    def __init__(self, task: Callable, size: int = DEFAULT_POOL_SIZE,
+                 max_queue: int = DEFAULT_MAX_QUEUE,
+                 initializer: Optional[Callable] = None):
+        """
+        Initialize pool (workers start on first submit or start())
+
+        Args:
+            task: Function run in the workers as task(*args, result_queue)
+            size: Number of worker processes
+            max_queue: Requests allowed to wait for a worker before new
+                requests are rejected
+            initializer: Optional function run once when a worker starts
+                (e.g. import endplay and build DDSPlayAI)
+        """
+        self.task = task
+        self.size = size
+        self.max_queue = max_queue
+        self.initializer = initializer
+
+        self._ctx = multiprocessing.get_context()
+        self._jobs = queue.Queue()
+        self._workers = [None] * size
+        self._threads = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._stopped = False
+
+        # Statistics
+        self._busy = 0
+        self._latencies_ms = deque(maxlen=LATENCY_WINDOW)
+        self.submitted = 0
+        self.completed = 0
+        self.errors = 0
+        self.crashes = 0
+        self.restarts = 0
+        self.timeouts = 0
+        self.expired = 0
+        self.rejected = 0
+
+    def start(self):
+        """Start worker processes and dispatcher threads"""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            for slot in range(self.size):
+                self._workers[slot] = _Worker(self._ctx, self.task, self.initializer)
+                thread = threading.Thread(target=self._dispatch, args=(slot,),
+                                          name=f"dds-pool-{slot}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def submit(self, *args, timeout: float = 15.0) -> Dict[str, Any]:
+        """
+        Run the task in a worker and wait for its result
+
+        Args:
+            *args: Task arguments (must be picklable)
+            timeout: Seconds from now until the request is abandoned,
+                including time spent waiting in the queue
+
+        Returns:
+            The task's result dict, or {'status': 'timeout' | 'crash' |
+            'rejected', 'error': ...} if no result was produced
+        """
+        if not self._started:
+            self.start()
+
+        with self._lock:
+            if self._stopped:
+                return {'status': 'rejected', 'error': 'Worker pool is shut down'}
+            if self._jobs.qsize() >= self.max_queue:
+                self.rejected += 1
+                return {'status': 'rejected',
+                        'error': f'Worker queue full ({self.max_queue} waiting)'}
+            self.submitted += 1
+
+        job = _Job(args, time.monotonic() + timeout)
+        self._jobs.put(job)
+
+        try:
+            # Dispatcher always resolves the job shortly after its deadline
+            return job.future.result(timeout + 5.0)
+        except Exception:
+            return {'status': 'timeout', 'error': f'No result after {timeout}s'}
+
+    def _dispatch(self, slot: int):
+        """Dispatcher thread for one worker slot"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+
+            remaining = job.deadline - time.monotonic()
+            if remaining <= 0:
+                with self._lock:
+                    self.expired += 1
+                job.future.set_result({'status': 'timeout',
+                                       'error': 'Deadline passed while queued'})
+                continue
+
+            with self._lock:
+                self._busy += 1
+            try:
+                result = self._run_on_worker(slot, job, remaining)
+            finally:
+                with self._lock:
+                    self._busy -= 1
+                    self._latencies_ms.append((time.monotonic() - job.submitted) * 1000)
+            job.future.set_result(result)
+
+    def _run_on_worker(self, slot: int, job: _Job, remaining: float) -> Dict[str, Any]:
+        """Send one job to the slot's worker, replacing the worker on crash/timeout"""
+        worker = self._workers[slot]
+        if not worker.is_alive():
+            # Died while idle
+            with self._lock:
+                self.crashes += 1
+            worker = self._restart(slot)
+
+        try:
+            worker.conn.send(job.args)
+            if not worker.conn.poll(remaining):
+                with self._lock:
+                    self.timeouts += 1
+                self._restart(slot)
+                return {'status': 'timeout',
+                        'error': f'Worker did not answer within {remaining:.1f}s'}
+            result = worker.conn.recv()
+        except (EOFError, OSError):
+            worker.process.join(1)
+            exitcode = worker.process.exitcode
+            with self._lock:
+                self.crashes += 1
+            self._restart(slot)
+            return {'status': 'crash', 'exitcode': exitcode,
+                    'error': f'Worker process died (exit code {exitcode})'}
+
+        with self._lock:
+            if result.get('status') == 'success':
+                self.completed += 1
+            else:
+                self.errors += 1
+        return result
+
+    def _restart(self, slot: int) -> _Worker:
+        old = self._workers[slot]
+        if old is not None:
+            old.kill()
+        worker = _Worker(self._ctx, self.task, self.initializer)
+        self._workers[slot] = worker
+        with self._lock:
+            self.restarts += 1
+        return worker
+
+    def shutdown(self):
+        """Stop dispatcher threads and worker processes"""
+        with self._lock:
+            if self._stopped or not self._started:
+                self._stopped = True
+                return
+            self._stopped = True
+
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(5)
+        for worker in self._workers:
+            if worker is not None:
+                worker.stop()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Get pool statistics
+
+        Returns:
+            Dictionary with worker counts, queue depth, outcome counters and
+            latency (ms, queue wait + solve) over the most recent calls
+        """
+        with self._lock:
+            latencies = sorted(self._latencies_ms)
+            busy = self._busy
+
+        def percentile(p):
+            if not latencies:
+                return None
+            return latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+
+        return {
+            'size': self.size,
+            'alive_workers': sum(1 for w in self._workers if w is not None and w.is_alive()),
+            'busy_workers': busy,
+            'queue_depth': self._jobs.qsize(),
+            'max_queue': self.max_queue,
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'errors': self.errors,
+            'crashes': self.crashes,
+            'restarts': self.restarts,
+            'timeouts': self.timeouts,
+            'expired': self.expired,
+            'rejected': self.rejected,
+            'latency_ms': {
+                'count': len(latencies),
+                'avg': sum(latencies) / len(latencies) if latencies else None,
+                'p50': percentile(0.50),
+                'p95': percentile(0.95),
+                'p99': percentile(0.99),
+                'max': latencies[-1] if latencies else None,
+            },
+        }
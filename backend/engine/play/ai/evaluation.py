@@ -9,7 +9,77 @@ positions are favorable and guides the search toward good outcomes.
 """
 
 from engine.play_engine import PlayState, PlayEngine
-from typing import Dict, List
+from engine.bitboard import SUITS, cards_to_mask, suit_cards
+from typing import Dict, List, Optional, Tuple
+
+
+SIDE_OF = {'N': ('N', 'S'), 'S': ('N', 'S'), 'E': ('E', 'W'), 'W': ('E', 'W')}
+
+RANK_VALUES = {
+    '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
+    'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14
+}
+
+
+class CardIndex:
+    """
+    Cards of a position grouped by hand, suit and partnership
+
+    Built once per evaluation from the hands' bitmasks (or maintained
+    incrementally by a SearchPosition) so that the components read
+    pre-grouped, rank-sorted suit holdings instead of each re-scanning
+    every hand. Partnership holdings come straight from OR-ing the two
+    hands' masks, so no sorting is needed.
+
+    - by_pos[pos][suit]: cards held by one position, highest first
+    - by_side[('N', 'S')][suit]: both partners' cards, highest first
+    """
+
+    __slots__ = ('by_pos', 'by_side')
+
+    def __init__(self, state):
+        masks = getattr(state, 'masks', None)
+        if masks is None:
+            masks = {pos: cards_to_mask(hand.cards) for pos, hand in state.hands.items()}
+
+        self.by_pos = {
+            pos: {suit: suit_cards(mask, suit) for suit in SUITS}
+            for pos, mask in masks.items()
+        }
+        self.by_side = {}
+        for side in (('N', 'S'), ('E', 'W')):
+            first, second = masks[side[0]], masks[side[1]]
+            if first & second:
+                # Malformed deal (same card in both hands) - merge lists so
+                # the duplicate is counted twice, as a list scan would
+                self.by_side[side] = {
+                    suit: sorted(self.by_pos[side[0]][suit] + self.by_pos[side[1]][suit],
+                                 key=lambda c: RANK_VALUES[c.rank], reverse=True)
+                    for suit in SUITS
+                }
+            else:
+                side_mask = first | second
+                self.by_side[side] = {suit: suit_cards(side_mask, suit) for suit in SUITS}
+
+    def suit(self, pos: str, suit: str) -> List:
+        """Cards held by one position in a suit, highest first"""
+        return self.by_pos[pos][suit]
+
+    def remove(self, pos: str, card) -> Tuple[int, int]:
+        """Remove a played card; returns the slots needed by restore()"""
+        own = self.by_pos[pos][card.suit]
+        own_slot = own.index(card)
+        del own[own_slot]
+
+        side = self.by_side[SIDE_OF[pos]][card.suit]
+        side_slot = side.index(card)
+        del side[side_slot]
+        return own_slot, side_slot
+
+    def restore(self, pos: str, card, own_slot: int, side_slot: int) -> None:
+        """Put a card back exactly where remove() took it from"""
+        self.by_pos[pos][card.suit].insert(own_slot, card)
+        self.by_side[SIDE_OF[pos]][card.suit].insert(side_slot, card)
 
 
 class PositionEvaluator:
@@ -23,10 +93,7 @@ class PositionEvaluator:
     """
 
     # Rank values for card evaluation
-    RANK_VALUES = {
-        '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9,
-        'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14
-    }
+    RANK_VALUES = RANK_VALUES
 
     def __init__(self):
         """Initialize evaluator with default weights"""
@@ -48,6 +115,12 @@ class PositionEvaluator:
         """Get hand for position (always short form: N/S/E/W)"""
         return state.hands[position]
 
+    def _index(self, state: PlayState, index: Optional[CardIndex]) -> CardIndex:
+        """Return the shared card index, building it if the caller has none"""
+        if index is not None:
+            return index
+        return getattr(state, 'card_index', None) or CardIndex(state)
+
     def evaluate(self, state: PlayState, perspective: str) -> float:
         """
         Evaluate position from given player's perspective
@@ -70,40 +143,41 @@ class PositionEvaluator:
             return self._evaluate_terminal(state, perspective)
 
         score = 0.0
+        index = self._index(state, None)
 
         # Component 1: Tricks already won (definitive)
         score += self.weights['tricks_won'] * self._tricks_won_component(state, perspective)
 
         # Component 2: Sure winners (high cards that must win)
-        score += self.weights['sure_winners'] * self._sure_winners_component(state, perspective)
+        score += self.weights['sure_winners'] * self._sure_winners_component(state, perspective, index)
 
         # Component 3: Trump control
         if self.weights['trump_control'] > 0:
-            score += self.weights['trump_control'] * self._trump_control_component(state, perspective)
+            score += self.weights['trump_control'] * self._trump_control_component(state, perspective, index)
 
         # Component 4: Communication/entries
         if self.weights['communication'] > 0:
-            score += self.weights['communication'] * self._communication_component(state, perspective)
+            score += self.weights['communication'] * self._communication_component(state, perspective, index)
 
         # Component 5: Finesse opportunities
         if self.weights.get('finesse', 0) > 0:
-            score += self.weights['finesse'] * self._finesse_component(state, perspective)
+            score += self.weights['finesse'] * self._finesse_component(state, perspective, index)
 
         # Component 6: Long suit establishment
         if self.weights.get('long_suits', 0) > 0:
-            score += self.weights['long_suits'] * self._long_suit_component(state, perspective)
+            score += self.weights['long_suits'] * self._long_suit_component(state, perspective, index)
 
         # Component 7: Danger hand avoidance (hold-up play)
         if self.weights.get('danger_hand', 0) > 0:
-            score += self.weights['danger_hand'] * self._danger_hand_component(state, perspective)
+            score += self.weights['danger_hand'] * self._danger_hand_component(state, perspective, index)
 
         # Component 8: Tempo and timing
         if self.weights.get('tempo', 0) > 0:
-            score += self.weights['tempo'] * self._tempo_component(state, perspective)
+            score += self.weights['tempo'] * self._tempo_component(state, perspective, index)
 
         # Component 9: Defensive strategy
         if self.weights.get('defensive', 0) > 0:
-            score += self.weights['defensive'] * self._defensive_component(state, perspective)
+            score += self.weights['defensive'] * self._defensive_component(state, perspective, index)
 
         return score
 
@@ -138,7 +212,8 @@ class PositionEvaluator:
 
         return float(my_tricks - opp_tricks)
 
-    def _sure_winners_component(self, state: PlayState, perspective: str) -> float:
+    def _sure_winners_component(self, state: PlayState, perspective: str,
+                                index: Optional[CardIndex] = None) -> float:
         """
         Count high cards that are guaranteed winners
 
@@ -162,33 +237,22 @@ class PositionEvaluator:
 
         total_sure_winners = 0.0
         trump_suit = state.contract.trump_suit
+        index = self._index(state, index)
+        our_side = index.by_side[tuple(positions)]
 
         # Evaluate each suit
-        for suit in ['♠', '♥', '♦', '♣']:
-            # Collect all cards in this suit from both hands
-            partnership_cards = []
-            for pos in positions:
-                hand = self._get_hand(state, pos)
-                partnership_cards.extend([c for c in hand.cards if c.suit == suit])
-
-            if not partnership_cards:
-                continue
+        for suit in SUITS:
+            # All cards in this suit from both hands, highest first
+            sorted_cards = our_side[suit]
 
-            # Sort by rank (highest first)
-            sorted_cards = sorted(
-                partnership_cards,
-                key=lambda c: self.RANK_VALUES[c.rank],
-                reverse=True
-            )
+            if not sorted_cards:
+                continue
 
             # CRITICAL FIX: Master Trump Detection
             # In trump contracts, check if this is the trump suit
             if trump_suit and suit == trump_suit:
-                # Get opponent's trumps
-                opp_trump_cards = []
-                for pos in opp_positions:
-                    hand = self._get_hand(state, pos)
-                    opp_trump_cards.extend([c for c in hand.cards if c.suit == trump_suit])
+                # Get opponent's trumps (highest first)
+                opp_trump_cards = index.by_side[tuple(opp_positions)][trump_suit]
 
                 if len(opp_trump_cards) == 0:
                     # OPPONENTS ARE VOID IN TRUMPS!
@@ -198,7 +262,7 @@ class PositionEvaluator:
 
                 else:
                     # Opponents have trumps - count how many of ours are masters
-                    opp_highest = max(opp_trump_cards, key=lambda c: self.RANK_VALUES[c.rank])
+                    opp_highest = opp_trump_cards[0]
                     opp_highest_val = self.RANK_VALUES[opp_highest.rank]
 
                     master_trump_count = 0
@@ -230,7 +294,8 @@ class PositionEvaluator:
 
         return total_sure_winners
 
-    def _trump_control_component(self, state: PlayState, perspective: str) -> float:
+    def _trump_control_component(self, state: PlayState, perspective: str,
+                                 index: Optional[CardIndex] = None) -> float:
         """
         Evaluate trump suit control
 
@@ -261,26 +326,23 @@ class PositionEvaluator:
         our_high_trumps = 0  # Count A, K, Q of trumps
         our_trump_cards = []
 
+        index = self._index(state, index)
         for pos in our_positions:
-            hand = self._get_hand(state, pos)
-            for card in hand.cards:
-                if card.suit == trump_suit:
-                    our_trump_count += 1
-                    our_trump_cards.append(card)
-                    if card.rank in ['A', 'K', 'Q']:
-                        our_high_trumps += 1
+            for card in index.suit(pos, trump_suit):
+                our_trump_count += 1
+                our_trump_cards.append(card)
+                if card.rank in ['A', 'K', 'Q']:
+                    our_high_trumps += 1
 
         # Count opponent trumps
         opp_trump_count = 0
         opp_high_trumps = 0
 
         for pos in opp_positions:
-            hand = self._get_hand(state, pos)
-            for card in hand.cards:
-                if card.suit == trump_suit:
-                    opp_trump_count += 1
-                    if card.rank in ['A', 'K', 'Q']:
-                        opp_high_trumps += 1
+            for card in index.suit(pos, trump_suit):
+                opp_trump_count += 1
+                if card.rank in ['A', 'K', 'Q']:
+                    opp_high_trumps += 1
 
         score = 0.0
 
@@ -311,7 +373,8 @@ class PositionEvaluator:
 
         return score
 
-    def _communication_component(self, state: PlayState, perspective: str) -> float:
+    def _communication_component(self, state: PlayState, perspective: str,
+                                 index: Optional[CardIndex] = None) -> float:
         """
         Evaluate entries between declarer and dummy
 
@@ -339,22 +402,13 @@ class PositionEvaluator:
 
         total_entries = 0.0
         entries_by_position = {}
+        index = self._index(state, index)
 
         for pos in positions:
-            hand = self._get_hand(state, pos)
             position_entries = 0
 
-            # Group cards by suit
-            by_suit = {}
-            for card in hand.cards:
-                if card.suit not in by_suit:
-                    by_suit[card.suit] = []
-                by_suit[card.suit].append(card)
-
-            # Count entries (A or K) in each suit
-            for suit, cards in by_suit.items():
-                sorted_cards = sorted(cards, key=lambda c: self.RANK_VALUES[c.rank], reverse=True)
-
+            # Count entries (A or K) in each suit (cards grouped by suit, highest first)
+            for suit, sorted_cards in index.by_pos[pos].items():
                 if sorted_cards:
                     highest = sorted_cards[0]
                     # Ace is a definite entry
@@ -388,7 +442,8 @@ class PositionEvaluator:
 
         return score
 
-    def _finesse_component(self, state: PlayState, perspective: str) -> float:
+    def _finesse_component(self, state: PlayState, perspective: str,
+                           index: Optional[CardIndex] = None) -> float:
         """
         Evaluate finessing opportunities
 
@@ -407,21 +462,18 @@ class PositionEvaluator:
             positions = ['E', 'W']
 
         finesse_value = 0.0
+        our_side = self._index(state, index).by_side[tuple(positions)]
 
         # Analyze each suit for finesse opportunities
-        for suit in ['♠', '♥', '♦', '♣']:
+        for suit in SUITS:
             # Get all cards in this suit from partnership
-            our_cards = []
-            for pos in positions:
-                hand = self._get_hand(state, pos)
-                our_cards.extend([c for c in hand.cards if c.suit == suit])
+            our_cards = our_side[suit]
 
             if len(our_cards) < 2:
                 continue  # Need at least 2 cards to finesse
 
             # Get ranks we hold
             our_ranks = set(card.rank for card in our_cards)
-            our_rank_values = set(self.RANK_VALUES[rank] for rank in our_ranks)
 
             # Check for specific finesse combinations
 
@@ -451,7 +503,8 @@ class PositionEvaluator:
 
         return finesse_value
 
-    def _long_suit_component(self, state: PlayState, perspective: str) -> float:
+    def _long_suit_component(self, state: PlayState, perspective: str,
+                             index: Optional[CardIndex] = None) -> float:
         """
         Evaluate long suit establishment potential
 
@@ -470,27 +523,22 @@ class PositionEvaluator:
 
         trump_suit = state.contract.trump_suit
         long_suit_value = 0.0
+        our_side = self._index(state, index).by_side[tuple(positions)]
 
         # Analyze each non-trump suit
-        for suit in ['♠', '♥', '♦', '♣']:
+        for suit in SUITS:
             if suit == trump_suit:
                 continue  # Don't count trump as long suit
 
-            # Count combined length in partnership
-            total_length = 0
-            high_cards = 0
-            all_cards = []
-
-            for pos in positions:
-                hand = self._get_hand(state, pos)
-                suit_cards = [c for c in hand.cards if c.suit == suit]
-                total_length += len(suit_cards)
-                all_cards.extend(suit_cards)
+            # Combined length in partnership (highest first)
+            all_cards = our_side[suit]
+            total_length = len(all_cards)
 
-                # Count high cards (A, K, Q)
-                for card in suit_cards:
-                    if card.rank in ['A', 'K', 'Q']:
-                        high_cards += 1
+            # Count high cards (A, K, Q)
+            high_cards = 0
+            for card in all_cards:
+                if card.rank in ['A', 'K', 'Q']:
+                    high_cards += 1
 
             # Long suits (5+) have potential
             if total_length >= 5:
@@ -508,8 +556,7 @@ class PositionEvaluator:
 
                 # Check if suit is likely to run (have top cards)
                 if all_cards:
-                    sorted_cards = sorted(all_cards, key=lambda c: self.RANK_VALUES[c.rank], reverse=True)
-                    top_card = sorted_cards[0]
+                    top_card = all_cards[0]
 
                     # If we have A or K in long suit, it's more likely to run
                     if top_card.rank == 'A':
@@ -519,7 +566,8 @@ class PositionEvaluator:
 
         return long_suit_value
 
-    def _danger_hand_component(self, state: PlayState, perspective: str) -> float:
+    def _danger_hand_component(self, state: PlayState, perspective: str,
+                               index: Optional[CardIndex] = None) -> float:
         """
         Evaluate danger hand avoidance and hold-up play
 
@@ -543,15 +591,15 @@ class PositionEvaluator:
             opp_positions = ['N', 'S']
 
         score = 0.0
+        index = self._index(state, index)
+        our_side = index.by_side[tuple(our_positions)]
 
         # Analyze each suit for danger
-        for suit in ['♠', '♥', '♦', '♣']:
+        for suit in SUITS:
             # Count cards remaining in suit for opponents
             opp_suit_lengths = {}
             for pos in opp_positions:
-                hand = self._get_hand(state, pos)
-                length = len([c for c in hand.cards if c.suit == suit])
-                opp_suit_lengths[pos] = length
+                opp_suit_lengths[pos] = len(index.suit(pos, suit))
 
             # Identify danger hand (opponent with long suit)
             if opp_suit_lengths:
@@ -562,18 +610,14 @@ class PositionEvaluator:
                     danger_pos = max(opp_suit_lengths, key=opp_suit_lengths.get)
 
                     # Count our stoppers in this suit
-                    our_cards = []
-                    for pos in our_positions:
-                        hand = self._get_hand(state, pos)
-                        our_cards.extend([c for c in hand.cards if c.suit == suit])
+                    our_cards = our_side[suit]
 
                     # Check for stopper (A, K, or Q with length)
                     has_stopper = False
                     stopper_quality = 0
 
                     if our_cards:
-                        sorted_cards = sorted(our_cards, key=lambda c: self.RANK_VALUES[c.rank], reverse=True)
-                        top_card = sorted_cards[0]
+                        top_card = our_cards[0]
 
                         if top_card.rank == 'A':
                             has_stopper = True
@@ -600,7 +644,8 @@ class PositionEvaluator:
 
         return score
 
-    def _tempo_component(self, state: PlayState, perspective: str) -> float:
+    def _tempo_component(self, state: PlayState, perspective: str,
+                         index: Optional[CardIndex] = None) -> float:
         """
         Evaluate tempo and timing considerations
 
@@ -622,17 +667,15 @@ class PositionEvaluator:
             opp_positions = ['N', 'S']
 
         trump_suit = state.contract.trump_suit
+        index = self._index(state, index)
+        our_side = index.by_side[tuple(our_positions)]
 
         # Count winners we can cash immediately
         immediate_winners = 0
-        for suit in ['♠', '♥', '♦', '♣']:
-            our_cards = []
-            for pos in our_positions:
-                hand = self._get_hand(state, pos)
-                our_cards.extend([c for c in hand.cards if c.suit == suit])
+        for suit in SUITS:
+            sorted_cards = our_side[suit]
 
-            if our_cards:
-                sorted_cards = sorted(our_cards, key=lambda c: self.RANK_VALUES[c.rank], reverse=True)
+            if sorted_cards:
                 # Count top sequential cards as immediate winners
                 top_val = 14  # Ace
                 for card in sorted_cards:
@@ -650,8 +693,7 @@ class PositionEvaluator:
             # Count opponent trumps
             opp_trumps = 0
             for pos in opp_positions:
-                hand = self._get_hand(state, pos)
-                opp_trumps += len([c for c in hand.cards if c.suit == trump_suit])
+                opp_trumps += len(index.suit(pos, trump_suit))
 
             # If opponents have few trumps left, less urgent
             if opp_trumps == 0:
@@ -662,22 +704,19 @@ class PositionEvaluator:
         # In NT, check for race situations (who establishes long suit first)
         if not trump_suit:
             # Count near-established long suits
-            for suit in ['♠', '♥', '♦', '♣']:
-                our_cards = []
-                for pos in our_positions:
-                    hand = self._get_hand(state, pos)
-                    our_cards.extend([c for c in hand.cards if c.suit == suit])
+            for suit in SUITS:
+                sorted_cards = our_side[suit]
 
-                if len(our_cards) >= 4:
+                if len(sorted_cards) >= 4:
                     # We have length - check if close to running
-                    sorted_cards = sorted(our_cards, key=lambda c: self.RANK_VALUES[c.rank], reverse=True)
-                    if sorted_cards and sorted_cards[0].rank in ['A', 'K']:
+                    if sorted_cards[0].rank in ['A', 'K']:
                         # Long suit with top card - good tempo
                         score += 0.25
 
         return score
 
-    def _defensive_component(self, state: PlayState, perspective: str) -> float:
+    def _defensive_component(self, state: PlayState, perspective: str,
+                             index: Optional[CardIndex] = None) -> float:
         """
         Evaluate defensive potential and strategy
 
@@ -709,12 +748,11 @@ class PositionEvaluator:
             our_positions = ['E', 'W']
             decl_positions = ['N', 'S']
 
+        index = self._index(state, index)
+
         # Defensive Trump Promotion
         if trump_suit:
-            our_trumps = []
-            for pos in our_positions:
-                hand = self._get_hand(state, pos)
-                our_trumps.extend([c for c in hand.cards if c.suit == trump_suit])
+            our_trumps = index.by_side[tuple(our_positions)][trump_suit]
 
             # Count high trumps (Q, K, A)
             high_trumps = len([c for c in our_trumps if c.rank in ['Q', 'K', 'A']])
@@ -723,16 +761,15 @@ class PositionEvaluator:
 
             # Check for defensive ruff potential (shortness in side suit with trumps)
             for pos in our_positions:
-                hand = self._get_hand(state, pos)
-                has_trumps = any(c.suit == trump_suit for c in hand.cards)
+                has_trumps = bool(index.suit(pos, trump_suit))
 
                 if has_trumps:
                     # Check for voids or singletons in side suits
-                    for suit in ['♠', '♥', '♦', '♣']:
+                    for suit in SUITS:
                         if suit == trump_suit:
                             continue
 
-                        suit_count = len([c for c in hand.cards if c.suit == suit])
+                        suit_count = len(index.suit(pos, suit))
                         if suit_count == 0:
                             score += 0.5  # Void - excellent for ruffing
                         elif suit_count == 1:
@@ -742,11 +779,10 @@ class PositionEvaluator:
         # Check if we're breaking up declarer's entries
         decl_entries = 0
         for pos in decl_positions:
-            hand = self._get_hand(state, pos)
-            for suit in ['♠', '♥', '♦', '♣']:
-                suit_cards = [c for c in hand.cards if c.suit == suit]
+            for suit in SUITS:
+                suit_cards = index.suit(pos, suit)
                 if suit_cards:
-                    highest = max(suit_cards, key=lambda c: self.RANK_VALUES[c.rank])
+                    highest = suit_cards[0]
                     if highest.rank in ['A', 'K']:
                         decl_entries += 1
 
@@ -777,16 +813,17 @@ class PositionEvaluator:
             >>> print(f"Tricks won: {scores['tricks_won']}")
             >>> print(f"Sure winners: {scores['sure_winners']}")
         """
+        index = self._index(state, None)
         return {
             'tricks_won': self._tricks_won_component(state, perspective),
-            'sure_winners': self._sure_winners_component(state, perspective),
-            'trump_control': self._trump_control_component(state, perspective),
-            'communication': self._communication_component(state, perspective),
-            'finesse': self._finesse_component(state, perspective),
-            'long_suits': self._long_suit_component(state, perspective),
-            'danger_hand': self._danger_hand_component(state, perspective),
-            'tempo': self._tempo_component(state, perspective),
-            'defensive': self._defensive_component(state, perspective),
+            'sure_winners': self._sure_winners_component(state, perspective, index),
+            'trump_control': self._trump_control_component(state, perspective, index),
+            'communication': self._communication_component(state, perspective, index),
+            'finesse': self._finesse_component(state, perspective, index),
+            'long_suits': self._long_suit_component(state, perspective, index),
+            'danger_hand': self._danger_hand_component(state, perspective, index),
+            'tempo': self._tempo_component(state, perspective, index),
+            'defensive': self._defensive_component(state, perspective, index),
         }
 
     def explain_evaluation(self, state: PlayState, perspective: str) -> str:
@@ -14,17 +14,39 @@ Performance:
 - Depth 2: ~16-64 positions, < 1 second
 - Depth 3: ~64-256 positions, 1-3 seconds
 - Depth 4: ~256-1024 positions, 3-10 seconds
+- Positions are updated in place with make/unmake (SearchPosition)
+  instead of deep-copying the PlayState at every node
+- A Zobrist-keyed transposition table caches results of positions
+  reached through transposed card orders; it is kept across moves so
+  trick N+1 reuses work from trick N
+- Optional anytime mode: with a time_budget_ms the search deepens one ply
+  at a time and returns the best card of the deepest completed iteration
 """
 
 from engine.hand import Hand, Card
 from engine.play_engine import PlayEngine, PlayState, Contract
 from engine.play.ai.base_ai import BasePlayAI
 from engine.play.ai.evaluation import PositionEvaluator
+from engine.play.ai.search_position import SearchPosition
+from engine.play.ai.transposition import (
+    TranspositionTable, DEFAULT_TT_SIZE, EXACT, LOWER, UPPER,
+    SEAT_INDEX, TURN_KEYS,
+)
+from engine.bitboard import legal_cards as bitboard_legal_cards
 from typing import List, Tuple, Optional
 import copy
 import time
 
 
+class SearchTimeout(Exception):
+    """Raised inside the search when the per-move time budget runs out"""
+    pass
+
+
+# How often (in nodes) the search checks the clock
+DEADLINE_CHECK_INTERVAL = 256
+
+
 class MinimaxPlayAI(BasePlayAI):
     """
     Minimax AI with alpha-beta pruning for Bridge card play
@@ -38,9 +60,13 @@ class MinimaxPlayAI(BasePlayAI):
         >>> card = ai.choose_card(play_state, 'S')
         >>> stats = ai.get_statistics()
         >>> print(f"Searched {stats['nodes']} nodes in {stats['time']:.2f}s")
+
+        >>> # Anytime search: deepen up to 4 plies within 500ms
+        >>> ai = MinimaxPlayAI(max_depth=4, time_budget_ms=500)
     """
 
-    def __init__(self, max_depth: int = 3, evaluator: Optional[PositionEvaluator] = None):
+    def __init__(self, max_depth: int = 3, evaluator: Optional[PositionEvaluator] = None,
+                 tt_size: int = DEFAULT_TT_SIZE, time_budget_ms: Optional[int] = None):
         """
         Initialize Minimax AI
 
@@ -50,6 +76,11 @@ class MinimaxPlayAI(BasePlayAI):
                 - 3 = balanced (~1-3s), advanced strength
                 - 4 = slow (~3-10s), expert strength
             evaluator: Position evaluation function (uses default if None)
+            tt_size: Transposition table slots (0 disables the table)
+            time_budget_ms: Per-move time budget. If set, search iteratively
+                deepens from depth 1 to max_depth and stops when the budget
+                runs out, returning the best card of the deepest completed
+                iteration. If None, searches to max_depth directly.
 
         Example:
             >>> # Fast AI for real-time play
@@ -59,7 +90,13 @@ class MinimaxPlayAI(BasePlayAI):
             >>> ai_strong = MinimaxPlayAI(max_depth=4)
         """
         self.max_depth = max_depth
+        self.time_budget_ms = time_budget_ms
         self.evaluator = evaluator or PositionEvaluator()
+        self._deadline = None
+
+        # Transposition table (kept across moves; entries are keyed on the
+        # full position and contract, so nothing leaks between hands)
+        self.tt = TranspositionTable(tt_size) if tt_size > 0 else None
 
         # Statistics (reset each move)
         self.nodes_searched = 0
@@ -67,6 +104,9 @@ class MinimaxPlayAI(BasePlayAI):
         self.pruned_branches = 0
         self.search_time = 0.0
         self.best_score = 0.0
+        self.tt_hits = 0
+        self.tt_misses = 0
+        self.completed_depth = 0
 
     def get_name(self) -> str:
         """Return AI name with depth"""
@@ -103,6 +143,8 @@ class MinimaxPlayAI(BasePlayAI):
         # Reset statistics
         self.reset_statistics()
         start_time = time.time()
+        if self.tt is not None:
+            self.tt.new_search()
 
         # Get legal moves
         legal_cards = self._get_legal_cards(state, position)
@@ -127,42 +169,20 @@ class MinimaxPlayAI(BasePlayAI):
         # Order moves for better alpha-beta pruning
         ordered_cards = self._order_moves(legal_cards, state, position, is_declarer_side)
 
-        # Run minimax search for each legal card
-        best_card = None
-        best_score = float('-inf')  # ALWAYS maximize from perspective player's viewpoint
-
-        # Track all cards with best score for tiebreaking
-        best_cards = []
-
-        for card in ordered_cards:
-            # Simulate playing this card
-            test_state = self._simulate_play(state, card, position)
+        # Single mutable position shared by the whole search (make/unmake)
+        search_pos = SearchPosition.from_play_state(state)
+        search_pos.next_to_play = position
 
-            # Evaluate resulting position
-            # CRITICAL FIX: Root player ALWAYS maximizes (evaluation is perspective-aware)
-            # Next player will minimize from root's perspective (i.e., maximize from their own)
-            score = self._minimax(
-                test_state,
-                depth=self.max_depth - 1,
-                alpha=float('-inf'),
-                beta=float('inf'),
-                maximizing=False,  # Next player minimizes root's score
-                perspective=position  # But evaluation stays from root's perspective
+        if self.time_budget_ms is None:
+            best_score, best_card, best_cards = self._search_root(
+                search_pos, ordered_cards, ordered_cards, self.max_depth,
+                position, is_discarding
+            )
+            self.completed_depth = self.max_depth
+        else:
+            best_score, best_card, best_cards = self._iterative_deepening(
+                search_pos, ordered_cards, position, is_discarding, start_time
             )
-
-            # DISCARD PENALTY: If discarding an honor card, apply strong penalty
-            # This prevents AI from discarding Kings when low cards are available
-            if is_discarding:
-                discard_penalty = self._calculate_discard_penalty(card)
-                score += discard_penalty  # Penalty is negative, so this reduces score
-
-            # Update best move - ALWAYS maximize from root player's perspective
-            if score > best_score:
-                best_score = score
-                best_card = card
-                best_cards = [card]
-            elif score == best_score:
-                best_cards.append(card)
 
         # CRITICAL TIEBREAKER: If discarding, ALWAYS choose the LOWEST rank card
         # This prevents wasting high cards when positions are evaluated similarly
@@ -184,16 +204,15 @@ class MinimaxPlayAI(BasePlayAI):
                 similar_cards = []
 
                 for c in legal_cards:
-                    # Simulate this card
-                    test_state = self._simulate_play(state, c, position)
-                    c_score = self._minimax(
-                        test_state,
-                        depth=0,  # Just evaluate, don't search deep again
-                        alpha=float('-inf'),
-                        beta=float('inf'),
-                        maximizing=True,  # FIXED: Consistent with main logic (root maximizes)
-                        perspective=position
-                    )
+                    # Play this card in place
+                    search_pos.play(c)
+                    # Just evaluate, don't search deep again. Bypasses the
+                    # transposition table: a deeper entry left by an earlier
+                    # search would make the choice depend on search history
+                    self.nodes_searched += 1
+                    self.leaf_nodes += 1
+                    c_score = self.evaluator.evaluate(search_pos, position)
+                    search_pos.undo()
 
                     # Check if score is similar to best (unified logic - no declarer check needed)
                     if abs(c_score - best_score) <= tolerance:
@@ -209,7 +228,107 @@ class MinimaxPlayAI(BasePlayAI):
         # Fallback (should never happen)
         return best_card or legal_cards[0]
 
-    def _minimax(self, state: PlayState, depth: int, alpha: float,
+    def _iterative_deepening(self, search_pos: SearchPosition, ordered_cards: List[Card],
+                             position: str, is_discarding: bool,
+                             start_time: float) -> Tuple[float, Card, List[Card]]:
+        """
+        Anytime search: deepen one ply at a time until max_depth or budget
+
+        Depth 1 always completes so there is always a move to return. Each
+        later iteration searches the previous best card first (and the
+        transposition table supplies best moves below the root); if the
+        budget runs out mid-iteration, that iteration is discarded.
+
+        Returns:
+            (best_score, best_card, best_cards) of the deepest completed iteration
+        """
+        deadline = start_time + self.time_budget_ms / 1000.0
+        result = None
+        search_order = ordered_cards
+
+        for depth in range(1, self.max_depth + 1):
+            # Depth 1 runs without a deadline so a move is always available
+            self._deadline = deadline if result is not None else None
+            try:
+                result = self._search_root(
+                    search_pos, search_order, ordered_cards, depth,
+                    position, is_discarding
+                )
+            except SearchTimeout:
+                while search_pos.depth:
+                    search_pos.undo()
+                break
+            finally:
+                self._deadline = None
+
+            self.completed_depth = depth
+            best_card = result[1]
+            search_order = [best_card] + [c for c in ordered_cards if c != best_card]
+
+            if time.time() >= deadline:
+                break
+
+        return result
+
+    def _search_root(self, search_pos: SearchPosition, search_order: List[Card],
+                     ordered_cards: List[Card], depth: int, position: str,
+                     is_discarding: bool) -> Tuple[float, Card, List[Card]]:
+        """
+        Search every root card to the given depth
+
+        Cards are searched in search_order, but ties are broken by their
+        place in ordered_cards, so the result does not depend on the order
+        the cards were searched in.
+
+        Returns:
+            (best_score, best_card, best_cards) where best_cards holds every
+            card sharing the best score, in ordered_cards order
+        """
+        rank_in_order = {card: i for i, card in enumerate(ordered_cards)}
+
+        best_card = None
+        best_score = float('-inf')  # ALWAYS maximize from perspective player's viewpoint
+
+        # Track all cards with best score for tiebreaking
+        best_cards = []
+
+        for card in search_order:
+            # Play this card in place
+            search_pos.play(card)
+
+            # Evaluate resulting position
+            # CRITICAL FIX: Root player ALWAYS maximizes (evaluation is perspective-aware)
+            # Next player will minimize from root's perspective (i.e., maximize from their own)
+            score = self._minimax(
+                search_pos,
+                depth=depth - 1,
+                alpha=float('-inf'),
+                beta=float('inf'),
+                maximizing=False,  # Next player minimizes root's score
+                perspective=position  # But evaluation stays from root's perspective
+            )
+            search_pos.undo()
+
+            # DISCARD PENALTY: If discarding an honor card, apply strong penalty
+            # This prevents AI from discarding Kings when low cards are available
+            if is_discarding:
+                discard_penalty = self._calculate_discard_penalty(card)
+                score += discard_penalty  # Penalty is negative, so this reduces score
+
+            # Update best move - ALWAYS maximize from root player's perspective
+            if score > best_score:
+                best_score = score
+                best_card = card
+                best_cards = [card]
+            elif score == best_score:
+                best_cards.append(card)
+                if rank_in_order[card] < rank_in_order[best_card]:
+                    best_card = card
+
+        best_cards.sort(key=rank_in_order.__getitem__)
+        return best_score, best_card, best_cards
+
+    def _minimax(self, state: SearchPosition, depth: int, alpha: float,
                  beta: float, maximizing: bool, perspective: str) -> float:
         """
         Minimax search with alpha-beta pruning
@@ -218,7 +337,8 @@ class MinimaxPlayAI(BasePlayAI):
         game tree, pruning branches that can't affect the final result.
 
         Args:
-            state: Current position to evaluate
+            state: Current position to evaluate (a PlayState is wrapped in
+                a SearchPosition; the position is restored before returning)
             depth: Remaining search depth (stops at 0)
             alpha: Best value maximizer can guarantee
             beta: Best value minimizer can guarantee
@@ -236,43 +356,86 @@ class MinimaxPlayAI(BasePlayAI):
         """
         self.nodes_searched += 1
 
+        # Anytime mode: abandon the current iteration when the budget runs out
+        if (self._deadline is not None
+                and self.nodes_searched % DEADLINE_CHECK_INTERVAL == 0
+                and time.time() > self._deadline):
+            raise SearchTimeout(f"Search budget of {self.time_budget_ms}ms exhausted")
+
+        if not isinstance(state, SearchPosition):
+            state = SearchPosition.from_play_state(state)
+
+        # Transposition table probe, keyed on the position and the player to
+        # move. Whether that player maximizes follows from their side and the
+        # perspective's, so an entry searched at least as deep for the same
+        # perspective side answers the query within its bound; the best
+        # move orders the search for either side.
+        tt = self.tt
+        hash_move = None
+        if tt is not None:
+            key = state.key ^ TURN_KEYS[SEAT_INDEX[state.next_to_play]]
+            side = SEAT_INDEX[perspective] & 1
+            entry = tt.probe(key)
+            if entry is not None:
+                entry_depth, flag, value, hash_move, entry_side = entry
+                if entry_side == side and entry_depth >= depth and (
+                        flag == EXACT
+                        or (flag == LOWER and value >= beta)
+                        or (flag == UPPER and value <= alpha)):
+                    self.tt_hits += 1
+                    return value
+            self.tt_misses += 1
+
         # Terminal conditions
         if depth == 0 or state.is_complete:
             self.leaf_nodes += 1
-            return self.evaluator.evaluate(state, perspective)
+            score = self.evaluator.evaluate(state, perspective)
+            if tt is not None:
+                tt.store(key, depth, EXACT, score, None, side)
+            return score
 
         # Get current player and legal moves
         current_player = state.next_to_play
-        legal_cards = self._get_legal_cards(state, current_player)
+        legal_cards = state.legal_cards(current_player)
 
-        # Order moves for better pruning
+        # Order moves for better pruning (best move from the table first)
         is_decl = self._is_declarer_side(current_player, state.contract.declarer)
         ordered_cards = self._order_moves(legal_cards, state, current_player, is_decl)
+        if hash_move is not None and hash_move in ordered_cards and ordered_cards[0] != hash_move:
+            ordered_cards.remove(hash_move)
+            ordered_cards.insert(0, hash_move)
+
+        alpha_orig, beta_orig = alpha, beta
+        best_move = None
 
         if maximizing:
-            max_eval = float('-inf')
+            best_eval = float('-inf')
             for card in ordered_cards:
-                test_state = self._simulate_play(state, card, current_player)
+                state.play(card)
                 eval_score = self._minimax(
-                    test_state, depth - 1, alpha, beta, False, perspective
+                    state, depth - 1, alpha, beta, False, perspective
                 )
-                max_eval = max(max_eval, eval_score)
+                state.undo()
+                if eval_score > best_eval:
+                    best_eval = eval_score
+                    best_move = card
                 alpha = max(alpha, eval_score)
 
                 # Beta cutoff (pruning)
                 if beta <= alpha:
                     self.pruned_branches += 1
                     break
-
-            return max_eval
         else:
-            min_eval = float('inf')
+            best_eval = float('inf')
             for card in ordered_cards:
-                test_state = self._simulate_play(state, card, current_player)
+                state.play(card)
                 eval_score = self._minimax(
-                    test_state, depth - 1, alpha, beta, True, perspective
+                    state, depth - 1, alpha, beta, True, perspective
                 )
-                min_eval = min(min_eval, eval_score)
+                state.undo()
+                if eval_score < best_eval:
+                    best_eval = eval_score
+                    best_move = card
                 beta = min(beta, eval_score)
 
                 # Alpha cutoff (pruning)
@@ -280,7 +443,16 @@ class MinimaxPlayAI(BasePlayAI):
                     self.pruned_branches += 1
                     break
 
-            return min_eval
+        if tt is not None:
+            if best_eval <= alpha_orig:
+                flag = UPPER
+            elif best_eval >= beta_orig:
+                flag = LOWER
+            else:
+                flag = EXACT
+            tt.store(key, depth, flag, best_eval, best_move, side)
+
+        return best_eval
 
     def _simulate_play(self, state: PlayState, card: Card,
                        position: str) -> PlayState:
@@ -299,7 +471,9 @@ class MinimaxPlayAI(BasePlayAI):
             New state after playing the card
 
         Note:
-            This is expensive (deep copy), but necessary for minimax search.
+            This is expensive (deep copy). The search itself uses
+            SearchPosition.play()/undo() instead; this is kept for callers
+            that need an independent PlayState.
         """
         # Deep copy the state (expensive but necessary)
         new_state = copy.deepcopy(state)
@@ -356,22 +530,11 @@ class MinimaxPlayAI(BasePlayAI):
         Returns:
             List of legal cards
         """
-        # Position is already in correct format (N/S/E/W)
-        hand = state.hands[position]
-
-        if not state.current_trick:
-            # Leading - any card is legal
-            return list(hand.cards)
-
-        # Following - must follow suit if able
-        led_suit = state.current_trick[0][0].suit
-        cards_in_suit = [c for c in hand.cards if c.suit == led_suit]
+        if isinstance(state, SearchPosition):
+            return state.legal_cards(position)
 
-        if cards_in_suit:
-            return cards_in_suit
-        else:
-            # Void - any card is legal
-            return list(hand.cards)
+        # Position is already in correct format (N/S/E/W)
+        return bitboard_legal_cards(state.hands[position].cards, state.current_trick)
 
     def _is_declarer_side(self, position: str, declarer: str) -> bool:
         """
@@ -539,6 +702,12 @@ class MinimaxPlayAI(BasePlayAI):
             - time: Search time in seconds
             - nps: Nodes per second
             - score: Best score found
+            - tt_hits: Transposition table probes that returned a result
+            - tt_misses: Probes that had to search the position
+            - tt_size: Positions currently stored in the table
+            - tt_capacity: Table slots (0 if the table is disabled)
+            - completed_depth: Deepest fully searched depth this move
+            - time_budget_ms: Per-move budget (None for fixed depth)
 
         Example:
             >>> card = ai.choose_card(state, 'S')
@@ -555,7 +724,13 @@ class MinimaxPlayAI(BasePlayAI):
             'time': self.search_time,
             'nps': nps,
             'score': self.best_score,
-            'depth': self.max_depth
+            'depth': self.max_depth,
+            'tt_hits': self.tt_hits,
+            'tt_misses': self.tt_misses,
+            'tt_size': len(self.tt) if self.tt is not None else 0,
+            'tt_capacity': self.tt.capacity if self.tt is not None else 0,
+            'completed_depth': self.completed_depth,
+            'time_budget_ms': self.time_budget_ms,
         }
 
     def reset_statistics(self):
@@ -565,6 +740,9 @@ class MinimaxPlayAI(BasePlayAI):
         self.pruned_branches = 0
         self.search_time = 0.0
         self.best_score = 0.0
+        self.tt_hits = 0
+        self.tt_misses = 0
+        self.completed_depth = 0
 
     def get_explanation(self, card: Card, state: PlayState, position: str) -> str:
         """
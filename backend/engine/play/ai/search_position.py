@@ -0,0 +1,279 @@
+"""
+Mutable Search Position for Bridge Card Play Search
+
+Minimax search used to deep-copy the whole PlayState (four Hand objects,
+trick history, contract) at every node of the game tree. SearchPosition
+replaces that with a single mutable position that is updated in place
+with play(card) and restored with undo().
+
+A SearchPosition exposes the subset of the PlayState interface that the
+search and the PositionEvaluator read (contract, hands[pos].cards,
+current_trick, tricks_won, next_to_play, is_complete, ...), so it can be
+passed anywhere those components expect a PlayState. Each hand is also
+kept as a 52-bit mask (see engine.bitboard) for O(1) follow-suit checks,
+and the evaluator's CardIndex (suit holdings per hand and per
+partnership) is updated incrementally, so leaf evaluation does not
+regroup every hand. A Zobrist hash of the position (see
+engine.play.ai.transposition) is maintained the same way.
+
+Example:
+    >>> pos = SearchPosition.from_play_state(play_state)
+    >>> pos.play(Card('A', '♠'))
+    >>> score = evaluator.evaluate(pos, 'S')
+    >>> pos.undo()
+"""
+
+from engine.hand import Card
+from engine.play_engine import PlayState, Contract
+from engine.play.ai.evaluation import CardIndex, RANK_VALUES
+from engine.bitboard import CARD_BIT, SUIT_MASK, cards_to_mask, mask_to_cards
+from engine.play.ai.transposition import (
+    SEAT_INDEX, HAND_KEYS, TRICK_KEYS, NS_TRICKS_KEYS, STRAIN_KEYS,
+    DECLARER_SIDE_KEYS, side_index,
+)
+from typing import Dict, List, Optional, Tuple
+
+from utils.seats import NEXT_PLAYER, PARTNERS
+
+
+class SearchHand:
+    """
+    Lightweight stand-in for Hand during search
+
+    Only carries the list of remaining cards - the evaluation properties
+    of Hand (hcp, suit_lengths, ...) describe the ORIGINAL 13 cards and
+    are never read during search.
+    """
+
+    __slots__ = ('cards',)
+
+    def __init__(self, cards: List[Card]):
+        self.cards = cards
+
+
+class SearchPosition:
+    """
+    Play position that supports in-place make/unmake
+
+    Every play() pushes an undo record onto an internal stack; undo()
+    pops it and restores hands, current trick, trick winner, tricks won
+    and the player to move exactly as they were, including the order of
+    cards within each hand (so move ordering stays deterministic).
+
+    `key` is the Zobrist hash of the cards in each hand, the current
+    trick, NS tricks won and the contract. It does not include the player
+    to move, which callers may reassign directly; searchers mix that in.
+    """
+
+    __slots__ = ('contract', 'hands', 'masks', 'current_trick', 'tricks_won',
+                 'next_to_play', 'tricks_played', 'card_index', 'key', '_trump',
+                 '_undo_stack')
+
+    def __init__(self, contract: Contract, hands: Dict[str, List[Card]],
+                 current_trick: List[Tuple[Card, str]], tricks_won: Dict[str, int],
+                 next_to_play: str):
+        """
+        Initialize search position
+
+        Args:
+            contract: Contract being played (read-only during search)
+            hands: Remaining cards for each position ('N', 'E', 'S', 'W')
+            current_trick: (card, position) pairs already played to this trick
+            tricks_won: Tricks won by each position so far
+            next_to_play: Position to play next
+        """
+        self.contract = contract
+        self.hands = {pos: SearchHand(list(cards)) for pos, cards in hands.items()}
+        self.masks = {pos: cards_to_mask(cards) for pos, cards in hands.items()}
+        self.current_trick = list(current_trick)
+        self.tricks_won = dict(tricks_won)
+        self.next_to_play = next_to_play
+        self.tricks_played = sum(self.tricks_won.values())
+        self.card_index = CardIndex(self)
+        self._trump = contract.trump_suit
+        self._undo_stack = []
+
+        key = STRAIN_KEYS[self._trump or 'NT'] ^ DECLARER_SIDE_KEYS[side_index(contract.declarer)]
+        key ^= NS_TRICKS_KEYS[self.tricks_taken_ns]
+        for pos, cards in hands.items():
+            hand_keys = HAND_KEYS[SEAT_INDEX[pos]]
+            for card in cards:
+                key ^= hand_keys[CARD_BIT[card]]
+        for card, pos in self.current_trick:
+            key ^= TRICK_KEYS[SEAT_INDEX[pos]][CARD_BIT[card]]
+        self.key = key
+
+    @classmethod
+    def from_play_state(cls, state: PlayState) -> 'SearchPosition':
+        """
+        Build a search position from a PlayState
+
+        The PlayState is not modified; cards and trick lists are copied.
+
+        Args:
+            state: Current play state
+
+        Returns:
+            Independent SearchPosition at the same point of play
+        """
+        return cls(
+            contract=state.contract,
+            hands={pos: hand.cards for pos, hand in state.hands.items()},
+            current_trick=state.current_trick,
+            tricks_won=state.tricks_won,
+            next_to_play=state.next_to_play,
+        )
+
+    @classmethod
+    def from_bitmasks(cls, contract: Contract, masks: Dict[str, int], next_to_play: str,
+                      current_trick: Optional[List[Tuple[Card, str]]] = None,
+                      tricks_won: Optional[Dict[str, int]] = None) -> 'SearchPosition':
+        """
+        Build a search position directly from bitmask hands
+
+        Args:
+            contract: Contract being played
+            masks: 52-bit card mask per position (engine.bitboard layout)
+            next_to_play: Position to play next
+            current_trick: Cards already played to this trick (default none)
+            tricks_won: Tricks won so far (default zero for everyone)
+
+        Returns:
+            SearchPosition that minimax and PositionEvaluator can run on
+        """
+        return cls(
+            contract=contract,
+            hands={pos: mask_to_cards(mask) for pos, mask in masks.items()},
+            current_trick=current_trick or [],
+            tricks_won=tricks_won or {'N': 0, 'E': 0, 'S': 0, 'W': 0},
+            next_to_play=next_to_play,
+        )
+
+    # ------------------------------------------------------------------
+    # PlayState-compatible read interface
+    # ------------------------------------------------------------------
+
+    @property
+    def dummy(self) -> str:
+        """Return dummy position (partner of declarer)"""
+        return PARTNERS[self.contract.declarer]
+
+    @property
+    def tricks_taken_ns(self) -> int:
+        """Total tricks taken by NS partnership"""
+        return self.tricks_won.get('N', 0) + self.tricks_won.get('S', 0)
+
+    @property
+    def tricks_taken_ew(self) -> int:
+        """Total tricks taken by EW partnership"""
+        return self.tricks_won.get('E', 0) + self.tricks_won.get('W', 0)
+
+    @property
+    def is_complete(self) -> bool:
+        """Check if all 13 tricks have been played"""
+        return self.tricks_played == 13
+
+    @property
+    def depth(self) -> int:
+        """Number of cards played since the position was created"""
+        return len(self._undo_stack)
+
+    # ------------------------------------------------------------------
+    # Move generation and make/unmake
+    # ------------------------------------------------------------------
+
+    def legal_cards(self, position: Optional[str] = None) -> List[Card]:
+        """
+        Get legal cards for a position (defaults to the player to move)
+
+        Must follow suit if able; if void in the led suit, any card.
+        Cards are returned in Hand order (suits ♠ ♥ ♦ ♣, highest first).
+        """
+        mask = self.masks[position or self.next_to_play]
+
+        if self.current_trick:
+            follow = mask & SUIT_MASK[self.current_trick[0][0].suit]
+            if follow:
+                mask = follow
+
+        return mask_to_cards(mask)
+
+    def play(self, card: Card) -> Optional[str]:
+        """
+        Play a card for the player to move, updating the position in place
+
+        Args:
+            card: Card to play (must be in the mover's hand)
+
+        Returns:
+            Winner of the trick if this card completed it, otherwise None
+        """
+        position = self.next_to_play
+        cards = self.hands[position].cards
+        slot = cards.index(card)
+        del cards[slot]
+        bit = CARD_BIT[card]
+        self.masks[position] ^= 1 << bit
+        index_slots = self.card_index.remove(position, card)
+
+        trick = self.current_trick
+        trick.append((card, position))
+
+        old_key = self.key
+        seat = SEAT_INDEX[position]
+        key = old_key ^ HAND_KEYS[seat][bit] ^ TRICK_KEYS[seat][bit]
+
+        if len(trick) == 4:
+            winner = self._trick_winner(trick)
+            for trick_card, player in trick:
+                key ^= TRICK_KEYS[SEAT_INDEX[player]][CARD_BIT[trick_card]]
+            if winner in ('N', 'S'):
+                ns = self.tricks_taken_ns
+                key ^= NS_TRICKS_KEYS[ns] ^ NS_TRICKS_KEYS[ns + 1]
+            self.key = key
+            self.tricks_won[winner] += 1
+            self.tricks_played += 1
+            self._undo_stack.append((position, slot, index_slots, trick, winner, old_key))
+            self.current_trick = []
+            self.next_to_play = winner
+            return winner
+
+        self.key = key
+        self._undo_stack.append((position, slot, index_slots, None, None, old_key))
+        self.next_to_play = NEXT_PLAYER[position]
+        return None
+
+    def undo(self) -> Card:
+        """
+        Take back the most recent play()
+
+        Returns:
+            The card that was taken back
+        """
+        position, slot, index_slots, completed_trick, winner, self.key = self._undo_stack.pop()
+
+        if completed_trick is not None:
+            self.tricks_won[winner] -= 1
+            self.tricks_played -= 1
+            self.current_trick = completed_trick
+
+        card, _ = self.current_trick.pop()
+        self.hands[position].cards.insert(slot, card)
+        self.masks[position] |= 1 << CARD_BIT[card]
+        self.card_index.restore(position, card, *index_slots)
+        self.next_to_play = position
+        return card
+
+    def _trick_winner(self, trick: List[Tuple[Card, str]]) -> str:
+        """Highest trump wins, otherwise highest card of the led suit"""
+        trump = self._trump
+        win_card, winner = trick[0]
+
+        for card, player in trick[1:]:
+            if card.suit == win_card.suit:
+                if RANK_VALUES[card.rank] > RANK_VALUES[win_card.rank]:
+                    win_card, winner = card, player
+            elif card.suit == trump:
+                win_card, winner = card, player
+
+        return winner
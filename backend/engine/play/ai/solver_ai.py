@@ -0,0 +1,172 @@
+"""
+Double Dummy AI on the pure-Python solver
+
+Expert-level play where endplay isn't installed or isn't safe to load
+(non-Linux platforms): the same card choice as DDSPlayAI - every card
+that keeps the double dummy value, then the tactical tie-break - with
+engine.play.dd_solver doing the solving.
+
+The Python solver is far slower than DDS. Endings of up to eight tricks
+solve in well under a second, but the opening tricks of a full deal take
+from seconds to minutes, so each move gets a time limit
+(SOLVER_AI_TIME_LIMIT) and a move whose solve runs out of time is chosen
+by the budgeted Minimax AI instead. The server only uses it for Expert
+play when EXPERT_PYTHON_SOLVER is set.
+
+Environment:
+    SOLVER_AI_TIME_LIMIT: seconds per solve before falling back (default 1)
+"""
+
+import os
+import time
+from typing import List, Optional, Tuple
+
+from engine.bitboard import BIT_CARD, CARD_BIT, cards_to_mask
+from engine.hand import Card
+from engine.play_engine import PlayState
+from engine.play.ai.dds_ai import DDSPlayAI
+from engine.play.ai.minimax_ai import MinimaxPlayAI
+from engine.play.dd_solver import (
+    SEATS,
+    SEAT_INDEX,
+    DoubleDummySolver,
+    SolverTimeout,
+    trump_index,
+)
+
+SOLVER_AI_TIME_LIMIT = float(os.environ.get('SOLVER_AI_TIME_LIMIT', 1))
+
+
+class SolverPlayAI(DDSPlayAI):
+    """
+    Double dummy play from the pure-Python solver.
+
+    Example:
+        >>> ai = SolverPlayAI(time_limit=1)
+        >>> card = ai.choose_card(play_state, 'S')
+    """
+
+    requires_endplay = False
+
+    def __init__(self, time_limit: Optional[float] = SOLVER_AI_TIME_LIMIT,
+                 fallback_ai: Optional[MinimaxPlayAI] = None):
+        """
+        Args:
+            time_limit: Seconds a solve may take (None = no limit)
+            fallback_ai: AI for moves whose solve times out (default:
+                Minimax depth 4 with a 3s budget)
+        """
+        super().__init__()
+        self.time_limit = time_limit
+        # Per-move budget, so callers treat this as an anytime AI
+        self.time_budget_ms = int(time_limit * 1000) if time_limit else None
+        self._fallback_ai = fallback_ai or MinimaxPlayAI(max_depth=4, time_budget_ms=3000)
+        self.timeouts = 0
+
+    def get_name(self) -> str:
+        """Return AI name"""
+        return "Double Dummy Solver AI (Python)"
+
+    def choose_card(self, state: PlayState, position: str) -> Card:
+        """
+        Choose a card that keeps the double dummy value.
+
+        Args:
+            state: Current play state
+            position: Position making the play
+
+        Returns:
+            Optimal card, tie-broken by signalling conventions; the
+            fallback AI's card if the solve times out
+        """
+        start_time = time.time()
+        legal_cards = self._get_legal_cards(state, position)
+
+        if len(legal_cards) == 0:
+            raise ValueError(f"No legal cards available for {position}")
+
+        if len(legal_cards) == 1:
+            self.solve_time = time.time() - start_time
+            return legal_cards[0]
+
+        try:
+            solver, leader, trick = self._build_solver(state, position)
+            tricks, optimal = solver.optimal_moves(leader, trick)
+            best_cards = [(card, tricks) for card in self._our_cards(optimal, legal_cards)]
+
+            self.solve_time = time.time() - start_time
+            self.solves_count += 1
+
+            if not best_cards:
+                print(f"⚠️  Solver returned no matching cards for {position}")
+                return legal_cards[0]
+            if len(best_cards) == 1:
+                return best_cards[0][0]
+            return self._break_tie(best_cards, state, position, legal_cards)
+
+        except SolverTimeout:
+            self.timeouts += 1
+            self._last_signal_reason = None
+            self._last_signal_result = None
+            return self._fallback_ai.choose_card(state, position)
+
+        except Exception as e:
+            print(f"⚠️  Solver failed for {position}: {e}")
+            print(f"   Falling back to simple heuristic play")
+            return self._fallback_choose_card(state, position, legal_cards)
+
+    def score_cards(self, state: PlayState, position: str) -> List[Tuple[Card, int]]:
+        """
+        Score every legal card for the player to move
+
+        Returns:
+            (card, tricks) pairs as DDSPlayAI.score_cards()
+
+        Raises:
+            SolverTimeout: If the solve exceeds the time limit
+        """
+        legal_cards = self._get_legal_cards(state, position)
+        start_time = time.time()
+        solver, leader, trick = self._build_solver(state, position)
+        scores = solver.score_moves(leader, trick)
+        self.solve_time += time.time() - start_time
+        self.solves_count += 1
+        return [(card, scores[CARD_BIT[card]]) for card in legal_cards if CARD_BIT[card] in scores]
+
+    def score_cards_batch(self, positions: List[Tuple[PlayState, str]]) -> List[List[Tuple[Card, int]]]:
+        """Score several positions, one solve each (no batching without DDS)"""
+        return [self.score_cards(state, position) for state, position in positions]
+
+    def _build_solver(self, state: PlayState, position: str) -> Tuple[DoubleDummySolver, int, List[int]]:
+        """
+        Solver for the position, with the leader and cards of the current trick
+
+        Returns:
+            (solver, trick leader seat index, bits of the cards played to the trick)
+        """
+        hands = [cards_to_mask(state.hands[seat].cards) for seat in SEATS]
+        solver = DoubleDummySolver(hands, trump_index(state.contract.trump_suit),
+                                   time_limit=self.time_limit)
+        if state.current_trick:
+            leader = state.current_trick[0][1]
+            trick = [CARD_BIT[card] for card, _ in state.current_trick]
+        else:
+            leader = position
+            trick = []
+        return solver, SEAT_INDEX[leader], trick
+
+    def _our_cards(self, bits: List[int], legal_cards: List[Card]) -> List[Card]:
+        """The hand's own Card objects for solver card bits"""
+        by_bit = {CARD_BIT[card]: card for card in legal_cards}
+        return [by_bit.get(bit, BIT_CARD[bit]) for bit in bits]
+
+    def get_statistics(self) -> dict:
+        """Get solver statistics"""
+        stats = super().get_statistics()
+        stats['timeouts'] = self.timeouts
+        return stats
+
+    def reset_statistics(self):
+        """Reset statistics"""
+        super().reset_statistics()
+        self.timeouts = 0
@@ -0,0 +1,139 @@
+"""
+Zobrist Hashing and Transposition Table for Play Search
+
+Minimax reaches the same position through different card orders (for
+example two low cards played from different hands in either order).
+The transposition table remembers what was learned about a position so
+it is searched only once.
+
+Zobrist hashing:
+    Every (seat, card) in a hand, every (seat, card) in the current trick,
+    the player to move, the number of tricks NS have won and the contract
+    (trump suit + declaring side) get a random 64-bit key. A position's
+    hash is the XOR of the keys of everything in it, so SearchPosition
+    can update it incrementally in play()/undo().
+
+Table:
+    Fixed number of slots (power of two) indexed by the low bits of the
+    hash. Each slot holds (hash, depth, bound type, value, best move,
+    side, generation); the searcher keys on the position and the player
+    to move only, and the side (0 = NS, 1 = EW) records whose evaluation
+    the value is, so the best move can be reused by either side but the
+    value only by the side it was computed for.
+
+    Replacement policy: a slot is overwritten when it is empty, holds the
+    same position, belongs to an older generation (an earlier move of the
+    hand) or was searched no deeper than the new entry. The generation is
+    bumped by new_search() once per AI move, so entries from trick N stay
+    available to trick N+1 until newer work needs their slot.
+"""
+
+import random
+from typing import Optional, Tuple
+
+from engine.hand import Card
+
+
+# Bound types
+EXACT = 0
+LOWER = 1  # True value >= stored value (search failed high)
+UPPER = 2  # True value <= stored value (search failed low)
+
+SEAT_INDEX = {'N': 0, 'E': 1, 'S': 2, 'W': 3}
+
+DEFAULT_TT_SIZE = 1 << 16
+
+# Zobrist keys - fixed seed so hashes are reproducible across processes
+_rng = random.Random(0x5EED_B81D)
+
+
+def _key() -> int:
+    return _rng.getrandbits(64)
+
+
+HAND_KEYS = [[_key() for _ in range(52)] for _ in range(4)]
+TRICK_KEYS = [[_key() for _ in range(52)] for _ in range(4)]
+TURN_KEYS = [_key() for _ in range(4)]
+NS_TRICKS_KEYS = [_key() for _ in range(14)]
+STRAIN_KEYS = {strain: _key() for strain in ['♠', '♥', '♦', '♣', 'NT']}
+DECLARER_SIDE_KEYS = [_key(), _key()]  # NS, EW
+
+
+def side_index(seat: str) -> int:
+    """0 for N/S, 1 for E/W"""
+    return SEAT_INDEX[seat] & 1
+
+
+class TranspositionTable:
+    """
+    Bounded transposition table with depth/generation replacement
+
+    Example:
+        >>> tt = TranspositionTable(1 << 16)
+        >>> tt.new_search()
+        >>> tt.store(key, depth=3, flag=EXACT, value=1.5, best_move=card, side=0)
+        >>> entry = tt.probe(key)   # (depth, flag, value, best_move, side) or None
+    """
+
+    def __init__(self, size: int = DEFAULT_TT_SIZE):
+        """
+        Initialize table
+
+        Args:
+            size: Number of slots, rounded up to a power of two
+        """
+        capacity = 1
+        while capacity < size:
+            capacity <<= 1
+        self.capacity = capacity
+        self._mask = capacity - 1
+        self._slots = [None] * capacity
+        self.generation = 0
+
+        # Counters (cumulative; the searcher keeps per-move hit/miss counts)
+        self.used = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def new_search(self) -> None:
+        """Start a new search (one AI move); older entries become replaceable"""
+        self.generation += 1
+
+    def probe(self, key: int) -> Optional[Tuple[int, int, float, Optional[Card], int]]:
+        """
+        Look up a position
+
+        Returns:
+            (depth, flag, value, best_move, side) or None if not stored
+        """
+        slot = self._slots[key & self._mask]
+        if slot is not None and slot[0] == key:
+            return slot[1], slot[2], slot[3], slot[4], slot[5]
+        return None
+
+    def store(self, key: int, depth: int, flag: int, value: float,
+              best_move: Optional[Card], side: int = 0) -> None:
+        """Store a search result, subject to the replacement policy"""
+        index = key & self._mask
+        slot = self._slots[index]
+
+        if slot is None:
+            self.used += 1
+        elif slot[0] != key and slot[6] == self.generation and slot[1] > depth:
+            # Keep the deeper entry from the current search
+            return
+        elif slot[0] != key:
+            self.overwrites += 1
+
+        self._slots[index] = (key, depth, flag, value, best_move, side, self.generation)
+        self.stores += 1
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._slots = [None] * self.capacity
+        self.used = 0
+        self.stores = 0
+        self.overwrites = 0
+
+    def __len__(self) -> int:
+        return self.used
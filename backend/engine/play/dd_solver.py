@@ -0,0 +1,1021 @@
+"""
+Pure-Python Double Dummy Solver
+
+Fallback for endplay/DDS: answers the same questions (tricks for every
+legal card with all four hands visible, full DD tables, par) with the
+standard library only, so double dummy features keep working where
+endplay isn't installed or isn't safe to load (non-Linux platforms).
+
+Representation:
+    Hands are engine.bitboard masks (13 bits per suit, ♠ ♥ ♦ ♣ = suit
+    index 0-3, deuce = bit 0). Seats are 0-3 = N E S W and the trump is a
+    suit index (-1 = notrump). A hand's holding in suit s is
+    (mask >> 13 * s) & SUIT_FULL.
+
+Search (after Ginsberg's partition search and Haglund's DDS):
+- Null-window searches answer "can NS take `need` more tricks?"; exact
+  values come from a binary search over `need`.
+- Transposition table at trick boundaries (partition search): a result
+  is stored with the cards it depended on - the tricks won by rank, the
+  quick tricks counted - and, per suit, only the relative ranks from the
+  lowest of those up are compared on lookup. One entry then covers every
+  position that differs only in the small cards. Entries are a lower and
+  an upper bound on NS tricks, tightened by every search that visits them.
+- Rank equivalence: cards of one hand with no other remaining card
+  between them (e.g. Q and J once the K is gone, or 5 and 3 around a
+  played 4) are a single move.
+- Quick tricks: winners the leader can cash without giving up the lead
+  (capped by the length of an opponent who can ruff); the leader's side
+  takes at least that many.
+- Sure trump tricks: in a suit contract, trumps one hand holds above all
+  the opponents' trumps are tricks for its side whoever is on lead.
+- Move ordering: cash winners, lead towards partner's top card, win
+  cheaply, ruff low, discard low from long suits.
+
+API (shaped like endplay's, with our Card objects):
+    solve_board(hands, trump, leader, current_trick) -> [(Card, tricks), ...]
+    calc_dd_table(hands) -> {'N': {'S': 9, 'H': 10, ..., 'NT': 8}, ...}
+    par_from_table(table, dealer, vulnerability) -> (score, ['4HN', '4HS'])
+
+Environment:
+    DD_SOLVER_FALLBACK: set to 'false' to disable the fallback (default true)
+
+Usage:
+    from engine.play.dd_solver import solve_board, calc_dd_table
+
+    scores = solve_board(remaining_hands, '♥', leader='W', current_trick=[Card('K', '♠')])
+    table = calc_dd_table(full_hands)      # table['S']['H'] = 10
+"""
+
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from engine.bitboard import (
+    BIT_CARD,
+    CARD_BIT,
+    SUIT_BITS,
+    SUIT_FULL,
+    SUIT_INDEX,
+    SUIT_LENGTH_TABLE,
+    SUIT_MASKS,
+    card_count,
+    cards_to_mask,
+)
+from engine.hand import Card
+
+
+SEATS = ('N', 'E', 'S', 'W')
+SEAT_INDEX = {seat: i for i, seat in enumerate(SEATS)}
+
+# DD-table strains in endplay Denom order (same as dds_analysis.STRAIN_ORDER)
+STRAINS = ('S', 'H', 'D', 'C', 'NT')
+STRAIN_TRUMP = {'S': 0, 'H': 1, 'D': 2, 'C': 3, 'NT': -1}
+STRAIN_SYMBOLS = {'S': '♠', 'H': '♥', 'D': '♦', 'C': '♣', 'NT': 'NT'}
+
+NOTRUMP = -1
+
+# Whether consumers (DD tables, decay curves, play feedback, the expert AI)
+# fall back to this solver when endplay is unavailable
+FALLBACK_ENABLED = os.environ.get('DD_SOLVER_FALLBACK', 'true').lower() == 'true'
+
+# The deadline is checked once per this many trick-boundary nodes
+_DEADLINE_CHECK_MASK = 0x3FF
+
+# Shared lookup caches (pure functions of 13/52-bit holdings)
+_CACHE_LIMIT = 1 << 20
+_run_cache: Dict[int, Tuple[int, ...]] = {}
+_suit_key_cache: Dict[int, Tuple[int, int]] = {}
+_mask_cards_cache: Dict[int, int] = {}
+
+
+class SolverTimeout(Exception):
+    """The search ran past its time limit."""
+
+
+# ============================================================================
+# Holding helpers
+# ============================================================================
+
+def _run_bottoms(holding: int, present: int) -> Tuple[int, ...]:
+    """
+    Lowest rank of each run of equivalent cards in `holding`, highest run first.
+
+    `present` is every card of the suit still in play (all hands plus the
+    current trick). Cards of `holding` with no other present card between
+    them win and lose the same tricks, so one card per run is enough.
+    """
+    key = holding << SUIT_BITS | present
+    runs = _run_cache.get(key)
+    if runs is None:
+        bottoms = []
+        in_run = False
+        for rank in range(SUIT_BITS - 1, -1, -1):
+            if present >> rank & 1:
+                if holding >> rank & 1:
+                    if in_run:
+                        bottoms[-1] = rank
+                    else:
+                        bottoms.append(rank)
+                        in_run = True
+                else:
+                    in_run = False
+        runs = tuple(bottoms)
+        if len(_run_cache) > _CACHE_LIMIT:
+            _run_cache.clear()
+        _run_cache[key] = runs
+    return runs
+
+
+def _run_mask(holding: int, present: int, rank: int) -> int:
+    """All cards of `holding` in the same run as `rank` (see _run_bottoms)."""
+    mask = 1 << rank
+    for step in (1, -1):
+        r = rank + step
+        while 0 <= r < SUIT_BITS:
+            if holding >> r & 1:
+                mask |= 1 << r
+            elif present >> r & 1:
+                break
+            r += step
+    return mask
+
+
+def _suit_key(packed: int) -> Tuple[int, int]:
+    """
+    Relative-rank code and lengths of one suit.
+
+    `packed` holds the four 13-bit holdings N | E << 13 | S << 26 | W << 39.
+    The code lists the seats holding the suit's cards, highest first, two
+    bits each after a leading 1; the lengths are N | E << 4 | S << 8 | W << 12.
+    """
+    key = _suit_key_cache.get(packed)
+    if key is None:
+        holdings = [(packed >> (SUIT_BITS * seat)) & SUIT_FULL for seat in range(4)]
+        code = 1
+        for rank in range(SUIT_BITS - 1, -1, -1):
+            for seat in range(4):
+                if holdings[seat] >> rank & 1:
+                    code = code << 2 | seat
+                    break
+        lengths = 0
+        for seat in range(4):
+            lengths |= SUIT_LENGTH_TABLE[holdings[seat]] << (4 * seat)
+        key = (code, lengths)
+        if len(_suit_key_cache) > _CACHE_LIMIT:
+            _suit_key_cache.clear()
+        _suit_key_cache[packed] = key
+    return key
+
+
+def _code_mask(in_play: int, cards: int) -> int:
+    """
+    Mask over a suit's relative-rank code (see _suit_key) selecting the
+    lowest of `cards` and every card in play above it.
+
+    A card's two code bits sit at 2 * (number of cards in play below it).
+    Everything above the lowest relevant card must match too: a card only
+    won its trick because no higher card was played to it.
+    """
+    if not cards:
+        return 0
+    below = SUIT_LENGTH_TABLE[in_play & ((cards & -cards) - 1)]
+    return ((1 << (2 * SUIT_LENGTH_TABLE[in_play])) - 1) >> (2 * below) << (2 * below)
+
+
+def _mask_cards(in_play: int, mask: int) -> int:
+    """The cards of `in_play` selected by a code mask (inverse of _code_mask)."""
+    key = in_play << 26 | mask
+    cards = _mask_cards_cache.get(key)
+    if cards is None:
+        cards = 0
+        below = 0
+        for rank in range(SUIT_BITS):
+            if in_play >> rank & 1:
+                if mask >> (2 * below) & 3:
+                    cards |= 1 << rank
+                below += 1
+        if len(_mask_cards_cache) > _CACHE_LIMIT:
+            _mask_cards_cache.clear()
+        _mask_cards_cache[key] = cards
+    return cards
+
+
+# ============================================================================
+# Solver
+# ============================================================================
+
+class DoubleDummySolver:
+    """
+    Double dummy search for one deal and trump suit.
+
+    The transposition table is kept between calls, so solving several
+    leaders (a DD table row) or several cards of one position reuses work.
+
+    Usage:
+        solver = DoubleDummySolver([n_mask, e_mask, s_mask, w_mask], trump=1)
+        tricks = solver.solve(leader=1)                 # East leads against hearts
+        scores = solver.score_moves(leader=1)           # {bit: tricks} for East's cards
+    """
+
+    def __init__(self, hands: Sequence[int], trump: int = NOTRUMP,
+                 time_limit: Optional[float] = None):
+        """
+        Args:
+            hands: Remaining cards of N, E, S, W as bitmasks (cards already
+                played to the current trick excluded)
+            trump: Trump suit index 0-3, or NOTRUMP
+            time_limit: Seconds a solve()/score_moves() call may take before
+                raising SolverTimeout (None = no limit)
+        """
+        if len(hands) != 4:
+            raise ValueError("Need the hands of all four seats")
+        self.hands = list(hands)
+        self.trump = trump
+        self.time_limit = time_limit
+        self.tt: Dict[int, List[list]] = {}
+        # Lead that last cut off at a trick boundary (exact hands + leader), tried first
+        self.best_leads: Dict[Tuple[int, ...], int] = {}
+        self.nodes = 0
+        self._present = 0
+        self._left = 0
+        self._deadline = None
+        self._cut_move = -1
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def solve(self, leader: int, trick: Sequence[int] = ()) -> int:
+        """
+        Most tricks the side to move can take from here (current trick included).
+
+        Args:
+            leader: Seat that led (or is to lead) the current trick
+            trick: Bits of the cards already played to the current trick
+        """
+        mover = (leader + len(trick)) & 3
+        win_bit, win_seat = self._start(leader, trick)
+        ns = self._value(lambda need: self._root_make(mover, need, trick, win_bit, win_seat))
+        return ns if not mover & 1 else self._left - ns
+
+    def score_moves(self, leader: int, trick: Sequence[int] = (),
+                    moves: Optional[Iterable[int]] = None) -> Dict[int, int]:
+        """
+        Tricks for the side to move after each of its legal cards.
+
+        The position is solved first; a card can't do better than that, so
+        an optimal card costs one more probe and only worse cards need a
+        search for their exact value.
+
+        Args:
+            leader: Seat that led (or is to lead) the current trick
+            trick: Bits of the cards already played to the current trick
+            moves: Bits of the legal cards to score (default: all)
+
+        Returns:
+            Dict of card bit -> tricks the mover's side takes from here
+            (current trick included)
+        """
+        mover = (leader + len(trick)) & 3
+        win_bit, win_seat = self._start(leader, trick)
+        legal = self._legal(mover, trick)
+        best = self._value(lambda need: self._root_make(mover, need, trick, win_bit, win_seat))
+        left = self._left
+
+        if moves is None:
+            cards = self._ordered_moves(mover, legal, list(trick), win_bit, win_seat)
+        else:
+            cards = list(moves)
+            if any(not legal >> bit & 1 for bit in cards):
+                raise ValueError("Card is not a legal play")
+
+        scores: Dict[int, int] = {}
+        for bit in cards:
+            make = lambda need: self._root_make(mover, need, trick, win_bit, win_seat, (bit,))
+            if not mover & 1:
+                ns = self._value(make, 0, best, guess=best)
+            else:
+                ns = self._value(make, best, left, guess=best + 1)
+            tricks = ns if not mover & 1 else left - ns
+            for card in (self._run_cards(legal, bit) if moves is None else (bit,)):
+                scores[card] = tricks
+        return scores
+
+    def optimal_moves(self, leader: int, trick: Sequence[int] = (),
+                      first_only: bool = False) -> Tuple[int, List[int]]:
+        """
+        The position's value and the cards that keep it.
+
+        Cheaper than score_moves when only the best cards matter: each
+        card is one probe at the position's value.
+
+        Args:
+            leader: Seat that led (or is to lead) the current trick
+            trick: Bits of the cards already played to the current trick
+            first_only: Stop at the first optimal card (usually the first
+                one tried)
+
+        Returns:
+            (tricks the mover's side takes from here, optimal card bits)
+        """
+        mover = (leader + len(trick)) & 3
+        win_bit, win_seat = self._start(leader, trick)
+        legal = self._legal(mover, trick)
+        best = self._value(lambda need: self._root_make(mover, need, trick, win_bit, win_seat))
+        left = self._left
+
+        optimal: List[int] = []
+        for bit in self._ordered_moves(mover, legal, list(trick), win_bit, win_seat):
+            if not mover & 1:
+                keeps = self._root_make(mover, best, trick, win_bit, win_seat, (bit,))
+            else:
+                keeps = best == left or not self._root_make(
+                    mover, best + 1, trick, win_bit, win_seat, (bit,))
+            if keeps:
+                if first_only:
+                    optimal.append(bit)
+                    break
+                optimal.extend(self._run_cards(legal, bit))
+        return (best if not mover & 1 else left - best), optimal
+
+    # ------------------------------------------------------------------
+    # Root helpers
+    # ------------------------------------------------------------------
+
+    def _start(self, leader: int, trick: Sequence[int]) -> Tuple[int, int]:
+        """Set up per-call state; returns the current winner of the trick."""
+        if len(trick) > 3:
+            raise ValueError("Current trick can hold at most 3 cards")
+        present = 0
+        for hand in self.hands:
+            present |= hand
+        win_bit = win_seat = -1
+        for i, bit in enumerate(trick):
+            present |= 1 << bit
+            if i == 0 or self._beats(bit, win_bit):
+                win_bit, win_seat = bit, (leader + i) & 3
+        # Seats that played to the current trick hold one card fewer
+        lengths = {card_count(hand) + ((seat - leader) & 3 < len(trick))
+                   for seat, hand in enumerate(self.hands)}
+        if len(lengths) != 1:
+            raise ValueError("Hands must hold the same number of cards")
+        self._present = present
+        self._left = lengths.pop()
+        if self._left == 0:
+            raise ValueError("No cards left to play")
+        self._deadline = time.monotonic() + self.time_limit if self.time_limit else None
+        return win_bit, win_seat
+
+    def _legal(self, mover: int, trick: Sequence[int]) -> int:
+        hand = self.hands[mover]
+        if trick:
+            return hand & SUIT_MASKS[trick[0] // SUIT_BITS] or hand
+        return hand
+
+    def _run_cards(self, legal: int, bit: int) -> List[int]:
+        """`bit` and the legal cards equivalent to it."""
+        base = bit - bit % SUIT_BITS
+        run = _run_mask((legal >> base) & SUIT_FULL, (self._present >> base) & SUIT_FULL, bit - base)
+        cards = []
+        while run:
+            low = run & -run
+            cards.append(base + low.bit_length() - 1)
+            run ^= low
+        return cards
+
+    def _beats(self, bit: int, win_bit: int) -> bool:
+        suit = bit // SUIT_BITS
+        win_suit = win_bit // SUIT_BITS
+        return (suit == win_suit and bit > win_bit) or (suit == self.trump and win_suit != self.trump)
+
+    def _root_make(self, mover, need, trick, win_bit, win_seat, moves=None) -> bool:
+        if not trick and moves is None:
+            return self._make(mover, need)[0]
+        return self._play(mover, need, list(trick), win_bit, win_seat, moves)[0]
+
+    def _value(self, make, lo: int = 0, hi: Optional[int] = None,
+               guess: Optional[int] = None) -> int:
+        """Exact NS trick count, known to lie in [lo, hi], from a `make(need) -> bool` probe."""
+        if hi is None:
+            hi = self._left
+        if guess is not None and lo < guess <= hi:
+            if make(guess):
+                lo = guess
+            else:
+                hi = guess - 1
+        while lo < hi:
+            need = (lo + hi + 1) // 2
+            if make(need):
+                lo = need
+            else:
+                hi = need - 1
+        return lo
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _make(self, leader: int, need: int) -> Tuple[bool, int]:
+        """
+        At a trick boundary: can NS take `need` of the remaining tricks?
+
+        Returns:
+            (answer, relevant) where relevant is the mask of cards whose
+            rank decided the answer; every position with the same suit
+            lengths and the same owners of those cards (and of all cards
+            above them) has the same answer
+        """
+        if need <= 0:
+            return True, 0
+        left = self._left
+        if need > left:
+            return False, 0
+
+        self.nodes += 1
+        if self._deadline is not None and not self.nodes & _DEADLINE_CHECK_MASK:
+            if time.monotonic() > self._deadline:
+                raise SolverTimeout(f"Double dummy search exceeded {self.time_limit}s")
+
+        hands = self.hands
+        trump = self.trump
+        if left == 1:
+            return self._last_trick(leader)
+
+        h0, h1, h2, h3 = hands
+        codes = []
+        primary = leader
+        for shift in (0, 13, 26, 39):
+            code, lengths = _suit_key(
+                (h0 >> shift) & SUIT_FULL | ((h1 >> shift) & SUIT_FULL) << 13
+                | ((h2 >> shift) & SUIT_FULL) << 26 | ((h3 >> shift) & SUIT_FULL) << 39
+            )
+            codes.append(code)
+            primary = primary << 16 | lengths
+        c0, c1, c2, c3 = codes
+
+        entries = self.tt.get(primary)
+        if entries is not None:
+            for pattern, lower, upper in entries:
+                if (lower >= need or upper < need) and c0 & pattern[0] == pattern[1] \
+                        and c1 & pattern[2] == pattern[3] and c2 & pattern[4] == pattern[5] \
+                        and c3 & pattern[6] == pattern[7]:
+                    return lower >= need, self._pattern_cards(pattern)
+
+        # Quick tricks bound the leader's side
+        quick, relevant = self._quick_tricks(leader)
+        if not leader & 1:
+            if quick >= need:
+                self._store(primary, codes, relevant, quick, left)
+                return True, relevant
+        elif left - quick < need:
+            self._store(primary, codes, relevant, 0, left - quick)
+            return False, relevant
+
+        # Sure trump tricks: trumps above all the opponents' trumps always take a trick
+        if trump >= 0:
+            tricks, relevant, ns_side = self._sure_trump_tricks()
+            if tricks:
+                if ns_side:
+                    if need <= tricks:
+                        self._store(primary, codes, relevant, tricks, left)
+                        return True, relevant
+                elif need > left - tricks:
+                    self._store(primary, codes, relevant, 0, left - tricks)
+                    return False, relevant
+
+        position = (h0, h1, h2, h3, leader)
+        moves = self._ordered_moves(leader, hands[leader], [], -1, -1)
+        best = self.best_leads.get(position)
+        if best is not None and moves[0] != best:
+            moves.remove(best)
+            moves.insert(0, best)
+        result, relevant = self._play(leader, need, [], -1, -1, moves)
+        if result == (not leader & 1):
+            self.best_leads[position] = self._cut_move
+        if result:
+            self._store(primary, codes, relevant, need, left)
+        else:
+            self._store(primary, codes, relevant, 0, need - 1)
+        return result, relevant
+
+    def _play(self, seat: int, need: int, trick: List[int], win_bit: int, win_seat: int,
+              moves=None) -> Tuple[bool, int]:
+        """Inside a trick: `seat` is to play; can NS take `need` tricks from here?"""
+        hands = self.hands
+        hand = hands[seat]
+        pos = len(trick)
+        if moves is None:
+            if pos:
+                legal = hand & SUIT_MASKS[trick[0] // SUIT_BITS] or hand
+            else:
+                legal = hand
+            moves = self._ordered_moves(seat, legal, trick, win_bit, win_seat)
+
+        maximize = not seat & 1
+        trump = self.trump
+        win_suit = win_bit // SUIT_BITS
+        relevant = 0
+        for bit in moves:
+            if pos == 0:
+                new_bit, new_seat = bit, seat
+            else:
+                suit = bit // SUIT_BITS
+                if (suit == win_suit and bit > win_bit) or (suit == trump and win_suit != trump):
+                    new_bit, new_seat = bit, seat
+                else:
+                    new_bit, new_seat = win_bit, win_seat
+
+            hands[seat] = hand ^ (1 << bit)
+            if pos == 3:
+                played = (1 << trick[0]) | (1 << trick[1]) | (1 << trick[2]) | (1 << bit)
+                self._present ^= played
+                self._left -= 1
+                try:
+                    result, child = self._make(new_seat, need if new_seat & 1 else need - 1)
+                finally:
+                    self._left += 1
+                    self._present |= played
+                    hands[seat] = hand
+                # The winner's rank only mattered if it beat a card of its own suit
+                if SUIT_LENGTH_TABLE[(played >> (new_bit - new_bit % SUIT_BITS)) & SUIT_FULL] > 1:
+                    child |= 1 << new_bit
+            else:
+                trick.append(bit)
+                try:
+                    result, child = self._play((seat + 1) & 3, need, trick, new_bit, new_seat)
+                finally:
+                    trick.pop()
+                    hands[seat] = hand
+
+            if result == maximize:
+                self._cut_move = bit
+                return result, child
+            relevant |= child
+        return not maximize, relevant
+
+    def _last_trick(self, leader: int) -> Tuple[bool, int]:
+        """Play out the final trick (one card per hand)."""
+        hands = self.hands
+        trump = self.trump
+        best_bit = hands[leader].bit_length() - 1
+        best_seat = leader
+        played = hands[0] | hands[1] | hands[2] | hands[3]
+        for seat in ((leader + 1) & 3, (leader + 2) & 3, (leader + 3) & 3):
+            bit = hands[seat].bit_length() - 1
+            suit = bit // SUIT_BITS
+            best_suit = best_bit // SUIT_BITS
+            if (suit == best_suit and bit > best_bit) or (suit == trump and best_suit != trump):
+                best_bit, best_seat = bit, seat
+        relevant = 0
+        if SUIT_LENGTH_TABLE[(played >> (best_bit - best_bit % SUIT_BITS)) & SUIT_FULL] > 1:
+            relevant = 1 << best_bit
+        return not best_seat & 1, relevant
+
+    # ------------------------------------------------------------------
+    # Transposition table
+    # ------------------------------------------------------------------
+
+    def _store(self, primary: int, codes: List[int], relevant: int, lower: int, upper: int):
+        """
+        Record NS-trick bounds for every position matching the relevant cards.
+
+        The pattern is, per suit, a mask over the relative-rank code covering
+        the lowest relevant card and every card above it, and the owners
+        found there: a position matches when code & mask == owners in every
+        suit.
+        """
+        present = self._present
+        pattern = []
+        for suit in range(4):
+            shift = suit * SUIT_BITS
+            mask = _code_mask((present >> shift) & SUIT_FULL, (relevant >> shift) & SUIT_FULL)
+            pattern.append(mask)
+            pattern.append(codes[suit] & mask)
+        pattern = tuple(pattern)
+
+        entries = self.tt.get(primary)
+        if entries is None:
+            self.tt[primary] = [[pattern, lower, upper]]
+            return
+        for entry in entries:
+            if entry[0] == pattern:
+                if lower > entry[1]:
+                    entry[1] = lower
+                if upper < entry[2]:
+                    entry[2] = upper
+                return
+        entries.append([pattern, lower, upper])
+
+    def _pattern_cards(self, pattern: Tuple[int, ...]) -> int:
+        """The cards a stored pattern covers in the current position."""
+        present = self._present
+        cards = 0
+        for suit in range(4):
+            mask = pattern[2 * suit]
+            if mask:
+                shift = suit * SUIT_BITS
+                cards |= _mask_cards((present >> shift) & SUIT_FULL, mask) << shift
+        return cards
+
+    # ------------------------------------------------------------------
+    # Bounds and move ordering
+    # ------------------------------------------------------------------
+
+    def _quick_tricks(self, leader: int) -> Tuple[int, int]:
+        """
+        Tricks the leader's side can cash from the top without losing the lead.
+
+        Either the leader cashes their own top cards, or leads a small card
+        to partner's top card and partner cashes theirs.
+
+        Returns:
+            (tricks, the winners counted)
+        """
+        hands = self.hands
+        own = hands[leader]
+        partner = hands[(leader + 2) & 3]
+        lho = hands[(leader + 1) & 3]
+        rho = hands[(leader + 3) & 3]
+        ruffers = ()
+        if self.trump >= 0:
+            trumps = SUIT_MASKS[self.trump]
+            ruffers = [opp for opp in (lho, rho) if opp & trumps]
+
+        total, relevant, _ = self._cashable(own, partner | lho | rho, ruffers)
+        partner_total, partner_relevant, entries = self._cashable(partner, own | lho | rho, ruffers)
+        if partner_total > total and own & entries:
+            return partner_total, partner_relevant
+        return total, relevant
+
+    def _sure_trump_tricks(self) -> Tuple[int, int, bool]:
+        """
+        Trumps of the side with the top trump that can't be beaten.
+
+        Each trump one hand holds above all the opponents' trumps wins the
+        trick it's played to, so that side takes at least as many tricks as
+        the best such hand holds (two hands' top trumps may fall together).
+
+        Returns:
+            (tricks, the trumps counted, True if NS hold them)
+        """
+        hands = self.hands
+        shift = self.trump * SUIT_BITS
+        holdings = [(hand >> shift) & SUIT_FULL for hand in hands]
+        everyone = holdings[0] | holdings[1] | holdings[2] | holdings[3]
+        if not everyone:
+            return 0, 0, False
+        top_seat = 0
+        while not holdings[top_seat] >> (everyone.bit_length() - 1) & 1:
+            top_seat += 1
+        above = (holdings[(top_seat + 1) & 3] | holdings[(top_seat + 3) & 3]).bit_length()
+        best = 0
+        for seat in (top_seat, (top_seat + 2) & 3):
+            winners = holdings[seat] >> above << above
+            if SUIT_LENGTH_TABLE[winners] > SUIT_LENGTH_TABLE[best]:
+                best = winners
+        return SUIT_LENGTH_TABLE[best], best << shift, not top_seat & 1
+
+    def _cashable(self, hand: int, others: int, ruffers) -> Tuple[int, int, int]:
+        """
+        Winners `hand` can cash in a row: its cards above every card in
+        `others`, a side suit capped by the length of each opponent who can
+        ruff it.
+
+        Returns:
+            (tricks, the winners counted, suit mask of suits with a winner)
+        """
+        trump = self.trump
+        total = 0
+        relevant = 0
+        suits = 0
+        for suit in range(4):
+            shift = suit * SUIT_BITS
+            holding = (hand >> shift) & SUIT_FULL
+            if not holding:
+                continue
+            above = ((others >> shift) & SUIT_FULL).bit_length()
+            top = holding >> above << above
+            winners = SUIT_LENGTH_TABLE[top]
+            if not winners:
+                continue
+            if suit != trump:
+                for opp in ruffers:
+                    length = SUIT_LENGTH_TABLE[(opp >> shift) & SUIT_FULL]
+                    if length < winners:
+                        winners = length
+                if not winners:
+                    continue
+            relevant |= top << shift
+            suits |= SUIT_MASKS[suit]
+            total += winners
+        return total, relevant, suits
+
+    def _ordered_moves(self, seat: int, legal: int, trick: List[int],
+                       win_bit: int, win_seat: int) -> List[int]:
+        """One card per run of equivalent cards, most promising first."""
+        hands = self.hands
+        present = self._present
+        trump = self.trump
+        trumps = SUIT_MASKS[trump] if trump >= 0 else 0
+        partner = hands[(seat + 2) & 3]
+        lho = hands[(seat + 1) & 3]
+        rho = hands[(seat + 3) & 3]
+        scored = []
+
+        if not trick:
+            for suit in range(4):
+                shift = suit * SUIT_BITS
+                holding = (legal >> shift) & SUIT_FULL
+                if not holding:
+                    continue
+                in_play = (present >> shift) & SUIT_FULL
+                top = in_play.bit_length() - 1
+                length = SUIT_LENGTH_TABLE[holding]
+                suit_mask = SUIT_MASKS[suit]
+                opp_ruff = partner_ruff = False
+                if trumps and suit != trump:
+                    opp_ruff = bool((not lho & suit_mask and lho & trumps)
+                                    or (not rho & suit_mask and rho & trumps))
+                    partner_ruff = bool(not partner & suit_mask and partner & trumps)
+                for i, rank in enumerate(_run_bottoms(holding, in_play)):
+                    if i == 0 and holding >> top & 1:
+                        # Cash a winner (draw trumps first)
+                        score = 10 if opp_ruff else 70 + (5 if suit == trump else 0)
+                    elif partner >> (shift + top) & 1 and not opp_ruff:
+                        # Lead low to partner's winner
+                        score = 55 - rank
+                    elif partner_ruff and not opp_ruff:
+                        score = 60 - rank
+                    else:
+                        # Low from length, through the opponent holding the top card
+                        score = 2 * length - rank
+                        if opp_ruff:
+                            score -= 30
+                        if lho >> (shift + top) & 1:
+                            score += 5
+                    scored.append((score, shift + rank))
+        else:
+            pos = len(trick)
+            led = trick[0] // SUIT_BITS
+            led_shift = led * SUIT_BITS
+            win_suit = win_bit // SUIT_BITS
+            # Only the left-hand opponent can still play after second or third hand
+            later = (lho >> led_shift) & SUIT_FULL if pos < 3 else 0
+            later_top = later.bit_length() - 1
+            later_ruffs = (pos < 3 and trumps and led != trump and not later
+                           and lho & trumps)
+            partner_secure = win_seat == (seat + 2) & 3 and (
+                pos == 3 or (win_suit == led and win_bit - led_shift > later_top
+                             and not later_ruffs))
+
+            follow = (legal >> led_shift) & SUIT_FULL if legal & SUIT_MASKS[led] else 0
+            if follow:
+                in_play = (present >> led_shift) & SUIT_FULL
+                beat = win_bit - led_shift if win_suit == led else SUIT_BITS
+                for rank in _run_bottoms(follow, in_play):
+                    if partner_secure or rank < beat:
+                        score = -rank
+                    elif rank > later_top and not later_ruffs:
+                        # Wins the trick outright: as cheaply as possible
+                        score = 100 - rank
+                    elif pos == 1:
+                        # Second hand low
+                        score = 20 - rank
+                    else:
+                        # Third hand high
+                        score = 40 + rank
+                    scored.append((score, led_shift + rank))
+            else:
+                for suit in range(4):
+                    shift = suit * SUIT_BITS
+                    holding = (legal >> shift) & SUIT_FULL
+                    if not holding:
+                        continue
+                    in_play = (present >> shift) & SUIT_FULL
+                    length = SUIT_LENGTH_TABLE[holding]
+                    top = in_play.bit_length() - 1
+                    for rank in _run_bottoms(holding, in_play):
+                        if suit == trump:
+                            if partner_secure:
+                                score = -50 - rank
+                            elif win_suit == trump and shift + rank < win_bit:
+                                score = -40 - rank
+                            else:
+                                score = 80 - rank
+                        else:
+                            # Discard low from a long suit, keeping winners
+                            score = 30 + length - rank
+                            if holding >> top & 1:
+                                score -= 20
+                        scored.append((score, shift + rank))
+
+        scored.sort(reverse=True)
+        return [bit for _, bit in scored]
+
+
+# ============================================================================
+# endplay-shaped API
+# ============================================================================
+
+def trump_index(trump: Optional[str]) -> int:
+    """Suit index for a trump given as '♠', 'S', 'NT' or None (-1 = notrump)."""
+    if trump is None or trump in ('NT', 'N'):
+        return NOTRUMP
+    if trump in SUIT_INDEX:
+        return SUIT_INDEX[trump]
+    if trump in STRAIN_TRUMP:
+        return STRAIN_TRUMP[trump]
+    raise ValueError(f"Unknown trump: {trump!r}")
+
+
+def _seat_masks(hands: Dict[str, Iterable[Card]]) -> List[int]:
+    try:
+        return [cards_to_mask(hands[seat]) for seat in SEATS]
+    except KeyError as e:
+        raise ValueError(f"Missing hand for position {e.args[0]}") from None
+
+
+def solve_board(
+    hands: Dict[str, Iterable[Card]],
+    trump: Optional[str],
+    leader: str,
+    current_trick: Sequence[Card] = (),
+    time_limit: Optional[float] = None,
+) -> List[Tuple[Card, int]]:
+    """
+    Double dummy value of every legal card for the player to move.
+
+    Args:
+        hands: Remaining cards per seat ('N', 'E', 'S', 'W'), without the
+            cards already played to the current trick
+        trump: Trump suit ('♠'/'S' ...) or 'NT'/None
+        leader: Seat that led the current trick (the player to move when
+            current_trick is empty)
+        current_trick: Cards played to the current trick, in order
+        time_limit: Optional seconds before SolverTimeout is raised
+
+    Returns:
+        (card, tricks) for every legal card, best first, where tricks is
+        what the mover's side takes from the remaining tricks (the current
+        trick included) - the same numbers as endplay's solve_board
+    """
+    solver = DoubleDummySolver(_seat_masks(hands), trump_index(trump), time_limit=time_limit)
+    trick = [CARD_BIT[card] for card in current_trick]
+    scores = solver.score_moves(SEAT_INDEX[leader], trick)
+    return sorted(((BIT_CARD[bit], tricks) for bit, tricks in scores.items()),
+                  key=lambda item: (-item[1], -CARD_BIT[item[0]]))
+
+
+def calc_dd_table(hands: Dict[str, Iterable[Card]],
+                  time_limit: Optional[float] = None,
+                  budget: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Full 20-result DD table.
+
+    Args:
+        hands: Cards per seat ('N', 'E', 'S', 'W'), equal lengths
+        time_limit: Optional seconds per declarer and strain before
+            SolverTimeout is raised
+        budget: Optional seconds for the whole table; each solve gets
+            what is left of it (or time_limit, if smaller)
+
+    Returns:
+        table[declarer][strain] = tricks, strains 'S', 'H', 'D', 'C', 'NT'
+        (the dds_analysis.DDTable layout)
+    """
+    masks = _seat_masks(hands)
+    deadline = time.monotonic() + budget if budget else None
+    table: Dict[str, Dict[str, int]] = {seat: {} for seat in SEATS}
+    for strain in STRAINS:
+        # One solver per strain: the four opening leads share its table
+        solver = DoubleDummySolver(masks, STRAIN_TRUMP[strain], time_limit=time_limit)
+        for declarer in range(4):
+            if deadline is not None:
+                left = deadline - time.monotonic()
+                if left <= 0:
+                    raise SolverTimeout(f"DD table exceeded its {budget}s budget")
+                solver.time_limit = min(time_limit, left) if time_limit else left
+            leader = (declarer + 1) & 3
+            defence = solver.solve(leader)
+            table[SEATS[declarer]][strain] = solver._left - defence
+    return table
+
+
+# ============================================================================
+# Par
+# ============================================================================
+
+# Contracts in bidding order: 1♣ 1♦ 1♥ 1♠ 1NT 2♣ ... 7NT
+_BID_STRAINS = ('C', 'D', 'H', 'S', 'NT')
+_CONTRACTS = [(level, strain) for level in range(1, 8) for strain in _BID_STRAINS]
+
+
+def _contract_score(level: int, strain: str, declarer: str, tricks: int, vulnerable: bool) -> int:
+    """Declarer's score: undoubled if it makes, doubled if it goes down (a sacrifice)."""
+    from engine.play_engine import Contract, PlayEngine
+
+    doubled = 0 if tricks >= level + 6 else 1
+    contract = Contract(level=level, strain=STRAIN_SYMBOLS[strain], declarer=declarer,
+                        doubled=doubled)
+    side = 'ns' if declarer in 'NS' else 'ew'
+    return PlayEngine.calculate_score(contract, tricks, {side: vulnerable})['score']
+
+
+def par_from_table(table: Dict[str, Dict[str, int]], dealer: str = 'N',
+                   vulnerability: str = 'None') -> Tuple[int, List[str]]:
+    """
+    Par score and contracts from a DD table.
+
+    Solves the auction by backward induction over the 35 contracts: after
+    a side bids a contract the other side either lets it stand or outbids
+    it, each side choosing what is best for itself. Contracts that make are
+    scored undoubled and sacrifices doubled. Each side declares from the
+    hand that takes more tricks; on equal scores the lower contract wins,
+    and the dealer's side gets the first chance to bid.
+
+    Args:
+        table: table[declarer][strain] = tricks (DDTable layout)
+        dealer: Dealer seat
+        vulnerability: 'None', 'NS', 'EW', 'Both' (or 'All')
+
+    Returns:
+        (par score for NS, contracts like ['4HN', '4HS'] or ['Pass'])
+    """
+    vulnerable = {
+        'NS': vulnerability in ('NS', 'Both', 'All'),
+        'EW': vulnerability in ('EW', 'Both', 'All'),
+    }
+    sides = {'NS': ('N', 'S'), 'EW': ('E', 'W')}
+    sign = {'NS': 1, 'EW': -1}
+    other = {'NS': 'EW', 'EW': 'NS'}
+
+    # NS score when each contract is the final one, per declaring side
+    final: Dict[str, List[int]] = {}
+    for side, declarers in sides.items():
+        final[side] = []
+        for level, strain in _CONTRACTS:
+            tricks = max(table[d][strain] for d in declarers)
+            declarer = next(d for d in declarers if table[d][strain] == tricks)
+            score = _contract_score(level, strain, declarer, tricks, vulnerable[side])
+            final[side].append(sign[side] * score)
+
+    def better(side, a, b):
+        """Is NS score a better than b for `side`?"""
+        return a > b if side == 'NS' else a < b
+
+    # value[side][i]: NS score once `side` has bid contract i and the other side is to act;
+    # choice[side][i]: the contract the other side outbids with, or None to pass
+    count = len(_CONTRACTS)
+    value = {'NS': [0] * count, 'EW': [0] * count}
+    choice = {'NS': [None] * count, 'EW': [None] * count}
+    best_after = {'NS': (None, None), 'EW': (None, None)}  # (score, index) of side's best bid above i
+    for i in range(count - 1, -1, -1):
+        for side in ('NS', 'EW'):
+            opp = other[side]
+            score, pick = final[side][i], None
+            opp_score, opp_index = best_after[opp]
+            if opp_index is not None and better(opp, opp_score, score):
+                score, pick = opp_score, opp_index
+            value[side][i], choice[side][i] = score, pick
+        for side in ('NS', 'EW'):
+            # Replace on ties too, so the lower contract wins
+            prev_score, _ = best_after[side]
+            if prev_score is None or not better(side, prev_score, value[side][i]):
+                best_after[side] = (value[side][i], i)
+
+    def best_open(side):
+        best_score, best_index = None, None
+        for i in range(count):
+            if best_score is None or better(side, value[side][i], best_score):
+                best_score, best_index = value[side][i], i
+        return best_score, best_index
+
+    # Opening: the dealer's side may open or pass; if the other side also
+    # passes, the dealer's side gets another chance before the pass-out
+    first = 'NS' if dealer in 'NS' else 'EW'
+    second = other[first]
+    first_score, first_index = best_open(first)
+    second_score, second_index = best_open(second)
+
+    outcome = (first, first_index) if better(first, first_score, 0) else None
+    outcome_score = first_score if outcome else 0
+    if better(second, second_score, outcome_score):
+        outcome, outcome_score = (second, second_index), second_score
+    if not better(first, outcome_score, first_score):
+        outcome = (first, first_index)
+
+    if outcome is None:
+        return 0, ['Pass']
+    side, index = outcome
+
+    # Follow the outbids to the final contract
+    while choice[side][index] is not None:
+        index = choice[side][index]
+        side = other[side]
+
+    level, strain = _CONTRACTS[index]
+    tricks = max(table[d][strain] for d in sides[side])
+    doubled = '' if tricks >= level + 6 else 'x'
+    contracts = [f"{level}{strain}{doubled}{d}" for d in sides[side] if table[d][strain] == tricks]
+    return final[side][index], contracts
@@ -0,0 +1,173 @@
+"""
+DD Table Cache - Bounded, shared cache of solved double dummy tables
+
+A DD table depends only on the 52 cards and who holds them, not on the
+dealer or vulnerability (those only affect par). The cache is therefore
+keyed on a canonical deal key and holds DD tables only; par is computed
+from the cached table on demand.
+
+Two tiers:
+- L1: in-process LRU (OrderedDict) with a size limit
+- L2 (optional): Redis, shared by all gunicorn workers and surviving
+  restarts. Redis errors are logged and treated as misses, so analysis
+  keeps working on L1 alone.
+
+Usage:
+    cache = DDTableCache(max_size=4096, redis_client=redis.Redis(...))
+    key = deal_key("N:AKQ2.KJ3.T98.432 JT98.Q42.KJ4.987 ...")
+    table = cache.get(key)
+    if table is None:
+        table = solve(...)
+        cache.put(key, table)
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Any
+
+from engine.bitboard import cards_to_mask
+from engine.hand import Card, PBN_SUITS, PBN_RANK_MAP
+
+logger = logging.getLogger(__name__)
+
+POSITION_ORDER = ['N', 'E', 'S', 'W']
+
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_REDIS_TTL = 30 * 24 * 3600  # 30 days
+REDIS_KEY_PREFIX = 'ddtable:'
+
+
+def deal_key(pbn: str) -> str:
+    """
+    Canonical key for a full deal
+
+    The same deal gives the same key whichever hand the PBN string starts
+    with. The key is the 52-bit card mask of N, E, S and W in hex, so it
+    is exact (no hash collisions).
+
+    Args:
+        pbn: Full deal in PBN format ("N:hand hand hand hand", any first seat)
+
+    Returns:
+        52-character hex string
+    """
+    first, hands_part = pbn.strip().split(':', 1)
+    start = POSITION_ORDER.index(first.strip().upper())
+    segments = hands_part.split()
+    if len(segments) != 4:
+        raise ValueError(f"Deal must have 4 hands: {pbn}")
+
+    masks = {}
+    for i, segment in enumerate(segments):
+        cards = []
+        for suit, ranks in zip(PBN_SUITS, segment.split('.')):
+            cards.extend(Card(PBN_RANK_MAP[r.upper()], suit) for r in ranks)
+        masks[POSITION_ORDER[(start + i) % 4]] = cards_to_mask(cards)
+
+    return ''.join(f"{masks[pos]:013x}" for pos in POSITION_ORDER)
+
+
+class DDTableCache:
+    """
+    Two-tier LRU cache of DD tables (table[player][strain] = tricks)
+
+    Thread-safe; one instance is shared by the analysis service.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE, redis_client=None,
+                 redis_ttl: int = DEFAULT_REDIS_TTL):
+        """
+        Args:
+            max_size: Maximum tables kept in process (least recently used
+                are evicted first)
+            redis_client: Optional Redis client for the shared second tier
+            redis_ttl: Expiry of Redis entries in seconds
+        """
+        self.max_size = max_size
+        self.redis = redis_client
+        self.redis_ttl = redis_ttl
+        self._tables: 'OrderedDict[str, Dict[str, Dict[str, int]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.redis_errors = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Dict[str, int]]]:
+        """Look up a DD table, checking the process cache then Redis"""
+        with self._lock:
+            table = self._tables.get(key)
+            if table is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return table
+
+        table = self._redis_get(key)
+        with self._lock:
+            if table is not None:
+                self.redis_hits += 1
+                self._store_local(key, table)
+            else:
+                self.misses += 1
+        return table
+
+    def put(self, key: str, table: Dict[str, Dict[str, int]]) -> None:
+        """Store a solved DD table in both tiers"""
+        with self._lock:
+            self._store_local(key, table)
+        self._redis_set(key, table)
+
+    def _store_local(self, key: str, table: Dict[str, Dict[str, int]]) -> None:
+        self._tables[key] = table
+        self._tables.move_to_end(key)
+        while len(self._tables) > self.max_size:
+            self._tables.popitem(last=False)
+            self.evictions += 1
+
+    def _redis_get(self, key: str) -> Optional[Dict[str, Dict[str, int]]]:
+        if self.redis is None:
+            return None
+        try:
+            data = self.redis.get(REDIS_KEY_PREFIX + key)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"DD table cache: Redis read failed: {e}")
+            return None
+        return json.loads(data) if data else None
+
+    def _redis_set(self, key: str, table: Dict[str, Dict[str, int]]) -> None:
+        if self.redis is None:
+            return
+        try:
+            self.redis.set(REDIS_KEY_PREFIX + key, json.dumps(table), ex=self.redis_ttl)
+        except Exception as e:
+            self.redis_errors += 1
+            logger.warning(f"DD table cache: Redis write failed: {e}")
+
+    def clear(self) -> None:
+        """Clear the process cache (shared Redis entries are kept)"""
+        with self._lock:
+            self._tables.clear()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rate across both tiers"""
+        lookups = self.hits + self.redis_hits + self.misses
+        return {
+            'cache_size': len(self._tables),
+            'cache_max_size': self.max_size,
+            'cache_hits': self.hits + self.redis_hits,
+            'cache_local_hits': self.hits,
+            'cache_redis_hits': self.redis_hits,
+            'cache_misses': self.misses,
+            'cache_evictions': self.evictions,
+            'cache_hit_rate': (self.hits + self.redis_hits) / lookups if lookups else 0.0,
+            'redis_enabled': self.redis is not None,
+            'redis_errors': self.redis_errors,
+        }
@@ -5,6 +5,7 @@ This module provides comprehensive DDS analysis capabilities:
 - Full 20-result DD table (4 players x 5 strains)
 - Par score calculation with vulnerability awareness
 - Deal parsing from PBN format (including 3-hand inference)
+- Bounded DD-table cache shared across workers via Redis (dd_table_cache)
 
 These features support:
 - Post-game analysis ("What if you played 4 Spades?")
@@ -14,6 +15,11 @@ These features support:
 
 Dependencies:
 - endplay library (includes DDS bindings)
+- Without endplay, the pure-Python solver (dd_solver.py) builds the same
+  tables, but a full deal takes seconds to a minute per declarer/strain.
+  Only background analysis (the job workers) relies on it, and a table
+  that doesn't fit DD_SOLVER_TABLE_BUDGET fails instead of holding the
+  worker (DDSAnalysisService.is_fast tells the two backends apart)
 
 Platform Notes:
 - Works reliably on Linux (production default)
@@ -23,7 +29,10 @@ Platform Notes:
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass, field
 from engine.hand import Hand, Card, PBN_SUITS
+from engine.play import dd_solver
+from engine.play.dd_table_cache import DDTableCache, deal_key
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +40,8 @@ logger = logging.getLogger(__name__)
 try:
     from endplay.types import Deal, Player, Denom, Vul
     from endplay.dds import calc_dd_table, par
+    from endplay.dds.ddtable import DDTable as EndplayDDTable
+    from endplay._dds import ddTableResults
     DDS_AVAILABLE = True
 except ImportError as e:
     DDS_AVAILABLE = False
@@ -40,8 +51,18 @@ except ImportError as e:
     Vul = None
     calc_dd_table = None
     par = None
+    EndplayDDTable = None
+    ddTableResults = None
     logger.warning(f"endplay not available: {e}")
 
+# Without endplay the service uses the pure-Python solver (dd_solver.FALLBACK_ENABLED).
+# is_dds_available() still reports endplay only: request-path callers can't
+# wait that long for a table.
+# Seconds the fallback may spend on one declarer/strain, and on the whole
+# 20-result table, before the analysis fails
+DD_SOLVER_TIME_LIMIT = float(os.environ.get('DD_SOLVER_TIME_LIMIT', 15))
+DD_SOLVER_TABLE_BUDGET = float(os.environ.get('DD_SOLVER_TABLE_BUDGET', 60))
+
 
 # Position mappings
 POSITION_ORDER = ['N', 'E', 'S', 'W']
@@ -197,19 +218,35 @@ class DDSAnalysisService:
         par_score = analysis.par_result.score
     """
 
-    def __init__(self):
-        """Initialize the analysis service."""
-        self._cache: Dict[str, DealAnalysis] = {}
+    def __init__(self, table_cache: Optional[DDTableCache] = None):
+        """
+        Initialize the analysis service.
+
+        Args:
+            table_cache: DD-table cache to use (default: in-process LRU only)
+        """
+        self._table_cache = table_cache or DDTableCache()
         self.stats = {
             'analyses': 0,
-            'cache_hits': 0,
             'errors': 0
         }
 
+    @property
+    def backend(self) -> Optional[str]:
+        """Solver behind the DD tables: 'endplay', 'python' (fallback) or None."""
+        if DDS_AVAILABLE:
+            return 'endplay'
+        return 'python' if dd_solver.FALLBACK_ENABLED else None
+
     @property
     def is_available(self) -> bool:
-        """Check if DDS is available on this platform."""
-        return DDS_AVAILABLE
+        """Check if DD analysis is available (endplay or the Python fallback)."""
+        return self.backend is not None
+
+    @property
+    def is_fast(self) -> bool:
+        """Whether tables come from native DDS, fast enough for the request path."""
+        return self.backend == 'endplay'
 
     def analyze_deal(
         self,
@@ -228,7 +265,7 @@ class DDSAnalysisService:
         Returns:
             DealAnalysis with DD table and par result
         """
-        if not DDS_AVAILABLE:
+        if not self.is_available:
             return DealAnalysis(
                 dealer=dealer,
                 vulnerability=vulnerability,
@@ -245,35 +282,8 @@ class DDSAnalysisService:
                 error=f"Failed to build PBN: {e}"
             )
 
-        # Check cache
-        cache_key = f"{pbn}:{dealer}:{vulnerability}"
-        if cache_key in self._cache:
-            self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
-
-        self.stats['analyses'] += 1
-
         try:
-            # Create endplay Deal
-            deal = Deal(pbn)
-
-            # Calculate DD table
-            dd_table = self._calculate_dd_table(deal)
-
-            # Calculate par score
-            par_result = self._calculate_par(deal, dealer, vulnerability)
-
-            analysis = DealAnalysis(
-                dd_table=dd_table,
-                par_result=par_result,
-                dealer=dealer,
-                vulnerability=vulnerability
-            )
-
-            # Cache result
-            self._cache[cache_key] = analysis
-
-            return analysis
+            return self._analyze(pbn, dealer, vulnerability)
 
         except Exception as e:
             self.stats['errors'] += 1
@@ -301,42 +311,17 @@ class DDSAnalysisService:
         Returns:
             DealAnalysis with DD table and par result
         """
-        if not DDS_AVAILABLE:
+        if not self.is_available:
             return DealAnalysis(
                 dealer=dealer,
                 vulnerability=vulnerability,
                 error="DDS not available on this platform"
             )
 
-        # Check cache
-        cache_key = f"{pbn_string}:{dealer}:{vulnerability}"
-        if cache_key in self._cache:
-            self.stats['cache_hits'] += 1
-            return self._cache[cache_key]
-
-        self.stats['analyses'] += 1
-
         try:
             # Handle 3-hand PBN with inference
-            deal = self._parse_pbn_with_inference(pbn_string)
-
-            # Calculate DD table
-            dd_table = self._calculate_dd_table(deal)
-
-            # Calculate par score
-            par_result = self._calculate_par(deal, dealer, vulnerability)
-
-            analysis = DealAnalysis(
-                dd_table=dd_table,
-                par_result=par_result,
-                dealer=dealer,
-                vulnerability=vulnerability
-            )
-
-            # Cache result
-            self._cache[cache_key] = analysis
-
-            return analysis
+            pbn = self._parse_pbn_with_inference(pbn_string)
+            return self._analyze(pbn, dealer, vulnerability)
 
         except Exception as e:
             self.stats['errors'] += 1
@@ -347,6 +332,31 @@ class DDSAnalysisService:
                 error=str(e)
             )
 
+    def _analyze(self, pbn: str, dealer: str, vulnerability: str) -> DealAnalysis:
+        """
+        DD table (from cache, or solved and cached) plus par for dealer/vulnerability.
+
+        The DD table is cached by canonical deal key only; par depends on
+        dealer and vulnerability and is recomputed from the table, which
+        needs no solving.
+        """
+        key = deal_key(pbn)
+        table = self._table_cache.get(key)
+        if table is None:
+            self.stats['analyses'] += 1
+            table = self._calculate_dd_table(pbn).table
+            self._table_cache.put(key, table)
+
+        # Copy so callers cannot modify the cached table
+        dd_table = DDTable(table={player: dict(row) for player, row in table.items()})
+
+        return DealAnalysis(
+            dd_table=dd_table,
+            par_result=self._calculate_par(dd_table, dealer, vulnerability),
+            dealer=dealer,
+            vulnerability=vulnerability
+        )
+
     def get_tricks(
         self,
         hands: Dict[str, Hand],
@@ -444,17 +454,35 @@ class DDSAnalysisService:
 
         return f"N:{' '.join(hand_strs)}"
 
-    def _parse_pbn_with_inference(self, pbn_string: str) -> Deal:
+    def _pbn_hands(self, pbn: str) -> Dict[str, Hand]:
+        """Parse a full 4-hand PBN deal string (any first seat) into Hands."""
+        first_pos, hands_part = pbn.strip().split(':', 1)
+        start = POSITION_ORDER.index(first_pos.strip().upper())
+        segments = hands_part.split()
+        if len(segments) != 4:
+            raise ValueError(f"Deal must have 4 hands: {pbn}")
+        return {
+            POSITION_ORDER[(start + i) % 4]: Hand.from_pbn(segment)
+            for i, segment in enumerate(segments)
+        }
+
+    def _parse_pbn_with_inference(self, pbn_string: str) -> str:
         """
-        Parse PBN string, inferring 4th hand if only 3 provided.
+        Validate a PBN deal string, inferring 4th hand if only 3 provided.
 
         Standard PBN format: "N:AKQ.KJ3.T98.432 JT98.Q42.KJ4.987 765.AT9.AQ5.KQJ 43.8765.7632.AT6"
 
         If one hand is missing (empty or "~"), infers it from remaining 52-card deck.
+
+        Returns:
+            Full 4-hand PBN string
         """
         # First try direct parsing
         try:
-            return Deal(pbn_string)
+            if DDS_AVAILABLE:
+                return Deal(pbn_string).to_pbn()
+            self._pbn_hands(pbn_string)
+            return pbn_string
         except (ValueError, KeyError):
             pass
 
@@ -522,11 +550,20 @@ class DDSAnalysisService:
         hand_strs = [positions[pos] for pos in POSITION_ORDER]
         full_pbn = f"N:{' '.join(hand_strs)}"
 
-        return Deal(full_pbn)
+        if DDS_AVAILABLE:
+            return Deal(full_pbn).to_pbn()
+        self._pbn_hands(full_pbn)
+        return full_pbn
+
+    def _calculate_dd_table(self, pbn: str) -> DDTable:
+        """Calculate the full 20-result DD table (endplay, or the Python fallback)."""
+        if not DDS_AVAILABLE:
+            hands = {pos: hand.cards for pos, hand in self._pbn_hands(pbn).items()}
+            return DDTable(table=dd_solver.calc_dd_table(
+                hands, time_limit=DD_SOLVER_TIME_LIMIT, budget=DD_SOLVER_TABLE_BUDGET
+            ))
 
-    def _calculate_dd_table(self, deal: Deal) -> DDTable:
-        """Calculate the full 20-result DD table."""
-        raw_table = calc_dd_table(deal)
+        raw_table = calc_dd_table(Deal(pbn))
         data = raw_table.to_list()
 
         # endplay format: data[suit_idx][player_idx]
@@ -541,9 +578,14 @@ class DDSAnalysisService:
 
         return DDTable(table=table)
 
-    def _calculate_par(self, deal: Deal, dealer: str, vulnerability: str) -> Optional[ParResult]:
-        """Calculate par (minimax) result."""
+    def _calculate_par(self, dd_table: DDTable, dealer: str, vulnerability: str) -> Optional[ParResult]:
+        """Calculate par (minimax) result from an already solved DD table."""
         try:
+            if not DDS_AVAILABLE:
+                score, contracts = dd_solver.par_from_table(dd_table.table, dealer, vulnerability)
+                declarer_side = ('NS' if contracts[0][-1] in 'NS' else 'EW') if score else 'NS'
+                return ParResult(score=score, contracts=contracts, declarer_side=declarer_side)
+
             # Map vulnerability string to endplay Vul enum
             vul_map = {
                 'None': Vul.none,
@@ -563,8 +605,12 @@ class DDSAnalysisService:
             }
             dealer_player = dealer_map.get(dealer, Player.north)
 
-            # Calculate DD table first (needed for par)
-            dd_table_raw = calc_dd_table(deal)
+            # Rebuild endplay's table from ours (par needs no further solving)
+            results = ddTableResults()
+            for s_idx, strain in enumerate(STRAIN_ORDER):
+                for p_idx, player in enumerate(POSITION_ORDER):
+                    results.resTable[s_idx][p_idx] = dd_table.get_tricks(player, strain)
+            dd_table_raw = EndplayDDTable(results)
 
             # Get par result
             result = par(dd_table_raw, vul, dealer_player)
@@ -600,30 +646,61 @@ class DDSAnalysisService:
             return None
 
     def clear_cache(self):
-        """Clear the analysis cache."""
-        self._cache.clear()
+        """Clear the in-process DD-table cache."""
+        self._table_cache.clear()
 
-    def get_stats(self) -> Dict[str, int]:
-        """Get usage statistics."""
+    def get_stats(self) -> Dict[str, Any]:
+        """Get usage statistics (solves, errors, cache size and hit rate)."""
         return {
             **self.stats,
-            'cache_size': len(self._cache)
+            'backend': self.backend,
+            'is_fast': self.is_fast,
+            **self._table_cache.get_stats()
         }
 
 
 # Module-level singleton for convenience
 _service: Optional[DDSAnalysisService] = None
 
+# In-process DD tables kept by the singleton service
+DD_TABLE_CACHE_SIZE = int(os.environ.get('DD_TABLE_CACHE_SIZE', 4096))
+
+
+def _shared_redis_client():
+    """Redis client for the shared DD-table tier, or None if not configured."""
+    url = os.environ.get('REDIS_URL') or os.environ.get('REDIS_HOST')
+    if not url:
+        return None
+    if '://' not in url:
+        url = f'redis://{url}:6379/0'
+    try:
+        import redis
+        client = redis.Redis.from_url(url)
+        client.ping()
+        return client
+    except Exception as e:
+        logger.warning(f"DD table cache: Redis unavailable ({e}); using in-process cache only")
+        return None
+
+
 def get_dds_service() -> DDSAnalysisService:
     """Get the singleton DDS analysis service."""
     global _service
     if _service is None:
-        _service = DDSAnalysisService()
+        _service = DDSAnalysisService(
+            DDTableCache(max_size=DD_TABLE_CACHE_SIZE, redis_client=_shared_redis_client())
+        )
     return _service
 
 
 def is_dds_available() -> bool:
-    """Check if DDS is available on this platform."""
+    """
+    Check if native DDS (endplay) is available on this platform.
+
+    Same as get_dds_service().is_fast. The service also runs on the Python
+    fallback (see DDSAnalysisService.is_available), but too slowly for the
+    request path, which is what this check guards.
+    """
     return DDS_AVAILABLE
 
 
@@ -11,6 +11,7 @@ This is the stable foundation that won't change when AI improves.
 """
 
 from engine.hand import Hand, Card
+from engine.bitboard import SUIT_MASK, cards_to_mask
 from typing import List, Tuple, Dict, Optional
 from dataclasses import dataclass, field
 from enum import Enum
@@ -417,10 +418,8 @@ class PlayEngine:
 
         led_suit = current_trick[0][0].suit
 
-        # Check if we have cards in led suit
-        cards_in_led_suit = [c for c in hand.cards if c.suit == led_suit]
-
-        if cards_in_led_suit:
+        # Check if we have cards in led suit (follow-suit mask)
+        if cards_to_mask(hand.cards) & SUIT_MASK[led_suit]:
             # Must follow suit
             return card.suit == led_suit
 
@@ -470,6 +470,19 @@ class SessionManager:
                 hand_data.get('hand_duration_seconds', 0)
             ))
 
+        # Keep the user's dashboard summary in step (same transaction)
+        from engine.learning.analytics_summary import record_hand
+        record_hand(cursor, session.user_id, {
+            'contract_level': contract.level if contract else None,
+            'tricks_taken': hand_data.get('tricks_taken'),
+            'made': hand_data.get('made', False),
+            'hand_score': hand_data['hand_score'],
+            'user_was_declarer': hand_data.get('user_was_declarer', False),
+            'user_was_dummy': hand_data.get('user_was_dummy', False),
+            'dd_tricks': dd_tricks,
+            'par_score': par_score,
+        })
+
         # Update session
         cursor.execute("""
             UPDATE game_sessions
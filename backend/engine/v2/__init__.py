@@ -10,7 +10,12 @@ Features:
 - Monte Carlo integration for bid validation (optional)
 """
 
-from .bidding_engine_v2_schema import BiddingEngineV2Schema, get_schema_engine
+from .bidding_engine_v2_schema import (
+    AuctionContext,
+    BiddingEngineV2Schema,
+    get_schema_engine
+)
+from .batch_bidding import DealResult, bid_auction, bid_deals
 from .features.enhanced_extractor import (
     extract_flat_features,
     hand_to_pbn,
@@ -21,8 +26,12 @@ from .inference.conflict_resolver import ConflictResolver, PassThroughResolver
 from .sanity_checker import CompetitiveSafetyValidator, validate_competitive_bid
 
 __all__ = [
+    'AuctionContext',
     'BiddingEngineV2Schema',
     'get_schema_engine',
+    'DealResult',
+    'bid_auction',
+    'bid_deals',
     'extract_flat_features',
     'hand_to_pbn',
     'pbn_to_hand',
@@ -0,0 +1,164 @@
+"""
+Batch Bidding for the V2 Schema Engine
+
+Runs complete four-seat auctions for many deals in one call, for
+simulations, QA runs and nightly regression over thousands of deals.
+
+- One engine bids every deal, each auction in its own AuctionContext,
+  so compiled schemas and the per-hand feature caches are shared.
+- With workers > 1, deals are bid in chunks on a process pool; each
+  worker builds its engine once. Only a few chunks per worker are in
+  flight, so deals can come from a generator of any length.
+- Results stream back as auctions finish: in deal order in-process, in
+  completion order from the pool (each DealResult carries its index).
+
+Usage:
+    for result in bid_deals(deals, dealer='North', vulnerability='None'):
+        print(result.index, result.auction)
+
+    # 10k deals on 8 processes, dealer/vulnerability per board
+    results = bid_deals(deals, dealer=dealers, vulnerability=vuls, workers=8)
+"""
+
+import itertools
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from engine.hand import Hand
+from engine.v2.bidding_engine_v2_schema import AuctionContext, BiddingEngineV2Schema
+from utils.seats import seat_from_index, seat_index, to_full_name
+
+MAX_AUCTION_LENGTH = 52  # Safety limit; real auctions are far shorter
+DEFAULT_CHUNK_SIZE = 16
+CHUNKS_PER_WORKER = 2  # Chunks queued per worker while others are bid
+
+Deal = Mapping[str, Union[Hand, str]]  # Seat -> Hand or PBN string ("AK5.KQ4.J962.K73")
+PerDeal = Union[str, Sequence[str]]
+
+
+@dataclass
+class DealResult:
+    """Auction bid for one deal"""
+    index: int
+    dealer: str
+    vulnerability: str
+    auction: List[str] = field(default_factory=list)
+    explanations: List[str] = field(default_factory=list)
+    rule_ids: List[Optional[str]] = field(default_factory=list)
+    error: Optional[str] = None  # Set if the engine raised; auction is partial
+
+    @property
+    def complete(self) -> bool:
+        return self.error is None and is_auction_complete(self.auction)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def is_auction_complete(auction: List[str]) -> bool:
+    """Passed out, or three passes after a bid"""
+    return len(auction) >= 4 and auction[-3:] == ['Pass', 'Pass', 'Pass']
+
+
+def _hands(deal: Deal) -> Dict[str, Hand]:
+    hands = {}
+    for seat, hand in deal.items():
+        hands[to_full_name(seat)] = hand if isinstance(hand, Hand) else Hand.from_pbn(hand)
+    return hands
+
+
+def bid_auction(engine: BiddingEngineV2Schema, deal: Deal, dealer: str = 'North',
+                vulnerability: str = 'None', index: int = 0) -> DealResult:
+    """Bid one deal to the end of its auction, in a fresh AuctionContext"""
+    hands = _hands(deal)
+    dealer = to_full_name(dealer)
+    result = DealResult(index=index, dealer=dealer, vulnerability=vulnerability)
+    context = AuctionContext()
+    auction = result.auction
+
+    while not is_auction_complete(auction) and len(auction) < MAX_AUCTION_LENGTH:
+        seat = to_full_name(seat_from_index(seat_index(dealer) + len(auction)))
+        context.last_rule_id = None
+        try:
+            bid, explanation = engine.get_next_bid(
+                hands[seat], list(auction), seat, vulnerability,
+                dealer=dealer, context=context
+            )
+        except Exception as e:
+            result.error = f"{seat} at bid {len(auction) + 1}: {type(e).__name__}: {e}"
+            break
+        auction.append(bid)
+        result.explanations.append(explanation)
+        result.rule_ids.append(context.last_rule_id)
+
+    return result
+
+
+def _per_deal(value: PerDeal, index: int) -> str:
+    return value if isinstance(value, str) else value[index]
+
+
+def bid_deals(deals: Iterable[Deal], dealer: PerDeal = 'North', vulnerability: PerDeal = 'None',
+              workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              engine: BiddingEngineV2Schema = None, schema_dir: str = None) -> Iterator[DealResult]:
+    """
+    Bid complete auctions for many deals, yielding results as they finish.
+
+    Args:
+        deals: Deals as {seat: Hand or PBN string}
+        dealer: Dealer for every deal, or a sequence with one per deal
+        vulnerability: Vulnerability for every deal, or one per deal
+        workers: Processes to bid on; 1 bids in this process
+        chunk_size: Deals sent to a worker at a time
+        engine: Engine to bid with in-process (default: a new engine)
+        schema_dir: Schema directory for new engines (in-process and workers)
+
+    Yields:
+        DealResult per deal; in deal order when workers == 1
+    """
+    jobs = ((i, deal, _per_deal(dealer, i), _per_deal(vulnerability, i))
+            for i, deal in enumerate(deals))
+
+    if workers <= 1:
+        engine = engine or BiddingEngineV2Schema(schema_dir)
+        for index, deal, deal_dealer, deal_vul in jobs:
+            yield bid_auction(engine, deal, deal_dealer, deal_vul, index)
+        return
+
+    yield from _bid_on_pool(jobs, workers, chunk_size, schema_dir)
+
+
+# === PROCESS POOL ===
+
+_worker_engine: Optional[BiddingEngineV2Schema] = None
+
+
+def _init_worker(schema_dir: Optional[str]):
+    global _worker_engine
+    _worker_engine = BiddingEngineV2Schema(schema_dir)
+
+
+def _bid_chunk(chunk: List[tuple]) -> List[DealResult]:
+    return [bid_auction(_worker_engine, deal, deal_dealer, deal_vul, index)
+            for index, deal, deal_dealer, deal_vul in chunk]
+
+
+def _bid_on_pool(jobs: Iterator[tuple], workers: int, chunk_size: int,
+                 schema_dir: Optional[str]) -> Iterator[DealResult]:
+    chunks = iter(lambda: list(itertools.islice(jobs, chunk_size)), [])
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                               initargs=(schema_dir,))
+    try:
+        pending = {pool.submit(_bid_chunk, chunk)
+                   for chunk in itertools.islice(chunks, workers * CHUNKS_PER_WORKER)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                next_chunk = next(chunks, None)
+                if next_chunk is not None:
+                    pending.add(pool.submit(_bid_chunk, next_chunk))
+                yield from future.result()
+    finally:
+        # Consumer stopped early or a chunk failed: drop queued chunks
+        pool.shutdown(wait=True, cancel_futures=True)
@@ -9,11 +9,22 @@ Python code. This allows for:
 4. Cleaner separation of bidding knowledge from engine logic
 5. Proper forcing level tracking across the auction
 6. Monte Carlo integration for bid validation (optional)
+
+Per-auction state (forcing level, last rule chosen) lives in an
+AuctionContext. The engine keeps a default context for callers that run
+one auction at a time; callers that share one engine across sessions or
+threads pass their own:
+
+    context = AuctionContext()
+    bid, explanation = engine.get_next_bid(hand, auction, 'South',
+                                           dealer='North', context=context)
 """
 
 import logging
+from dataclasses import dataclass, field
 from typing import Dict, Optional, Tuple, List
 from engine.hand import Hand
+from engine.ai.feature_cache import get_feature_cache_stats
 from utils.seats import seat_index, seat_from_index, partner as partner_seat
 from engine.v2.features.enhanced_extractor import extract_flat_features
 from engine.v2.interpreters.schema_interpreter import (
@@ -22,6 +33,7 @@ from engine.v2.interpreters.schema_interpreter import (
     BidValidationResult,
     ForcingLevel
 )
+from engine.v2.interpreters.forcing_state import ForcingStateMachine
 from engine.v2.inference.conflict_resolver import (
     ConflictResolver, PassThroughResolver, validate_bid_structure
 )
@@ -29,6 +41,68 @@ from engine.v2.inference.conflict_resolver import (
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class AuctionContext:
+    """
+    Bidding state for one auction.
+
+    Forcing level depends on the rules the engine chose for earlier bids,
+    so it can't be rebuilt from the auction alone; it is carried here
+    from bid to bid instead. Keep one context per table/session.
+    """
+    forcing: ForcingStateMachine = field(default_factory=ForcingStateMachine)
+    last_auction: Optional[List[str]] = None  # Track auction for auto-reset detection
+
+    # Tracking for analysis - info about the last bid decision
+    last_rule_id: Optional[str] = None
+    last_schema_file: Optional[str] = None
+    last_priority: Optional[int] = None
+
+    def reset(self):
+        """Reset state for a new deal."""
+        self.forcing.reset()
+        self.last_auction = None
+
+    def sync(self, auction_history: List[str]):
+        """Reset forcing state if auction_history is not a continuation of the last auction."""
+        self.forcing.sync_auction(auction_history or [])
+        if self.last_auction is None or not auction_history:
+            self.forcing.reset()
+        elif len(auction_history) <= len(self.last_auction):
+            # Auction got shorter or same length — new deal
+            self.forcing.reset()
+        elif auction_history[:len(self.last_auction)] != self.last_auction:
+            # Auction prefix changed — new deal
+            self.forcing.reset()
+        self.last_auction = list(auction_history) if auction_history else []
+
+    def record(self, candidate: BidCandidate):
+        """Store rule info for analysis"""
+        self.last_rule_id = candidate.rule_id
+        self.last_schema_file = getattr(candidate, 'schema_file', None)
+        self.last_priority = candidate.priority
+
+    def to_dict(self) -> Dict:
+        """Serialize for session storage (see core.session_state)."""
+        return {
+            'forcing': self.forcing.to_dict(),
+            'last_auction': self.last_auction,
+            'last_rule_id': self.last_rule_id,
+            'last_schema_file': self.last_schema_file,
+            'last_priority': self.last_priority,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'AuctionContext':
+        return cls(
+            forcing=ForcingStateMachine.from_dict(d.get('forcing', {})),
+            last_auction=d.get('last_auction'),
+            last_rule_id=d.get('last_rule_id'),
+            last_schema_file=d.get('last_schema_file'),
+            last_priority=d.get('last_priority'),
+        )
+
+
 class BiddingEngineV2Schema:
     """
     Schema-driven bidding engine.
@@ -59,12 +133,11 @@ class BiddingEngineV2Schema:
         self.interpreter = SchemaInterpreter(schema_dir)
         self._bid_legality_cache = {}
         self._total_bid_count = 0
-        self._last_auction = None  # Track auction for auto-reset detection
 
-        # Tracking for analysis - stores info about last bid decision
-        self._last_rule_id: Optional[str] = None
-        self._last_schema_file: Optional[str] = None
-        self._last_priority: Optional[int] = None
+        # Default context for callers that don't pass their own. It shares the
+        # interpreter's forcing state machine so interpreter.get_forcing_state()
+        # keeps reporting the engine's auction.
+        self.context = AuctionContext(forcing=self.interpreter.forcing)
 
         # Initialize conflict resolver for Monte Carlo integration
         if simulator is not None:
@@ -72,13 +145,26 @@ class BiddingEngineV2Schema:
         else:
             self.conflict_resolver = PassThroughResolver()
 
-    def new_deal(self):
+    # Last bid decision on the default context (read by analysis scripts)
+    @property
+    def _last_rule_id(self) -> Optional[str]:
+        return self.context.last_rule_id
+
+    @property
+    def _last_schema_file(self) -> Optional[str]:
+        return self.context.last_schema_file
+
+    @property
+    def _last_priority(self) -> Optional[int]:
+        return self.context.last_priority
+
+    def new_deal(self, context: AuctionContext = None):
         """Reset state for a new deal. Call this before each new hand."""
-        self.interpreter.reset_state()
+        (context or self.context).forcing.reset()
 
-    def get_forcing_state(self) -> Dict:
+    def get_forcing_state(self, context: AuctionContext = None) -> Dict:
         """Get the current forcing state of the auction."""
-        return self.interpreter.get_forcing_state()
+        return (context or self.context).forcing.get_state()
 
     def get_next_bid(
         self,
@@ -87,7 +173,8 @@ class BiddingEngineV2Schema:
         my_position: str,
         vulnerability: str = 'None',
         explanation_level: str = 'detailed',  # Not used by V2, but kept for V1 API compatibility
-        dealer: str = 'North'
+        dealer: str = 'North',
+        context: AuctionContext = None
     ) -> Tuple[str, str]:
         """
         Get the next bid for a hand.
@@ -99,25 +186,20 @@ class BiddingEngineV2Schema:
             vulnerability: Vulnerability string
             explanation_level: Explanation level (ignored, for V1 API compatibility)
             dealer: Dealer position
+            context: Auction state to read and update. Defaults to the
+                     engine's own context; pass one per session to share
+                     the engine between concurrent auctions.
 
         Returns:
             Tuple of (bid, explanation)
         """
         # Note: explanation_level is ignored - V2 Schema generates its own explanations
         self._total_bid_count += 1
+        ctx = context or self.context
+        forcing = ctx.forcing
 
         # Auto-reset forcing state when a new deal is detected.
-        # The FSM also self-guards via sync_auction (handles direct interpreter usage).
-        self.interpreter.sync_auction(auction_history or [])
-        if self._last_auction is None or not auction_history:
-            self.interpreter.reset_state()
-        elif len(auction_history) <= len(self._last_auction):
-            # Auction got shorter or same length — new deal
-            self.interpreter.reset_state()
-        elif auction_history[:len(self._last_auction)] != self._last_auction:
-            # Auction prefix changed — new deal
-            self.interpreter.reset_state()
-        self._last_auction = list(auction_history) if auction_history else []
+        ctx.sync(auction_history)
 
         # Extract features in flat format for schema evaluation
         features = extract_flat_features(
@@ -125,7 +207,7 @@ class BiddingEngineV2Schema:
         )
 
         # Add forcing state to features for rule evaluation
-        forcing_state = self.interpreter.get_forcing_state()
+        forcing_state = forcing.get_state()
         features['forcing_level'] = forcing_state['forcing_level']
         features['is_game_forced'] = forcing_state['is_game_forced']
 
@@ -198,7 +280,7 @@ class BiddingEngineV2Schema:
                 if not is_competitive:
                     last_level = features.get('last_contract_level', 0)
                     last_suit = self._get_last_contract_suit(auction_history)
-                    forcing_validation = self.interpreter.validate_bid_against_forcing(
+                    forcing_validation = forcing.validate_bid(
                         bid, last_contract_level=last_level, last_contract_suit=last_suit
                     )
                     if not forcing_validation.is_valid:
@@ -221,15 +303,10 @@ class BiddingEngineV2Schema:
 
                 # Update forcing state based on this bid's metadata
                 if candidate.sets_forcing_level:
-                    self.interpreter._update_forcing_state(
-                        candidate.sets_forcing_level,
-                        candidate.rule_id
-                    )
+                    forcing.update(candidate.sets_forcing_level, candidate.rule_id)
 
                 # Store rule info for analysis
-                self._last_rule_id = candidate.rule_id
-                self._last_schema_file = getattr(candidate, 'schema_file', None)
-                self._last_priority = candidate.priority
+                ctx.record(candidate)
 
                 # Slam exploration safety net: intercept game bids when slam values exist
                 slam_bid = self._slam_exploration_check(
@@ -244,23 +321,21 @@ class BiddingEngineV2Schema:
             # use it rather than defaulting to Pass in a forced auction
             if best_forcing_rejected is not None:
                 bid = best_forcing_rejected.bid
-                self._last_rule_id = best_forcing_rejected.rule_id
-                self._last_schema_file = getattr(best_forcing_rejected, 'schema_file', None)
-                self._last_priority = best_forcing_rejected.priority
+                ctx.record(best_forcing_rejected)
                 if best_forcing_rejected.sets_forcing_level:
-                    self.interpreter._update_forcing_state(
+                    forcing.update(
                         best_forcing_rejected.sets_forcing_level,
                         best_forcing_rejected.rule_id
                     )
                 return (bid, best_forcing_rejected.explanation)
 
         # No schema rule matched - fallback to Pass (check forcing constraints first)
-        self._last_rule_id = 'default_pass'
-        self._last_schema_file = None
-        self._last_priority = 0
+        ctx.last_rule_id = 'default_pass'
+        ctx.last_schema_file = None
+        ctx.last_priority = 0
         last_level = features.get('last_contract_level', 0)
         last_suit = self._get_last_contract_suit(auction_history)
-        forcing_validation = self.interpreter.validate_bid_against_forcing(
+        forcing_validation = forcing.validate_bid(
             "Pass", last_contract_level=last_level, last_contract_suit=last_suit
         )
         if not forcing_validation.is_valid:
@@ -287,7 +362,8 @@ class BiddingEngineV2Schema:
         auction_history: List[str],
         my_position: str,
         vulnerability: str = 'None',
-        dealer: str = 'North'
+        dealer: str = 'North',
+        context: AuctionContext = None
     ) -> Tuple[str, Dict]:
         """
         Get next bid with structured explanation data (for V1 API compatibility).
@@ -296,7 +372,8 @@ class BiddingEngineV2Schema:
             Tuple of (bid, explanation_dict)
         """
         bid, explanation_str = self.get_next_bid(
-            hand, auction_history, my_position, vulnerability, 'detailed', dealer
+            hand, auction_history, my_position, vulnerability, 'detailed', dealer,
+            context=context
         )
 
         # Create structured explanation similar to V1 format
@@ -306,7 +383,7 @@ class BiddingEngineV2Schema:
                 'id': None,
                 'name': 'V2 Schema'
             },
-            'forcing_status': self.interpreter.get_forcing_state().get('forcing_level', 'NON_FORCING'),
+            'forcing_status': self.get_forcing_state(context).get('forcing_level', 'NON_FORCING'),
             'hand_evaluation': {
                 'hcp': hand.hcp,
                 'shape': hand.shape_string  # e.g., "5-3-3-2"
@@ -315,6 +392,19 @@ class BiddingEngineV2Schema:
 
         return (bid, explanation_dict)
 
+    def bid_deals(self, deals, dealer='North', vulnerability: str = 'None',
+                  workers: int = 1, chunk_size: int = 16):
+        """
+        Bid complete auctions for many deals (see engine/v2/batch_bidding.py).
+
+        Bids with this engine in-process; with workers > 1, each worker
+        process builds an engine on this engine's schema directory.
+        Yields a DealResult per deal as its auction finishes.
+        """
+        from engine.v2.batch_bidding import bid_deals
+        return bid_deals(deals, dealer, vulnerability, workers=workers, chunk_size=chunk_size,
+                         engine=self, schema_dir=str(self.interpreter.schema_dir))
+
     def get_bid_candidates(
         self,
         hand: Hand,
@@ -586,6 +676,14 @@ class BiddingEngineV2Schema:
         """Reset conflict resolver statistics."""
         self.conflict_resolver.reset_stats()
 
+    def get_candidate_stats(self) -> Dict:
+        """Get rule candidate-set sizes per bid (rule index effectiveness)."""
+        return self.interpreter.get_candidate_stats()
+
+    def get_feature_cache_stats(self) -> Dict:
+        """Get feature layer cache hits, misses and time saved (shared by all engines)."""
+        return get_feature_cache_stats()
+
     def get_fallback_stats(self) -> Dict:
         """Get bid statistics. V1 fallback has been removed — always returns 0 fallbacks."""
         return {
@@ -606,7 +704,8 @@ class BiddingEngineV2Schema:
         auction_history: List[str],
         my_position: str,
         vulnerability: str = 'None',
-        dealer: str = 'North'
+        dealer: str = 'North',
+        context: AuctionContext = None
     ) -> 'V2BiddingFeedback':
         """
         Evaluate a user's bid against V2 schema rules.
@@ -626,6 +725,7 @@ class BiddingEngineV2Schema:
             my_position: User's position (North/East/South/West)
             vulnerability: Vulnerability string
             dealer: Dealer position
+            context: Auction state to use (see get_next_bid)
 
         Returns:
             V2BiddingFeedback object with evaluation results
@@ -633,7 +733,7 @@ class BiddingEngineV2Schema:
         # Lazy import to avoid circular dependency
         from engine.v2.feedback.bid_evaluator import V2BidEvaluator
 
-        evaluator = V2BidEvaluator(self)
+        evaluator = V2BidEvaluator(self, context=context)
         return evaluator.evaluate_bid(
             hand, user_bid, auction_history,
             my_position, vulnerability, dealer
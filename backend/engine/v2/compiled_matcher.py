@@ -0,0 +1,500 @@
+"""
+Compiled Soft-Match Predicates for V2 Bidding Engine
+
+SoftMatcher.calculate() interprets a rule's JSON on every call: it walks
+the condition dicts, dispatches on string keys and re-parses the trigger.
+The engine scores every rule in every schema for every bid (~750 rules),
+so that interpretation dominates bid time.
+
+compile_rule() does the dispatch once. A rule becomes a flat tuple of
+check closures, each bound to its feature key and constants, and a
+scorer that runs them in order:
+
+    - Legacy format: checks run in SoftMatcher's order and a check
+      returning below 1.0 subtracts (1.0 - score); 0.0 is a hard fail.
+    - New format: constraint scores multiply; HARD constraints scoring
+      0.0 fail the rule.
+    - Triggers are split, normalized and regex-compiled up front and
+      checked first, since they reject most rules for any given auction.
+
+The scorer returns exactly SoftMatcher.calculate(rule, features).score.
+It does not build penalty breakdowns or fail reasons; use SoftMatcher
+when those are needed. Rules with a shape the compiler doesn't expect
+fall back to SoftMatcher.
+
+Usage:
+    scorer = compile_rule(rule)
+    quality = scorer(features)   # same as SoftMatcher().calculate(rule, features).score
+"""
+
+import functools
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from engine.v2.soft_matcher import SoftMatcher
+
+# features -> score (1.0 pass, 0.0 hard fail, in between = soft penalty)
+Check = Callable[[Dict[str, Any]], float]
+Scorer = Callable[[Dict[str, Any]], float]
+
+_matcher = SoftMatcher()
+_QUALITY = SoftMatcher.SUIT_QUALITY_ORDER
+
+_BOOLEAN_KEYS = (
+    'is_opening', 'is_response', 'is_contested', 'is_overcall',
+    'has_5_card_major', 'is_two_over_one', 'is_game_forced',
+    'partner_opened', 'opponent_opened'
+)
+_SHAPE_KEYS = ('spades_length', 'hearts_length', 'diamonds_length', 'clubs_length')
+# Keys handled by the specialized legacy checks (see SoftMatcher._check_other_conditions)
+_HANDLED_KEYS = frozenset(('hcp', 'is_balanced') + _SHAPE_KEYS + _BOOLEAN_KEYS + (
+    'OR', 'AND', 'NOT', 'stoppers_required', 'stoppers_in'
+))
+
+
+_REGEX_CHARS = frozenset('.^$*+?{}[]\\|()')
+
+
+@functools.lru_cache(maxsize=4096)
+def normalized(value: str) -> str:
+    """SoftMatcher._normalize, cached (bids and bid-valued features repeat constantly)"""
+    return SoftMatcher._normalize(value)
+
+
+def is_literal_pattern(pattern: str) -> bool:
+    """True if a pattern only matches values that normalize to the pattern itself"""
+    return not _REGEX_CHARS.intersection(SoftMatcher._normalize(pattern))
+
+
+def compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Matcher for SoftMatcher._matches_pattern(pattern, value)"""
+    pattern_norm = SoftMatcher._normalize(pattern)
+    try:
+        regex = re.compile(f"^{pattern_norm}$").match
+    except re.error:
+        regex = None
+
+    def matches(value: str) -> bool:
+        if value == pattern:
+            return True
+        value_norm = normalized(value)
+        return value_norm == pattern_norm or (regex is not None and regex(value_norm) is not None)
+    return matches
+
+
+def _compile_any_pattern(patterns) -> Callable[[str], bool]:
+    matchers = tuple(compile_pattern(str(p)) for p in patterns)
+    return lambda value: any(m(value) for m in matchers)
+
+
+# === TRIGGER ===
+
+def _compile_trigger(trigger: str) -> Check:
+    parts = [p.strip() for p in trigger.split(' - ')]
+    if not parts or parts[-1] != '?':
+        return lambda features: 0.0
+
+    matchers = tuple(compile_pattern(p) for p in parts[:-1])
+    length = len(matchers)
+
+    def check(features):
+        auction = features.get('_auction_history', features.get('auction_history', []))
+        if len(auction) != length:
+            return 0.0
+        for matches, bid in zip(matchers, auction):
+            if not matches(bid):
+                return 0.0
+        return 1.0
+    return check
+
+
+# === LEGACY FORMAT ===
+
+def _compile_hcp(condition) -> Optional[Check]:
+    if not condition:
+        return None
+    if isinstance(condition, dict):
+        lo, hi = condition.get('min', 0), condition.get('max', 40)
+    elif isinstance(condition, (int, float)):
+        lo = hi = condition
+    else:
+        return None
+
+    soft = 1.0 - 0.10
+
+    def check(features):
+        actual = features.get('hcp', 0)
+        if lo <= actual <= hi:
+            return 1.0
+        dist = lo - actual if actual < lo else actual - hi
+        return soft if dist == 1 else 0.0
+    return check
+
+
+def _compile_suit_length(key: str, condition) -> Optional[Check]:
+    if not condition:
+        return None
+    if isinstance(condition, dict):
+        lo, hi = condition.get('min', 0), condition.get('max', 13)
+        lo_ref = lo if isinstance(lo, str) else None
+        hi_ref = hi if isinstance(hi, str) else None
+
+        def check(features):
+            actual = features.get(key, 0)
+            if actual < (features.get(lo_ref, 0) if lo_ref else lo):
+                return 0.0
+            if actual > (features.get(hi_ref, 13) if hi_ref else hi):
+                return 0.0
+            return 1.0
+        return check
+    if isinstance(condition, (int, float)):
+        return lambda features: 0.0 if features.get(key, 0) < condition else 1.0
+    return None
+
+
+def _compile_balance(required) -> Optional[Check]:
+    if required is None:
+        return None
+    if required:
+        semi = 1.0 - SoftMatcher.SEMI_BALANCED_PENALTY
+
+        def check(features):
+            if features.get('is_balanced', False):
+                return 1.0
+            return semi if features.get('is_semi_balanced', False) else 0.0
+        return check
+    return lambda features: 0.0 if features.get('is_balanced', False) else 1.0
+
+
+def _compile_booleans(conditions: Dict) -> Optional[Check]:
+    required = tuple((key, conditions[key]) for key in _BOOLEAN_KEYS if key in conditions)
+    if not required:
+        return None
+
+    def check(features):
+        for key, value in required:
+            if value != features.get(key, False):
+                return 0.0
+        return 1.0
+    return check
+
+
+def _ordinal(value):
+    return _QUALITY.get(value, value) if isinstance(value, str) else value
+
+
+def _compile_other(key: str, expected) -> Optional[Check]:
+    """One condition from SoftMatcher._check_other_conditions"""
+    if isinstance(expected, dict):
+        if 'in' in expected:
+            matches = _compile_any_pattern(expected['in'])
+
+            def check(features):
+                actual = features.get(key)
+                return 1.0 if actual is not None and matches(str(actual)) else 0.0
+            return check
+        if 'not_in' in expected:
+            matches = _compile_any_pattern(expected['not_in'])
+
+            def check(features):
+                actual = features.get(key)
+                return 0.0 if actual is not None and matches(str(actual)) else 1.0
+            return check
+        if 'exact' in expected:
+            exact = expected['exact']
+
+            def check(features):
+                actual = features.get(key)
+                if actual is None:
+                    return 0.0
+                try:
+                    if actual != exact:
+                        return 0.0
+                except TypeError:
+                    pass
+                return 1.0
+            return check
+        if 'min' in expected or 'max' in expected:
+            lo = _ordinal(expected.get('min', float('-inf')))
+            hi = _ordinal(expected.get('max', float('inf')))
+
+            def check(features):
+                actual = features.get(key)
+                if actual is None:
+                    return 0.0
+                actual = _ordinal(actual)
+                try:
+                    if actual < lo or actual > hi:
+                        return 0.0
+                except TypeError:
+                    pass
+                return 1.0
+            return check
+        return None
+
+    if isinstance(expected, bool):
+        return lambda features: 0.0 if features.get(key) != expected else 1.0
+
+    if isinstance(expected, (int, float)):
+        def check(features):
+            actual = features.get(key)
+            if actual is None:
+                return 0.0
+            try:
+                return 0.0 if actual != expected else 1.0
+            except TypeError:
+                return 0.0
+        return check
+
+    if isinstance(expected, str):
+        matches = compile_pattern(expected)
+
+        def check(features):
+            actual = features.get(key)
+            return 1.0 if matches(str(actual) if actual else '') else 0.0
+        return check
+
+    if isinstance(expected, list):
+        matches = _compile_any_pattern(expected)
+
+        def check(features):
+            actual = features.get(key)
+            return 1.0 if actual is not None and matches(str(actual)) else 0.0
+        return check
+
+    return None
+
+
+def _compile_or(branches) -> Optional[Check]:
+    if not branches or not isinstance(branches, list):
+        return None
+    scorers = tuple(_compile_legacy(b, None) for b in branches if isinstance(b, dict))
+
+    def check(features):
+        best = 0.0
+        for score in scorers:
+            branch_score = score(features)
+            if branch_score > best:
+                best = branch_score
+        return best
+    return check
+
+
+def _compile_and(branches) -> Optional[Check]:
+    if not branches or not isinstance(branches, list):
+        return None
+    scorers = tuple(_compile_legacy(b, None) for b in branches if isinstance(b, dict))
+
+    def check(features):
+        worst = 1.0
+        for score in scorers:
+            branch_score = score(features)
+            if branch_score == 0.0:
+                return 0.0
+            if branch_score < worst:
+                worst = branch_score
+        return worst
+    return check
+
+
+def _compile_not(branch) -> Optional[Check]:
+    if not branch or not isinstance(branch, dict):
+        return None
+    score = _compile_legacy(branch, None)
+    return lambda features: 0.0 if score(features) > 0.5 else 1.0
+
+
+def _compile_legacy(conditions: Dict, trigger: Optional[str]) -> Scorer:
+    checks: List[Optional[Check]] = [_compile_trigger(trigger) if trigger else None]
+    checks.append(_compile_hcp(conditions.get('hcp')))
+    checks.extend(_compile_suit_length(key, conditions.get(key)) for key in _SHAPE_KEYS)
+    checks.append(_compile_balance(conditions.get('is_balanced')))
+    checks.append(_compile_booleans(conditions))
+    checks.extend(_compile_other(key, expected) for key, expected in conditions.items()
+                  if key not in _HANDLED_KEYS)
+    checks.append(_compile_or(conditions.get('OR')))
+    checks.append(_compile_and(conditions.get('AND')))
+    checks.append(_compile_not(conditions.get('NOT')))
+    checks = tuple(c for c in checks if c is not None)
+
+    def score(features):
+        total = 1.0
+        for check in checks:
+            result = check(features)
+            if result == 0.0:
+                return 0.0
+            if result < 1.0:
+                total -= 1.0 - result
+        return max(0.0, min(1.0, total))
+    return score
+
+
+# === NEW FORMAT ===
+
+def _compile_constraint(constraint: Dict) -> Tuple[Check, bool]:
+    """(check, is_hard) for one entry of a constraints array"""
+    feature = constraint.get('feature')
+    is_hard = constraint.get('constraint_type', 'HARD').upper() == 'HARD'
+
+    if feature == 'OR':
+        scorers = tuple(_compile_legacy(b, None) for b in constraint.get('in', [])
+                        if isinstance(b, dict))
+
+        def check(features):
+            best = 0.0
+            for score in scorers:
+                branch_score = score(features)
+                if branch_score > best:
+                    best = branch_score
+            return best
+        return check, is_hard
+
+    evaluate = _matcher.evaluate_constraint
+    if 'expected' in constraint or 'in' in constraint or 'not_in' in constraint:
+        passes = _compile_membership(constraint)
+    else:
+        passes = _compile_range(constraint)
+
+    if is_hard:
+        return (lambda features: 1.0 if passes(features.get(feature)) else 0.0), True
+
+    # Only SOFT failures need SoftMatcher's distance and penalty arithmetic
+    def check(features):
+        actual = features.get(feature)
+        if passes(actual):
+            return 1.0
+        return evaluate(constraint, actual)[0]
+    return check, is_hard
+
+
+def _compile_membership(constraint: Dict) -> Callable[[Any], bool]:
+    if 'expected' in constraint:
+        expected = constraint['expected']
+        return lambda actual: actual == expected
+    if 'in' in constraint:
+        allowed = constraint['in']
+        return lambda actual: actual is not None and actual in allowed
+    forbidden = constraint['not_in']
+    return lambda actual: actual is None or actual not in forbidden
+
+
+def _compile_range(constraint: Dict) -> Callable[[Any], bool]:
+    lo, hi = constraint.get('min'), constraint.get('max')
+    if lo is None and hi is None:
+        return lambda actual: True
+    if isinstance(lo, str) and lo in _QUALITY:
+        rank = _QUALITY[lo]
+        return lambda actual: actual is not None and (
+            _QUALITY.get(actual, -1) if isinstance(actual, str) else -1) >= rank
+
+    def passes(actual):
+        if actual is None:
+            return False
+        if lo is not None and actual < lo:
+            return False
+        return not (hi is not None and actual > hi)
+    return passes
+
+
+def _compile_new(constraints: List[Dict], trigger: Optional[str]) -> Scorer:
+    trigger_check = _compile_trigger(trigger) if trigger else None
+    steps = tuple(_compile_constraint(c) for c in constraints)
+
+    def score(features):
+        if trigger_check is not None and trigger_check(features) == 0.0:
+            return 0.0
+        quality = 1.0
+        for check, is_hard in steps:
+            result = check(features)
+            if result == 0.0 and is_hard:
+                return 0.0
+            quality *= result
+        return max(0.0, min(1.0, quality))
+    return score
+
+
+# === PUBLIC API ===
+
+def compile_rule(rule: Dict[str, Any]) -> Scorer:
+    """
+    Compile a schema rule into a scorer equivalent to
+    SoftMatcher.calculate(rule, features).score
+    """
+    try:
+        constraints = rule.get('constraints')
+        if isinstance(constraints, list):
+            return _compile_new(constraints, rule.get('trigger'))
+        conditions = {**rule.get('conditions', {}),
+                      **(constraints if isinstance(constraints, dict) else {})}
+        return _compile_legacy(conditions, rule.get('trigger'))
+    except (AttributeError, KeyError, TypeError):
+        # Unexpected rule shape - let SoftMatcher interpret it (and report errors) per call
+        return lambda features: _matcher.calculate(rule, features).score
+
+
+# === GUARDS ===
+#
+# A guard is an equality a rule needs for any score above 0.0. Guard keys
+# are (feature, kind), and guard_value() reads the value the rule's check
+# compares against:
+#   - 'flag':  legacy boolean keys, compared with features.get(key, False)
+#   - 'value': compared with features.get(key)
+#   - 'bid':   literal bid patterns, compared after normalizing the feature
+
+GuardKey = Tuple[str, str]
+
+
+def _add_guard(guards: Dict[GuardKey, frozenset], key: GuardKey, values):
+    try:
+        values = frozenset(values)
+    except TypeError:
+        return  # Unhashable expected value - not usable as a guard
+    guards[key] = guards[key] & values if key in guards else values
+
+
+def rule_guards(rule: Dict[str, Any]) -> Dict[GuardKey, frozenset]:
+    """
+    Equality guards of a rule: {guard key: values}. The rule scores 0.0
+    unless guard_value(key, features) is in values for every key.
+    Triggers are not included.
+    """
+    guards: Dict[GuardKey, frozenset] = {}
+    try:
+        constraints = rule.get('constraints')
+        if isinstance(constraints, list):
+            for c in constraints:
+                if c.get('feature') == 'OR' or c.get('constraint_type', 'HARD').upper() != 'HARD':
+                    continue
+                if 'expected' in c:
+                    _add_guard(guards, (c.get('feature'), 'value'), (c['expected'],))
+                elif isinstance(c.get('in'), (list, tuple)):
+                    _add_guard(guards, (c.get('feature'), 'value'),
+                               (v for v in c['in'] if v is not None))
+            return guards
+
+        conditions = {**rule.get('conditions', {}),
+                      **(constraints if isinstance(constraints, dict) else {})}
+    except (AttributeError, TypeError):
+        return {}
+
+    for key, expected in conditions.items():
+        if key in _BOOLEAN_KEYS:
+            _add_guard(guards, (key, 'flag'), (expected,))
+        elif key in _HANDLED_KEYS:
+            continue
+        elif isinstance(expected, (bool, int, float)):
+            _add_guard(guards, (key, 'value'), (expected,))
+        elif isinstance(expected, str) and is_literal_pattern(expected):
+            _add_guard(guards, (key, 'bid'), (SoftMatcher._normalize(expected),))
+    return guards
+
+
+def guard_value(key: GuardKey, features: Dict[str, Any]):
+    """The value a guard key's rules compare against"""
+    feature, kind = key
+    if kind == 'flag':
+        return features.get(feature, False)
+    actual = features.get(feature)
+    if kind == 'bid':
+        return normalized(str(actual) if actual else '')
+    return actual
@@ -5,11 +5,13 @@ Builds on the existing feature_extractor.py but adds PBN support
 and flattens features for schema-based rule evaluation.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from engine.hand import Hand
 from utils.seats import seat_index, seat_from_index, partner as partner_seat, lho as lho_seat, rho as rho_seat
+from engine.ai.feature_cache import FeatureLayerCache, hand_key
 from engine.ai.feature_extractor import (
     extract_features,
+    extract_hand_layer,
     calculate_quick_tricks,
     calculate_stoppers,
     calculate_stopper_quality,
@@ -78,6 +80,82 @@ def pbn_to_hand(pbn: str) -> Hand:
     return Hand(cards)
 
 
+_SUITS = ['♠', '♥', '♦', '♣']
+
+_FLAT_HAND_LAYER = FeatureLayerCache('flat_hand_features')
+
+
+def extract_flat_hand_layer(hand: Hand) -> Dict[str, Any]:
+    """
+    Hand-only inputs of the flat features, memoized per hand.
+
+    Computed once per deal instead of on every bid of the auction (see
+    engine/ai/feature_cache.py). Shared between calls: treat as read-only.
+    """
+    return _FLAT_HAND_LAYER.get(hand_key(hand), lambda: _compute_flat_hand_layer(hand))
+
+
+def _compute_flat_hand_layer(hand: Hand) -> Dict[str, Any]:
+    suit_textures = extract_hand_layer(hand)['suit_texture']
+
+    # Texture HCP adjustment: "Working Points" for NT/slam evaluation
+    # +1.0 per suit with solid/sequential texture (honors work together)
+    # -0.5 per suit with isolated honor (stiff K, Qx, Jxx — wasted values)
+    texture_adj = 0.0
+    for suit in _SUITS:
+        tex = suit_textures[suit]['texture']
+        length = hand.suit_lengths[suit]
+        suit_cards = set(c.rank for c in hand.cards if c.suit == suit)
+        if tex in ('solid', 'sequential'):
+            texture_adj += 1.0
+        # Isolated honor: stiff K, Qx without A/K, Jxx without A/K/Q
+        elif length == 1 and 'K' in suit_cards:
+            texture_adj -= 0.5
+        elif length == 2 and 'Q' in suit_cards and 'A' not in suit_cards and 'K' not in suit_cards:
+            texture_adj -= 0.5
+        elif length <= 3 and 'J' in suit_cards and 'A' not in suit_cards and 'K' not in suit_cards and 'Q' not in suit_cards:
+            texture_adj -= 0.5
+
+    return {
+        'suit_texture': suit_textures,
+        'texture_hcp_adjustment': texture_adj,
+        'aces': sum(1 for c in hand.cards if c.rank == 'A'),
+        'kings': sum(1 for c in hand.cards if c.rank == 'K'),
+        'suit_quality': {suit: evaluate_suit_quality(hand, suit) for suit in _SUITS},
+        'suit_hcp': {suit: get_suit_hcp(hand, suit) for suit in _SUITS},
+        'control': {suit: _get_suit_control_level(hand, suit) for suit in _SUITS},
+        'pbn': hand_to_pbn(hand),
+    }
+
+
+_SEAT_BIDS_LAYER = FeatureLayerCache('auction_seat_bids', maxsize=4096)
+
+
+def _seat_bids(auction_history: List[str], dealer: str) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Bids made by each seat (indexed 0=N..3=W), memoized per auction.
+
+    Built incrementally: when the auction without its last bid is cached
+    (the previous call of the same auction), only the new bid is added.
+    """
+    auction = tuple(auction_history)
+    dealer_idx = seat_index(dealer)
+    return _SEAT_BIDS_LAYER.get((auction, dealer_idx), lambda: _compute_seat_bids(auction, dealer_idx))
+
+
+def _compute_seat_bids(auction: tuple, dealer_idx: int) -> Tuple[Tuple[str, ...], ...]:
+    if auction:
+        previous = _SEAT_BIDS_LAYER.peek((auction[:-1], dealer_idx))
+        if previous is not None:
+            seat = (dealer_idx + len(auction) - 1) % 4
+            return previous[:seat] + (previous[seat] + (auction[-1],),) + previous[seat + 1:]
+
+    bids = ([], [], [], [])
+    for i, bid in enumerate(auction):
+        bids[(dealer_idx + i) % 4].append(bid)
+    return tuple(tuple(seat_bids) for seat_bids in bids)
+
+
 def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
                           vulnerability: str, dealer: str = 'North') -> Dict[str, Any]:
     """
@@ -98,6 +176,7 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     """
     # Get existing features
     nested = extract_features(hand, auction_history, my_position, vulnerability, dealer)
+    hand_layer = extract_flat_hand_layer(hand)
 
     # --- Single-pass auction parse ---
     # Build seat-keyed bid lists once; every later reference uses these.
@@ -107,23 +186,18 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     lho_idx = seat_index(lho_seat(my_position))
     rho_idx = seat_index(rho_seat(my_position))
 
-    parsed_bids = {'me': [], 'partner': [], 'lho': [], 'rho': []}
     _seat_to_key = {
         seat_from_index(my_idx): 'me',
         seat_from_index(partner_idx): 'partner',
         seat_from_index(lho_idx): 'lho',
         seat_from_index(rho_idx): 'rho',
     }
-    for _i, _bid in enumerate(auction_history):
-        _seat = seat_from_index(dealer_idx + _i)
-        _key = _seat_to_key.get(_seat)
-        if _key:
-            parsed_bids[_key].append(_bid)
+    seat_bids = _seat_bids(auction_history, dealer)
 
-    my_bids = parsed_bids['me']
-    partner_bids = parsed_bids['partner']
-    lho_bids = parsed_bids['lho']
-    rho_bids = parsed_bids['rho']
+    my_bids = list(seat_bids[my_idx])
+    partner_bids = list(seat_bids[partner_idx])
+    lho_bids = list(seat_bids[lho_idx])
+    rho_bids = list(seat_bids[rho_idx])
 
     # Flatten into single dict
     flat = {}
@@ -158,7 +232,7 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
         flat[f'{suit_name}_stopper_quality'] = quality
 
     # Suit texture (sequences vs fragmented honors)
-    suit_textures = calculate_suit_texture(hand)
+    suit_textures = hand_layer['suit_texture']
     for suit, tex in suit_textures.items():
         suit_name = {'♠': 'spades', '♥': 'hearts', '♦': 'diamonds', '♣': 'clubs'}[suit]
         flat[f'{suit_name}_texture'] = tex['texture']
@@ -166,24 +240,8 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
         flat[f'{suit_name}_has_sequence'] = tex['has_sequence']
         flat[f'{suit_name}_texture_score'] = tex['score']
 
-    # Texture HCP adjustment: "Working Points" for NT/slam evaluation
-    # +1.0 per suit with solid/sequential texture (honors work together)
-    # -0.5 per suit with isolated honor (stiff K, Qx, Jxx — wasted values)
-    _texture_adj = 0.0
-    for suit in ['♠', '♥', '♦', '♣']:
-        suit_name = {'♠': 'spades', '♥': 'hearts', '♦': 'diamonds', '♣': 'clubs'}[suit]
-        tex = flat[f'{suit_name}_texture']
-        length = hf['suit_lengths'][suit]
-        suit_cards = set(c.rank for c in hand.cards if c.suit == suit)
-        if tex in ('solid', 'sequential'):
-            _texture_adj += 1.0
-        # Isolated honor: stiff K, Qx without A/K, Jxx without A/K/Q
-        elif length == 1 and 'K' in suit_cards:
-            _texture_adj -= 0.5
-        elif length == 2 and 'Q' in suit_cards and 'A' not in suit_cards and 'K' not in suit_cards:
-            _texture_adj -= 0.5
-        elif length <= 3 and 'J' in suit_cards and 'A' not in suit_cards and 'K' not in suit_cards and 'Q' not in suit_cards:
-            _texture_adj -= 0.5
+    # Texture HCP adjustment ("Working Points"), see _compute_flat_hand_layer
+    _texture_adj = hand_layer['texture_hcp_adjustment']
     flat['texture_hcp_adjustment'] = _texture_adj
     flat['effective_hcp'] = flat['hcp'] + _texture_adj
 
@@ -468,8 +526,8 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     flat['has_7_card_suit'] = longest_length >= 7
 
     # Ace and King counts (for Blackwood/Gerber responses)
-    flat['aces'] = sum(1 for c in hand.cards if c.rank == 'A')
-    flat['kings'] = sum(1 for c in hand.cards if c.rank == 'K')
+    flat['aces'] = hand_layer['aces']
+    flat['kings'] = hand_layer['kings']
 
     # Longest major suit (for responding to takeout doubles)
     spades_len = suit_lengths.get('♠', 0)
@@ -505,8 +563,8 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     # Per-suit quality and HCP (needed by opening/preempt schemas)
     suit_names = {'♠': 'spades', '♥': 'hearts', '♦': 'diamonds', '♣': 'clubs'}
     for suit_sym, suit_name in suit_names.items():
-        flat[f'suit_quality_{suit_name}'] = evaluate_suit_quality(hand, suit_sym)
-        flat[f'{suit_name}_hcp'] = get_suit_hcp(hand, suit_sym)
+        flat[f'suit_quality_{suit_name}'] = hand_layer['suit_quality'][suit_sym]
+        flat[f'{suit_name}_hcp'] = hand_layer['suit_hcp'][suit_sym]
 
     # Longest suit quality, HCP, and texture
     longest = flat.get('longest_suit', '')
@@ -570,7 +628,7 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     for suit in ['♠', '♥', '♦', '♣']:  # Check in rank order for tie-breaking
         length = suit_lengths.get(suit, 0)
         if length >= 5:
-            quality = evaluate_suit_quality(hand, suit)
+            quality = hand_layer['suit_quality'][suit]
             # Prefer longer suits, then better quality, then higher ranking
             if (length > best_overcall_length or
                 (length == best_overcall_length and quality_order.get(quality, 0) > quality_order.get(best_overcall_quality, 0)) or
@@ -1116,7 +1174,7 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     flat['lho_last_bid'] = lho_bids[-1] if lho_bids else None
 
     # PBN representation
-    flat['pbn'] = hand_to_pbn(hand)
+    flat['pbn'] = hand_layer['pbn']
 
     # Partner HCP range inference
     # Build up partner's known HCP range from ALL available auction information.
@@ -1293,7 +1351,7 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     # Key cards for RKCB (Roman Key Card Blackwood)
     # Key cards = 4 aces + trump King (if trump suit is known)
     # Count aces held
-    aces_held = sum(1 for c in hand.cards if c.rank == 'A')
+    aces_held = hand_layer['aces']
     flat['aces_held'] = aces_held
 
     # Key cards depend on agreed trump suit
@@ -1340,7 +1398,7 @@ def extract_flat_features(hand: Hand, auction_history: list, my_position: str,
     # Control level: 1 = first-round (Ace/Void), 2 = second-round (King/Singleton)
     for suit in ['♠', '♥', '♦', '♣']:
         suit_name = {'♠': 'spades', '♥': 'hearts', '♦': 'diamonds', '♣': 'clubs'}[suit]
-        flat[f'{suit_name}_control'] = _get_suit_control_level(hand, suit)
+        flat[f'{suit_name}_control'] = hand_layer['control'][suit]
 
     # Early partnership HCP estimate (needed for in_slam_zone before final calculation)
     # Use midpoint of partner's range (capped at 20) for more realistic slam evaluation.
@@ -1629,13 +1687,7 @@ def _extract_bids_for_seat(auction_history: List[str], target_position: str, dea
     Returns:
         List of bids made by the target seat
     """
-    target_seat = seat_from_index(seat_index(target_position))
-    dealer_idx = seat_index(dealer)
-    bids = []
-    for i, bid in enumerate(auction_history):
-        if seat_from_index(dealer_idx + i) == target_seat:
-            bids.append(bid)
-    return bids
+    return list(_seat_bids(auction_history, dealer)[seat_index(target_position)])
 
 
 def _get_partner_bids(auction_history: List[str], my_position: str, dealer: str = 'North') -> List[str]:
@@ -161,14 +161,16 @@ class V2BidEvaluator:
     # Minimum priority for a candidate to be considered acceptable
     MIN_ACCEPTABLE_PRIORITY = 400
 
-    def __init__(self, engine: 'BiddingEngineV2Schema'):
+    def __init__(self, engine: 'BiddingEngineV2Schema', context: 'AuctionContext' = None):
         """
         Initialize evaluator with a V2 schema engine.
 
         Args:
             engine: BiddingEngineV2Schema instance to use for evaluation
+            context: Auction state to evaluate in (defaults to the engine's own)
         """
         self.engine = engine
+        self.context = context
         self.error_categorizer = get_error_categorizer()
 
     def evaluate_bid(
@@ -202,7 +204,8 @@ class V2BidEvaluator:
         """
         # Get optimal bid and all candidates from V2 engine
         optimal_bid, optimal_explanation = self.engine.get_next_bid(
-            hand, auction_history, my_position, vulnerability, 'detailed', dealer
+            hand, auction_history, my_position, vulnerability, 'detailed', dealer,
+            context=self.context
         )
 
         candidates = self.engine.get_bid_candidates(
@@ -210,7 +213,7 @@ class V2BidEvaluator:
         )
 
         # Get forcing state for context
-        forcing_state = self.engine.get_forcing_state()
+        forcing_state = self.engine.get_forcing_state(self.context)
         forcing_status = forcing_state.get('forcing_level', 'NON_FORCING')
 
         # Determine correctness and score
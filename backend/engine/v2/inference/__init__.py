@@ -3,8 +3,10 @@ V2 Inference Module
 
 Provides judgment layers for the schema-driven bidding engine:
 - ConflictResolver: Monte Carlo integration for bid validation
+- MonteCarloSimulator: constrained-deal simulator the resolver consults
 """
 
 from .conflict_resolver import ConflictResolver
+from .monte_carlo import MonteCarloSimulator
 
-__all__ = ['ConflictResolver']
+__all__ = ['ConflictResolver', 'MonteCarloSimulator']
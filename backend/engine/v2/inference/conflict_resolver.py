@@ -248,7 +248,7 @@ class ConflictResolver:
         try:
             # Run quick simulation (50 iterations for speed)
             expected_tricks = self.simulator.simulate_tricks(
-                hand, history, n_sims=50
+                hand, history, n_sims=50, strain=suit
             )
 
             # Generous buffer: veto only if clearly failing
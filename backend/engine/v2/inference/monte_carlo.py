@@ -0,0 +1,383 @@
+"""
+Monte Carlo Simulator - Constrained Deals for Bid Validation
+
+Deals the three hidden hands many times, consistent with what the auction
+has shown, and estimates how many tricks a contract takes across the
+sample. ConflictResolver uses it to sanity-check slam and competitive
+decisions.
+
+Dealing:
+    BiddingStateBuilder replays the auction into per-seat beliefs (HCP
+    range and suit-length ranges). The 39 unseen cards are shuffled and
+    split between the other three seats; a deal is kept only if every
+    hidden hand fits its seat's belief. Sampling stops at the sample
+    count or the time budget, whichever comes first.
+
+Trick scoring:
+    - Fast mode (default): a trick estimator on the two partnership hands
+      (losing trick count for suit contracts, combined HCP for notrump).
+      Cheap enough to run inline, inside the per-bid latency budget.
+    - Full mode: batched double-dummy tables (endplay calc_all_tables)
+      for the contract strain. Accurate, but seconds per call - for
+      offline analysis and QA runs.
+
+Results are cached by (hand, auction, question), so re-evaluating the same
+bid (e.g. candidate retries, hint + bid for the same position) is free.
+
+Usage:
+    simulator = MonteCarloSimulator()
+    engine = BiddingEngineV2Schema(simulator=simulator)
+
+    tricks = simulator.simulate_tricks(hand, ['1♠', 'Pass', '3♠', 'Pass'], strain='♠')
+"""
+
+import logging
+import random
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from engine.ai.bidding_state import BiddingStateBuilder
+from engine.bitboard import (
+    SUITS, SUIT_BITS, SUIT_FULL, RANKS, FULL_DECK,
+    SUIT_LENGTH_TABLE, SUIT_HCP_TABLE,
+)
+from engine.hand import Hand
+from utils.seats import SEATS, partner, lho
+
+logger = logging.getLogger(__name__)
+
+# Try to import DDS (full mode only)
+try:
+    from endplay.types import Deal, Denom
+    from endplay.dds import calc_all_tables
+    DDS_AVAILABLE = True
+except ImportError:
+    DDS_AVAILABLE = False
+    Deal = None
+    Denom = None
+    calc_all_tables = None
+
+
+DEFAULT_SAMPLES = 50
+FAST_TIME_BUDGET_MS = 100     # Inline, per bid
+FULL_TIME_BUDGET_MS = 5000    # Offline, DDS-scored
+MIN_SAMPLES = 10              # Fewer accepted deals than this is not an answer
+MAX_BATCH_DEALS = 40          # Deals per calc_all_tables call
+DEFAULT_CACHE_SIZE = 1024
+TIME_CHECK_INTERVAL = 64      # Dealing attempts between clock reads
+
+STRAINS = SUITS + ['NT']
+_STRAIN_INDEX = {strain: i for i, strain in enumerate(STRAINS)}  # endplay Denom order
+
+
+# === TRICK ESTIMATOR ===
+
+def _holding_losers(holding: int) -> int:
+    """Losing trick count of one 13-bit suit holding (A/K/Q in the top three cards)"""
+    length = SUIT_LENGTH_TABLE[holding]
+    top = min(length, 3)
+    honors = sum(1 for rank in (12, 11, 10)[:top] if holding >> rank & 1)
+    return top - honors
+
+
+SUIT_LOSERS_TABLE: List[int] = [_holding_losers(h) for h in range(1 << SUIT_BITS)]
+
+# Estimator coefficients, checked against double-dummy tables of random deals
+# (mean error about 1 trick for game/slam-strength partnerships):
+# notrump tricks grow ~0.5 per combined HCP; suit contracts follow the
+# losing trick count (24 - combined losers), less a trick per card the
+# trump fit is short of eight
+NT_BASE_TRICKS = 6.3          # Tricks with 20 combined HCP
+NT_TRICKS_PER_HCP = 0.5
+TRUMP_BASE_TRICKS = 24.0
+SHORT_FIT_PENALTY = 1.0
+
+
+def estimate_tricks(mask_a: int, mask_b: int, strain: str) -> float:
+    """
+    Estimate tricks a partnership takes as declarer
+
+    Args:
+        mask_a, mask_b: Bitmasks of the two partnership hands
+        strain: '♠', '♥', '♦', '♣' or 'NT'
+
+    Returns:
+        Estimated tricks (0-13)
+    """
+    holdings_a = [(mask_a >> (i * SUIT_BITS)) & SUIT_FULL for i in range(4)]
+    holdings_b = [(mask_b >> (i * SUIT_BITS)) & SUIT_FULL for i in range(4)]
+
+    if strain == 'NT':
+        points = sum(SUIT_HCP_TABLE[h] for h in holdings_a + holdings_b)
+        tricks = NT_BASE_TRICKS + NT_TRICKS_PER_HCP * (points - 20)
+    else:
+        trump = SUITS.index(strain)
+        fit = SUIT_LENGTH_TABLE[holdings_a[trump]] + SUIT_LENGTH_TABLE[holdings_b[trump]]
+        losers = sum(SUIT_LOSERS_TABLE[h] for h in holdings_a + holdings_b)
+        tricks = TRUMP_BASE_TRICKS - losers - SHORT_FIT_PENALTY * max(0, 8 - fit)
+
+    return max(0.0, min(13.0, tricks))
+
+
+# === HELPERS ===
+
+def _mask_to_pbn(mask: int) -> str:
+    """PBN hand string (spades first, high cards first) for a bitmask"""
+    suits = []
+    for i in range(4):
+        holding = (mask >> (i * SUIT_BITS)) & SUIT_FULL
+        suits.append(''.join(RANKS[r] for r in range(12, -1, -1) if holding >> r & 1))
+    return '.'.join(suits)
+
+
+def _bid_strain(bid: str) -> Optional[str]:
+    """Strain of a contract bid ('4♠' -> '♠', '3NT' -> 'NT'), None for Pass/X/XX"""
+    if not bid or not bid[0].isdigit():
+        return None
+    return 'NT' if bid[1:] == 'NT' else bid[1:]
+
+
+class MonteCarloSimulator:
+    """
+    Constrained-deal simulator for ConflictResolver
+
+    Seats are taken relative to a North dealer: beliefs depend only on the
+    order of bids, so the bidder is SEATS[len(history) % 4].
+    """
+
+    def __init__(self, n_samples: int = DEFAULT_SAMPLES, fast_mode: bool = True,
+                 time_budget_ms: Optional[float] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE, seed: Optional[int] = None):
+        """
+        Initialize simulator
+
+        Args:
+            n_samples: Maximum deals per question
+            fast_mode: Score with the trick estimator (True) or DDS (False).
+                Without endplay, full mode falls back to the estimator.
+            time_budget_ms: Wall-clock budget per question (dealing +
+                scoring). Defaults to FAST_TIME_BUDGET_MS or FULL_TIME_BUDGET_MS.
+            cache_size: Results kept in the LRU cache (0 disables)
+            seed: Random seed for reproducible samples
+        """
+        self.n_samples = n_samples
+        self.use_dds = not fast_mode and DDS_AVAILABLE
+        if not fast_mode and not DDS_AVAILABLE:
+            logger.warning("DDS not available - Monte Carlo simulator using trick estimator")
+        if time_budget_ms is None:
+            time_budget_ms = FAST_TIME_BUDGET_MS if fast_mode else FULL_TIME_BUDGET_MS
+        self.time_budget_ms = time_budget_ms
+        self.cache_size = cache_size
+        self._cache: OrderedDict = OrderedDict()
+        self._rng = random.Random(seed)
+        self._state_builder = BiddingStateBuilder()
+
+        # Statistics
+        self.stats = {
+            'questions': 0,
+            'cache_hits': 0,
+            'deals_sampled': 0,
+            'deal_attempts': 0,
+            'budget_exhausted': 0,
+            'dds_tables': 0,
+        }
+
+    @property
+    def is_fast_mode(self) -> bool:
+        """True when results come from the estimator, safe to call inline per bid"""
+        return not self.use_dds
+
+    # === PUBLIC API ===
+
+    def simulate_tricks(self, hand: Hand, history: List[str],
+                        n_sims: Optional[int] = None,
+                        strain: Optional[str] = None) -> float:
+        """
+        Expected tricks for our partnership declaring in strain
+
+        Args:
+            hand: Bidder's hand
+            history: Auction so far (the bidder is next to call)
+            n_sims: Sample count (capped at n_samples)
+            strain: Contract strain; defaults to our side's last bid strain,
+                else notrump
+
+        Returns:
+            Average tricks over the sampled deals
+        """
+        me = SEATS[len(history) % 4]
+        if strain is None:
+            strain = self._last_strain(history, {me, partner(me)}) or 'NT'
+        return self._ask('tricks', hand, history, strain, n_sims,
+                         declarers=(me, partner(me)))
+
+    def simulate_defense(self, hand: Hand, history: List[str],
+                         n_sims: Optional[int] = None) -> float:
+        """
+        Expected defensive tricks against the opponents' last contract bid
+
+        Raises:
+            ValueError: If the opponents have not bid a contract
+        """
+        me = SEATS[len(history) % 4]
+        opponents = (lho(me), partner(lho(me)))
+        strain = self._last_strain(history, set(opponents))
+        if strain is None:
+            raise ValueError("Opponents have not bid a contract")
+        return 13.0 - self._ask('defense', hand, history, strain, n_sims,
+                                declarers=opponents)
+
+    def sample_deals(self, hand: Hand, history: List[str], n: int,
+                     deadline: Optional[float] = None) -> List[Dict[str, int]]:
+        """
+        Deal the hidden hands consistent with the auction
+
+        Args:
+            hand: Bidder's hand
+            history: Auction so far
+            n: Deals wanted
+            deadline: time.monotonic() value to stop at
+
+        Returns:
+            Up to n deals as {seat: bitmask} (fewer if the deadline passed)
+        """
+        me = SEATS[len(history) % 4]
+        my_mask = hand.to_bitmask()
+        state = self._state_builder.build(history, 'N')
+
+        hidden = [seat for seat in SEATS if seat != me]
+        constraints = []
+        for seat in hidden:
+            belief = state.seat(seat)
+            constraints.append((seat, belief.hcp,
+                                [belief.suits[suit] for suit in SUITS]))
+        # Check the most constrained seat first so bad deals fail fast
+        constraints.sort(key=lambda c: (c[1][1] - c[1][0])
+                         + sum(hi - lo for lo, hi in c[2]))
+
+        unseen_mask = FULL_DECK ^ my_mask
+        unseen = [1 << bit for bit in range(52) if unseen_mask >> bit & 1]
+        sample = self._rng.sample
+        deals = []
+        attempts = 0
+        while len(deals) < n:
+            attempts += 1
+            if deadline is not None and attempts % TIME_CHECK_INTERVAL == 0 \
+                    and time.monotonic() > deadline:
+                self.stats['budget_exhausted'] += 1
+                break
+
+            # Deal seat by seat and start over on the first misfit. Same
+            # distribution as shuffling all 39 cards and rejecting, but a
+            # bad first hand costs only 13 draws.
+            deal = {me: my_mask}
+            remaining = unseen_mask
+            pool = unseen
+            for k, (seat, (hcp_min, hcp_max), suit_ranges) in enumerate(constraints):
+                if k < 2:
+                    mask = 0
+                    for bit in sample(pool, 13):
+                        mask |= bit
+                else:
+                    mask = remaining
+                if not self._fits(mask, hcp_min, hcp_max, suit_ranges):
+                    break
+                deal[seat] = mask
+                remaining ^= mask
+                pool = [bit for bit in pool if remaining & bit]
+            else:
+                deals.append(deal)
+
+        self.stats['deal_attempts'] += attempts
+        self.stats['deals_sampled'] += len(deals)
+        return deals
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return simulator statistics"""
+        stats = dict(self.stats)
+        stats['cache_size'] = len(self._cache)
+        stats['fast_mode'] = self.is_fast_mode
+        stats['acceptance_rate'] = (stats['deals_sampled'] / stats['deal_attempts']
+                                    if stats['deal_attempts'] else 0.0)
+        return stats
+
+    def clear_cache(self):
+        """Drop cached results"""
+        self._cache.clear()
+
+    # === INTERNALS ===
+
+    def _ask(self, kind: str, hand: Hand, history: List[str], strain: str,
+             n_sims: Optional[int], declarers: Tuple[str, str]) -> float:
+        """Sample, score and cache one question; returns declarer-side tricks"""
+        self.stats['questions'] += 1
+        n = min(n_sims or self.n_samples, self.n_samples)
+        key = (hand.to_bitmask(), tuple(history), kind, strain, n)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats['cache_hits'] += 1
+            return self._cache[key]
+
+        deadline = time.monotonic() + self.time_budget_ms / 1000
+        deals = self.sample_deals(hand, history, n, deadline)
+        if len(deals) < min(n, MIN_SAMPLES):
+            raise RuntimeError(
+                f"Only {len(deals)} deals consistent with the auction within "
+                f"{self.time_budget_ms:.0f}ms"
+            )
+
+        if self.use_dds:
+            tricks = self._dds_tricks(deals, strain, declarers)
+        else:
+            a, b = declarers
+            tricks = [estimate_tricks(deal[a], deal[b], strain) for deal in deals]
+        result = sum(tricks) / len(tricks)
+
+        if self.cache_size > 0:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _dds_tricks(self, deals: List[Dict[str, int]], strain: str,
+                    declarers: Tuple[str, str]) -> List[float]:
+        """Double-dummy tricks for the better declarer of the pair, one table per deal"""
+        strain_index = _STRAIN_INDEX[strain]
+        exclude = [Denom(i) for i in range(5) if i != strain_index]
+        seat_indexes = [SEATS.index(seat) for seat in declarers]
+
+        tricks = []
+        for start in range(0, len(deals), MAX_BATCH_DEALS):
+            batch = deals[start:start + MAX_BATCH_DEALS]
+            boards = [Deal('N:' + ' '.join(_mask_to_pbn(deal[seat]) for seat in SEATS))
+                      for deal in batch]
+            for table in calc_all_tables(boards, exclude=exclude):
+                row = table.to_list()[strain_index]
+                tricks.append(float(max(row[i] for i in seat_indexes)))
+            self.stats['dds_tables'] += len(batch)
+        return tricks
+
+    @staticmethod
+    def _fits(mask: int, hcp_min: int, hcp_max: int,
+              suit_ranges: List[Tuple[int, int]]) -> bool:
+        """Check a hand against a seat's HCP and suit-length ranges"""
+        points = 0
+        for i in range(4):
+            holding = (mask >> (i * SUIT_BITS)) & SUIT_FULL
+            lo, hi = suit_ranges[i]
+            length = SUIT_LENGTH_TABLE[holding]
+            if length < lo or length > hi:
+                return False
+            points += SUIT_HCP_TABLE[holding]
+        return hcp_min <= points <= hcp_max
+
+    @staticmethod
+    def _last_strain(history: List[str], seats: set) -> Optional[str]:
+        """Strain of the last contract bid made by any of seats"""
+        for i in range(len(history) - 1, -1, -1):
+            if SEATS[i % 4] in seats:
+                strain = _bid_strain(history[i])
+                if strain is not None:
+                    return strain
+        return None
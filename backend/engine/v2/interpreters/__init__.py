@@ -11,6 +11,7 @@ from .forcing_state import (
     BidValidationResult
 )
 from .gap_analyzer import GapAnalyzer
+from .rule_set import CompiledRuleSet, get_rule_set
 
 __all__ = [
     'SchemaInterpreter',
@@ -19,5 +20,7 @@ __all__ = [
     'ForcingLevel',
     'AuctionState',
     'ForcingStateMachine',
-    'GapAnalyzer'
+    'GapAnalyzer',
+    'CompiledRuleSet',
+    'get_rule_set'
 ]
@@ -94,6 +94,23 @@ class ForcingStateMachine:
             'bids_since_forcing': self.state.bids_since_forcing
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize full state for session storage."""
+        return {**self.get_state(), 'last_auction_len': self._last_auction_len}
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'ForcingStateMachine':
+        """Rebuild from to_dict() output."""
+        machine = cls()
+        machine.state = AuctionState(
+            forcing_level=ForcingLevel(d.get('forcing_level', 'NON_FORCING')),
+            is_game_forced=d.get('is_game_forced', False),
+            forcing_source=d.get('forcing_source'),
+            bids_since_forcing=d.get('bids_since_forcing', 0),
+        )
+        machine._last_auction_len = d.get('last_auction_len', 0)
+        return machine
+
     def update(self, new_level: Optional[str], rule_id: str):
         """
         Update the forcing state based on a matched rule's metadata.
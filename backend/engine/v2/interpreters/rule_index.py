@@ -0,0 +1,177 @@
+"""
+Rule Index for the V2 Schema Interpreter
+
+Scoring a rule is cheap once compiled, but the engine scored every rule
+in every schema for every bid even though, for a given auction, most of
+them hard-fail on their trigger or on a role flag (is_opening,
+is_advancer, partner_last_bid...). The index narrows a bid to the rules
+that can score above zero, so only those are scored.
+
+Two structures, both built once per CompiledRuleSet:
+
+    - TriggerTrie: rules with a trigger, in a trie over auction
+      positions. Literal parts ("1♣", "Pass") are dict children keyed
+      by normalized bid; pattern parts ("1[CD]") are matcher children.
+      Lookup walks the auction once.
+    - GuardNet: rules without a trigger, in a discrimination net over
+      their equality guards (see compiled_matcher.rule_guards). Each
+      node tests one guard feature; rules that don't constrain it sit
+      on the node's "rest" branch and are always followed.
+
+Both are exact: a rule left out would have scored 0.0 in SoftMatcher.
+
+Usage:
+    trie = TriggerTrie()
+    trie.add("1♣ - Pass - ?", rule_index)
+    trie.match(['1♣', 'Pass'])          # -> [rule_index]
+
+    net = GuardNet([(rule_index, rule_guards(rule)), ...])
+    net.match(features)                 # -> rule indexes
+"""
+
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from engine.v2.compiled_matcher import (
+    GuardKey, compile_pattern, guard_value, is_literal_pattern, normalized,
+)
+
+
+def trigger_parts(trigger: str) -> Optional[List[str]]:
+    """Bid patterns of a trigger ("1♣ - Pass - ?"), None if malformed (never matches)"""
+    parts = [p.strip() for p in trigger.split(' - ')]
+    if not parts or parts[-1] != '?':
+        return None
+    return parts[:-1]
+
+
+# === TRIGGER TRIE ===
+
+class _TrieNode:
+    __slots__ = ('literals', 'patterns', 'pattern_nodes', 'values')
+
+    def __init__(self):
+        self.literals: Dict[str, '_TrieNode'] = {}
+        self.patterns: List[Tuple[Any, '_TrieNode']] = []
+        self.pattern_nodes: Dict[str, '_TrieNode'] = {}
+        self.values: List[int] = []
+
+
+class TriggerTrie:
+    """Trie over auction positions with literal and pattern children"""
+
+    def __init__(self):
+        self.root = _TrieNode()
+        self.size = 0
+
+    def add(self, trigger: str, value: int) -> bool:
+        """Index value under trigger. Returns False for malformed triggers."""
+        parts = trigger_parts(trigger)
+        if parts is None:
+            return False
+
+        node = self.root
+        for part in parts:
+            if is_literal_pattern(part):
+                node = node.literals.setdefault(normalized(part), _TrieNode())
+            else:
+                child = node.pattern_nodes.get(part)
+                if child is None:
+                    child = node.pattern_nodes[part] = _TrieNode()
+                    node.patterns.append((compile_pattern(part), child))
+                node = child
+        node.values.append(value)
+        self.size += 1
+        return True
+
+    def match(self, auction: List[str]) -> List[int]:
+        """Values whose trigger matches the auction exactly"""
+        nodes = [self.root]
+        for bid in auction:
+            bid_norm = normalized(bid)
+            next_nodes = []
+            for node in nodes:
+                child = node.literals.get(bid_norm)
+                if child is not None:
+                    next_nodes.append(child)
+                for matches, child in node.patterns:
+                    if matches(bid):
+                        next_nodes.append(child)
+            if not next_nodes:
+                return []
+            nodes = next_nodes
+        return [value for node in nodes for value in node.values]
+
+
+# === GUARD NET ===
+
+class _GuardNode:
+    __slots__ = ('key', 'branches', 'rest')
+
+    def __init__(self, key: GuardKey, branches: Dict[Any, Any], rest):
+        self.key = key
+        self.branches = branches
+        self.rest = rest
+
+
+class GuardNet:
+    """
+    Discrimination net over rule guards
+
+    Built greedily: each node tests the guard feature shared by the most
+    remaining rules, until a node holds LEAF_SIZE rules or fewer or no
+    guard is shared by two of them. Leaf rules are returned unfiltered,
+    so match() may include a rule whose guards fail, never the reverse.
+    """
+
+    LEAF_SIZE = 4
+
+    def __init__(self, entries: Iterable[Tuple[int, Dict[GuardKey, frozenset]]]):
+        entries = list(entries)
+        self.size = len(entries)
+        self.root = self._build(entries, frozenset())
+
+    def _build(self, entries, used: frozenset):
+        if len(entries) <= self.LEAF_SIZE:
+            return tuple(value for value, _ in entries)
+
+        counts = Counter(key for _, guards in entries for key in guards if key not in used)
+        if not counts:
+            return tuple(value for value, _ in entries)
+        key, shared = counts.most_common(1)[0]
+        if shared < 2:
+            return tuple(value for value, _ in entries)
+
+        branches: Dict[Any, list] = {}
+        rest = []
+        for value, guards in entries:
+            if key in guards:
+                for guard in guards[key]:
+                    branches.setdefault(guard, []).append((value, guards))
+            else:
+                rest.append((value, guards))
+
+        used = used | {key}
+        return _GuardNode(
+            key,
+            {guard: self._build(group, used) for guard, group in branches.items()},
+            self._build(rest, used),
+        )
+
+    def match(self, features: Dict[str, Any]) -> List[int]:
+        """Values whose guards all hold for features"""
+        found: List[int] = []
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if type(node) is tuple:
+                found.extend(node)
+                continue
+            stack.append(node.rest)
+            try:
+                branch = node.branches.get(guard_value(node.key, features))
+            except TypeError:
+                branch = None  # Unhashable feature value equals no guard value
+            if branch is not None:
+                stack.append(branch)
+        return found
@@ -0,0 +1,222 @@
+"""
+Compiled Rule Set for the V2 Schema Interpreter
+
+Parsing the ~30 JSON schema files and indexing their triggers takes
+about 10ms and half a megabyte per copy, and routes build a new
+BiddingEngineV2Schema for every room bid, hint and evaluation. The
+parsed schemas never change while the process runs, so they are
+compiled once per schema directory into a CompiledRuleSet and shared by
+every SchemaInterpreter. Interpreters keep only per-auction state
+(forcing level) on top of it.
+
+Compiled form:
+    - schemas: category -> schema dict, in sorted file order
+    - trigger_index: normalized auction prefix ("1C|Pass|1H") -> rules
+    - global_rules: rules without a trigger, evaluated for every auction
+    - rules_by_id: rule id -> rule (first rule with that id)
+    - scorers: id(rule) -> compiled soft-match scorer (see
+      engine/v2/compiled_matcher.py), so rules are compiled with the
+      schemas rather than interpreted on every bid
+    - rules: every (category, rule) in schema order
+    - trigger_trie / guard_net: discrimination net over rules (see
+      rule_index.py); matching_rules(features) uses them to return only
+      the rules that can score above zero for a bid, in lookup order
+      (global rules, then rules triggered by the exact auction, then
+      pattern-triggered rules by trigger key) or in schema order
+
+The rule set is read-only. Mappings are exposed as MappingProxyType and
+rule lists as tuples; the rule dicts themselves are shared, so callers
+must not modify them.
+
+Usage:
+    rule_set = get_rule_set()                # compiled on first use
+    interpreter = SchemaInterpreter(rule_set=rule_set)
+    rules = rule_set.candidate_rules(['1♣', 'Pass'])
+    rules = rule_set.matching_rules(features)
+"""
+
+import json
+import threading
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Tuple
+
+from engine.v2.compiled_matcher import Scorer, compile_rule, rule_guards
+from engine.v2.interpreters.rule_index import GuardNet, TriggerTrie
+
+DEFAULT_SCHEMA_DIR = Path(__file__).parent.parent / 'schemas'
+
+# (category, rule) - how rules travel through the interpreter
+RuleEntry = Tuple[str, Dict]
+
+
+def normalize_bid(s: str) -> str:
+    """Normalize Unicode suit symbols to ASCII for trigger indexing."""
+    return s.replace('♣', 'C').replace('♦', 'D').replace('♥', 'H').replace('♠', 'S').replace('NT', 'N')
+
+
+class CompiledRuleSet:
+    """
+    Schemas for one directory, parsed and indexed once
+
+    Build through get_rule_set() so each process compiles a directory
+    only once.
+    """
+
+    def __init__(self, schema_dir: Path):
+        self.schema_dir = Path(schema_dir)
+
+        schemas: Dict[str, Dict] = {}
+        # CRITICAL: Sort schema files for deterministic loading order
+        # glob() returns files in arbitrary filesystem order, causing non-deterministic
+        # bid selection when multiple rules have the same priority
+        for schema_file in sorted(self.schema_dir.glob('*.json')):
+            try:
+                with open(schema_file, 'r') as f:
+                    schema = json.load(f)
+                    category = schema.get('category', schema_file.stem)
+                    schemas[category] = schema
+            except (json.JSONDecodeError, IOError) as e:
+                print(f"Warning: Failed to load schema {schema_file}: {e}")
+        self.schemas: Mapping[str, Dict] = MappingProxyType(schemas)
+
+        self._build_indexes()
+
+    def _build_indexes(self):
+        """
+        Build trigger index, global rules, rule-id lookup, compiled
+        scorers and the rule index.
+
+        Rules with triggers are indexed by their normalized trigger prefix
+        (the auction bids before '?') and in the trigger trie. Rules
+        without triggers go into global_rules and the guard net.
+        """
+        trigger_index: Dict[str, List[RuleEntry]] = {}
+        global_rules: List[RuleEntry] = []
+        rules_by_id: Dict[str, Dict] = {}
+        scorers: Dict[int, Scorer] = {}
+        rules: List[RuleEntry] = []
+        guarded = []
+        trigger_keys: Dict[int, str] = {}
+        self.trigger_trie = TriggerTrie()
+
+        for category, schema in self.schemas.items():
+            for rule in schema.get('rules', []):
+                position = len(rules)
+                rules.append((category, rule))
+                rules_by_id.setdefault(rule.get('id'), rule)
+                # Rules live as long as the rule set, so their ids are stable keys
+                scorers[id(rule)] = compile_rule(rule)
+
+                trigger = rule.get('trigger')
+                if not trigger:
+                    global_rules.append((category, rule))
+                    guarded.append((position, rule_guards(rule)))
+                    continue
+                # Malformed triggers never match, so they stay out of the trie
+                self.trigger_trie.add(trigger, position)
+
+                # Parse trigger: "1C - Pass - 1H - ?" -> key = "1C|Pass|1H"
+                parts = [p.strip() for p in trigger.split(' - ')]
+                if parts and parts[-1] == '?':
+                    # Normalize each bid to ASCII for consistent lookup
+                    key = '|'.join(normalize_bid(b) for b in parts[:-1])
+                    trigger_index.setdefault(key, []).append((category, rule))
+                    trigger_keys[position] = key
+                else:
+                    # Malformed trigger, treat as global
+                    global_rules.append((category, rule))
+
+        self.trigger_index: Mapping[str, Tuple[RuleEntry, ...]] = MappingProxyType(
+            {key: tuple(rules) for key, rules in trigger_index.items()}
+        )
+        self.global_rules: Tuple[RuleEntry, ...] = tuple(global_rules)
+        self.rules_by_id: Mapping[str, Dict] = MappingProxyType(rules_by_id)
+        self.scorers: Mapping[int, Scorer] = MappingProxyType(scorers)
+        self.rules: Tuple[RuleEntry, ...] = tuple(rules)
+        self.guard_net = GuardNet(guarded)
+
+        # Lookup order of triggered rules: trigger key, then schema order
+        key_order = {key: i for i, key in enumerate(trigger_index)}
+        self._trigger_keys = trigger_keys
+        self._trigger_rank = {position: (key_order[key], position)
+                              for position, key in trigger_keys.items()}
+
+    def _lookup_order(self, auction: List[str], positions: List[int]) -> List[int]:
+        """
+        Triggered rule positions in lookup order: the exact auction key's
+        rules first, then the pattern keys' rules in trigger_index order.
+        """
+        auction_key = '|'.join(normalize_bid(str(b)) for b in auction)
+        keys = self._trigger_keys
+        rank = self._trigger_rank
+        return sorted(positions, key=lambda i: (keys[i] != auction_key, rank[i]))
+
+    def candidate_rules(self, auction_history: List[str]) -> List[RuleEntry]:
+        """
+        Rules that could match an auction: global rules, then rules
+        triggered by the exact auction, then rules whose pattern trigger
+        matches it.
+        """
+        auction = [str(b) for b in auction_history or []]
+        candidate_rules = list(self.global_rules)
+        candidate_rules.extend(self.rules[i] for i in self._lookup_order(
+            auction, self.trigger_trie.match(auction)))
+        return candidate_rules
+
+    def matching_rules(self, features: Dict, schema_order: bool = False) -> List[RuleEntry]:
+        """
+        Rules that can score above zero for a bid's features.
+
+        Triggered rules must match the auction; untriggered rules must pass
+        their guards. Every other rule would hard-fail in SoftMatcher.
+
+        Args:
+            features: Bid features (with the auction history)
+            schema_order: Return rules in schema order instead of lookup
+                order (global rules, then triggered rules as in
+                candidate_rules()); equal scores rank by this order
+
+        Returns:
+            (category, rule) entries
+        """
+        auction = features.get('_auction_history', features.get('auction_history', [])) or []
+        triggered = self.trigger_trie.match(auction)
+        positions = self.guard_net.match(features)
+        if schema_order:
+            positions.extend(triggered)
+            positions.sort()
+        else:
+            positions.sort()
+            positions.extend(self._lookup_order(auction, triggered))
+        rules = self.rules
+        return [rules[i] for i in positions]
+
+
+_rule_sets: Dict[str, CompiledRuleSet] = {}
+_rule_sets_lock = threading.Lock()
+
+
+def get_rule_set(schema_dir: str = None) -> CompiledRuleSet:
+    """
+    Shared compiled rule set for a schema directory (compiled on first use)
+
+    Args:
+        schema_dir: Path to directory containing JSON schema files.
+                   Defaults to engine/v2/schemas/
+    """
+    key = str(Path(schema_dir or DEFAULT_SCHEMA_DIR).resolve())
+    rule_set = _rule_sets.get(key)
+    if rule_set is None:
+        with _rule_sets_lock:
+            rule_set = _rule_sets.get(key)
+            if rule_set is None:
+                rule_set = CompiledRuleSet(Path(key))
+                _rule_sets[key] = rule_set
+    return rule_set
+
+
+def clear_rule_sets():
+    """Drop compiled rule sets so the next get_rule_set() re-reads the files"""
+    with _rule_sets_lock:
+        _rule_sets.clear()
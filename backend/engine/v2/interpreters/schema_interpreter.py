@@ -9,17 +9,18 @@ Phase 2 Enhancement: Uses SoftMatcher for fuzzy matching to enable
 
 Forcing level tracking is delegated to ForcingStateMachine.
 Gap analysis is delegated to GapAnalyzer.
+Schemas are parsed once per process into a shared CompiledRuleSet.
 """
 
 import functools
-import json
 import logging
 import re
-from pathlib import Path
+import threading
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass, field
 
 from engine.v2.soft_matcher import SoftMatcher
+from engine.v2.interpreters.rule_set import CompiledRuleSet, get_rule_set, normalize_bid
 from engine.v2.interpreters.forcing_state import (
     ForcingStateMachine,
     ForcingLevel,
@@ -51,7 +52,7 @@ class SchemaInterpreter:
     Interprets JSON bidding schemas and evaluates rules against features.
 
     The interpreter:
-    1. Loads schema files
+    1. Uses the shared compiled rule set for its schema directory
     2. Evaluates each rule's conditions against features
     3. Returns matching bids sorted by priority
     4. Tracks forcing level state across the auction
@@ -62,18 +63,22 @@ class SchemaInterpreter:
     - GAME_FORCE: Neither partner can pass until game is reached (sticky)
     """
 
-    def __init__(self, schema_dir: str = None):
+    def __init__(self, schema_dir: str = None, rule_set: CompiledRuleSet = None):
         """
         Initialize interpreter with schema directory.
 
         Args:
             schema_dir: Path to directory containing JSON schema files.
                        Defaults to engine/v2/schemas/
+            rule_set: Compiled rule set to use instead of the shared one
+                     for schema_dir
         """
-        if schema_dir is None:
-            schema_dir = Path(__file__).parent.parent / 'schemas'
-        self.schema_dir = Path(schema_dir)
-        self.schemas: Dict[str, Dict] = {}
+        if rule_set is None:
+            rule_set = get_rule_set(schema_dir)
+        self.rule_set = rule_set
+        self.schema_dir = rule_set.schema_dir
+        # Read-only views shared with every interpreter on this rule set
+        self.schemas = rule_set.schemas
 
         # Forcing level state tracking (delegated to ForcingStateMachine)
         self.forcing = ForcingStateMachine()
@@ -83,12 +88,14 @@ class SchemaInterpreter:
         # SoftMatcher for fuzzy matching (Phase 2: Best-Match-Wins)
         self.soft_matcher = SoftMatcher()
 
-        # Trigger index: maps normalized auction prefix -> list of (schema_key, rule)
+        # Trigger index: maps normalized auction prefix -> (schema_key, rule) tuples
         # Global rules (no trigger) are evaluated for every auction
-        self.trigger_index: Dict[str, List[tuple]] = {}
-        self.global_rules: List[tuple] = []  # List of (schema_key, rule)
+        self.trigger_index = rule_set.trigger_index
+        self.global_rules = rule_set.global_rules
 
-        self._load_schemas()
+        # Candidate-set sizes seen by soft-match evaluation (see get_candidate_stats)
+        self.candidate_stats = {'lookups': 0, 'candidates': 0, 'max_candidates': 0}
+        self._candidate_stats_lock = threading.Lock()
 
     def reset_state(self):
         """Reset auction state for a new deal."""
@@ -105,7 +112,7 @@ class SchemaInterpreter:
     @staticmethod
     def _normalize_bid(s: str) -> str:
         """Normalize Unicode suit symbols to ASCII for trigger indexing."""
-        return s.replace('♣', 'C').replace('♦', 'D').replace('♥', 'H').replace('♠', 'S').replace('NT', 'N')
+        return normalize_bid(s)
 
     @staticmethod
     @functools.lru_cache(maxsize=1024)
@@ -113,55 +120,6 @@ class SchemaInterpreter:
         """Compile and cache a normalized regex pattern."""
         return re.compile(f"^{pattern_norm}$")
 
-    def _load_schemas(self):
-        """Load all JSON schema files from the schema directory."""
-        # CRITICAL: Sort schema files for deterministic loading order
-        # glob() returns files in arbitrary filesystem order, causing non-deterministic
-        # bid selection when multiple rules have the same priority
-        schema_files = sorted(self.schema_dir.glob('*.json'))
-        for schema_file in schema_files:
-            try:
-                with open(schema_file, 'r') as f:
-                    schema = json.load(f)
-                    category = schema.get('category', schema_file.stem)
-                    self.schemas[category] = schema
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Failed to load schema {schema_file}: {e}")
-
-        # Build trigger index after all schemas are loaded
-        self._build_trigger_index()
-
-    def _build_trigger_index(self):
-        """
-        Build trigger index from loaded schemas.
-
-        Rules with triggers are indexed by their normalized trigger prefix
-        (the auction bids before '?'). Rules without triggers go into
-        global_rules and are evaluated for every auction.
-        """
-        self.trigger_index = {}
-        self.global_rules = []
-
-        for category, schema in self.schemas.items():
-            for rule in schema.get('rules', []):
-                trigger = rule.get('trigger')
-                if not trigger:
-                    self.global_rules.append((category, rule))
-                    continue
-
-                # Parse trigger: "1C - Pass - 1H - ?" -> key = "1C|Pass|1H"
-                parts = [p.strip() for p in trigger.split(' - ')]
-                if parts and parts[-1] == '?':
-                    bid_parts = parts[:-1]
-                    # Normalize each bid to ASCII for consistent lookup
-                    key = '|'.join(self._normalize_bid(b) for b in bid_parts)
-                    if key not in self.trigger_index:
-                        self.trigger_index[key] = []
-                    self.trigger_index[key].append((category, rule))
-                else:
-                    # Malformed trigger, treat as global
-                    self.global_rules.append((category, rule))
-
     def _update_forcing_state(self, new_level: Optional[str], rule_id: str):
         """Update forcing state. Delegates to ForcingStateMachine."""
         self.forcing.update(new_level, rule_id)
@@ -242,59 +200,99 @@ class SchemaInterpreter:
         candidates.sort(key=lambda c: c.priority, reverse=True)
         return candidates
 
-    def _get_candidate_rules(self, features: Dict[str, Any]) -> List[tuple]:
+    def _get_candidate_rules(self, features: Dict[str, Any], schema_order: bool = False) -> List[tuple]:
         """
-        Get candidate rules using trigger index for fast filtering.
+        Get candidate rules using the rule index for fast filtering.
 
-        Returns list of (category, rule) tuples that could potentially match
-        the current auction, combining trigger-matched rules with global rules.
+        Returns list of (category, rule) tuples that can score above zero:
+        untriggered rules whose guard features match, then rules whose
+        trigger matches the auction (exact auction first, then patterns).
+        With schema_order, the same rules in schema order instead.
         """
-        auction_history = features.get('_auction_history', features.get('auction_history', []))
-
-        # Build normalized auction key for lookup
-        if auction_history:
-            auction_key = '|'.join(self._normalize_bid(str(b)) for b in auction_history)
-        else:
-            auction_key = ''
-
-        # Start with global rules (always evaluated)
-        candidate_rules = list(self.global_rules)
-
-        # Add trigger-matched rules via exact key lookup
-        if auction_key in self.trigger_index:
-            candidate_rules.extend(self.trigger_index[auction_key])
-
-        # Also check regex trigger keys (patterns with character classes like [CDHS])
-        # These can't be indexed by exact match, so we check all regex keys
-        for trigger_key, rules in self.trigger_index.items():
-            if trigger_key == auction_key:
-                continue  # Already added above
-            # Only attempt regex match if key contains regex metacharacters
-            if '[' in trigger_key or '(' in trigger_key or '.' in trigger_key:
-                key_parts = trigger_key.split('|')
-                if auction_history and len(auction_history) == len(key_parts):
-                    matched = True
-                    for i, pattern in enumerate(key_parts):
-                        value = self._normalize_bid(str(auction_history[i]))
-                        if pattern == value:
-                            continue
-                        try:
-                            if not self._compile_pattern(pattern).match(value):
-                                matched = False
-                                break
-                        except re.error:
-                            matched = False
-                            break
-                    if matched:
-                        candidate_rules.extend(rules)
+        candidate_rules = self.rule_set.matching_rules(features, schema_order=schema_order)
 
+        count = len(candidate_rules)
+        with self._candidate_stats_lock:
+            stats = self.candidate_stats
+            stats['lookups'] += 1
+            stats['candidates'] += count
+            if count > stats['max_candidates']:
+                stats['max_candidates'] = count
         return candidate_rules
 
+    def get_candidate_stats(self) -> Dict[str, Any]:
+        """Candidate-set sizes per soft-match evaluation, against the total rule count."""
+        with self._candidate_stats_lock:
+            stats = dict(self.candidate_stats)
+        return {
+            'lookups': stats['lookups'],
+            'total_rules': len(self.rule_set.rules),
+            'avg_candidates': stats['candidates'] / stats['lookups'] if stats['lookups'] else 0.0,
+            'max_candidates': stats['max_candidates'],
+        }
+
+    def reset_candidate_stats(self):
+        """Reset candidate-set statistics."""
+        with self._candidate_stats_lock:
+            self.candidate_stats = {'lookups': 0, 'candidates': 0, 'max_candidates': 0}
+
+    def _match_quality(self, rule: Dict, features: Dict[str, Any]) -> float:
+        """
+        SoftMatcher match quality for a rule.
+
+        Uses the rule's compiled scorer from the rule set; rules from
+        elsewhere are interpreted by SoftMatcher.
+        """
+        scorer = self.rule_set.scorers.get(id(rule))
+        if scorer is None:
+            return self.soft_matcher.calculate(rule, features).score
+        return scorer(features)
+
+    def _soft_candidate(self, rule: Dict, features: Dict[str, Any],
+                        schema_file: str = None) -> Optional[BidCandidate]:
+        """
+        Score one rule with soft matching.
+
+        Returns None if match_quality is at or below 0.1 (threshold from
+        spec) or the bid can't be resolved.
+        """
+        QUALITY_THRESHOLD = 0.1
+
+        # Calculate match quality (compiled SoftMatcher scoring)
+        quality = self._match_quality(rule, features)
+
+        # Skip if below threshold
+        if quality <= QUALITY_THRESHOLD:
+            return None
+
+        # Resolve the bid
+        bid = self._resolve_bid(rule.get('bid', 'Pass'), features, rule)
+        if bid is None:
+            return None
+
+        explanation = self._format_explanation(rule.get('explanation', ''), features)
+        priority = rule.get('priority', 0)
+        weighted_score = priority * quality
+
+        return BidCandidate(
+            bid=bid,
+            rule_id=rule.get('id', 'unknown'),
+            priority=priority,
+            explanation=explanation,
+            forcing=rule.get('forcing', 'none'),
+            conditions_met={},
+            sets_forcing_level=rule.get('sets_forcing_level'),
+            is_limit_bid=rule.get('is_limit_bid', False),
+            schema_file=schema_file,
+            match_quality=quality,
+            weighted_score=weighted_score
+        )
+
     def evaluate_all_candidates(self, features: Dict[str, Any]) -> Optional[Tuple[str, str]]:
         """
         Evaluate candidate rules using soft matching for Best-Match-Wins selection.
 
-        Uses trigger index to filter the candidate pool before scoring,
+        Uses the rule index to filter the candidate pool before scoring,
         avoiding O(N) SoftMatcher evaluation of all rules.
 
         Args:
@@ -305,40 +303,11 @@ class SchemaInterpreter:
         """
         candidates = []
 
-        # Get filtered candidate rules via trigger index
-        candidate_rules = self._get_candidate_rules(features)
-
-        # Evaluate candidates with soft matching
-        QUALITY_THRESHOLD = 0.1
-        for category, rule in candidate_rules:
-            match_result = self.soft_matcher.calculate(rule, features)
-            quality = match_result.score
-
-            if quality <= QUALITY_THRESHOLD:
-                continue
-
-            bid = self._resolve_bid(rule.get('bid', 'Pass'), features, rule)
-            if bid is None:
-                continue
-
-            explanation = self._format_explanation(rule.get('explanation', ''), features)
-            priority = rule.get('priority', 0)
-            weighted_score = priority * quality
-
-            candidate = BidCandidate(
-                bid=bid,
-                rule_id=rule.get('id', 'unknown'),
-                priority=priority,
-                explanation=explanation,
-                forcing=rule.get('forcing', 'none'),
-                conditions_met={},
-                sets_forcing_level=rule.get('sets_forcing_level'),
-                is_limit_bid=rule.get('is_limit_bid', False),
-                schema_file=category,
-                match_quality=quality,
-                weighted_score=weighted_score
-            )
-            candidates.append(candidate)
+        # Get filtered candidate rules via the rule index, globals first
+        for category, rule in self._get_candidate_rules(features):
+            candidate = self._soft_candidate(rule, features, category)
+            if candidate is not None:
+                candidates.append(candidate)
 
         if not candidates:
             logger.debug("No candidates found with soft matching")
@@ -374,9 +343,12 @@ class SchemaInterpreter:
         """
         candidates = []
 
-        for category, schema in self.schemas.items():
-            category_candidates = self._evaluate_schema_soft(schema, features, category)
-            candidates.extend(category_candidates)
+        # Rules outside the candidate set would score 0.0; schema order is kept
+        # so equal scores still rank as if every schema had been scanned
+        for category, rule in self._get_candidate_rules(features, schema_order=True):
+            candidate = self._soft_candidate(rule, features, category)
+            if candidate is not None:
+                candidates.append(candidate)
 
         candidates.sort(key=lambda c: c.weighted_score, reverse=True)
         return candidates
@@ -391,40 +363,11 @@ class SchemaInterpreter:
         Only returns candidates with match_quality > 0.1 (threshold from spec).
         """
         candidates = []
-        QUALITY_THRESHOLD = 0.1
 
         for rule in schema.get('rules', []):
-            # Calculate match quality using SoftMatcher
-            match_result = self.soft_matcher.calculate(rule, features)
-            quality = match_result.score
-
-            # Skip if below threshold
-            if quality <= QUALITY_THRESHOLD:
-                continue
-
-            # Resolve the bid
-            bid = self._resolve_bid(rule.get('bid', 'Pass'), features, rule)
-            if bid is None:
-                continue
-
-            explanation = self._format_explanation(rule.get('explanation', ''), features)
-            priority = rule.get('priority', 0)
-            weighted_score = priority * quality
-
-            candidate = BidCandidate(
-                bid=bid,
-                rule_id=rule.get('id', 'unknown'),
-                priority=priority,
-                explanation=explanation,
-                forcing=rule.get('forcing', 'none'),
-                conditions_met={},
-                sets_forcing_level=rule.get('sets_forcing_level'),
-                is_limit_bid=rule.get('is_limit_bid', False),
-                schema_file=schema_file,
-                match_quality=quality,
-                weighted_score=weighted_score
-            )
-            candidates.append(candidate)
+            candidate = self._soft_candidate(rule, features, schema_file)
+            if candidate is not None:
+                candidates.append(candidate)
 
         return candidates
 
@@ -980,11 +923,7 @@ class SchemaInterpreter:
 
     def get_rule_by_id(self, rule_id: str) -> Optional[Dict]:
         """Find a rule by its ID across all schemas."""
-        for schema in self.schemas.values():
-            for rule in schema.get('rules', []):
-                if rule.get('id') == rule_id:
-                    return rule
-        return None
+        return self.rule_set.rules_by_id.get(rule_id)
 
     def list_rules(self, category: str = None) -> List[Dict]:
         """List all rules, optionally filtered by category."""
@@ -0,0 +1,73 @@
+-- Migration 021: Incrementally maintained per-user analytics summaries
+-- The dashboard reads these instead of re-aggregating bidding_decisions,
+-- play_decisions and session_hands on every page load. They are updated in
+-- the same transaction as the rows they summarize (see
+-- engine/learning/analytics_summary.py), and can be rebuilt with:
+--   python -m engine.learning.analytics_summary backfill
+
+-- Lifetime hand counters plus the recent-declarer rolling window.
+-- complete = TRUE once the user has been backfilled; until then the
+-- dashboard falls back to the live queries.
+CREATE TABLE IF NOT EXISTS user_analytics_summary (
+    user_id BIGINT PRIMARY KEY,
+    complete BOOLEAN NOT NULL DEFAULT FALSE,
+    hands_recorded INTEGER NOT NULL DEFAULT 0,
+    declarer_hands INTEGER NOT NULL DEFAULT 0,
+    contracts_made INTEGER NOT NULL DEFAULT 0,
+    contracts_failed INTEGER NOT NULL DEFAULT 0,
+    declarer_tricks_sum INTEGER NOT NULL DEFAULT 0,
+    declarer_tricks_count INTEGER NOT NULL DEFAULT 0,
+    defender_hands INTEGER NOT NULL DEFAULT 0,
+    dummy_hands INTEGER NOT NULL DEFAULT 0,
+    recent_declarer_results TEXT NOT NULL DEFAULT '[]',
+    analyzed_hands INTEGER NOT NULL DEFAULT 0,
+    q1_count INTEGER NOT NULL DEFAULT 0,
+    q2_count INTEGER NOT NULL DEFAULT 0,
+    q3_count INTEGER NOT NULL DEFAULT 0,
+    q4_count INTEGER NOT NULL DEFAULT 0,
+    efficiency_rated INTEGER NOT NULL DEFAULT 0,
+    optimal_bids INTEGER NOT NULL DEFAULT 0,
+    underbids INTEGER NOT NULL DEFAULT 0,
+    overbids INTEGER NOT NULL DEFAULT 0,
+    points_left_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    underbid_points_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    underbid_points_count INTEGER NOT NULL DEFAULT 0,
+    tricks_vs_dd_sum INTEGER NOT NULL DEFAULT 0,
+    tricks_vs_dd_count INTEGER NOT NULL DEFAULT 0,
+    score_vs_par_sum INTEGER NOT NULL DEFAULT 0,
+    score_vs_par_count INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Per-day decision counters; rolling windows (30-day stats, 7-day trend)
+-- are sums over at most 30 rows. category is '' for all decisions of a
+-- kind, or a play_category for the per-category play breakdown.
+CREATE TABLE IF NOT EXISTS user_decision_daily (
+    user_id BIGINT NOT NULL,
+    kind TEXT NOT NULL CHECK(kind IN ('bidding', 'play')),
+    category TEXT NOT NULL DEFAULT '',
+    day DATE NOT NULL,
+    decisions INTEGER NOT NULL DEFAULT 0,
+    score_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    optimal_count INTEGER NOT NULL DEFAULT 0,
+    acceptable_count INTEGER NOT NULL DEFAULT 0,
+    good_count INTEGER NOT NULL DEFAULT 0,
+    suboptimal_count INTEGER NOT NULL DEFAULT 0,
+    error_count INTEGER NOT NULL DEFAULT 0,
+    blunder_count INTEGER NOT NULL DEFAULT 0,
+    critical_count INTEGER NOT NULL DEFAULT 0,
+    tricks_cost_sum DOUBLE PRECISION NOT NULL DEFAULT 0,
+    tricks_cost_count INTEGER NOT NULL DEFAULT 0,
+    hands INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, kind, category, day)
+);
+
+-- Hands a user has bid on, so distinct-hand counts stay incremental.
+-- A hand is counted on the day of its first decision.
+CREATE TABLE IF NOT EXISTS user_decision_hands (
+    user_id BIGINT NOT NULL,
+    kind TEXT NOT NULL,
+    hand_key TEXT NOT NULL,
+    first_day DATE NOT NULL,
+    PRIMARY KEY (user_id, kind, hand_key)
+);
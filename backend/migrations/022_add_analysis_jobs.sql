@@ -0,0 +1,42 @@
+-- Migration 022: Durable queue for background analysis jobs
+-- The web process enqueues post-game hand analysis and tournament analysis
+-- here; a separate worker pool runs them:
+--   python -m core.job_worker --concurrency 2
+-- Workers claim jobs with SELECT ... FOR UPDATE SKIP LOCKED (see
+-- core/job_queue.py). status: queued -> running -> done | failed. A failed
+-- attempt returns to queued with a later run_after until max_attempts.
+-- A running job whose heartbeat_at goes stale (worker died) is reclaimed.
+
+CREATE TABLE IF NOT EXISTS analysis_jobs (
+    id SERIAL PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,
+    dedupe_key VARCHAR(100),
+    payload TEXT NOT NULL DEFAULT '{}',
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',
+    priority INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    progress_done INTEGER NOT NULL DEFAULT 0,
+    progress_total INTEGER,
+    last_error TEXT,
+    worker_id VARCHAR(100),
+    enqueued_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    run_after TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    started_at TIMESTAMP,
+    heartbeat_at TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+-- Dedupe: one queued/running job per (kind, dedupe_key), e.g. per session_hand_id
+CREATE UNIQUE INDEX IF NOT EXISTS idx_analysis_jobs_active_key
+    ON analysis_jobs(kind, dedupe_key) WHERE status IN ('queued', 'running');
+
+-- Claiming and queue-depth queries
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status_run_after
+    ON analysis_jobs(status, run_after);
+
+-- Status lookups (get_import_status) and latency metrics
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_kind_key
+    ON analysis_jobs(kind, dedupe_key, id);
+CREATE INDEX IF NOT EXISTS idx_analysis_jobs_finished_at
+    ON analysis_jobs(finished_at);
@@ -0,0 +1,11 @@
+-- Migration 023: Heartbeats of running job workers
+-- Each pool worker (python -m core.job_worker) upserts its row every few
+-- seconds and deletes it on shutdown. The web process checks for a fresh
+-- row before relying on the pool; with none it runs the job in-process
+-- (see core/job_queue.py has_live_worker).
+
+CREATE TABLE IF NOT EXISTS job_workers (
+    worker_id VARCHAR(100) PRIMARY KEY,
+    kinds TEXT,
+    beat_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
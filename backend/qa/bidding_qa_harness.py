@@ -12,15 +12,22 @@ Usage:
     harness = BiddingQAHarness()
     results = harness.run_pbn_file('test_hands.pbn')
     harness.print_summary(results)
+
+    # Large corpora: shard boards over 8 processes, resumable after a crash
+    results = harness.run_directory('data/pbn/', workers=8,
+                                    checkpoint='/tmp/qa_checkpoint.jsonl')
 """
 
+import hashlib
 import json
 import logging
 import os
 import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from engine.hand import Hand
 from engine.v2.bidding_engine_v2_schema import BiddingEngineV2Schema
@@ -40,6 +47,10 @@ logger = logging.getLogger(__name__)
 # Directions in auction order from a given dealer
 SEAT_ORDER = list(SEAT_NAMES.values())
 
+# Upper bounds (seconds) of the per-board timing histogram buckets
+TIMING_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+BOARDS_PER_CHUNK = 8  # Boards sent to a worker process at a time
+
 
 @dataclass
 class BidComparison:
@@ -58,6 +69,21 @@ class BidComparison:
     def to_dict(self) -> Dict:
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'BidComparison':
+        return cls(
+            board=d['board'],
+            seat=d['seat'],
+            bid_index=d['bid_index'],
+            auction_so_far=d.get('auction_so_far', []),
+            mbb_bid=d['mbb_bid'],
+            reference_bid=d['reference_bid'],
+            match=d.get('match', False),
+            mbb_explanation=d.get('mbb_explanation', ''),
+            feature_vector=d.get('feature_vector'),
+            hand_pbn=d.get('hand_pbn', ''),
+        )
+
 
 @dataclass
 class BoardResult:
@@ -69,6 +95,7 @@ class BoardResult:
     matches: int = 0
     discrepancies: List[BidComparison] = field(default_factory=list)
     error: Optional[str] = None
+    duration_seconds: float = 0.0
 
     @property
     def accuracy(self) -> float:
@@ -86,8 +113,23 @@ class BoardResult:
             'accuracy': round(self.accuracy, 4),
             'discrepancies': [d.to_dict() for d in self.discrepancies],
             'error': self.error,
+            'duration_seconds': round(self.duration_seconds, 4),
         }
 
+    @classmethod
+    def from_dict(cls, d: Dict) -> 'BoardResult':
+        """Rebuild a BoardResult from to_dict() output (saved results, checkpoints)."""
+        return cls(
+            board=d['board'],
+            dealer=d['dealer'],
+            vulnerability=d['vulnerability'],
+            total_bids_compared=d.get('total_bids_compared', 0),
+            matches=d.get('matches', 0),
+            discrepancies=[BidComparison.from_dict(c) for c in d.get('discrepancies', [])],
+            error=d.get('error'),
+            duration_seconds=d.get('duration_seconds', 0.0),
+        )
+
 
 @dataclass
 class HarnessResult:
@@ -110,6 +152,23 @@ class HarnessResult:
     def discrepancy_count(self) -> int:
         return self.total_bids_compared - self.total_matches
 
+    def timing_histogram(self) -> Dict[str, int]:
+        """Count boards per TIMING_BUCKETS time range, e.g. {'<0.05s': 40, '>=5.0s': 1}."""
+        labels = [f'<{b}s' for b in TIMING_BUCKETS] + [f'>={TIMING_BUCKETS[-1]}s']
+        histogram = {label: 0 for label in labels}
+        for board in self.board_results:
+            for bound, label in zip(TIMING_BUCKETS, labels):
+                if board.duration_seconds < bound:
+                    histogram[label] += 1
+                    break
+            else:
+                histogram[labels[-1]] += 1
+        return histogram
+
+    def slowest_boards(self, n: int = 5) -> List[BoardResult]:
+        """The n boards that took longest to test."""
+        return sorted(self.board_results, key=lambda b: -b.duration_seconds)[:n]
+
     def to_dict(self) -> Dict:
         return {
             'summary': {
@@ -121,6 +180,7 @@ class HarnessResult:
                 'overall_accuracy': round(self.overall_accuracy, 4),
                 'discrepancy_count': self.discrepancy_count,
                 'duration_seconds': round(self.duration_seconds, 2),
+                'timing_histogram': self.timing_histogram(),
             },
             'boards': [b.to_dict() for b in self.board_results],
         }
@@ -157,6 +217,8 @@ class BiddingQAHarness:
         seats: List[str] = None,
         max_boards: int = None,
         include_features: bool = False,
+        workers: int = 1,
+        checkpoint: str = None,
     ) -> HarnessResult:
         """
         Run differential testing on a PBN file.
@@ -168,10 +230,32 @@ class BiddingQAHarness:
             max_boards: Limit number of boards to process.
             include_features: Include feature vectors in discrepancy logs
                             (useful for debugging, increases output size).
+            workers: Processes to shard boards across; 1 tests in this process.
+            checkpoint: JSONL file each BoardResult is appended to as it
+                        finishes. Boards already in it are not re-tested,
+                        so an interrupted run resumes where it stopped.
+                        Boards are keyed by the PBN file's resolved path and
+                        content, so an edited file is tested afresh.
+                        Start a new file after changing seats or the engine.
 
         Returns:
-            HarnessResult with summary and per-board details.
+            HarnessResult with summary and per-board details, boards in
+            PBN file order regardless of workers.
         """
+        with _board_pool(workers) as pool:
+            return self._run_pbn_file(
+                pbn_path, seats, max_boards, include_features, pool, checkpoint
+            )
+
+    def _run_pbn_file(
+        self,
+        pbn_path: str,
+        seats: Optional[List[str]],
+        max_boards: Optional[int],
+        include_features: bool,
+        pool: Optional[ProcessPoolExecutor],
+        checkpoint: Optional[str],
+    ) -> HarnessResult:
         start_time = time.time()
         records = parse_pbn_file(pbn_path)
         result = HarnessResult(total_boards=len(records))
@@ -179,6 +263,11 @@ class BiddingQAHarness:
         if seats is None:
             seats = list(SEAT_ORDER)
 
+        # Board results by record index: PBN board numbers need not be unique
+        source = _checkpoint_source(pbn_path)
+        board_results = _load_checkpoint(checkpoint, source)
+        selected = []
+
         for i, record in enumerate(records):
             if max_boards and i >= max_boards:
                 break
@@ -191,7 +280,21 @@ class BiddingQAHarness:
                 continue
             result.boards_with_auctions += 1
 
-            board_result = self._test_board(record, seats, include_features)
+            selected.append(i)
+
+        pending = [(i, records[i]) for i in selected if i not in board_results]
+        if pool is None:
+            tested = ((i, self._test_board(record, seats, include_features))
+                      for i, record in pending)
+        else:
+            tested = _test_on_pool(pool, pending, seats, include_features)
+
+        for i, board_result in tested:
+            board_results[i] = board_result
+            _append_checkpoint(checkpoint, source, i, board_result)
+
+        for i in selected:
+            board_result = board_results[i]
             result.total_bids_compared += board_result.total_bids_compared
             result.total_matches += board_result.matches
             result.board_results.append(board_result)
@@ -206,6 +309,7 @@ class BiddingQAHarness:
         include_features: bool,
     ) -> BoardResult:
         """Test all bid positions in a single board."""
+        start_time = time.time()
         board_result = BoardResult(
             board=record.board,
             dealer=record.dealer,
@@ -266,6 +370,7 @@ class BiddingQAHarness:
                     comparison.feature_vector = calculate_feature_vector(hand)
                 board_result.discrepancies.append(comparison)
 
+        board_result.duration_seconds = time.time() - start_time
         return board_result
 
     def run_with_oracle(
@@ -437,6 +542,15 @@ class BiddingQAHarness:
         print(f"  Duration:            {s['duration_seconds']:.1f}s")
         print(f"{'='*60}")
 
+        # Per-board timing so slow boards are visible
+        if result.board_results:
+            print(f"\n  Board Timing:")
+            for bucket, count in s['timing_histogram'].items():
+                if count:
+                    print(f"  {bucket:>8} {count:>5}")
+            for b in result.slowest_boards(3):
+                print(f"  Slowest: Board {b.board:>3} {b.duration_seconds:.2f}s")
+
         # Show top discrepancies grouped by type
         if result.discrepancy_count > 0:
             print(f"\n  Top Discrepancies:")
@@ -614,6 +728,8 @@ class BiddingQAHarness:
         max_boards: int = None,
         include_features: bool = False,
         event_filter: str = None,
+        workers: int = 1,
+        checkpoint: str = None,
     ) -> Dict[str, HarnessResult]:
         """
         Run differential testing on all PBN files in a directory.
@@ -624,6 +740,8 @@ class BiddingQAHarness:
             max_boards: Max boards per file.
             include_features: Include feature vectors in output.
             event_filter: Only test boards whose [Event] contains this string.
+            workers: Processes to shard boards across, shared by all files.
+            checkpoint: JSONL checkpoint shared by all files (see run_pbn_file).
 
         Returns:
             Dict mapping filename → HarnessResult for per-tier reporting.
@@ -635,13 +753,14 @@ class BiddingQAHarness:
             logger.error(f"Not a directory: {dir_path}")
             return results
 
+        with _board_pool(workers) as pool:
+            for pbn_file in sorted(pbn_dir.glob('*.pbn')):
+                results[pbn_file.name] = self._run_pbn_file(
+                    str(pbn_file), seats, max_boards, include_features, pool, checkpoint
+                )
+
         for pbn_file in sorted(pbn_dir.glob('*.pbn')):
-            file_result = self.run_pbn_file(
-                str(pbn_file),
-                seats=seats,
-                max_boards=max_boards,
-                include_features=include_features,
-            )
+            file_result = results[pbn_file.name]
 
             # Apply event filter post-hoc if specified
             if event_filter:
@@ -666,8 +785,6 @@ class BiddingQAHarness:
                     b.matches for b in filtered_boards
                 )
 
-            results[pbn_file.name] = file_result
-
         return results
 
     def print_tier_report(self, tier_results: Dict[str, HarnessResult]):
@@ -734,3 +851,103 @@ class BiddingQAHarness:
         print(f"{'='*70}")
 
         return overall_accuracy
+
+
+# === CHECKPOINTS ===
+
+def _checkpoint_source(pbn_path: str) -> str:
+    """Checkpoint key for a PBN file: its resolved path and a hash of its content."""
+    with open(pbn_path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()[:16]
+    return f"{Path(pbn_path).resolve()}#{digest}"
+
+
+def _truncate_partial_line(checkpoint: str):
+    """Cut a partial last line (a run killed mid-write) so appends start on a new line."""
+    with open(checkpoint, 'rb+') as f:
+        size = end = f.seek(0, os.SEEK_END)
+        keep = 0
+        while end > 0:
+            start = max(0, end - 4096)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b'\n')
+            if newline >= 0:
+                keep = start + newline + 1
+                break
+            end = start
+        if keep < size:
+            logger.warning(f"Dropping partial last line of checkpoint {checkpoint}")
+            f.truncate(keep)
+
+
+def _load_checkpoint(checkpoint: Optional[str], source: str) -> Dict[int, BoardResult]:
+    """Board results already recorded for a PBN file, by record index."""
+    board_results = {}
+    if not checkpoint or not os.path.exists(checkpoint):
+        return board_results
+
+    _truncate_partial_line(checkpoint)
+    with open(checkpoint, encoding='utf-8') as f:
+        for line_num, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Skipping unreadable checkpoint line {line_num} in {checkpoint}")
+                continue
+            if entry.get('source') == source:
+                board_results[entry['index']] = BoardResult.from_dict(entry['result'])
+    return board_results
+
+
+def _append_checkpoint(checkpoint: Optional[str], source: str, index: int,
+                       board_result: BoardResult):
+    if not checkpoint:
+        return
+    entry = {'source': source, 'index': index, 'result': board_result.to_dict()}
+    with open(checkpoint, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(entry, default=str) + '\n')
+
+
+# === PROCESS POOL ===
+
+_worker_harness: Optional[BiddingQAHarness] = None
+
+
+def _init_worker():
+    global _worker_harness
+    _worker_harness = BiddingQAHarness()
+
+
+def _test_chunk(chunk: List[Tuple[int, PBNRecord]], seats: List[str],
+                include_features: bool) -> List[Tuple[int, BoardResult]]:
+    return [(i, _worker_harness._test_board(record, seats, include_features))
+            for i, record in chunk]
+
+
+@contextmanager
+def _board_pool(workers: int) -> Iterator[Optional[ProcessPoolExecutor]]:
+    """Process pool whose workers each build one harness, or None for workers <= 1."""
+    if workers <= 1:
+        yield None
+        return
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+    try:
+        yield pool
+    finally:
+        # Interrupted run: drop queued chunks, the checkpoint has the rest
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _test_on_pool(pool: ProcessPoolExecutor, pending: List[Tuple[int, PBNRecord]],
+                  seats: List[str], include_features: bool) -> Iterator[Tuple[int, BoardResult]]:
+    """Test boards in chunks on the pool, yielding (index, result) as chunks finish."""
+    futures = {
+        pool.submit(_test_chunk, pending[i:i + BOARDS_PER_CHUNK], seats, include_features)
+        for i in range(0, len(pending), BOARDS_PER_CHUNK)
+    }
+    while futures:
+        done, futures = wait(futures, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield from future.result()
@@ -16,6 +16,9 @@ Usage:
     # Run only specific tier
     python -m qa.run_qa suite --data data/ground_truth/ --filter "Tier 1"
 
+    # Large corpus on 8 processes; rerun the same command to resume after a crash
+    python -m qa.run_qa test --pbn corpus.pbn --workers 8 --checkpoint /tmp/qa_corpus.jsonl
+
     # Analyze discrepancies from a previous run
     python -m qa.run_qa analyze --results /tmp/qa_results.json
 
@@ -35,7 +38,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from qa.pbn_generator import PBNTestGenerator
 from qa.bidding_qa_harness import (
-    BiddingQAHarness, HarnessResult, BoardResult, BidComparison,
+    BiddingQAHarness, HarnessResult, BoardResult,
 )
 
 
@@ -75,6 +78,8 @@ def cmd_test(args):
         seats=seats,
         max_boards=args.max_boards,
         include_features=args.features,
+        workers=args.workers,
+        checkpoint=args.checkpoint,
     )
 
     harness.print_summary(result)
@@ -111,6 +116,8 @@ def cmd_suite(args):
         max_boards=args.max_boards,
         include_features=args.features,
         event_filter=args.filter,
+        workers=args.workers,
+        checkpoint=args.checkpoint,
     )
 
     if not tier_results:
@@ -155,27 +162,7 @@ def _reconstruct_result(data: Dict) -> HarnessResult:
         duration_seconds=summary.get('duration_seconds', 0.0),
     )
     for b in data.get('boards', []):
-        board = BoardResult(
-            board=b['board'],
-            dealer=b['dealer'],
-            vulnerability=b['vulnerability'],
-            total_bids_compared=b.get('total_bids_compared', 0),
-            matches=b.get('matches', 0),
-            error=b.get('error'),
-        )
-        for d in b.get('discrepancies', []):
-            board.discrepancies.append(BidComparison(
-                board=d['board'],
-                seat=d['seat'],
-                bid_index=d['bid_index'],
-                auction_so_far=d.get('auction_so_far', []),
-                mbb_bid=d['mbb_bid'],
-                reference_bid=d['reference_bid'],
-                match=d.get('match', False),
-                mbb_explanation=d.get('mbb_explanation', ''),
-                hand_pbn=d.get('hand_pbn', ''),
-            ))
-        result.board_results.append(board)
+        result.board_results.append(BoardResult.from_dict(b))
     return result
 
 
@@ -289,6 +276,10 @@ def main():
     test_parser.add_argument('--features', action='store_true',
                             help='Include feature vectors in output')
     test_parser.add_argument('--output', help='Output JSON file path')
+    test_parser.add_argument('--workers', type=int, default=1,
+                            help='Processes to shard boards across')
+    test_parser.add_argument('--checkpoint',
+                            help='JSONL checkpoint to resume an interrupted run')
 
     # Suite command (ground truth directory)
     suite_parser = subparsers.add_parser('suite', help='Run ground truth suite')
@@ -301,6 +292,10 @@ def main():
     suite_parser.add_argument('--fail-under', type=float,
                              help='Fail if accuracy below this threshold (0-100)')
     suite_parser.add_argument('--output', help='Output JSON file path')
+    suite_parser.add_argument('--workers', type=int, default=1,
+                             help='Processes to shard boards across')
+    suite_parser.add_argument('--checkpoint',
+                             help='JSONL checkpoint to resume an interrupted run')
 
     # Analyze command
     analyze_parser = subparsers.add_parser('analyze', help='Analyze previous results')
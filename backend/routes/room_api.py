@@ -7,6 +7,11 @@ two human partners playing against AI opponents.
 All state mutations use Redis WATCH/MULTI via RoomStateManager.mutate_room*()
 to prevent race conditions across Gunicorn workers.
 
+Clients follow room changes by long-polling /api/room/poll. Where
+ROOM_STREAM_ENABLED is set (streams served by an async worker or a
+separate process), they can use /api/room/stream instead: Server-Sent
+Events pushed on every commit via Redis pub/sub.
+
 To add to server.py:
     from routes.room_api import register_room_endpoints
     register_room_endpoints(app, room_manager)
@@ -14,12 +19,15 @@ To add to server.py:
 
 import json
 import random
-from flask import request, jsonify
+import threading
+from collections import OrderedDict
+from flask import request, jsonify, Response
 from datetime import datetime
 from typing import Optional
 
 from core.room_state import (
-    RoomStateManager, RoomSettings, RoomState, RoomConflictError
+    RoomStateManager, RoomSettings, RoomState, RoomConflictError,
+    LONG_POLL_MAX_WAIT, LONG_POLL_SLOTS, ROOM_STREAM_ENABLED,
 )
 from core.session_state import get_session_id_from_request
 from engine.hand import Hand, Card
@@ -313,6 +321,64 @@ def _save_room_hand(room: RoomState):
         log_error(e, endpoint='room/save-hand', context={'room_code': room.room_code})
 
 
+# Beliefs per (room, version, position): a room only changes when its version does
+BELIEFS_CACHE_SIZE = 256
+_beliefs_cache: 'OrderedDict[tuple, dict]' = OrderedDict()
+_beliefs_lock = threading.Lock()
+
+# Blocking polls in this process (see LONG_POLL_SLOTS)
+_long_poll_slots = threading.BoundedSemaphore(LONG_POLL_SLOTS)
+
+
+def _room_beliefs(room: RoomState, session_id: str) -> Optional[dict]:
+    """Coaching beliefs for a session's seat, built once per room version"""
+    position = room.get_position_for_session(session_id)
+    key = (room.room_code, room.created_at, room.version, position)  # Codes get reused
+    with _beliefs_lock:
+        if key in _beliefs_cache:
+            _beliefs_cache.move_to_end(key)
+            return _beliefs_cache[key]
+
+    position_full = SEAT_NAMES.get(position, position)
+    hand = room.deal.get(position_full)
+    if not hand:
+        return None
+
+    user_hcp = hand.hcp
+    user_suit_lengths = {
+        '♠': len([c for c in hand.cards if c.suit == '♠']),
+        '♥': len([c for c in hand.cards if c.suit == '♥']),
+        '♦': len([c for c in hand.cards if c.suit == '♦']),
+        '♣': len([c for c in hand.cards if c.suit == '♣']),
+    }
+
+    dealer_full = SEAT_NAMES.get(normalize(room.dealer), room.dealer)
+    bidding_state = BiddingStateBuilder().build(room.auction_history, dealer_full)
+    beliefs = bidding_state.to_dict(position, my_hcp=user_hcp, my_suit_lengths=user_suit_lengths)
+
+    with _beliefs_lock:
+        _beliefs_cache[key] = beliefs
+        while len(_beliefs_cache) > BELIEFS_CACHE_SIZE:
+            _beliefs_cache.popitem(last=False)
+    return beliefs
+
+
+def _room_view(room: RoomState, session_id: str) -> dict:
+    """Room as seen by one session (poll and stream payload), with coaching beliefs"""
+    room_dict = room.to_dict(for_session=session_id)
+
+    # Add beliefs for coaching support during bidding phase
+    if room.game_phase == 'bidding' and room.auction_history:
+        try:
+            beliefs = _room_beliefs(room, session_id)
+            if beliefs:
+                room_dict['beliefs'] = beliefs
+        except Exception as e:
+            print(f"⚠️ Could not compute beliefs for room {room.room_code}: {e}")
+
+    return room_dict
+
+
 def register_room_endpoints(app, room_manager: RoomStateManager):
     """
     Register all room-related endpoints with the Flask app
@@ -457,7 +523,17 @@ def register_room_endpoints(app, room_manager: RoomStateManager):
 
     @app.route('/api/room/poll', methods=['GET'])
     def poll_room():
-        """Poll current room state (long-poll with version check)"""
+        """
+        Poll current room state (long-poll with version check)
+
+        Query params:
+            version: Room version the client has; 304 if unchanged
+            wait: Seconds to block for a newer version before the 304
+                  (capped at LONG_POLL_MAX_WAIT; default 0 answers at once).
+                  When LONG_POLL_SLOTS polls are already blocking in this
+                  worker, answers at once and the client polls again on
+                  its short interval.
+        """
         session_id = get_session_id_from_request(request)
         if not session_id:
             return jsonify({
@@ -473,47 +549,97 @@ def register_room_endpoints(app, room_manager: RoomStateManager):
                 'in_room': False
             }), 404
 
-        # Record heartbeat (mutation — needs OCC)
-        try:
-            with room_manager.mutate_room(room.room_code) as mutable_room:
-                mutable_room.record_heartbeat(session_id)
-        except (KeyError, RoomConflictError):
-            pass  # Non-critical — heartbeat can be missed occasionally
+        # Heartbeat goes to its own hash — the room itself is not rewritten
+        room_manager.record_heartbeat(room.room_code, session_id)
 
         # Version check (use the snapshot we already read)
         client_version = request.args.get('version', type=int)
         if client_version is not None and client_version == room.version:
-            return '', 304
+            wait = min(request.args.get('wait', 0.0, type=float), LONG_POLL_MAX_WAIT)
+            if wait > 0 and _long_poll_slots.acquire(blocking=False):
+                try:
+                    room = room_manager.wait_for_change(room.room_code, client_version, wait)
+                finally:
+                    _long_poll_slots.release()
+                if not room:
+                    return jsonify({
+                        'success': False,
+                        'error': 'Not in a room',
+                        'in_room': False
+                    }), 404
+            if client_version == room.version:
+                return '', 304
 
-        room_dict = room.to_dict(for_session=session_id)
+        return jsonify({
+            'success': True,
+            'in_room': True,
+            'room': _room_view(room, session_id)
+        })
 
-        # Add beliefs for coaching support during bidding phase
-        if room.game_phase == 'bidding' and room.auction_history:
-            try:
-                position = room.get_position_for_session(session_id)
-                position_full = SEAT_NAMES.get(position, position)
-                hand = room.deal.get(position_full)
+    @app.route('/api/room/stream', methods=['GET'])
+    def stream_room():
+        """
+        Push room state as Server-Sent Events
 
-                if hand:
-                    user_hcp = hand.hcp
-                    user_suit_lengths = {
-                        '♠': len([c for c in hand.cards if c.suit == '♠']),
-                        '♥': len([c for c in hand.cards if c.suit == '♥']),
-                        '♦': len([c for c in hand.cards if c.suit == '♦']),
-                        '♣': len([c for c in hand.cards if c.suit == '♣']),
-                    }
+        Sends a `room` event (same body as /api/room/poll, id = room version)
+        whenever a mutation commits, from any worker. Idle streams get a
+        keepalive comment, which also records the heartbeat. The stream
+        ends after STREAM_MAX_DURATION and EventSource reconnects with
+        Last-Event-ID, so only newer versions are re-sent. A `closed` event
+        means the room is gone or this session left it.
 
-                    dealer_full = SEAT_NAMES.get(normalize(room.dealer), room.dealer)
-                    bidding_state = BiddingStateBuilder().build(room.auction_history, dealer_full)
-                    beliefs = bidding_state.to_dict(position, my_hcp=user_hcp, my_suit_lengths=user_suit_lengths)
-                    room_dict['beliefs'] = beliefs
-            except Exception as e:
-                print(f"⚠️ Could not compute beliefs for room {room.room_code}: {e}")
+        Each open stream holds a request thread, so this answers 503 (the
+        client falls back to long-polling) unless ROOM_STREAM_ENABLED is set.
 
-        return jsonify({
-            'success': True,
-            'in_room': True,
-            'room': room_dict
+        EventSource can't set headers: pass session_id as a query param.
+        """
+        if not ROOM_STREAM_ENABLED:
+            return jsonify({
+                'success': False,
+                'error': 'Room streaming is disabled; use /api/room/poll'
+            }), 503
+
+        session_id = get_session_id_from_request(request)
+        if not session_id:
+            return jsonify({
+                'success': False,
+                'error': 'No session ID provided'
+            }), 400
+
+        room = room_manager.get_room_by_session(session_id)
+        if not room:
+            return jsonify({
+                'success': False,
+                'error': 'Not in a room',
+                'in_room': False
+            }), 404
+
+        room_code = room.room_code
+        known_version = request.headers.get('Last-Event-ID', type=int)
+        if known_version is None:
+            known_version = request.args.get('version', -1, type=int)
+
+        def events():
+            yield 'retry: 2000\n\n'
+            room_manager.record_heartbeat(room_code, session_id)
+            for changed in room_manager.watch_room(room_code, known_version):
+                if changed is None:
+                    room_manager.record_heartbeat(room_code, session_id)
+                    yield ': keepalive\n\n'
+                    continue
+                if not changed.is_session_in_room(session_id):
+                    break
+                payload = {'success': True, 'in_room': True,
+                           'room': _room_view(changed, session_id)}
+                yield f'id: {changed.version}\nevent: room\ndata: {json.dumps(payload)}\n\n'
+            else:
+                if room_manager.get_room(room_code) is not None:
+                    return  # Lifetime over — client reconnects
+            yield 'event: closed\ndata: {"in_room": false}\n\n'
+
+        return Response(events(), mimetype='text/event-stream', headers={
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no',  # nginx: pass events through unbuffered
         })
 
     @app.route('/api/room/status', methods=['GET'])
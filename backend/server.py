@@ -7,14 +7,17 @@ import json
 import traceback
 import os
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from typing import Optional
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, g
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 
-from db import get_connection, init_database
+from db import get_connection, init_database, connection_scope, get_pool_stats, WEB_THREADS
+from core.telemetry_writer import get_telemetry_writer
 from engine.hand import Hand, Card
 from engine.hand_constructor import generate_hand_for_convention, generate_hand_with_constraints
 from utils.dealing import deal_four_hands, shuffled_deck
@@ -33,11 +36,10 @@ from engine.bridge_rules_engine import BridgeRulesEngine, GameState as BridgeGam
 from engine.feedback.play_feedback import get_play_feedback_generator
 from engine.play.dds_analysis import get_dds_service, is_dds_available
 
-# Analysis engine for post-game analysis (bidding efficiency, quadrant classification)
-from engine.analysis import get_analysis_engine
-
 # Session state management (fixes global state race conditions)
-from core.session_state import SessionStateManager, get_session_id_from_request
+from core.session_state import (
+    create_state_manager, get_session_id_from_request, SessionConflictError
+)
 
 # Error logging for bidding/play diagnostics
 from utils.error_logger import log_error
@@ -81,6 +83,23 @@ except ImportError:
     PLATFORM_ALLOWS_DDS = False
     print("⚠️  DDS AI not available - install endplay for expert play")
 
+# Without usable endplay, expert play is budgeted Minimax. The pure-Python
+# double dummy solver (SolverPlayAI) can play instead with
+# EXPERT_PYTHON_SOLVER=true, but it only solves the later tricks within the
+# per-move budget, so it stays opt-in: each move is time-limited and a move
+# whose solve runs out of time is chosen by Minimax.
+from engine.play import dd_solver
+
+EXPERT_PYTHON_SOLVER = os.environ.get('EXPERT_PYTHON_SOLVER', 'false').lower() == 'true'
+
+if DDS_AVAILABLE and PLATFORM_ALLOWS_DDS:
+    EXPERT_DD_BACKEND = 'endplay'
+elif dd_solver.FALLBACK_ENABLED and EXPERT_PYTHON_SOLVER:
+    EXPERT_DD_BACKEND = 'python'
+    print("   Expert AI will use the Python double dummy solver (Minimax when a solve times out)")
+else:
+    EXPERT_DD_BACKEND = None
+
 # Initialize database (run migrations)
 print("🔄 Initializing database schema...")
 try:
@@ -116,6 +135,21 @@ limiter = Limiter(
     storage_uri="memory://",
 )
 
+# Optional: one pooled DB connection per request instead of one per helper call
+DB_REQUEST_SCOPE = os.environ.get('DB_REQUEST_SCOPE', 'false').lower() == 'true'
+
+if DB_REQUEST_SCOPE:
+    @app.before_request
+    def open_db_scope():
+        g.db_scope = connection_scope()
+        g.db_scope.__enter__()
+
+    @app.teardown_request
+    def close_db_scope(exc):
+        scope = g.pop('db_scope', None)
+        if scope is not None:
+            scope.__exit__(None, None, None)
+
 # Security headers on all responses
 @app.after_request
 def add_security_headers(response):
@@ -170,15 +204,24 @@ def handle_internal_error(e):
 # =============================================================================
 
 from engine.v2 import BiddingEngineV2Schema
-engine = BiddingEngineV2Schema()
-print("✅ BiddingEngineV2Schema initialized [PRODUCTION]")
+from engine.v2.inference import MonteCarloSimulator
+
+# Monte Carlo review of slam/competitive bids (ConflictResolver) is opt-in:
+# it can change bids, so enable it per deployment with BIDDING_SIMULATOR=1
+BIDDING_SIMULATOR = os.environ.get('BIDDING_SIMULATOR', '0') == '1'
+engine = BiddingEngineV2Schema(
+    simulator=MonteCarloSimulator() if BIDDING_SIMULATOR else None
+)
+print("✅ BiddingEngineV2Schema initialized [PRODUCTION]"
+      + (" with Monte Carlo review" if BIDDING_SIMULATOR else ""))
 
 play_engine = PlayEngine()
 play_ai = SimplePlayAI()  # Default AI (backward compatibility)
 session_manager = SessionManager()
 
 # Initialize session state manager (replaces global variables)
-state_manager = SessionStateManager()
+# Redis-backed when REDIS_URL/REDIS_HOST is set so all workers share sessions
+state_manager = create_state_manager()
 
 
 
@@ -194,6 +237,26 @@ app.config['STATE_MANAGER'] = state_manager
 # - current_hand_start_time -> state.hand_start_time
 # Access via: state = get_state()
 
+
+@app.after_request
+def save_session_state(response):
+    """Persist the session state this request used (shared store in multi-worker mode)"""
+    state = g.pop('session_state', None)
+    if state is not None:
+        try:
+            state_manager.save(state)
+        except SessionConflictError as e:
+            # Another request for this session saved first; its state wins.
+            # This request's changes are lost, so don't report success; the
+            # client can retry against the fresh state
+            print(f"⚠️  {e}")
+            response = jsonify({
+                'error': 'Session was changed by another request; please retry',
+                'session_conflict': True,
+            })
+            response.status_code = 409
+    return response
+
 CONVENTION_MAP = {
     "Preempt": PreemptConvention(),
     "JacobyTransfer": JacobyConvention(),
@@ -203,17 +266,114 @@ CONVENTION_MAP = {
 
 # AI instances for different difficulty levels
 # Expert level uses DDS ONLY on Linux (production)
-# macOS/Windows use Minimax depth 4 fallback to prevent crashes
+# macOS/Windows use Minimax depth 4 (or the opt-in Python solver) to prevent crashes
 # See: BUG_DDS_CRASH_2025-10-18.md for details on macOS DDS instability
-ai_instances = {
-    'beginner': SimplePlayAINew(),
-    'intermediate': MinimaxPlayAI(max_depth=2),
-    'advanced': MinimaxPlayAI(max_depth=3),
-    'expert': DDSPlayAI() if (DDS_AVAILABLE and PLATFORM_ALLOWS_DDS) else MinimaxPlayAI(max_depth=4)
+# Minimax levels are (max depth, per-move time budget in ms) budgets: the
+# search deepens iteratively and returns the deepest completed result when
+# the budget runs out, so latency stays bounded without timeouts
+AI_SEARCH_BUDGETS = {
+    'intermediate': (2, 500),
+    'advanced': (3, 1500),
+    'expert': (4, 3000),
+    'fallback': (3, 1000),
+}
+
+
+def _budgeted_minimax(level):
+    max_depth, time_budget_ms = AI_SEARCH_BUDGETS[level]
+    return MinimaxPlayAI(max_depth=max_depth, time_budget_ms=time_budget_ms)
+
+
+def _expert_ai():
+    if EXPERT_DD_BACKEND == 'endplay':
+        return DDSPlayAI()
+    if EXPERT_DD_BACKEND == 'python':
+        from engine.play.ai.solver_ai import SolverPlayAI
+        return SolverPlayAI(fallback_ai=_budgeted_minimax('expert'))
+    return _budgeted_minimax('expert')
+
+
+AI_FACTORIES = {
+    'beginner': SimplePlayAINew,
+    'intermediate': lambda: _budgeted_minimax('intermediate'),
+    'advanced': lambda: _budgeted_minimax('advanced'),
+    'expert': _expert_ai,
+    # Fallback AI for when DDS/expert fails (prevents 502 crashes)
+    'fallback': lambda: _budgeted_minimax('fallback'),
 }
 
-# Fallback AI for when DDS/expert fails (prevents 502 crashes)
-fallback_ai = MinimaxPlayAI(max_depth=3)
+# One instance per level for names, ratings and validation only. AIs keep
+# per-search state (deadline, statistics, transposition table), so play
+# goes through get_play_ai(): gthread workers serve requests on several
+# threads and must not share an AI between them
+ai_instances = {level: AI_FACTORIES[level]() for level in ('beginner', 'intermediate', 'advanced', 'expert')}
+
+_thread_ais = threading.local()
+_last_ai_statistics = {}  # difficulty -> get_statistics() after its last move
+_last_ai_statistics_lock = threading.Lock()
+
+
+def get_play_ai(difficulty):
+    """This request thread's AI for a difficulty level (or 'fallback')"""
+    ais = getattr(_thread_ais, 'ais', None)
+    if ais is None:
+        ais = _thread_ais.ais = {}
+    ai = ais.get(difficulty)
+    if ai is None:
+        ai = ais[difficulty] = AI_FACTORIES[difficulty]()
+    return ai
+
+
+def _discard_play_ai(difficulty):
+    """Drop this thread's AI (e.g. a timed-out search still running on it)"""
+    getattr(_thread_ais, 'ais', {}).pop(difficulty, None)
+
+
+def _record_ai_statistics(difficulty, ai):
+    if hasattr(ai, 'get_statistics'):
+        stats = ai.get_statistics()
+        with _last_ai_statistics_lock:
+            _last_ai_statistics[difficulty] = stats
+
+
+def get_last_ai_statistics(difficulty):
+    """Statistics of the last move any thread played at a difficulty, or None"""
+    with _last_ai_statistics_lock:
+        return _last_ai_statistics.get(difficulty)
+
+
+# Runs AIs without their own time budget so they can time out from any
+# request thread (signal.alarm only works on the main thread). These are
+# the beginner heuristics and in-process endplay, and neither can be
+# interrupted: a timed-out call keeps its helper thread until it returns.
+# One helper per request thread means a call only waits in the queue while
+# earlier timed-out calls are still running, which is logged
+AI_TIMEOUT_WORKERS = int(os.environ.get('AI_TIMEOUT_WORKERS', WEB_THREADS))
+_ai_timeout_executor = ThreadPoolExecutor(max_workers=AI_TIMEOUT_WORKERS,
+                                          thread_name_prefix='ai-timeout')
+_ai_timeout_busy = 0  # calls submitted and not yet returned
+_ai_timeout_lock = threading.Lock()
+
+
+def _ai_call_done(_future):
+    global _ai_timeout_busy
+    with _ai_timeout_lock:
+        _ai_timeout_busy -= 1
+
+
+def _submit_ai_call(fn, *args):
+    """Run fn(*args) on a helper thread, logging when every helper is busy"""
+    global _ai_timeout_busy
+    with _ai_timeout_lock:
+        busy = _ai_timeout_busy
+        _ai_timeout_busy += 1
+    if busy >= AI_TIMEOUT_WORKERS:
+        print(f"⚠️  AI helper threads saturated: {busy} calls running on "
+              f"{AI_TIMEOUT_WORKERS} threads (timed-out calls still running); "
+              f"this call waits in the queue")
+    future = _ai_timeout_executor.submit(fn, *args)
+    future.add_done_callback(_ai_call_done)
+    return future
 
 # ============================================================================
 # SUBPROCESS-BASED DDS WRAPPER (SEGFAULT PROTECTION)
@@ -221,17 +381,34 @@ fallback_ai = MinimaxPlayAI(max_depth=3)
 # DDS (endplay library) can crash with segfaults that Python can't catch.
 # Running DDS in a subprocess isolates crashes - if the subprocess dies,
 # the main server continues and falls back to Minimax AI.
+# Subprocesses are long-lived workers in a DDSWorkerPool; a crashed worker
+# is replaced automatically.
 # ============================================================================
 
-import multiprocessing
+import atexit
+
+from engine.play.ai.dds_worker_pool import DDSWorkerPool
+
+# DDSPlayAI built once per worker process (see _dds_worker_init)
+_worker_dds_ai = None
+
+
+def _dds_worker_init():
+    """Import endplay and build DDSPlayAI once when a pool worker starts."""
+    global _worker_dds_ai
+    from engine.play.ai.dds_ai import DDSPlayAI
+    _worker_dds_ai = DDSPlayAI()
+
 
 def _dds_worker(play_state_dict, position, result_queue):
     """
     Worker function that runs DDS in a separate process.
 
     If DDS segfaults, this process dies but the main server survives.
-    The result is communicated back via a multiprocessing Queue.
+    The result is communicated back via a multiprocessing Queue (or the
+    pool's pipe, which offers the same put()).
     """
+    global _worker_dds_ai
     try:
         # Import DDS inside the subprocess
         from engine.play.ai.dds_ai import DDSPlayAI
@@ -241,9 +418,10 @@ def _dds_worker(play_state_dict, position, result_queue):
         # Reconstruct PlayState from dict
         play_state = _reconstruct_play_state(play_state_dict)
 
-        # Run DDS
-        dds_ai = DDSPlayAI()
-        card = dds_ai.choose_card(play_state, position)
+        # Run DDS (reusing this worker's instance if it has one)
+        if _worker_dds_ai is None:
+            _worker_dds_ai = DDSPlayAI()
+        card = _worker_dds_ai.choose_card(play_state, position)
 
         # Return card as dict (can't pickle Card namedtuple across processes easily)
         result_queue.put({
@@ -348,17 +526,41 @@ def _serialize_play_state(play_state):
         'vulnerability': getattr(play_state, 'vulnerability', 'None')
     }
 
+# Long-lived DDS worker processes shared by all tables (started on first use)
+DDS_POOL_SIZE = int(os.environ.get('DDS_POOL_SIZE', 2))
+DDS_POOL_MAX_QUEUE = int(os.environ.get('DDS_POOL_MAX_QUEUE', 32))
+_dds_pool = None
+_dds_pool_lock = threading.Lock()
+
+
+def get_dds_pool():
+    """Return the shared DDS worker pool, creating it on first use."""
+    global _dds_pool
+    with _dds_pool_lock:
+        if _dds_pool is None:
+            _dds_pool = DDSWorkerPool(
+                _dds_worker,
+                size=DDS_POOL_SIZE,
+                max_queue=DDS_POOL_MAX_QUEUE,
+                initializer=_dds_worker_init,
+            )
+            _dds_pool.start()
+            atexit.register(_dds_pool.shutdown)
+        return _dds_pool
+
+
 def safe_ai_choose_card(ai, play_state, position, difficulty, timeout_seconds=15):
     """
     Safely execute AI card selection with subprocess isolation for DDS.
 
     For expert (DDS) difficulty, runs in a subprocess to catch segfaults.
-    For other difficulties, runs directly with timeout protection.
+    AIs with a per-move time budget (anytime Minimax) run directly and
+    stop themselves; other AIs run on a helper thread with a timeout.
 
     If DDS crashes (segfault) or times out, falls back to Minimax AI.
 
     Args:
-        ai: The AI instance to use
+        ai: The AI instance to use (this thread's, from get_play_ai())
         play_state: Current play state
         position: Position making the play
         difficulty: AI difficulty level string
@@ -368,6 +570,7 @@ def safe_ai_choose_card(ai, play_state, position, difficulty, timeout_seconds=15
         tuple: (card, used_fallback, actual_ai_name)
     """
     actual_ai_name = ai.get_name()
+    fallback_ai = get_play_ai('fallback')
 
     # For expert difficulty with DDS available, use subprocess isolation
     if difficulty == 'expert' and DDS_AVAILABLE and PLATFORM_ALLOWS_DDS:
@@ -375,47 +578,21 @@ def safe_ai_choose_card(ai, play_state, position, difficulty, timeout_seconds=15
             # Serialize play state for subprocess
             state_dict = _serialize_play_state(play_state)
 
-            # Create queue for result
-            result_queue = multiprocessing.Queue()
+            # Run on a pooled worker process (queue wait counts against timeout)
+            result = get_dds_pool().submit(state_dict, position, timeout=timeout_seconds)
 
-            # Start subprocess
-            process = multiprocessing.Process(
-                target=_dds_worker,
-                args=(state_dict, position, result_queue)
-            )
-            process.start()
-
-            # Wait for result with timeout
-            process.join(timeout_seconds)
-
-            if process.is_alive():
-                # Timeout - kill the subprocess
-                print(f"⚠️  DDS TIMEOUT: Subprocess timed out after {timeout_seconds}s for {position}")
-                process.terminate()
-                process.join(1)  # Give it 1 second to terminate
-                if process.is_alive():
-                    process.kill()  # Force kill if still alive
-                # Fall through to fallback
-
-            elif process.exitcode != 0:
-                # Subprocess crashed (likely segfault)
-                print(f"⚠️  DDS CRASH: Subprocess exited with code {process.exitcode} for {position}")
+            if result['status'] == 'success':
+                card = Card(result['card']['rank'], result['card']['suit'])
+                return card, False, actual_ai_name
+            elif result['status'] == 'timeout':
+                print(f"⚠️  DDS TIMEOUT: {result.get('error')} for {position}")
+            elif result['status'] == 'crash':
+                # Worker crashed (likely segfault); the pool replaces it
+                print(f"⚠️  DDS CRASH: Worker exited with code {result.get('exitcode')} for {position}")
                 print(f"   This was likely a segfault in the DDS library")
-                # Fall through to fallback
-
             else:
-                # Process completed - check result
-                try:
-                    result = result_queue.get_nowait()
-                    if result['status'] == 'success':
-                        card = Card(result['card']['rank'], result['card']['suit'])
-                        return card, False, actual_ai_name
-                    else:
-                        print(f"⚠️  DDS ERROR: {result.get('error', 'Unknown error')}")
-                        # Fall through to fallback
-                except Exception as e:
-                    print(f"⚠️  DDS QUEUE ERROR: {e}")
-                    # Fall through to fallback
+                print(f"⚠️  DDS ERROR: {result.get('error', 'Unknown error')}")
+            # Fall through to fallback
 
         except Exception as e:
             print(f"⚠️  DDS SUBPROCESS ERROR: {e}")
@@ -431,29 +608,33 @@ def safe_ai_choose_card(ai, play_state, position, difficulty, timeout_seconds=15
             print(f"❌ CRITICAL: Even fallback AI failed: {fallback_error}")
             # Last resort below
 
-    else:
-        # Non-DDS AI: run directly with simple timeout
-        import signal
-        import sys
-
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"AI decision timed out after {timeout_seconds}s")
-
+    elif getattr(ai, 'time_budget_ms', None) is not None:
+        # Anytime search: returns the best card found within its own budget
         try:
-            if sys.platform != 'win32':
-                old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-                signal.alarm(timeout_seconds)
+            card = ai.choose_card(play_state, position)
+            return card, False, actual_ai_name
+        except Exception as e:
+            print(f"⚠️  AI ERROR: {difficulty} AI failed for {position}: {e}")
+            log_error(e)
 
-            try:
-                card = ai.choose_card(play_state, position)
-                return card, False, actual_ai_name
-            finally:
-                if sys.platform != 'win32':
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
+        print(f"   Falling back to Minimax AI")
+        try:
+            card = fallback_ai.choose_card(play_state, position)
+            return card, True, f"{actual_ai_name} (fallback: {fallback_ai.get_name()})"
+        except Exception as fallback_error:
+            print(f"❌ CRITICAL: Even fallback AI failed: {fallback_error}")
 
-        except TimeoutError:
+    else:
+        # Non-DDS AI without a budget: wait for it on a helper thread
+        future = _submit_ai_call(ai.choose_card, play_state, position)
+        try:
+            card = future.result(timeout=timeout_seconds)
+            return card, False, actual_ai_name
+        except FuturesTimeoutError:
             print(f"⚠️  AI TIMEOUT: {difficulty} AI timed out for {position}")
+            # The search can't be interrupted; give this thread a fresh AI
+            # rather than one still in use by the helper thread
+            _discard_play_ai(difficulty)
         except Exception as e:
             print(f"⚠️  AI ERROR: {difficulty} AI failed for {position}: {e}")
             log_error(e)
@@ -494,7 +675,8 @@ def log_ai_play(card, position, ai_level, solve_time_ms, used_fallback=False,
     """
     Log AI play decision to database for quality monitoring.
 
-    This minimal logging approach adds <1% overhead and enables:
+    The row is queued for the background telemetry writer, so the AI-play
+    request never waits on the database. This enables:
     - Real-time DDS health monitoring
     - Quality analysis over time
     - Fallback rate tracking
@@ -512,19 +694,16 @@ def log_ai_play(card, position, ai_level, solve_time_ms, used_fallback=False,
         trump_suit: Optional trump suit symbol
     """
     try:
-        with get_connection() as conn:
-            cursor = conn.cursor()
-
-            # Convert card to simple string format
-            card_str = f"{card.rank}{card.suit}"
-
-            cursor.execute("""
-                INSERT INTO ai_play_log
-                (position, ai_level, card_played, solve_time_ms, used_fallback,
-                 session_id, hand_number, trick_number, contract, trump_suit)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (position, ai_level, card_str, solve_time_ms, int(used_fallback),
-                  session_id, hand_number, trick_number, contract, trump_suit))
+        # Convert card to simple string format
+        card_str = f"{card.rank}{card.suit}"
+
+        get_telemetry_writer().submit(
+            'ai_play_log',
+            ('position', 'ai_level', 'card_played', 'solve_time_ms', 'used_fallback',
+             'session_id', 'hand_number', 'trick_number', 'contract', 'trump_suit'),
+            (position, ai_level, card_str, solve_time_ms, int(used_fallback),
+             session_id, hand_number, trick_number, contract, trump_suit)
+        )
 
     except Exception as e:
         # Never let logging break gameplay - just print error
@@ -535,70 +714,9 @@ def log_ai_play(card, position, ai_level, solve_time_ms, used_fallback=False,
 # POST-GAME ANALYSIS HELPER
 # ============================================================================
 
-import threading
-
-def run_post_game_analysis(
-    session_hand_id: int,
-    hands: dict,
-    contract,
-    play_history: list,
-    actual_tricks: int,
-    actual_score: int,
-    vulnerability: str,
-    dealer: str,
-):
-    """
-    Run post-game analysis in background thread.
-
-    This analyzes the completed hand for:
-    - Bidding efficiency (optimal/underbid/overbid)
-    - Quadrant classification (bidding vs play quality)
-    - Points left on table
-    - Opening lead quality
-
-    The results are stored in the session_hands table for dashboard display.
-
-    Args:
-        session_hand_id: ID of the session_hands row to update
-        hands: Dict of position -> Hand objects (original deal)
-        contract: Contract object
-        play_history: List of plays from the hand
-        actual_tricks: Tricks taken by declarer
-        actual_score: Score achieved
-        vulnerability: Vulnerability string
-        dealer: Dealer position
-    """
-    try:
-        engine = get_analysis_engine()
-
-        # Skip if no DDS available (analysis will be minimal)
-        # We still run it to get basic quadrant based on made/down
-        result = engine.analyze_hand(
-            hands=hands,
-            contract=contract,
-            play_history=play_history,
-            actual_tricks=actual_tricks,
-            actual_score=actual_score,
-            vulnerability=vulnerability,
-            dealer=dealer,
-        )
-
-        # Store results in database
-        success = engine.store_analysis(session_hand_id, result)
-
-        if success:
-            print(f"✅ Post-game analysis stored for hand {session_hand_id}")
-            print(f"   Quadrant: {result.quadrant.value}, Efficiency: {result.bid_efficiency.value}")
-            if result.points_left_on_table > 0:
-                print(f"   Points left on table: {result.points_left_on_table}")
-        else:
-            print(f"⚠️ Failed to store analysis for hand {session_hand_id}")
-
-    except Exception as e:
-        # Never let analysis break the main flow
-        print(f"⚠️ Post-game analysis failed for hand {session_hand_id}: {e}")
-        log_error(e)
-
+from engine.analysis.analysis_jobs import POST_GAME_ANALYSIS, enqueue_post_game_analysis
+from core.job_queue import get_job_queue
+from core.job_worker import run_in_process_if_no_worker
 
 def trigger_post_game_analysis(
     session_hand_id: int,
@@ -611,10 +729,13 @@ def trigger_post_game_analysis(
     dealer: str,
 ):
     """
-    Trigger post-game analysis in a background thread.
+    Queue post-game analysis for a saved hand.
 
     This is called from complete_session_hand after the hand is saved.
-    Running in a thread ensures the API response is not delayed.
+    The DDS-heavy analysis runs in the job worker pool
+    (python -m core.job_worker), so the API response is not delayed and
+    queued hands survive a server restart. Without a live worker the job
+    runs in a background thread of this process instead.
 
     Args:
         session_hand_id: ID of the session_hands row
@@ -626,36 +747,28 @@ def trigger_post_game_analysis(
         vulnerability: Vulnerability string
         dealer: Dealer position
     """
-    # Convert original_deal to the format expected by analysis engine
-    # original_deal uses full names (North, East, etc.)
-    hands = {}
-    name_to_pos = {'North': 'N', 'East': 'E', 'South': 'S', 'West': 'W'}
-
-    if original_deal:
-        for full_name, hand in original_deal.items():
-            pos = name_to_pos.get(full_name, full_name)
-            hands[pos] = hand
-    else:
+    if not original_deal:
         print("⚠️ No original_deal available for analysis")
         return
 
-    # Start analysis in background thread
-    thread = threading.Thread(
-        target=run_post_game_analysis,
-        args=(
+    try:
+        job_id = enqueue_post_game_analysis(
             session_hand_id,
-            hands,
+            original_deal,
             contract,
             play_history,
             actual_tricks,
             actual_score,
             vulnerability,
             dealer,
-        ),
-        daemon=True,  # Thread will be killed when main program exits
-    )
-    thread.start()
-    print(f"🔄 Post-game analysis started for hand {session_hand_id} (background)")
+        )
+        print(f"🔄 Post-game analysis queued for hand {session_hand_id} (job {job_id})")
+        if run_in_process_if_no_worker(POST_GAME_ANALYSIS):
+            print("   No analysis worker running - analyzing in-process")
+    except Exception as e:
+        # Never let analysis break the main flow
+        print(f"⚠️ Failed to queue post-game analysis for hand {session_hand_id}: {e}")
+        log_error(e)
 
 
 # ============================================================================
@@ -734,8 +847,9 @@ def get_state():
         else:
             session_id = f"user_{user_id}_default"
 
-    # Get or create session state
+    # Get or create session state (saved by save_session_state after the request)
     state = state_manager.get_or_create(session_id)
+    g.session_state = state
 
     # CRITICAL FIX: Load active game session from database if not already loaded
     # This ensures gameplay tracking persists across requests
@@ -838,9 +952,8 @@ def perform_new_deal(state):
     state.original_deal = None
     state.auction_history = []
 
-    # CRITICAL: Reset engine state for new deal
-    if hasattr(engine, 'new_deal'):
-        engine.new_deal()
+    # CRITICAL: Reset bidding state for new deal
+    state.bid_context.reset()
 
     # Determine dealer and vulnerability
     if state.game_session:
@@ -1216,6 +1329,7 @@ def get_ai_status():
         ai_status = {
             'dds_available': DDS_AVAILABLE,
             'dds_platform_ready': dds_platform_ready,  # Platform can use DDS
+            'dd_backend': EXPERT_DD_BACKEND,  # 'endplay', 'python' (solver fallback) or None
             'dds_active': dds_actually_active,  # DDS is ACTUALLY being used for this session
             'platform': current_platform,
             'is_production': is_production,
@@ -1246,8 +1360,13 @@ def get_ai_status():
                 },
                 'expert': {
                     'name': ai_instances['expert'].get_name(),
-                    'rating': '9/10' if dds_platform_ready else '8+/10',
-                    'description': 'Double Dummy Solver (perfect play)' if dds_platform_ready else 'Deep minimax search (4-ply)',
+                    'rating': '9/10' if EXPERT_DD_BACKEND else '8+/10',
+                    'description': (
+                        'Double Dummy Solver (perfect play)' if EXPERT_DD_BACKEND == 'endplay'
+                        else 'Python double dummy solver (minimax when a move times out)'
+                        if EXPERT_DD_BACKEND == 'python'
+                        else 'Deep minimax search (4-ply)'
+                    ),
                     'using_dds': dds_platform_ready
                 }
             },
@@ -1255,13 +1374,10 @@ def get_ai_status():
         }
 
         # Add DDS statistics if available and active
-        if dds_actually_active:
-            try:
-                expert_ai = ai_instances['expert']
-                if hasattr(expert_ai, 'get_statistics'):
-                    ai_status['dds_statistics'] = expert_ai.get_statistics()
-            except:
-                pass
+        if EXPERT_DD_BACKEND and state.ai_difficulty == 'expert':
+            expert_statistics = get_last_ai_statistics('expert')
+            if expert_statistics is not None:
+                ai_status['dds_statistics'] = expert_statistics
 
         return jsonify(ai_status)
 
@@ -1417,9 +1533,9 @@ def get_ai_statistics():
     state = get_state()
     try:
         ai = ai_instances[state.ai_difficulty]
+        stats = get_last_ai_statistics(state.ai_difficulty)
 
-        if hasattr(ai, 'get_statistics'):
-            stats = ai.get_statistics()
+        if stats is not None:
             return jsonify({
                 'has_statistics': True,
                 'statistics': stats,
@@ -1435,6 +1551,20 @@ def get_ai_statistics():
     except Exception as e:
         return jsonify({'error': f'Could not get AI statistics: {str(e)}'}), 500
 
+@app.route('/api/bidding-statistics', methods=['GET'])
+def get_bidding_statistics():
+    """
+    Get bidding engine statistics: rule candidate-set sizes and
+    feature layer cache hits and time saved
+    """
+    try:
+        return jsonify({
+            'candidates': engine.get_candidate_stats(),
+            'feature_cache': engine.get_feature_cache_stats(),
+        })
+    except Exception as e:
+        return jsonify({'error': f'Could not get bidding statistics: {str(e)}'}), 500
+
 @app.route('/api/load-scenario', methods=['POST'])
 def load_scenario():
     # Get session state for this request
@@ -1620,7 +1750,8 @@ def get_next_bid():
             return jsonify({'error': "Deal has not been made yet."}), 400
 
         bid, explanation = engine.get_next_bid(player_hand, auction_history, current_player,
-                                                state.vulnerability, explanation_level, dealer=dealer)
+                                                state.vulnerability, explanation_level, dealer=dealer,
+                                                context=state.bid_context)
 
         # Fix for TypeError: Object of type BidExplanation is not JSON serializable
         if hasattr(explanation, 'description'):
@@ -1710,7 +1841,8 @@ def get_next_bid_structured():
             return jsonify({'error': "Deal has not been made yet."}), 400
 
         bid, explanation_dict = engine.get_next_bid_structured(player_hand, auction_history,
-                                                                current_player, state.vulnerability)
+                                                                current_player, state.vulnerability,
+                                                                context=state.bid_context)
         return jsonify({
             'bid': bid,
             'explanation': explanation_dict
@@ -1741,7 +1873,8 @@ def get_feedback():
         user_bid, auction_before_user_bid = auction_history[-1], auction_history[:-1]
         user_hand = state.deal['South']
         optimal_bid, explanation = engine.get_next_bid(user_hand, auction_before_user_bid, 'South',
-                                                        state.vulnerability, explanation_level)
+                                                        state.vulnerability, explanation_level,
+                                                        context=state.bid_context)
 
         was_correct = (user_bid == optimal_bid)
 
@@ -1935,7 +2068,8 @@ def evaluate_bid():
             auction_history=auction_history,
             my_position=current_player,
             vulnerability=state.vulnerability,
-            dealer=dealer
+            dealer=dealer,
+            context=state.bid_context
         )
 
         # Store in database for analytics
@@ -3105,7 +3239,8 @@ def play_random_hand():
                     auction_history,
                     current_player,
                     state.vulnerability,
-                    explanation_level='simple'
+                    explanation_level='simple',
+                    context=state.bid_context
                 )
                 auction_history.append(bid)
                 bid_count += 1
@@ -3279,7 +3414,9 @@ def play_card():
         )
         if user_id and is_user_controlled:
             try:
-                feedback_gen = get_play_feedback_generator(use_dds=PLATFORM_ALLOWS_DDS)
+                # The generator checks the platform itself and uses the Python
+                # solver where endplay is unusable
+                feedback_gen = get_play_feedback_generator(use_dds=True)
                 # Get session_id: prefer request body, fall back to game_session
                 feedback_session_id = data.get('session_id')
                 if feedback_session_id is None and state.game_session:
@@ -3455,8 +3592,9 @@ def get_ai_play():
         if is_dummy_play:
             print(f"🎭 DUMMY PLAY: Declarer ({declarer}) controlling dummy ({dummy})")
 
-        # AI chooses card (using current difficulty AI)
-        current_ai = ai_instances.get(state.ai_difficulty, ai_instances["intermediate"])
+        # AI chooses card (this thread's AI for the session's difficulty)
+        ai_difficulty = state.ai_difficulty if state.ai_difficulty in ai_instances else "intermediate"
+        current_ai = get_play_ai(ai_difficulty)
 
         # DIAGNOSTIC: Log hand state before AI chooses
         hand = state.play_state.hands[position]
@@ -3486,6 +3624,7 @@ def get_ai_play():
             timeout_seconds=15  # 15s timeout (Render has 30s limit)
         )
         solve_time_ms = (time.time() - start_time) * 1000  # Convert to milliseconds
+        _record_ai_statistics(ai_difficulty, current_ai)
 
         if ai_used_fallback:
             print(f"   ⚠️ AI used FALLBACK: {card.rank}{card.suit} (took {solve_time_ms:.1f}ms)")
@@ -3535,7 +3674,7 @@ def get_ai_play():
             # ai_used_fallback is set by safe_ai_choose_card() above
             used_fallback = ai_used_fallback or (
                 state.ai_difficulty == 'expert' and
-                not (DDS_AVAILABLE and PLATFORM_ALLOWS_DDS)
+                EXPERT_DD_BACKEND is None
             )
 
             # Format contract string
@@ -3885,6 +4024,14 @@ def complete_play():
 # AI MONITORING & QUALITY ENDPOINTS
 # ============================================================================
 
+def _analysis_job_stats():
+    """Background job queue depth/latency for dds-health (None if unavailable)."""
+    try:
+        return get_job_queue().stats()
+    except Exception as e:
+        return {"error": str(e)}
+
+
 @app.route("/api/dds-health", methods=["GET"])
 def dds_health():
     """
@@ -3961,6 +4108,7 @@ def dds_health():
 
         return jsonify({
             "dds_available": DDS_AVAILABLE and PLATFORM_ALLOWS_DDS,
+            "dd_backend": EXPERT_DD_BACKEND,
             "platform": platform.system(),
             "hours_analyzed": hours,
             "overall": overall,
@@ -3972,7 +4120,11 @@ def dds_health():
                     "difficulty": ai_instances[level].get_difficulty()
                 }
                 for level in ['beginner', 'intermediate', 'advanced', 'expert']
-            }
+            },
+            "dds_worker_pool": _dds_pool.get_statistics() if _dds_pool is not None else None,
+            "db_pool": get_pool_stats(),
+            "telemetry": get_telemetry_writer().stats(),
+            "analysis_jobs": _analysis_job_stats()
         })
 
     except Exception as e:
@@ -4600,18 +4752,12 @@ def _generate_shadow_play_recommendation(
 
 
 def log_play_decision(user_id, position, user_card, score, rating, contract, trick_number):
-    """Log a user's play decision for dashboard analytics"""
-    try:
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO play_decisions
-                (user_id, position, user_card, score, rating, contract, trick_number, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (user_id, position, user_card, score, rating, contract, trick_number, datetime.now()))
-    except Exception as e:
-        # Table might not exist yet - that's ok
-        print(f"Could not log play decision: {e}")
+    """Log a user's play decision for dashboard analytics (written in the background)"""
+    get_telemetry_writer().submit(
+        'play_decisions',
+        ('user_id', 'position', 'user_card', 'score', 'rating', 'contract', 'trick_number'),
+        (user_id, position, user_card, score, rating, contract, trick_number)
+    )
 
 
 @app.route("/api/ai-quality-summary", methods=["GET"])
@@ -2,6 +2,7 @@ import random
 import json
 from engine.hand import Hand, Card
 from engine.v2 import BiddingEngineV2Schema as BiddingEngine
+from engine.v2.batch_bidding import bid_auction
 from engine.hand_constructor import generate_hand_for_convention, generate_hand_with_constraints
 from engine.ai.conventions.preempts import PreemptConvention
 from engine.ai.conventions.jacoby_transfers import JacobyConvention
@@ -48,24 +49,10 @@ def deal_scenario_hand(scenario, deck):
 # ... (The rest of the file: run_bidding_simulation, format_deal_for_log, main, etc. are unchanged) ...
 
 def run_bidding_simulation(engine, deal, vulnerability):
-    auction_history = []
-    players = ['North', 'East', 'South', 'West']
-    current_bidder_index = 0
+    """Bid the deal; the DealResult's error is set if the engine failed mid-auction"""
+    return bid_auction(engine, deal, 'North', vulnerability)
 
-    while True:
-        if len(auction_history) >= 4 and all(b == "Pass" for b in auction_history[-3:]):
-            break
-        if len(auction_history) > 30: break # Safety break
-
-        player_name = players[current_bidder_index]
-        hand = deal[player_name]
-        bid, _ = engine.get_next_bid(hand, auction_history, player_name, vulnerability)
-        auction_history.append(bid)
-        current_bidder_index = (current_bidder_index + 1) % 4
-    
-    return auction_history
-
-def format_deal_for_log(deal, auction, deal_num, vulnerability, scenario_name="Random"):
+def format_deal_for_log(deal, auction, deal_num, vulnerability, scenario_name="Random", error=None):
     log_entry = [f"--- Hand {deal_num} (Scenario: {scenario_name}, Vulnerability: {vulnerability}) ---\n"]
     for player in ['North', 'East', 'South', 'West']:
         hand = deal[player]
@@ -78,6 +65,8 @@ def format_deal_for_log(deal, auction, deal_num, vulnerability, scenario_name="R
         if i % 4 == 0: bidding_str += "\n"
         bidding_str += f"{['N','E','S','W'][i%4]}: {bid:<7}"
     log_entry.append(bidding_str)
+    if error:
+        log_entry.append(f"\nAUCTION INCOMPLETE - engine error: {error}")
     log_entry.append("\n" + "-"*40 + "\n")
     return "\n".join(log_entry)
 
@@ -93,6 +82,7 @@ def main():
         scenarios = []
         print("Warning: scenarios.json not found or corrupted. Running random hands only.")
     
+    failed = 0
     with open(LOG_FILE, 'w') as log_file:
         for i in range(1, DEAL_COUNT + 1):
             deal, scenario_name = None, "Random"
@@ -105,12 +95,18 @@ def main():
             if not deal:
                 deal = deal_random_hand()
 
-            auction = run_bidding_simulation(engine, deal, "None")
-            log_entry = format_deal_for_log(deal, auction, i, "None", scenario_name)
+            result = run_bidding_simulation(engine, deal, "None")
+            log_entry = format_deal_for_log(deal, result.auction, i, "None", scenario_name, result.error)
             log_file.write(log_entry)
-            print(f"  ... Hand {i} completed.")
+            if result.error:
+                failed += 1
+                print(f"  ... Hand {i} FAILED: {result.error}")
+            else:
+                print(f"  ... Hand {i} completed.")
 
     print(f"\nSimulation complete. Results saved to {LOG_FILE}")
+    if failed:
+        print(f"Warning: {failed} of {DEAL_COUNT} auctions stopped on an engine error (marked in the log)")
 
 # This is the line that was missing, which tells Python to run the simulation.
 if __name__ == "__main__":
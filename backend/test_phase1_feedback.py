@@ -19,6 +19,7 @@ from engine.feedback.bidding_feedback import (
 )
 from engine.hand import Hand
 from db import get_connection
+from core.telemetry_writer import get_telemetry_writer
 
 
 # Import helper functions directly since they don't depend on Flask context
@@ -152,6 +153,7 @@ def test_feedback_storage():
         session_id="test_session_1",
         hand_analysis_id=None
     )
+    get_telemetry_writer().flush()
 
     # Verify it was stored
     with get_connection() as conn:
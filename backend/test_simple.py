@@ -123,7 +123,7 @@ try:
         print("  ❌ server.py missing session state import!")
         sys.exit(1)
 
-    if 'SessionStateManager()' in content:
+    if 'create_state_manager()' in content:
         print("  ✅ server.py creates SessionStateManager")
     else:
         print("  ❌ server.py doesn't create SessionStateManager!")
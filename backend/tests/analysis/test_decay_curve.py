@@ -1032,5 +1032,92 @@ class TestProductionDecayCurveGenerator:
         assert restored['curve'] == [10, 10, 10, 8, 8]
 
 
+@pytest.mark.skipif(
+    not __import__('os').environ.get('DATABASE_URL'),
+    reason="DATABASE_URL not set — requires PostgreSQL"
+)
+class TestProductionIncrementalDecayCurve:
+    """
+    Tests for incremental decay curve generation against real DDS.
+
+    Incremental mode must produce the same curve as solving every state.
+    """
+
+    HANDS = {
+        'N': ['SA', 'SK', 'SQ', 'S2', 'HK', 'HJ', 'H3', 'DT', 'D9', 'D8', 'C4', 'C3', 'C2'],
+        'E': ['SJ', 'ST', 'S9', 'S8', 'HQ', 'H4', 'H2', 'DK', 'DJ', 'D4', 'C9', 'C8', 'C7'],
+        'S': ['S7', 'S6', 'S5', 'HA', 'HT', 'H9', 'DA', 'DQ', 'D5', 'CA', 'CK', 'CQ', 'CJ'],
+        'W': ['S4', 'S3', 'H8', 'H7', 'H6', 'H5', 'D7', 'D6', 'D3', 'D2', 'CT', 'C6', 'C5'],
+    }
+
+    def _play_out(self, gen, trump, pick):
+        """Play all 52 cards legally, choosing with pick(legal_cards)."""
+        hands = {pos: list(cards) for pos, cards in self.HANDS.items()}
+        history = []
+        position = 'E'  # North declares
+        trick = []
+        for _ in range(52):
+            hand = hands[position]
+            legal = [c for c in hand if trick and c[0] == trick[0]['card'][0]] or hand
+            card = pick(sorted(legal))
+            hand.remove(card)
+            trick.append({'card': card, 'position': position})
+            history.append({'card': card, 'position': position})
+            if len(trick) == 4:
+                position = gen._determine_trick_winner(trick, trick[0]['position'], trump)
+                trick = []
+            else:
+                position = {'N': 'E', 'E': 'S', 'S': 'W', 'W': 'N'}[position]
+        return history
+
+    @pytest.mark.parametrize("trump,pick", [
+        ('S', lambda legal: legal[0]),
+        ('NT', lambda legal: legal[-1]),
+        ('H', lambda legal: legal[len(legal) // 2]),
+    ])
+    def test_incremental_matches_full_solve(self, trump, pick):
+        """Incremental curve is identical and uses fewer solves."""
+        from engine.analysis.decay_curve import DecayCurveGenerator
+
+        full = DecayCurveGenerator()
+        if not full.is_available:
+            pytest.skip("DDS not available")
+        incremental = DecayCurveGenerator()
+        history = self._play_out(full, trump, pick)
+
+        expected = full.generate(self.HANDS, history, 'N', trump, 4, incremental=False)
+        result = incremental.generate(self.HANDS, history, 'N', trump, 4)
+
+        assert result.to_dict() == expected.to_dict()
+        assert full.stats['dds_calls'] == 52
+        assert incremental.stats['dds_calls'] + incremental.stats['dds_calls_saved'] == 52
+        assert incremental.stats['dds_calls'] <= 26
+
+    def test_mid_trick_states_are_solved(self):
+        """A trick thrown away mid-trick shows up at the next card."""
+        from engine.analysis.decay_curve import DecayCurveGenerator
+
+        gen = DecayCurveGenerator()
+        if not gen.is_available:
+            pytest.skip("DDS not available")
+
+        hands = {
+            'N': ['SA', 'ST', 'S9', 'S7', 'S2', 'H4', 'DQ', 'DT', 'D7', 'D5', 'CQ', 'C9', 'C6'],
+            'E': ['SQ', 'SJ', 'S6', 'S5', 'S3', 'HA', 'HQ', 'H9', 'H2', 'D2', 'C4', 'C3', 'C2'],
+            'S': ['SK', 'S8', 'S4', 'HK', 'HT', 'H7', 'H6', 'DJ', 'D9', 'CA', 'CJ', 'C8', 'C5'],
+            'W': ['HJ', 'H8', 'H5', 'H3', 'DA', 'DK', 'D8', 'D6', 'D4', 'D3', 'CK', 'CT', 'C7'],
+        }
+        # South drops the king under East's ace
+        history = [
+            {'card': 'HA', 'position': 'E'},
+            {'card': 'HK', 'position': 'S'},
+            {'card': 'H5', 'position': 'W'},
+        ]
+        result = gen.generate(hands, history, 'N', 'NT', 3, incremental=False)
+
+        assert gen.stats['dds_calls'] == 3
+        assert result.curve == [7, 7, 6]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,346 @@
+"""
+Tests for the pure-Python double dummy solver (endplay fallback)
+
+Tests:
+- Solved values match a brute-force minimax on random small endings,
+  for whole positions, every card, optimal_moves() and single cards
+- Known positions (a squeeze) and solve_board() output
+- calc_dd_table() and par_from_table()
+- Time limits raise SolverTimeout; table budgets hold
+- Solve speed: late-deal positions fit the per-move limits
+- DDSAnalysisService and SolverPlayAI run on the solver without endplay
+"""
+
+import random
+import time
+
+import pytest
+from engine.bitboard import SUIT_MASKS, cards_to_mask
+from engine.hand import Card, Hand
+from engine.play.dd_solver import (
+    NOTRUMP,
+    DoubleDummySolver,
+    SolverTimeout,
+    calc_dd_table,
+    par_from_table,
+    solve_board,
+)
+
+
+def _cards(text):
+    return [Card(card[1], card[0]) for card in text.split()]
+
+
+def _legal(hand, trick):
+    return (hand & SUIT_MASKS[trick[0] // 13] if trick else 0) or hand
+
+
+def _beats(bit, win_bit, trump):
+    suit, win_suit = bit // 13, win_bit // 13
+    return (suit == win_suit and bit > win_bit) or (suit == trump and win_suit != trump)
+
+
+def _brute(hands, trump, leader, trick=(), win_bit=-1, win_seat=-1):
+    """NS tricks from here by plain minimax"""
+    seat = (leader + len(trick)) & 3
+    if not hands[seat]:
+        return 0
+    values = []
+    legal = _legal(hands[seat], trick)
+    while legal:
+        low = legal & -legal
+        legal ^= low
+        bit = low.bit_length() - 1
+        if not trick or _beats(bit, win_bit, trump):
+            best_bit, best_seat = bit, seat
+        else:
+            best_bit, best_seat = win_bit, win_seat
+        hands[seat] ^= low
+        if len(trick) == 3:
+            value = (0 if best_seat & 1 else 1) + _brute(hands, trump, best_seat)
+        else:
+            value = _brute(hands, trump, leader, trick + (bit,), best_bit, best_seat)
+        hands[seat] ^= low
+        values.append(value)
+    return max(values) if not seat & 1 else min(values)
+
+
+def _random_ending(rng):
+    """Random (hands, trump, leader, partial trick) with 1-3 cards a hand"""
+    size = rng.randint(1, 3)
+    cards = list(range(52))
+    rng.shuffle(cards)
+    hands = [sum(1 << bit for bit in cards[i * size:(i + 1) * size]) for i in range(4)]
+    trump = rng.choice([NOTRUMP, 0, 1, 2, 3])
+    leader = rng.randrange(4)
+    trick = []
+    for offset in range(rng.randrange(4)):
+        seat = (leader + offset) & 3
+        legal = _legal(hands[seat], trick)
+        bit = rng.choice([b for b in range(52) if legal >> b & 1])
+        hands[seat] ^= 1 << bit
+        trick.append(bit)
+    return hands, trump, leader, trick, size
+
+
+def _card_values(hands, trump, leader, trick, size):
+    """Mover's tricks after each legal card, by brute force"""
+    mover = (leader + len(trick)) & 3
+    win_bit = win_seat = -1
+    for offset, bit in enumerate(trick):
+        if offset == 0 or _beats(bit, win_bit, trump):
+            win_bit, win_seat = bit, (leader + offset) & 3
+    values = {}
+    legal = _legal(hands[mover], trick)
+    for bit in (b for b in range(52) if legal >> b & 1):
+        after = list(hands)
+        after[mover] ^= 1 << bit
+        if not trick or _beats(bit, win_bit, trump):
+            best_bit, best_seat = bit, mover
+        else:
+            best_bit, best_seat = win_bit, win_seat
+        if len(trick) == 3:
+            ns = (0 if best_seat & 1 else 1) + _brute(after, trump, best_seat)
+        else:
+            ns = _brute(after, trump, leader, tuple(trick) + (bit,), best_bit, best_seat)
+        values[bit] = ns if not mover & 1 else size - ns
+    return values
+
+
+class TestAgainstBruteForce:
+    """Solver results equal plain minimax on small endings"""
+
+    @pytest.mark.parametrize("seed", range(4))
+    def test_random_endings(self, seed):
+        rng = random.Random(seed)
+        for _ in range(40):
+            hands, trump, leader, trick, size = _random_ending(rng)
+            values = _card_values(hands, trump, leader, trick, size)
+            best = max(values.values())
+
+            assert DoubleDummySolver(hands, trump).solve(leader, trick) == best
+            assert DoubleDummySolver(hands, trump).score_moves(leader, trick) == values
+
+            tricks, optimal = DoubleDummySolver(hands, trump).optimal_moves(leader, trick)
+            assert tricks == best
+            assert sorted(optimal) == sorted(b for b, v in values.items() if v == best)
+
+            tricks, first = DoubleDummySolver(hands, trump).optimal_moves(leader, trick, first_only=True)
+            assert tricks == best and len(first) == 1 and values[first[0]] == best
+
+            card = rng.choice(sorted(values))
+            assert DoubleDummySolver(hands, trump).score_moves(leader, trick, [card]) == {card: values[card]}
+
+    def test_illegal_move_rejected(self):
+        # North led the ♠A; East can't play South's ♠Q
+        hands = [0, 1 << 11, 1 << 10, 1 << 25]
+        with pytest.raises(ValueError):
+            DoubleDummySolver(hands).score_moves(0, [12], [10])
+
+
+class TestSolveBoard:
+    """endplay-shaped solve_board()"""
+
+    @pytest.fixture
+    def squeeze(self):
+        # West guards both majors; the ♣A squeezes them
+        return {
+            'N': _cards("♠A ♠J ♥Q ♥3"),
+            'E': _cards("♦5 ♦4 ♦3 ♦2"),
+            'S': _cards("♣A ♥A ♥2 ♠2"),
+            'W': _cards("♠K ♠Q ♥K ♥4"),
+        }
+
+    def test_squeeze(self, squeeze):
+        scores = dict(solve_board(squeeze, 'NT', 'S'))
+        assert scores[Card('A', '♣')] == 4
+        assert scores[Card('2', '♠')] == 3
+
+    def test_matches_brute_force(self, squeeze):
+        masks = [cards_to_mask(squeeze[seat]) for seat in 'NESW']
+        assert _brute(masks, NOTRUMP, 2) == 4
+
+    def test_sorted_best_first(self, squeeze):
+        tricks = [value for _, value in solve_board(squeeze, 'NT', 'S')]
+        assert tricks == sorted(tricks, reverse=True)
+
+    def test_current_trick(self, squeeze):
+        # Without the squeeze card first, South's ♠2 lead gives the defence a trick
+        hands = dict(squeeze, S=_cards("♣A ♥A ♥2"))
+        scores = solve_board(hands, 'NT', 'S', current_trick=[Card('2', '♠')])
+        assert {card for card, _ in scores} == {Card('K', '♠'), Card('Q', '♠')}
+        assert max(value for _, value in scores) == 1
+
+    def test_trump_formats(self, squeeze):
+        assert solve_board(squeeze, '♠', 'S') == solve_board(squeeze, 'S', 'S')
+        assert solve_board(squeeze, None, 'S') == solve_board(squeeze, 'NT', 'S')
+
+    def test_missing_hand(self, squeeze):
+        del squeeze['W']
+        with pytest.raises(ValueError):
+            solve_board(squeeze, 'NT', 'S')
+
+
+class TestDDTable:
+    """calc_dd_table() and par_from_table()"""
+
+    @pytest.fixture
+    def solid_suits(self):
+        ranks = 'AKQJT98765432'
+        return {seat: [Card(rank, suit) for rank in ranks]
+                for seat, suit in zip('NESW', '♠♥♦♣')}
+
+    def test_solid_suits(self, solid_suits):
+        table = calc_dd_table(solid_suits)
+        # A side takes every trick in its own suits and none elsewhere
+        for seat in 'NS':
+            assert table[seat] == {'S': 13, 'H': 0, 'D': 13, 'C': 0, 'NT': 0}
+        for seat in 'EW':
+            assert table[seat] == {'S': 0, 'H': 13, 'D': 0, 'C': 13, 'NT': 0}
+        assert par_from_table(table, 'N', 'None') == (1510, ['7SN', '7SS'])
+
+    @staticmethod
+    def _table(ns, ew):
+        return {seat: {strain: (ns if seat in 'NS' else ew).get(strain, 6)
+                       for strain in ('S', 'H', 'D', 'C', 'NT')}
+                for seat in 'NESW'}
+
+    def test_par_game(self):
+        assert par_from_table(self._table({'H': 10}, {}), 'N', 'None') == (420, ['4HN', '4HS'])
+        assert par_from_table(self._table({'H': 10}, {}), 'N', 'NS') == (620, ['4HN', '4HS'])
+
+    def test_par_pass_out(self):
+        assert par_from_table(self._table({}, {}), 'N', 'None') == (0, ['Pass'])
+
+    def test_par_sacrifice(self):
+        others = {'S': 3, 'D': 3, 'C': 3, 'NT': 3}
+        table = self._table(dict(others, H=10), dict(others, S=9, H=3))
+        assert par_from_table(table, 'N', 'None') == (100, ['4SxE', '4SxW'])
+
+
+class TestTimeLimit:
+    """Searches stop with SolverTimeout"""
+
+    def test_full_deal_times_out(self):
+        hands = {
+            'N': _cards("♠A ♠J ♠5 ♠2 ♥K ♥8 ♥4 ♦Q ♦9 ♦3 ♣T ♣6 ♣2"),
+            'E': _cards("♠K ♠9 ♠3 ♥Q ♥J ♥2 ♦A ♦8 ♦6 ♦4 ♣J ♣8 ♣5"),
+            'S': _cards("♠Q ♠8 ♠6 ♠4 ♥A ♥7 ♥3 ♦K ♦J ♦2 ♣A ♣Q ♣4"),
+            'W': _cards("♠T ♠7 ♥T ♥9 ♥6 ♥5 ♦T ♦7 ♦5 ♣K ♣9 ♣7 ♣3"),
+        }
+        with pytest.raises(SolverTimeout):
+            solve_board(hands, 'NT', 'W', time_limit=0.01)
+
+    def test_table_budget(self):
+        hands = {
+            'N': _cards("♠A ♠J ♠5 ♠2 ♥K ♥8 ♥4 ♦Q ♦9 ♦3 ♣T ♣6 ♣2"),
+            'E': _cards("♠K ♠9 ♠3 ♥Q ♥J ♥2 ♦A ♦8 ♦6 ♦4 ♣J ♣8 ♣5"),
+            'S': _cards("♠Q ♠8 ♠6 ♠4 ♥A ♥7 ♥3 ♦K ♦J ♦2 ♣A ♣Q ♣4"),
+            'W': _cards("♠T ♠7 ♥T ♥9 ♥6 ♥5 ♦T ♦7 ♦5 ♣K ♣9 ♣7 ♣3"),
+        }
+        start = time.monotonic()
+        with pytest.raises(SolverTimeout):
+            calc_dd_table(hands, time_limit=30, budget=0.5)
+        # The budget covers all 20 solves, not each one
+        assert time.monotonic() - start < 2
+
+
+class TestSolveSpeed:
+    """Positions the per-move limits are meant for solve within them"""
+
+    @pytest.mark.parametrize("seed", range(2))
+    def test_feedback_tricks_within_feedback_limit(self, seed):
+        from engine.feedback.play_feedback import (
+            FEEDBACK_SOLVER_TIME_LIMIT, FEEDBACK_SOLVER_MAX_TRICKS,
+        )
+
+        n = FEEDBACK_SOLVER_MAX_TRICKS
+        rng = random.Random(seed)
+        for _ in range(10):
+            cards = list(range(52))
+            rng.shuffle(cards)
+            hands = [sum(1 << bit for bit in cards[i * n:(i + 1) * n]) for i in range(4)]
+            solver = DoubleDummySolver(hands, rng.choice([NOTRUMP, 0, 1, 2, 3]),
+                                       time_limit=FEEDBACK_SOLVER_TIME_LIMIT)
+            # Raises SolverTimeout if too slow
+            solver.score_moves(rng.randrange(4), [])
+
+
+class TestFallbackConsumers:
+    """Double dummy features without endplay"""
+
+    def test_analysis_service(self):
+        from engine.play.dds_analysis import DDSAnalysisService, DDS_AVAILABLE
+        if DDS_AVAILABLE:
+            pytest.skip("endplay installed: the service uses DDS")
+
+        service = DDSAnalysisService()
+        assert service.backend == 'python'
+        assert service.is_available and not service.is_fast
+        ranks = 'AKQJT98765432'
+        hands = {seat: Hand([Card(rank, suit) for rank in ranks])
+                 for seat, suit in zip('NESW', '♠♥♦♣')}
+        analysis = service.analyze_deal(hands, dealer='N', vulnerability='None')
+        assert analysis.is_valid
+        assert analysis.dd_table.get_tricks('N', 'S') == 13
+        assert analysis.par_result.score == 1510
+
+    def test_solver_play_ai(self):
+        from engine.play.ai.solver_ai import SolverPlayAI
+        from tests.integration.play_test_helpers import create_test_deal, create_play_scenario
+
+        deal = create_test_deal(
+            north="♠AKQ ♥432 ♦AKQ2 ♣432",
+            east="♠432 ♥765 ♦765 ♣7654",
+            south="♠765 ♥AKQ ♦432 ♣AKQ8",
+            west="♠JT98 ♥JT98 ♦JT9 ♣J9"
+        )
+        state = create_play_scenario("3NT by S", deal, "None")
+        state.hands = {
+            'N': Hand(_cards("♠A ♠J ♥Q ♥3"), _skip_validation=True),
+            'E': Hand(_cards("♦5 ♦4 ♦3 ♦2"), _skip_validation=True),
+            'S': Hand(_cards("♣A ♥A ♥2 ♠2"), _skip_validation=True),
+            'W': Hand(_cards("♠K ♠Q ♥K ♥4"), _skip_validation=True),
+        }
+        ai = SolverPlayAI(time_limit=5)
+        assert ai.choose_card(state, 'S') in (Card('A', '♣'), Card('A', '♥'))
+        assert dict(ai.score_cards(state, 'S'))[Card('2', '♠')] == 3
+
+    def test_play_feedback_solves_only_late_tricks(self, monkeypatch):
+        from engine.feedback.play_feedback import PlayFeedbackGenerator
+        from engine.play.ai.solver_ai import SolverPlayAI
+        from tests.integration.play_test_helpers import create_test_deal, create_play_scenario
+
+        generator = PlayFeedbackGenerator(use_dds=True)
+        if not isinstance(generator._dds_ai, SolverPlayAI):
+            pytest.skip("endplay installed: feedback uses DDS")
+
+        deal = create_test_deal(
+            north="♠AKQ ♥432 ♦AKQ2 ♣432",
+            east="♠432 ♥765 ♦765 ♣7654",
+            south="♠765 ♥AKQ ♦432 ♣AKQ8",
+            west="♠JT98 ♥JT98 ♦JT9 ♣J9"
+        )
+        state = create_play_scenario("3NT by S", deal, "None")
+        monkeypatch.setattr(generator._dds_ai, '_build_solver',
+                            lambda *args: pytest.fail("solver used at trick 1"))
+
+        *_, source = generator._analyze_plays(state, 'W', Card('J', '♠'),
+                                              list(state.hands['W'].cards))
+        assert source == "heuristic"
+
+        monkeypatch.undo()
+        state.hands = {
+            'N': Hand(_cards("♠A ♠J ♥Q ♥3"), _skip_validation=True),
+            'E': Hand(_cards("♦5 ♦4 ♦3 ♦2"), _skip_validation=True),
+            'S': Hand(_cards("♣A ♥A ♥2 ♠2"), _skip_validation=True),
+            'W': Hand(_cards("♠K ♠Q ♥K ♥4"), _skip_validation=True),
+        }
+        state.tricks_won = {'N': 4, 'E': 1, 'S': 3, 'W': 1}
+        state.next_to_play = 'S'
+
+        optimal, user_tricks, optimal_tricks, source = generator._analyze_plays(
+            state, 'S', Card('2', '♠'), list(state.hands['S'].cards))
+        assert source == "dds"
+        assert set(optimal) == {Card('A', '♣'), Card('A', '♥')}
+        assert (user_tricks, optimal_tricks) == (3, 4)
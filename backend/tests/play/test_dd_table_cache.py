@@ -0,0 +1,136 @@
+"""
+Tests for the DD-table cache used by DDSAnalysisService
+
+Tests:
+- Canonical deal key (independent of the PBN's first seat)
+- LRU eviction with a size limit
+- Redis second tier shared between cache instances (fakeredis)
+- Service caches the DD table once per deal, independent of dealer/vulnerability
+"""
+
+import fakeredis
+import pytest
+
+from engine.hand import Hand
+from engine.play.dd_table_cache import DDTableCache, deal_key
+from engine.play.dds_analysis import DDSAnalysisService, is_dds_available
+
+
+PBN = "N:AKQ2.KJ3.T98.432 JT98.Q42.KJ4.987 765.AT9.AQ5.AKQJ 43.8765.7632.T65"
+TABLE = {'N': {'S': 9, 'H': 8, 'D': 7, 'C': 10, 'NT': 11}}
+
+
+class TestDealKey:
+    """Test canonical deal keys"""
+
+    def test_rotated_pbn_same_key(self):
+        rotated = "E:JT98.Q42.KJ4.987 765.AT9.AQ5.AKQJ 43.8765.7632.T65 AKQ2.KJ3.T98.432"
+        assert deal_key(rotated) == deal_key(PBN)
+
+    def test_different_deals_differ(self):
+        swapped = "N:JT98.Q42.KJ4.987 AKQ2.KJ3.T98.432 765.AT9.AQ5.AKQJ 43.8765.7632.T65"
+        assert deal_key(swapped) != deal_key(PBN)
+
+
+class TestLRU:
+    """Test the in-process tier"""
+
+    def test_hit_and_miss_counts(self):
+        cache = DDTableCache(max_size=4)
+        assert cache.get('a') is None
+        cache.put('a', TABLE)
+
+        assert cache.get('a') == TABLE
+        stats = cache.get_stats()
+        assert stats['cache_hits'] == 1
+        assert stats['cache_misses'] == 1
+        assert stats['cache_hit_rate'] == 0.5
+
+    def test_evicts_least_recently_used(self):
+        cache = DDTableCache(max_size=2)
+        cache.put('a', TABLE)
+        cache.put('b', TABLE)
+        cache.get('a')
+        cache.put('c', TABLE)
+
+        assert cache.get('b') is None
+        assert cache.get('a') == TABLE
+        assert len(cache) == 2
+        assert cache.get_stats()['cache_evictions'] == 1
+
+
+class TestRedisTier:
+    """Test the shared Redis tier"""
+
+    def test_shared_between_instances(self):
+        redis_client = fakeredis.FakeStrictRedis()
+        worker1 = DDTableCache(redis_client=redis_client)
+        worker2 = DDTableCache(redis_client=redis_client)
+
+        worker1.put('deal', TABLE)
+
+        assert worker2.get('deal') == TABLE
+        assert worker2.get_stats()['cache_redis_hits'] == 1
+        # Promoted into the local tier
+        assert worker2.get('deal') == TABLE
+        assert worker2.get_stats()['cache_local_hits'] == 1
+
+    def test_redis_failure_degrades_to_local(self):
+        class BrokenRedis:
+            def get(self, key):
+                raise ConnectionError("down")
+
+            def set(self, key, value, ex=None):
+                raise ConnectionError("down")
+
+        cache = DDTableCache(redis_client=BrokenRedis())
+        cache.put('deal', TABLE)
+
+        assert cache.get('deal') == TABLE
+        assert cache.get('other') is None
+        assert cache.get_stats()['redis_errors'] == 2
+
+
+@pytest.mark.skipif(not is_dds_available(), reason="DDS not available on this platform")
+class TestServiceCaching:
+    """Test DDSAnalysisService uses the DD-table cache"""
+
+    @pytest.fixture
+    def hands(self):
+        return {pos: Hand.from_pbn(segment)
+                for pos, segment in zip('NESW', PBN[2:].split())}
+
+    def test_table_reused_across_dealer_and_vulnerability(self, hands):
+        service = DDSAnalysisService()
+
+        first = service.analyze_deal(hands, dealer='N', vulnerability='None')
+        second = service.analyze_deal(hands, dealer='E', vulnerability='Both')
+
+        stats = service.get_stats()
+        assert stats['analyses'] == 1
+        assert stats['cache_hits'] == 1
+        assert first.dd_table.to_dict() == second.dd_table.to_dict()
+        assert second.dealer == 'E' and second.par_result is not None
+
+    def test_pbn_and_hands_share_entry(self, hands):
+        service = DDSAnalysisService()
+        service.analyze_deal(hands)
+        service.analyze_pbn("E:" + " ".join(PBN[2:].split()[1:] + PBN[2:].split()[:1]))
+
+        assert service.get_stats()['analyses'] == 1
+
+    def test_cached_table_not_mutable_by_callers(self, hands):
+        service = DDSAnalysisService()
+        first = service.analyze_deal(hands)
+        first.dd_table.table['N']['NT'] = 99
+
+        assert service.analyze_deal(hands).dd_table.get_tricks('N', 'NT') != 99
+
+    def test_par_matches_fresh_solve(self, hands):
+        cached = DDSAnalysisService()
+        cached.analyze_deal(hands, vulnerability='None')
+        from_cache = cached.analyze_deal(hands, dealer='S', vulnerability='NS')
+
+        fresh = DDSAnalysisService().analyze_deal(hands, dealer='S', vulnerability='NS')
+
+        assert from_cache.par_result.to_dict() == fresh.par_result.to_dict()
@@ -0,0 +1,94 @@
+"""
+Tests for DDSPlayAI card scoring
+
+Tests:
+- One solve_board call scores every legal card
+- Batched scoring matches scoring positions one at a time
+- choose_card picks a card with the best trick count
+- Position evaluation from solve_board matches the full DD table
+
+Note: These tests are skipped on platforms where DDS is not available (e.g., macOS M1/M2)
+"""
+
+import pytest
+from engine.hand import Card
+from engine.play.ai.dds_ai import DDSPlayAI, DDS_AVAILABLE
+from tests.integration.play_test_helpers import create_test_deal, create_play_scenario
+
+
+# Skip all tests if DDS not available
+pytestmark = pytest.mark.skipif(
+    not DDS_AVAILABLE,
+    reason="DDS not available on this platform (expected on macOS M1/M2)"
+)
+
+
+def _opening_state():
+    deal = create_test_deal(
+        north="♠AKQ2 ♥AKQ2 ♦AKQ ♣A2",
+        east="♠543 ♥543 ♦543 ♣6543",
+        south="♠876 ♥876 ♦8762 ♣T87",
+        west="♠JT9 ♥JT9 ♦JT9 ♣KQJ9"
+    )
+    return create_play_scenario("4♠ by N", deal, "None")
+
+
+@pytest.fixture
+def state():
+    return _opening_state()
+
+
+class TestScoreCards:
+    """Test solve_board-based card scoring"""
+
+    def test_scores_every_legal_card(self, state):
+        ai = DDSPlayAI()
+        scores = ai.score_cards(state, 'E')
+
+        assert len(scores) == 13
+        assert {card for card, _ in scores} == set(state.hands['E'].cards)
+        assert all(0 <= tricks <= 13 for _, tricks in scores)
+
+    def test_mid_trick_scores_follow_suit(self, state):
+        state.current_trick = [(Card('3', '♣'), 'E')]
+        state.hands['E'].cards.remove(Card('3', '♣'))
+        state.next_to_play = 'S'
+
+        scores = DDSPlayAI().score_cards(state, 'S')
+
+        assert {card for card, _ in scores} == {Card('T', '♣'), Card('8', '♣'), Card('7', '♣')}
+
+    def test_batch_matches_single(self, state):
+        mid_trick = _opening_state()
+        mid_trick.current_trick = [(Card('3', '♣'), 'E')]
+        mid_trick.hands['E'].cards.remove(Card('3', '♣'))
+        mid_trick.next_to_play = 'S'
+        ai = DDSPlayAI()
+
+        batch = ai.score_cards_batch([(state, 'E'), (mid_trick, 'S')])
+
+        assert batch == [ai.score_cards(state, 'E'), ai.score_cards(mid_trick, 'S')]
+
+    def test_choose_card_is_best_scoring(self, state):
+        ai = DDSPlayAI()
+        scores = dict(ai.score_cards(state, 'E'))
+
+        card = ai.choose_card(state, 'E')
+
+        assert scores[card] == max(scores.values())
+
+
+class TestPositionEvaluation:
+    """Test _evaluate_position_with_dds"""
+
+    def test_matches_dd_table_at_start(self, state):
+        from endplay.dds import calc_dd_table
+        from endplay.types import Deal, Denom, Player
+
+        ai = DDSPlayAI()
+        table = calc_dd_table(Deal(ai._get_pbn_string(state))).to_list()
+        declarer_tricks = table[0][0]  # to_list() strain order is ♠ ♥ ♦ ♣ NT; North
+
+        margin = ai._evaluate_position_with_dds(state, Denom.spades, Player.north)
+
+        assert margin == float(declarer_tricks - (13 - declarer_tricks))
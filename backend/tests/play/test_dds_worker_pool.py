@@ -0,0 +1,127 @@
+"""
+Unit tests for DDSWorkerPool (persistent DDS worker processes)
+
+Uses small stand-in tasks with the same contract as server._dds_worker
+(task(*args, result_queue) puts one result dict) so the tests do not
+need endplay:
+- Results come back from long-lived workers (same process reused)
+- A crashing worker is reported, counted and replaced
+- A worker that overruns the deadline is killed and replaced
+- Statistics report queue depth, crashes and latency
+"""
+
+import os
+import time
+
+import pytest
+
+from engine.play.ai.dds_worker_pool import DDSWorkerPool
+
+
+def _echo_task(value, result_queue):
+    result_queue.put({'status': 'success', 'value': value, 'pid': os.getpid()})
+
+
+def _crash_task(mode, result_queue):
+    if mode == 'crash':
+        os._exit(139)  # Simulate a segfault killing the worker
+    if mode == 'sleep':
+        time.sleep(10)
+    if mode == 'raise':
+        raise RuntimeError("solver failed")
+    result_queue.put({'status': 'success', 'pid': os.getpid()})
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def _make(task, **kwargs):
+        pool = DDSWorkerPool(task, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield _make
+    for pool in pools:
+        pool.shutdown()
+
+
+class TestWorkerReuse:
+    """Test that workers are long-lived"""
+
+    def test_result_returned(self, make_pool):
+        pool = make_pool(_echo_task, size=1)
+        result = pool.submit(42, timeout=10)
+
+        assert result['status'] == 'success'
+        assert result['value'] == 42
+
+    def test_same_worker_serves_consecutive_requests(self, make_pool):
+        pool = make_pool(_echo_task, size=1)
+        pids = {pool.submit(i, timeout=10)['pid'] for i in range(5)}
+
+        assert len(pids) == 1
+        assert os.getpid() not in pids
+
+    def test_task_exception_reported_as_error(self, make_pool):
+        pool = make_pool(_crash_task, size=1)
+        result = pool.submit('raise', timeout=10)
+
+        assert result['status'] == 'error'
+        assert 'solver failed' in result['error']
+        assert pool.submit('ok', timeout=10)['status'] == 'success'
+
+
+class TestCrashIsolation:
+    """Test crashed and stuck workers are replaced"""
+
+    def test_crash_reported_and_worker_restarted(self, make_pool):
+        pool = make_pool(_crash_task, size=1)
+        first_pid = pool.submit('ok', timeout=10)['pid']
+
+        result = pool.submit('crash', timeout=10)
+        assert result['status'] == 'crash'
+        assert result['exitcode'] == 139
+
+        after = pool.submit('ok', timeout=10)
+        assert after['status'] == 'success'
+        assert after['pid'] != first_pid
+
+        stats = pool.get_statistics()
+        assert stats['crashes'] == 1
+        assert stats['restarts'] == 1
+        assert stats['alive_workers'] == 1
+
+    def test_overrun_deadline_times_out(self, make_pool):
+        pool = make_pool(_crash_task, size=1)
+        start = time.monotonic()
+
+        result = pool.submit('sleep', timeout=0.5)
+
+        assert result['status'] == 'timeout'
+        assert time.monotonic() - start < 5
+        assert pool.submit('ok', timeout=10)['status'] == 'success'
+        assert pool.get_statistics()['timeouts'] == 1
+
+
+class TestStatistics:
+    """Test pool statistics"""
+
+    def test_counters_and_latency(self, make_pool):
+        pool = make_pool(_echo_task, size=2, max_queue=8)
+        for i in range(4):
+            pool.submit(i, timeout=10)
+
+        stats = pool.get_statistics()
+        assert stats['size'] == 2
+        assert stats['submitted'] == stats['completed'] == 4
+        assert stats['queue_depth'] == 0
+        assert stats['latency_ms']['count'] == 4
+        assert stats['latency_ms']['p50'] >= 0
+
+    def test_shut_down_pool_rejects(self, make_pool):
+        pool = make_pool(_echo_task, size=1)
+        pool.submit(1, timeout=10)
+        pool.shutdown()
+
+        assert pool.submit(2, timeout=10)['status'] == 'rejected'
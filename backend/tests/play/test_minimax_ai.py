@@ -7,6 +7,7 @@ Tests the minimax algorithm with alpha-beta pruning:
 - Alpha-beta pruning efficiency
 - Statistics tracking
 - Difficulty levels
+- Iterative deepening under a time budget
 """
 
 import pytest
@@ -326,6 +327,54 @@ class TestMinimaxWithTrump:
         assert state.contract.trump_suit == '♥'
 
 
+class TestMinimaxIterativeDeepening:
+    """Test anytime search with a per-move time budget"""
+
+    def _state(self):
+        deal = create_test_deal(
+            north="♠AKQ2 ♥AKQ2 ♦AKQ ♣A2",
+            east="♠543 ♥543 ♦543 ♣5432",
+            south="♠876 ♥876 ♦8762 ♣876",
+            west="♠JT9 ♥JT9 ♦JT9 ♣KQJ9"
+        )
+        return create_play_scenario("4♠ by N", deal, "None")
+
+    def test_ample_budget_matches_fixed_depth(self):
+        """With enough time, iterative deepening picks the fixed-depth card"""
+        state = self._state()
+
+        fixed = MinimaxPlayAI(max_depth=4)
+        anytime = MinimaxPlayAI(max_depth=4, time_budget_ms=60000)
+
+        assert anytime.choose_card(state, 'E') == fixed.choose_card(state, 'E')
+        assert anytime.get_statistics()['completed_depth'] == 4
+        assert anytime.best_score == fixed.best_score
+
+    def test_exhausted_budget_returns_shallower_result(self):
+        """A tiny budget still returns a legal card from a completed iteration"""
+        state = self._state()
+
+        ai = MinimaxPlayAI(max_depth=12, time_budget_ms=1)
+        card = ai.choose_card(state, 'E')
+        stats = ai.get_statistics()
+
+        assert card in state.hands['E'].cards
+        assert 1 <= stats['completed_depth'] < 12
+        assert stats['time_budget_ms'] == 1
+        assert stats['time'] < 1.0
+
+    def test_timeout_leaves_play_state_untouched(self):
+        """Abandoning an iteration does not leak moves into the caller's state"""
+        state = self._state()
+        cards_before = {p: list(h.cards) for p, h in state.hands.items()}
+
+        ai = MinimaxPlayAI(max_depth=12, time_budget_ms=1)
+        ai.choose_card(state, 'E')
+
+        assert {p: list(h.cards) for p, h in state.hands.items()} == cards_before
+        assert state.current_trick == []
+
+
 class TestMinimaxPerformance:
     """Test performance characteristics"""
 
@@ -0,0 +1,153 @@
+"""
+Unit tests for SearchPosition (make/unmake play state used by minimax)
+
+Tests:
+- play() updates hands, current trick, trick winner and tricks won in place
+- undo() restores the exact previous position
+- Evaluation on a SearchPosition matches evaluation on the equivalent PlayState
+- MinimaxPlayAI leaves the caller's PlayState untouched
+"""
+
+import copy
+import pytest
+from engine.hand import Card
+from engine.play_engine import PlayEngine
+from engine.play.ai.evaluation import PositionEvaluator
+from engine.play.ai.minimax_ai import MinimaxPlayAI
+from engine.play.ai.search_position import SearchPosition
+from tests.integration.play_test_helpers import create_test_deal, create_play_scenario
+
+
+@pytest.fixture
+def state():
+    deal = create_test_deal(
+        north="♠AKQ2 ♥AKQ2 ♦AKQ ♣A2",
+        east="♠543 ♥543 ♦543 ♣5432",
+        south="♠876 ♥876 ♦8762 ♣876",
+        west="♠JT9 ♥JT9 ♦JT9 ♣KQJ9"
+    )
+    return create_play_scenario("4♠ by N", deal, "None")
+
+
+def _snapshot(pos: SearchPosition):
+    return (
+        {p: list(h.cards) for p, h in pos.hands.items()},
+        list(pos.current_trick),
+        dict(pos.tricks_won),
+        pos.next_to_play,
+        pos.tricks_played,
+        {p: {s: list(c) for s, c in g.items()} for p, g in pos.card_index.by_pos.items()},
+        {side: {s: list(c) for s, c in g.items()} for side, g in pos.card_index.by_side.items()},
+    )
+
+
+class TestPlayAndUndo:
+    """Test in-place make/unmake"""
+
+    def test_play_removes_card_and_advances_player(self, state):
+        pos = SearchPosition.from_play_state(state)
+        assert pos.next_to_play == 'E'
+
+        pos.play(Card('5', '♣'))
+
+        assert Card('5', '♣') not in pos.hands['E'].cards
+        assert pos.current_trick == [(Card('5', '♣'), 'E')]
+        assert pos.next_to_play == 'S'
+        # Original PlayState is untouched
+        assert Card('5', '♣') in state.hands['E'].cards
+        assert state.current_trick == []
+
+    def test_completed_trick_awards_winner(self, state):
+        pos = SearchPosition.from_play_state(state)
+        for card in [Card('5', '♣'), Card('6', '♣'), Card('K', '♣'), Card('A', '♣')]:
+            winner = pos.play(card)
+
+        assert winner == 'N'
+        assert pos.tricks_won['N'] == 1
+        assert pos.tricks_played == 1
+        assert pos.current_trick == []
+        assert pos.next_to_play == 'N'
+
+    def test_ruff_wins_trick(self, state):
+        # North is void in clubs
+        pos = SearchPosition(state.contract,
+                             {p: [c for c in h.cards if not (p == 'N' and c.suit == '♣')]
+                              for p, h in state.hands.items()},
+                             [], state.tricks_won, 'E')
+
+        pos.play(Card('5', '♣'))
+        pos.play(Card('6', '♣'))
+        pos.play(Card('K', '♣'))
+        winner = pos.play(Card('2', '♠'))
+
+        assert winner == 'N'
+
+    def test_undo_restores_exact_position(self, state):
+        pos = SearchPosition.from_play_state(state)
+        before = _snapshot(pos)
+
+        plays = []
+        for _ in range(9):
+            card = pos.legal_cards()[-1]
+            pos.play(card)
+            plays.append(card)
+        assert pos.depth == 9
+
+        for card in reversed(plays):
+            assert pos.undo() == card
+
+        assert _snapshot(pos) == before
+        assert pos.depth == 0
+
+    def test_legal_cards_follow_suit(self, state):
+        pos = SearchPosition.from_play_state(state)
+        pos.play(Card('5', '♣'))
+
+        legal = pos.legal_cards()
+
+        assert legal == [Card('8', '♣'), Card('7', '♣'), Card('6', '♣')]
+
+
+class TestSearchIntegration:
+    """Test SearchPosition together with evaluator and minimax"""
+
+    def test_evaluation_matches_play_state(self, state):
+        evaluator = PositionEvaluator()
+        pos = SearchPosition.from_play_state(state)
+        pos.play(Card('5', '♣'))
+        pos.play(Card('6', '♣'))
+
+        # Equivalent PlayState built the slow way
+        expected_state = copy.deepcopy(state)
+        for card, player in [(Card('5', '♣'), 'E'), (Card('6', '♣'), 'S')]:
+            expected_state.hands[player].cards.remove(card)
+            expected_state.current_trick.append((card, player))
+        expected_state.next_to_play = 'W'
+
+        for perspective in PlayEngine.POSITIONS:
+            assert evaluator.evaluate(pos, perspective) == \
+                evaluator.evaluate(expected_state, perspective)
+
+    def test_bitmask_position_matches_play_state(self, state):
+        evaluator = PositionEvaluator()
+        masks = {p: h.to_bitmask() for p, h in state.hands.items()}
+
+        from_masks = SearchPosition.from_bitmasks(state.contract, masks, 'E')
+        from_state = SearchPosition.from_play_state(state)
+
+        assert from_masks.legal_cards() == from_state.legal_cards()
+        for perspective in PlayEngine.POSITIONS:
+            assert evaluator.evaluate(from_masks, perspective) == \
+                evaluator.evaluate(from_state, perspective)
+
+    def test_minimax_does_not_mutate_play_state(self, state):
+        before = copy.deepcopy(state)
+
+        ai = MinimaxPlayAI(max_depth=3)
+        card = ai.choose_card(state, 'E')
+
+        assert card in state.hands['E'].cards
+        assert state.hands['E'].cards == before.hands['E'].cards
+        assert state.current_trick == before.current_trick
+        assert state.tricks_won == before.tricks_won
+        assert state.next_to_play == before.next_to_play
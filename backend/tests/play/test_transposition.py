@@ -0,0 +1,177 @@
+"""
+Unit tests for the minimax transposition table
+
+Tests:
+- Zobrist key is maintained incrementally by SearchPosition.play()/undo()
+- Transposed card orders reach the same key
+- Replacement policy of the bounded table
+- MinimaxPlayAI picks the same cards with and without the table and
+  reports hit/miss/size counters
+- The discard tie-break picks the same card whatever the table holds
+"""
+
+import pytest
+from engine.hand import Card
+from engine.play.ai.minimax_ai import MinimaxPlayAI
+from engine.play.ai.search_position import SearchPosition
+from engine.play.ai.transposition import TranspositionTable, EXACT, LOWER
+from tests.integration.play_test_helpers import create_test_deal, create_play_scenario
+
+
+@pytest.fixture
+def state():
+    deal = create_test_deal(
+        north="♠AKQ2 ♥AKQ2 ♦AKQ ♣A2",
+        east="♠543 ♥543 ♦543 ♣5432",
+        south="♠876 ♥876 ♦8762 ♣876",
+        west="♠JT9 ♥JT9 ♦JT9 ♣KQJ9"
+    )
+    return create_play_scenario("4♠ by N", deal, "None")
+
+
+def _fresh_key(pos: SearchPosition) -> int:
+    """Key of an equivalent position built from scratch"""
+    return SearchPosition(pos.contract, {p: h.cards for p, h in pos.hands.items()},
+                          pos.current_trick, pos.tricks_won, pos.next_to_play).key
+
+
+class TestZobristKey:
+    """Test incremental hashing"""
+
+    def test_incremental_key_matches_fresh_key(self, state):
+        pos = SearchPosition.from_play_state(state)
+        for _ in range(10):
+            pos.play(pos.legal_cards()[0])
+            assert pos.key == _fresh_key(pos)
+
+    def test_undo_restores_key(self, state):
+        pos = SearchPosition.from_play_state(state)
+        start = pos.key
+        for _ in range(6):
+            pos.play(pos.legal_cards()[-1])
+        for _ in range(6):
+            pos.undo()
+        assert pos.key == start
+
+    def test_transposed_tricks_share_key(self, state):
+        # Same eight cards, clubs and hearts tricks in either order
+        clubs = [Card('5', '♣'), Card('6', '♣'), Card('9', '♣'), Card('A', '♣')]
+        hearts = [Card('3', '♥'), Card('6', '♥'), Card('9', '♥'), Card('A', '♥')]
+
+        first = SearchPosition.from_play_state(state)
+        for card in clubs + [hearts[3]] + hearts[:3]:
+            first.play(card)
+
+        second = SearchPosition.from_play_state(state)
+        for card in hearts + [clubs[3]] + clubs[:3]:
+            second.play(card)
+
+        assert first.next_to_play == second.next_to_play == 'N'
+        assert first.key == second.key
+        assert first.key != SearchPosition.from_play_state(state).key
+
+
+class TestTranspositionTable:
+    """Test the bounded table"""
+
+    def test_store_and_probe(self):
+        tt = TranspositionTable(16)
+        tt.new_search()
+        tt.store(12345, depth=3, flag=EXACT, value=1.5, best_move=Card('A', '♠'), side=1)
+
+        assert tt.probe(12345) == (3, EXACT, 1.5, Card('A', '♠'), 1)
+        assert tt.probe(54321) is None
+        assert len(tt) == 1
+
+    def test_size_rounds_up_to_power_of_two(self):
+        assert TranspositionTable(1000).capacity == 1024
+
+    def test_deeper_entry_kept_within_same_search(self):
+        tt = TranspositionTable(16)
+        tt.new_search()
+        tt.store(1, depth=4, flag=EXACT, value=1.0, best_move=None)
+        tt.store(17, depth=2, flag=LOWER, value=2.0, best_move=None)  # same slot
+
+        assert tt.probe(1) is not None
+        assert tt.probe(17) is None
+
+    def test_older_generation_replaced(self):
+        tt = TranspositionTable(16)
+        tt.new_search()
+        tt.store(1, depth=4, flag=EXACT, value=1.0, best_move=None)
+        tt.new_search()
+        tt.store(17, depth=2, flag=LOWER, value=2.0, best_move=None)
+
+        assert tt.probe(1) is None
+        assert tt.probe(17) == (2, LOWER, 2.0, None, 0)
+        assert len(tt) == 1
+
+
+class TestMinimaxWithTable:
+    """Test the table inside MinimaxPlayAI"""
+
+    def test_same_choice_with_and_without_table(self, state):
+        with_tt = MinimaxPlayAI(max_depth=3)
+        without_tt = MinimaxPlayAI(max_depth=3, tt_size=0)
+
+        assert with_tt.choose_card(state, 'E') == without_tt.choose_card(state, 'E')
+        assert with_tt.best_score == without_tt.best_score
+
+    def test_statistics_report_table_counters(self, state):
+        ai = MinimaxPlayAI(max_depth=3)
+        ai.choose_card(state, 'E')
+        stats = ai.get_statistics()
+
+        assert stats['tt_misses'] > 0
+        assert 0 < stats['tt_size'] <= stats['tt_capacity']
+
+    def test_repeated_position_hits_table(self, state):
+        ai = MinimaxPlayAI(max_depth=3)
+        card = ai.choose_card(state, 'E')
+        first_nodes = ai.nodes_searched
+
+        assert ai.choose_card(state, 'E') == card
+        assert ai.tt_hits > 0
+        assert ai.nodes_searched < first_nodes
+
+    def test_deeper_entries_answer_shallower_searches(self, state):
+        ai = MinimaxPlayAI(max_depth=4)
+        ai.choose_card(state, 'E')
+        ai.max_depth = 3
+        ai.choose_card(state, 'E')
+
+        fresh = MinimaxPlayAI(max_depth=3)
+        fresh.choose_card(state, 'E')
+        assert ai.tt_hits > 0
+        assert ai.nodes_searched < fresh.nodes_searched
+
+    def test_discard_tiebreak_ignores_warmed_table(self):
+        # East is void in clubs; a deeper search of the same position
+        # leaves entries the depth-0 tie-break pass must not read
+        def discard_state():
+            deal = create_test_deal(
+                north="♠KJ6 ♥2 ♦T653 ♣JT982",
+                east="♠Q4 ♥A97654 ♦AKJ92",
+                south="♠A8752 ♥KQT8 ♦4 ♣AQ4",
+                west="♠T93 ♥J3 ♦Q87 ♣K7653"
+            )
+            state = create_play_scenario("4♠ by N", deal, "None")
+            state.hands['N'].cards.remove(Card('J', '♣'))
+            state.current_trick = [(Card('J', '♣'), 'N')]
+            state.next_to_play = 'E'
+            return state
+
+        warmed = MinimaxPlayAI(max_depth=4)
+        warmed.choose_card(discard_state(), 'E')
+        warmed.max_depth = 2
+
+        fresh = MinimaxPlayAI(max_depth=2)
+        assert (warmed.choose_card(discard_state(), 'E')
+                == fresh.choose_card(discard_state(), 'E'))
+
+    def test_table_disabled(self, state):
+        ai = MinimaxPlayAI(max_depth=2, tt_size=0)
+        ai.choose_card(state, 'E')
+        stats = ai.get_statistics()
+
+        assert stats['tt_hits'] == stats['tt_misses'] == stats['tt_size'] == 0
@@ -24,6 +24,7 @@ from engine.feedback.bidding_feedback import (
     BiddingFeedback, BiddingFeedbackGenerator, CorrectnessLevel, ImpactLevel,
     get_feedback_generator
 )
+from core.telemetry_writer import get_telemetry_writer
 
 
 # Use a unique user_id for test isolation
@@ -84,6 +85,7 @@ def test_evaluate_bid_stores_non_pass_bids():
             session_id=None,
             hand_analysis_id=None
         )
+        assert get_telemetry_writer().flush(), "Queued feedback should be written"
 
         # Verify bid was stored in database
         with get_connection() as conn:
@@ -150,6 +152,7 @@ def test_evaluate_bid_with_various_bids():
                 session_id=None,
                 hand_analysis_id=None
             )
+        assert get_telemetry_writer().flush(), "Queued feedback should be written"
 
         # Verify all bids stored
         with get_connection() as conn:
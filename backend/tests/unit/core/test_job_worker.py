@@ -0,0 +1,210 @@
+"""
+Unit tests for the background job worker.
+
+The queue is an in-memory stand-in for JobQueue, so no database is required.
+"""
+import sys
+import threading
+
+sys.path.insert(0, 'backend')
+
+import core.job_worker as job_worker
+from core.job_queue import Job, retry_delay, RETRY_MAX_SECONDS
+from core.job_worker import JobWorker, run_in_process_if_no_worker
+
+
+class FakeQueue:
+    """Stands in for JobQueue: hands out jobs and records outcomes."""
+
+    def __init__(self, jobs=(), live_worker=False):
+        self.jobs = list(jobs)
+        self.completed = []
+        self.failed = []
+        self.heartbeats = []
+        self.workers = {}
+        self.removed = []
+        self.live_worker = live_worker
+
+    def claim(self, worker_id, kinds=None, lease=None):
+        for job in self.jobs:
+            if kinds is None or job.kind in kinds:
+                self.jobs.remove(job)
+                return job
+        return None
+
+    def complete(self, job):
+        self.completed.append(job.id)
+        return True
+
+    def fail(self, job, error, retry=True):
+        status = 'queued' if retry and not job.is_last_attempt else 'failed'
+        self.failed.append((job.id, error, status))
+        return status
+
+    def heartbeat(self, job, done=None, total=None):
+        self.heartbeats.append((job.id, done, total))
+        return True
+
+    def fail_abandoned(self, lease=None):
+        return 0
+
+    def worker_heartbeat(self, worker_id, kinds=None):
+        self.workers[worker_id] = kinds
+
+    def remove_worker(self, worker_id):
+        self.removed.append(worker_id)
+
+    def has_live_worker(self, kind, max_age=None):
+        return self.live_worker
+
+
+def _worker(queue, handlers, **kwargs):
+    return JobWorker(queue, handlers, worker_id='test', lease=60, poll_interval=0.01, **kwargs)
+
+
+class TestRetryDelay:
+    def test_backs_off_exponentially(self):
+        assert retry_delay(1) < retry_delay(2) < retry_delay(3)
+        assert retry_delay(2) == 2 * retry_delay(1)
+
+    def test_is_capped(self):
+        assert retry_delay(50) == RETRY_MAX_SECONDS
+
+
+class TestJobWorker:
+    def test_no_job_returns_false(self):
+        assert _worker(FakeQueue(), {}).run_once() is False
+
+    def test_successful_job_is_completed(self):
+        seen = []
+        queue = FakeQueue([Job(id=1, kind='echo', payload={'x': 1})])
+        worker = _worker(queue, {'echo': lambda payload, progress: seen.append(payload)})
+
+        assert worker.run_once() is True
+        assert seen == [{'x': 1}]
+        assert queue.completed == [1]
+        assert worker.stats['completed'] == 1
+
+    def test_failed_job_is_retried_until_last_attempt(self):
+        def boom(payload, progress):
+            raise ValueError("no DDS")
+
+        queue = FakeQueue([
+            Job(id=1, kind='boom', attempts=1, max_attempts=3),
+            Job(id=2, kind='boom', attempts=3, max_attempts=3),
+        ])
+        worker = _worker(queue, {'boom': boom})
+        worker.run_once()
+        worker.run_once()
+
+        assert [(job_id, status) for job_id, _, status in queue.failed] == [
+            (1, 'queued'), (2, 'failed')
+        ]
+        assert 'no DDS' in queue.failed[0][1]
+        assert worker.stats['retried'] == 1 and worker.stats['failed'] == 1
+        assert queue.completed == []
+
+    def test_unknown_kind_fails_without_retry(self):
+        queue = FakeQueue([Job(id=7, kind='mystery', attempts=1, max_attempts=3)])
+        _worker(queue, {}).run_once()
+
+        assert queue.failed[0][0] == 7
+        assert queue.failed[0][2] == 'failed'
+
+    def test_progress_is_reported_through_heartbeat(self):
+        def handler(payload, progress):
+            progress(0, 2)
+            progress(2, 2)
+
+        queue = FakeQueue([Job(id=3, kind='work')])
+        _worker(queue, {'work': handler}).run_once()
+
+        assert (3, 0, 2) in queue.heartbeats
+        assert (3, 2, 2) in queue.heartbeats
+        assert queue.completed == [3]
+
+    def test_only_claims_requested_kinds(self):
+        queue = FakeQueue([Job(id=1, kind='other')])
+        worker = _worker(queue, {'other': lambda p, progress: None}, kinds=['mine'])
+
+        assert worker.run_once() is False
+        assert len(queue.jobs) == 1
+
+    def test_drain_runs_until_queue_empty(self):
+        queue = FakeQueue([Job(id=i, kind='echo') for i in range(5)])
+        worker = _worker(queue, {'echo': lambda p, progress: None})
+
+        worker.run(threading.Event(), drain=True)
+
+        assert queue.completed == [0, 1, 2, 3, 4]
+
+    def test_run_stops_when_event_set(self):
+        stop = threading.Event()
+        worker = _worker(FakeQueue(), {})
+        thread = threading.Thread(target=worker.run, args=(stop,))
+        thread.start()
+        stop.set()
+        thread.join(2)
+        assert not thread.is_alive()
+
+
+    def test_run_registers_and_removes_worker(self):
+        stop = threading.Event()
+        queue = FakeQueue()
+        worker = _worker(queue, {}, kinds=['echo'])
+        thread = threading.Thread(target=worker.run, args=(stop,))
+        thread.start()
+        stop.set()
+        thread.join(2)
+
+        assert queue.workers == {'test': ['echo']}
+        assert queue.removed == ['test']
+
+    def test_drain_does_not_register_worker(self):
+        queue = FakeQueue([Job(id=1, kind='echo')])
+        _worker(queue, {'echo': lambda p, progress: None}).run(threading.Event(), drain=True)
+
+        assert queue.workers == {}
+
+
+class TestInProcessFallback:
+    def _run(self, monkeypatch, queue):
+        seen = []
+        monkeypatch.setattr(job_worker, 'load_handlers',
+                            lambda: {'echo': lambda payload, progress: seen.append(payload)})
+        inline = run_in_process_if_no_worker('echo', queue)
+        for thread in threading.enumerate():
+            if thread.name == 'inline-echo-jobs':
+                thread.join(2)
+        return inline, seen
+
+    def test_runs_jobs_without_live_worker(self, monkeypatch):
+        queue = FakeQueue([Job(id=1, kind='echo', payload={'x': 1}), Job(id=2, kind='other')])
+
+        inline, seen = self._run(monkeypatch, queue)
+
+        assert inline is True
+        assert seen == [{'x': 1}]
+        assert queue.completed == [1]
+        assert [job.id for job in queue.jobs] == [2]
+        assert queue.workers == {}
+
+    def test_leaves_jobs_to_live_worker(self, monkeypatch):
+        queue = FakeQueue([Job(id=1, kind='echo')], live_worker=True)
+
+        inline, seen = self._run(monkeypatch, queue)
+
+        assert inline is False
+        assert seen == [] and len(queue.jobs) == 1
+
+    def test_runs_jobs_when_liveness_unknown(self, monkeypatch):
+        queue = FakeQueue([Job(id=1, kind='echo')])
+
+        def missing_table(kind, max_age=None):
+            raise RuntimeError('relation "job_workers" does not exist')
+        queue.has_live_worker = missing_table
+
+        inline, seen = self._run(monkeypatch, queue)
+
+        assert inline is True
+        assert queue.completed == [1]
@@ -8,6 +8,8 @@ No database or Flask required — uses fakeredis for in-memory Redis emulation.
 """
 import sys
 import json
+import threading
+import time
 import pytest
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
@@ -754,6 +756,125 @@ class TestOCCMutateRoom:
                 room.game_phase = 'bidding'
 
 
+# ===========================================================================
+# RoomStateManager — Heartbeats and long-poll
+# ===========================================================================
+
+class TestHeartbeatStore:
+
+    def test_heartbeat_does_not_rewrite_room(self, fake_redis):
+        mgr = RoomStateManager(redis_client=fake_redis)
+        code = mgr.create_room('host-1')
+        before = fake_redis.get(f'room:{code}')
+
+        mgr.record_heartbeat(code, 'host-1')
+
+        assert fake_redis.get(f'room:{code}') == before
+        assert fake_redis.hget(f'room_heartbeat:{code}', 'host-1')
+        assert 0 < fake_redis.ttl(f'room_heartbeat:{code}') <= ROOM_TTL
+
+    def test_heartbeats_merged_into_loaded_room(self, manager):
+        code = manager.create_room('host-1')
+        manager.join_room(code, 'guest-1')
+        manager.record_heartbeat(code, 'guest-1')
+
+        assert 'guest-1' in manager.get_room(code).last_seen
+        with manager.mutate_room(code) as room:
+            assert 'guest-1' in room.last_seen
+
+    def test_stale_partner_revived_by_heartbeat(self, manager):
+        code = manager.create_room('host-1')
+        manager.join_room(code, 'guest-1')
+        old_time = datetime.now() - timedelta(seconds=RoomState.DISCONNECT_TIMEOUT + 10)
+        with manager.mutate_room(code) as room:
+            room.last_seen['guest-1'] = old_time.isoformat()
+        assert manager.get_room(code).is_partner_disconnected('host-1')
+
+        manager.record_heartbeat(code, 'guest-1')
+        assert not manager.get_room(code).is_partner_disconnected('host-1')
+
+    def test_host_leave_deletes_heartbeats(self, fake_redis):
+        mgr = RoomStateManager(redis_client=fake_redis)
+        code = mgr.create_room('host-1')
+        mgr.record_heartbeat(code, 'host-1')
+        mgr.leave_room('host-1')
+        assert fake_redis.exists(f'room_heartbeat:{code}') == 0
+
+
+class TestWaitForChange:
+
+    def test_returns_at_once_if_version_already_newer(self, manager):
+        code = manager.create_room('host-1')
+        manager.update_room(code, game_phase='bidding')
+
+        start = time.monotonic()
+        room = manager.wait_for_change(code, known_version=0, timeout=5)
+        assert room.version == 1
+        assert time.monotonic() - start < 1
+
+    def test_times_out_with_unchanged_room(self, manager):
+        code = manager.create_room('host-1')
+        room = manager.wait_for_change(code, known_version=0, timeout=0.2)
+        assert room is not None
+        assert room.version == 0
+
+    def test_wakes_on_commit_from_another_writer(self, manager):
+        code = manager.create_room('host-1')
+        timer = threading.Timer(0.2, manager.update_room, args=(code,),
+                                kwargs={'game_phase': 'bidding'})
+        timer.start()
+        try:
+            start = time.monotonic()
+            room = manager.wait_for_change(code, known_version=0, timeout=5)
+        finally:
+            timer.join()
+        assert room.version == 1
+        assert room.game_phase == 'bidding'
+        assert time.monotonic() - start < 4
+
+    def test_returns_none_when_room_closes(self, manager):
+        code = manager.create_room('host-1')
+        timer = threading.Timer(0.2, manager.leave_room, args=('host-1',))
+        timer.start()
+        try:
+            assert manager.wait_for_change(code, known_version=0, timeout=5) is None
+        finally:
+            timer.join()
+
+
+class TestWatchRoom:
+
+    def test_current_room_first_when_version_unknown(self, manager):
+        code = manager.create_room('host-1')
+        stream = manager.watch_room(code, known_version=-1, duration=1)
+        assert next(stream).version == 0
+        stream.close()
+
+    def test_pushes_each_commit_then_ends_when_room_closes(self, manager):
+        code = manager.create_room('host-1')
+        timers = [
+            threading.Timer(0.1, manager.update_room, args=(code,), kwargs={'game_phase': 'bidding'}),
+            threading.Timer(0.3, manager.update_room, args=(code,), kwargs={'dealer': 'East'}),
+            threading.Timer(0.5, manager.leave_room, args=('host-1',)),
+        ]
+        for t in timers:
+            t.start()
+        try:
+            rooms = [r for r in manager.watch_room(code, known_version=0, duration=5, tick=5)]
+        finally:
+            for t in timers:
+                t.join()
+        assert [r.version for r in rooms] == [1, 2]
+        assert rooms[-1].dealer == 'East'
+
+    def test_idle_ticks_and_duration_limit(self, manager):
+        code = manager.create_room('host-1')
+        start = time.monotonic()
+        events = list(manager.watch_room(code, known_version=0, duration=0.5, tick=0.2))
+        assert events and all(e is None for e in events)
+        assert time.monotonic() - start < 2
+
+
 # ===========================================================================
 # RoomState — to_dict waiting_for logic
 # ===========================================================================
@@ -0,0 +1,232 @@
+"""
+Unit tests for Redis-backed solo session state (RedisSessionStateManager).
+
+Covers SessionState storage round-trips, sharing state between managers
+(stand-ins for gunicorn workers), optimistic concurrency and the
+per-process read-through cache, and the 409 a request gets when its
+session save loses the race.
+
+No database or Flask required — uses fakeredis for in-memory Redis emulation.
+"""
+import json
+import os
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+# core.session_state imports GameSession, whose module imports db
+if not os.environ.get('DATABASE_URL'):
+    pytest.skip("DATABASE_URL not set — requires PostgreSQL", allow_module_level=True)
+
+from core.session_state import (
+    SessionState, SessionStateManager, RedisSessionStateManager,
+    SessionConflictError, SESSION_TTL,
+)
+from engine.hand import Hand
+from engine.play_engine import PlayState, Contract
+from engine.session_manager import GameSession
+
+
+@pytest.fixture
+def fake_redis():
+    return fakeredis.FakeRedis(decode_responses=True)
+
+
+@pytest.fixture
+def workers(fake_redis):
+    """Two managers sharing one Redis, like two gunicorn workers."""
+    return (RedisSessionStateManager(redis_client=fake_redis),
+            RedisSessionStateManager(redis_client=fake_redis))
+
+
+def _deal():
+    return {
+        'North': Hand.from_pbn('AKQ32.KQ8.A95.74'),
+        'East': Hand.from_pbn('J98.AT7.KQJ3.KQ8'),
+        'South': Hand.from_pbn('T764.J65.T84.A53'),
+        'West': Hand.from_pbn('5.9432.762.JT962'),
+    }
+
+
+def _playing_state(session_id='s1'):
+    state = SessionState(session_id=session_id)
+    state.deal = _deal()
+    state.original_deal = _deal()
+    state.vulnerability = 'NS'
+    state.dealer = 'East'
+    state.auction_history = ['1NT', 'Pass', '3NT', 'Pass', 'Pass', 'Pass']
+    state.hand_start_time = datetime(2026, 1, 5, 12, 30)
+    state.bid_context.forcing.update('GAME_FORCE', 'stayman_gf')
+    state.bid_context.last_auction = ['1NT', 'Pass']
+    state.game_session = GameSession(id=7, user_id=3, hands_completed=2, ns_score=620)
+    state.play_state = PlayState(
+        contract=Contract(level=3, strain='NT', declarer='E'),
+        hands=dict(state.deal),
+        current_trick=[],
+        tricks_won={'N': 0, 'E': 0, 'S': 0, 'W': 0},
+        trick_history=[],
+        next_to_play='S',
+        dummy_revealed=False,
+    )
+    return state
+
+
+class TestStorageRoundTrip:
+
+    def test_full_state_survives_storage(self):
+        state = _playing_state()
+        restored = SessionState.from_storage_dict(
+            json.loads(json.dumps(state.to_storage_dict()))
+        )
+
+        assert restored.to_storage_dict() == state.to_storage_dict()
+        assert restored.deal['North'].to_pbn() == state.deal['North'].to_pbn()
+        assert restored.play_state.contract.declarer == 'E'
+        assert restored.game_session.ns_score == 620
+        assert restored.bid_context.forcing.state.is_game_forced
+        assert restored.hand_start_time == state.hand_start_time
+
+    def test_empty_state_survives_storage(self):
+        state = SessionState(session_id='new')
+        restored = SessionState.from_storage_dict(state.to_storage_dict())
+        assert restored.deal == {'North': None, 'East': None, 'South': None, 'West': None}
+        assert restored.play_state is None
+        assert restored.game_session is None
+
+    def test_database_loaded_game_session_survives_storage(self, workers):
+        # psycopg2 returns TIMESTAMP columns as datetime
+        a, b = workers
+        state = a.get_or_create('s1')
+        state.game_session = GameSession(
+            id=7, started_at=datetime(2026, 1, 5, 12, 0),
+            completed_at=datetime(2026, 1, 5, 13, 15, 30),
+        )
+        a.save(state)
+
+        restored = b.get('s1').game_session
+        assert restored.started_at == datetime(2026, 1, 5, 12, 0)
+        assert restored.completed_at == datetime(2026, 1, 5, 13, 15, 30)
+
+
+class TestSharedAcrossWorkers:
+
+    def test_state_saved_by_one_worker_is_seen_by_another(self, workers):
+        a, b = workers
+        state = a.get_or_create('s1')
+        state.deal = _deal()
+        state.auction_history = ['1♠']
+        a.save(state)
+
+        other = b.get('s1')
+        assert other is not None
+        assert other.auction_history == ['1♠']
+        assert other.deal['South'].to_pbn() == state.deal['South'].to_pbn()
+
+    def test_unsaved_session_is_local(self, workers):
+        a, b = workers
+        assert a.get_or_create('s1') is a.get_or_create('s1')
+        assert b.get('s1') is None
+        assert not b.exists('s1')
+
+    def test_save_sets_ttl(self, workers, fake_redis):
+        a, _ = workers
+        a.save(a.get_or_create('s1'))
+        assert 0 < fake_redis.ttl('solo_session:s1') <= SESSION_TTL
+
+    def test_delete(self, workers):
+        a, b = workers
+        a.save(a.get_or_create('s1'))
+        b.delete('s1')
+        assert a.get('s1') is None
+        assert a.get_session_count() == 0
+
+
+class TestOptimisticConcurrency:
+
+    def test_stale_save_raises_conflict(self, workers):
+        a, b = workers
+        a.save(a.get_or_create('s1'))
+
+        first = a.get('s1')
+        second = b.get('s1')
+        first.auction_history = ['1♣']
+        second.auction_history = ['1♦']
+        a.save(first)
+
+        with pytest.raises(SessionConflictError):
+            b.save(second)
+
+        # The loser re-reads the winner's state
+        assert b.get('s1').auction_history == ['1♣']
+
+    def test_versions_increase_on_each_change(self, workers):
+        a, _ = workers
+        state = a.get_or_create('s1')
+        a.save(state)
+        state.vulnerability = 'Both'
+        a.save(state)
+        assert state.version == 2
+
+    def test_unchanged_state_is_not_rewritten(self, workers):
+        a, _ = workers
+        state = a.get_or_create('s1')
+        a.save(state)
+        a.get('s1').touch()
+        a.save(a.get('s1'))
+        assert state.version == 1
+
+
+class TestReadThroughCache:
+
+    def test_cached_state_reused_while_version_unchanged(self, workers):
+        a, _ = workers
+        a.save(a.get_or_create('s1'))
+        assert a.get('s1') is a.get('s1')
+
+    def test_cache_refreshed_after_other_worker_saves(self, workers):
+        a, b = workers
+        a.save(a.get_or_create('s1'))
+        cached = a.get('s1')
+
+        state = b.get('s1')
+        state.dealer = 'West'
+        b.save(state)
+
+        fresh = a.get('s1')
+        assert fresh is not cached
+        assert fresh.dealer == 'West'
+
+    def test_cache_is_bounded(self, fake_redis):
+        manager = RedisSessionStateManager(redis_client=fake_redis, cache_size=2)
+        for sid in ('s1', 's2', 's3'):
+            manager.save(manager.get_or_create(sid))
+        assert len(manager._cache) == 2
+        assert manager.get('s1') is not None  # Evicted, reloaded from Redis
+
+
+class TestConflictResponse:
+
+    def test_conflicting_save_returns_409(self, monkeypatch):
+        import server
+
+        def conflicting_save(state):
+            raise SessionConflictError(f'Session {state.session_id} was saved concurrently')
+
+        monkeypatch.setattr(server.state_manager, 'save', conflicting_save)
+        server.app.config['TESTING'] = True
+        with server.app.test_client() as client:
+            response = client.get('/api/ai/status', headers={'X-Session-ID': 'conflict-test'})
+
+        assert response.status_code == 409
+        assert response.get_json()['session_conflict'] is True
+
+
+class TestInMemoryManager:
+
+    def test_save_is_a_no_op(self):
+        manager = SessionStateManager()
+        state = manager.get_or_create('s1')
+        manager.save(state)
+        assert manager.get('s1') is state
+        assert state.version == 0
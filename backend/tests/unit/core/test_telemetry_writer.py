@@ -0,0 +1,140 @@
+"""
+Unit tests for the background telemetry writer.
+
+Inserts go to an in-memory recorder, so no database is required.
+"""
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, 'backend')
+
+from core.telemetry_writer import TelemetryWriter
+
+
+COLUMNS = ('position', 'card_played')
+
+
+class RecordingInsert:
+    """Stands in for the multi-row INSERT; records each call."""
+
+    def __init__(self, fail_on=None, delay=0.0):
+        self.calls = []
+        self.fail_on = fail_on
+        self.delay = delay
+        self.lock = threading.Lock()
+
+    def __call__(self, table, columns, rows):
+        if self.delay:
+            time.sleep(self.delay)
+        if self.fail_on is not None and any(self.fail_on in row for row in rows):
+            raise ValueError("check constraint violated")
+        with self.lock:
+            self.calls.append((table, columns, list(rows)))
+
+    @property
+    def rows(self):
+        return [row for _, _, rows in self.calls for row in rows]
+
+
+@pytest.fixture
+def recorder():
+    return RecordingInsert()
+
+
+def make_writer(insert, **kwargs):
+    kwargs.setdefault('flush_interval', 0.05)
+    return TelemetryWriter(insert=insert, **kwargs)
+
+
+class TestBatching:
+
+    def test_rows_written_after_flush_interval(self, recorder):
+        writer = make_writer(recorder)
+        writer.submit('ai_play_log', COLUMNS, ('N', 'AS'))
+        deadline = time.monotonic() + 2.0
+        while not recorder.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert recorder.rows == [('N', 'AS')]
+        writer.close()
+
+    def test_rows_grouped_into_multi_row_inserts(self, recorder):
+        writer = make_writer(recorder, flush_interval=1.0, batch_size=100)
+        for i in range(10):
+            writer.submit('ai_play_log', COLUMNS, ('N', f'{i}S'))
+        assert writer.flush()
+        assert len(recorder.calls) == 1
+        assert len(recorder.rows) == 10
+        writer.close()
+
+    def test_full_batch_written_without_waiting_for_interval(self, recorder):
+        writer = make_writer(recorder, flush_interval=10.0, batch_size=5)
+        for i in range(5):
+            writer.submit('ai_play_log', COLUMNS, ('N', f'{i}S'))
+        deadline = time.monotonic() + 2.0
+        while not recorder.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(recorder.rows) == 5
+        writer.close()
+
+    def test_tables_inserted_separately_in_order(self, recorder):
+        writer = make_writer(recorder, flush_interval=1.0)
+        writer.submit('ai_play_log', COLUMNS, ('N', 'AS'))
+        writer.submit('play_decisions', ('user_id',), (7,))
+        writer.submit('ai_play_log', COLUMNS, ('E', 'KS'))
+        writer.flush()
+        assert [(table, len(rows)) for table, _, rows in recorder.calls] == [
+            ('ai_play_log', 2), ('play_decisions', 1)
+        ]
+        writer.close()
+
+
+class TestBackpressure:
+
+    def test_full_queue_drops_and_counts(self):
+        slow = RecordingInsert(delay=0.2)
+        writer = make_writer(slow, max_queue=3, batch_size=1)
+        results = [writer.submit('ai_play_log', COLUMNS, ('N', f'{i}S')) for i in range(10)]
+        assert not all(results)
+        stats = writer.stats()
+        assert stats['dropped'] == results.count(False)
+        assert stats['dropped_by_table'] == {'ai_play_log': stats['dropped']}
+        writer.close()
+
+    def test_submit_after_close_is_dropped(self, recorder):
+        writer = make_writer(recorder)
+        writer.close()
+        assert writer.submit('ai_play_log', COLUMNS, ('N', 'AS')) is False
+
+
+class TestFailures:
+
+    def test_bad_row_does_not_sink_batch(self):
+        insert = RecordingInsert(fail_on='BAD')
+        writer = make_writer(insert, flush_interval=1.0)
+        for card in ('AS', 'BAD', 'KS'):
+            writer.submit('ai_play_log', COLUMNS, ('N', card))
+        writer.flush()
+        assert insert.rows == [('N', 'AS'), ('N', 'KS')]
+        stats = writer.stats()
+        assert stats['written'] == 2
+        assert stats['failed'] == 1
+        assert 'check constraint' in stats['last_error']
+        writer.close()
+
+
+class TestShutdown:
+
+    def test_close_flushes_queued_rows(self, recorder):
+        writer = make_writer(recorder, flush_interval=10.0)
+        for i in range(3):
+            writer.submit('ai_play_log', COLUMNS, ('N', f'{i}S'))
+        assert writer.close()
+        assert len(recorder.rows) == 3
+        assert not writer._thread.is_alive()
+
+    def test_flush_without_rows_returns_immediately(self, recorder):
+        writer = make_writer(recorder)
+        assert writer.flush(timeout=0.01)
@@ -0,0 +1,105 @@
+"""
+Unit tests for the background analysis jobs (payloads, dedupe keys, handlers).
+
+The queue is replaced by a recorder; running the SQL queue itself needs
+PostgreSQL.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+if not os.environ.get('DATABASE_URL'):
+    pytest.skip("DATABASE_URL not set — requires PostgreSQL", allow_module_level=True)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.analysis import analysis_jobs
+from engine.hand import Hand, Card
+from engine.play_engine import Contract
+
+
+class RecordingQueue:
+    def __init__(self):
+        self.enqueued = []
+
+    def enqueue(self, kind, payload, dedupe_key=None, **kwargs):
+        self.enqueued.append((kind, payload, dedupe_key))
+        return len(self.enqueued)
+
+
+def _hand(rank, suit):
+    return Hand([Card(rank, suit)] * 13, _skip_validation=True)
+
+
+def _post_game_payload(queue):
+    with patch.object(analysis_jobs, 'get_job_queue', return_value=queue):
+        analysis_jobs.enqueue_post_game_analysis(
+            session_hand_id=42,
+            original_deal={'North': _hand('A', '♠'), 'South': _hand('2', '♣')},
+            contract=Contract(level=4, strain='♠', declarer='N', doubled=0),
+            play_history=[{'trick': 1, 'position': 'E', 'rank': 'K', 'suit': '♥'}],
+            actual_tricks=10,
+            actual_score=420,
+            vulnerability='None',
+            dealer='N',
+        )
+    return queue.enqueued[0]
+
+
+class TestPostGameAnalysisJob:
+    def test_payload_is_json_and_deduped_by_session_hand(self):
+        kind, payload, dedupe_key = _post_game_payload(RecordingQueue())
+
+        assert kind == analysis_jobs.POST_GAME_ANALYSIS
+        assert dedupe_key == '42'
+        assert json.loads(json.dumps(payload)) == payload
+        assert set(payload['hands']) == {'N', 'S'}
+        assert payload['hands']['N'][0] == {'rank': 'A', 'suit': '♠'}
+        assert payload['contract']['level'] == 4
+
+    def test_handler_rebuilds_hands_and_contract(self):
+        _, payload, _ = _post_game_payload(RecordingQueue())
+        engine = MagicMock()
+        engine.analyze_hand.return_value.points_left_on_table = 0
+        engine.store_analysis.return_value = True
+
+        with patch('engine.analysis.analysis_engine.get_analysis_engine', return_value=engine):
+            analysis_jobs.run_post_game_analysis(payload)
+
+        kwargs = engine.analyze_hand.call_args.kwargs
+        assert isinstance(kwargs['hands']['N'], Hand)
+        assert kwargs['hands']['N'].cards[0] == Card('A', '♠')
+        assert kwargs['contract'] == Contract(level=4, strain='♠', declarer='N', doubled=0)
+        engine.store_analysis.assert_called_once_with(42, engine.analyze_hand.return_value)
+
+    def test_handler_raises_when_store_fails_so_job_retries(self):
+        _, payload, _ = _post_game_payload(RecordingQueue())
+        engine = MagicMock()
+        engine.store_analysis.return_value = False
+
+        with patch('engine.analysis.analysis_engine.get_analysis_engine', return_value=engine):
+            with pytest.raises(RuntimeError):
+                analysis_jobs.run_post_game_analysis(payload)
+
+
+class TestTournamentAnalysisJob:
+    def test_deduped_by_tournament(self):
+        queue = RecordingQueue()
+        with patch.object(analysis_jobs, 'get_job_queue', return_value=queue):
+            analysis_jobs.enqueue_tournament_analysis(9, 'S')
+
+        assert queue.enqueued == [
+            (analysis_jobs.TOURNAMENT_ANALYSIS, {'tournament_id': 9, 'hero_position': 'S'}, '9')
+        ]
+
+
+def test_worker_loads_analysis_handlers():
+    from core.job_worker import load_handlers
+
+    handlers = load_handlers()
+    assert handlers[analysis_jobs.POST_GAME_ANALYSIS] is analysis_jobs.run_post_game_analysis
+    assert handlers[analysis_jobs.TOURNAMENT_ANALYSIS] is analysis_jobs.run_tournament_analysis
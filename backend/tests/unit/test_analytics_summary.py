@@ -0,0 +1,198 @@
+"""
+Unit tests for the incrementally maintained analytics summaries.
+
+Covers the per-row contributions and the dashboard views built from a
+summary; the SQL paths need PostgreSQL and are exercised by the
+`python -m engine.learning.analytics_summary check` job.
+"""
+
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+import pytest
+
+if not os.environ.get('DATABASE_URL'):
+    pytest.skip("DATABASE_URL not set — requires PostgreSQL", allow_module_level=True)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from engine.learning.analytics_summary import (
+    DECISION_COUNTERS,
+    HAND_COUNTERS,
+    bidding_analysis_stats,
+    bidding_feedback_stats,
+    decision_contributions,
+    diff_summaries,
+    gameplay_stats,
+    hand_contribution,
+    play_feedback_stats,
+)
+
+
+TODAY = date(2026, 3, 20)
+
+
+def empty_summary():
+    hand = {name: 0 for name in HAND_COUNTERS}
+    hand['recent_declarer_results'] = []
+    return {'hand': hand, 'daily': {}, 'hands': {}}
+
+
+def add_decisions(summary, kind, rows):
+    """Fold rows into summary['daily'] the way the insert hook does."""
+    for row in rows:
+        for (category, day), delta in decision_contributions(kind, row).items():
+            bucket = summary['daily'].setdefault(
+                (kind, category, day), {name: 0 for name in DECISION_COUNTERS})
+            for name in DECISION_COUNTERS:
+                bucket[name] += delta[name]
+
+
+def add_hand(summary, hand):
+    for name, value in hand_contribution(hand).items():
+        summary['hand'][name] += value
+
+
+def declarer_hand(made, tricks, **extra):
+    return dict(contract_level=4, tricks_taken=tricks, made=made, hand_score=420,
+                user_was_declarer=True, user_was_dummy=False, **extra)
+
+
+class TestHandContribution:
+
+    def test_declarer_hand(self):
+        delta = hand_contribution(declarer_hand(True, 10))
+        assert delta['declarer_hands'] == 1
+        assert delta['contracts_made'] == 1
+        assert delta['contracts_failed'] == 0
+        assert delta['declarer_tricks_sum'] == 10
+
+    def test_null_made_is_neither_made_nor_failed(self):
+        delta = hand_contribution(declarer_hand(None, None))
+        assert delta['declarer_hands'] == 1
+        assert delta['contracts_made'] == delta['contracts_failed'] == 0
+        assert delta['declarer_tricks_count'] == 0
+
+    def test_passed_out_hand_counts_only_as_recorded(self):
+        delta = hand_contribution(dict(contract_level=None, user_was_declarer=False,
+                                       user_was_dummy=False, hand_score=0))
+        assert delta['hands_recorded'] == 1
+        assert delta['defender_hands'] == 0
+
+    def test_analysis_update_difference(self):
+        before = declarer_hand(True, 10, dd_tricks=None, quadrant=None)
+        after = dict(before, quadrant='Q2', bid_efficiency='underbid',
+                     points_left_on_table=300, dd_tricks=11)
+        old, new = hand_contribution(before), hand_contribution(after)
+        delta = {name: new[name] - old[name] for name in HAND_COUNTERS}
+        assert delta['declarer_hands'] == 0
+        assert delta['q2_count'] == 1
+        assert delta['underbids'] == 1
+        assert delta['underbid_points_sum'] == 300
+        assert delta['tricks_vs_dd_sum'] == -1
+
+
+class TestDecisionContribution:
+
+    def test_play_decision_counts_overall_and_category(self):
+        row = dict(timestamp=datetime(2026, 3, 20, 9), score=8.0, rating='good',
+                   tricks_cost=0, play_category='discarding')
+        contributions = decision_contributions('play', row)
+        assert set(contributions) == {('', TODAY), ('discarding', TODAY)}
+        assert contributions[('', TODAY)]['good_count'] == 1
+
+    def test_bidding_critical_error(self):
+        row = dict(timestamp=datetime(2026, 3, 20), score=2.0,
+                   correctness='error', impact='critical')
+        delta = decision_contributions('bidding', row)[('', TODAY)]
+        assert delta['error_count'] == 1
+        assert delta['critical_count'] == 1
+
+    def test_row_without_timestamp_ignored(self):
+        assert decision_contributions('bidding', dict(score=5.0)) == {}
+
+
+class TestDashboardViews:
+
+    def test_bidding_stats_window_and_trend(self):
+        summary = empty_summary()
+        add_decisions(summary, 'bidding', [
+            dict(timestamp=datetime(2026, 3, 19), score=9.0, correctness='optimal'),
+            dict(timestamp=datetime(2026, 3, 18), score=7.0, correctness='acceptable'),
+            dict(timestamp=datetime(2026, 3, 10), score=5.0, correctness='suboptimal'),
+            dict(timestamp=datetime(2026, 1, 1), score=0.0, correctness='error'),  # Outside 30 days
+        ])
+        stats = bidding_feedback_stats(summary, TODAY)
+        assert stats['total_decisions'] == 3
+        assert stats['avg_score'] == 7.0
+        assert stats['good_rate'] == round(2 / 3, 3)
+        assert stats['error_rate'] == 0
+        assert stats['recent_trend'] == 'improving'  # 8.0 this week vs 5.0 the week before
+
+    def test_empty_play_stats(self):
+        stats = play_feedback_stats(empty_summary(), TODAY)
+        assert stats['total_decisions'] == 0
+        assert stats['recent_trend'] == 'stable'
+
+    def test_play_category_breakdown(self):
+        summary = empty_summary()
+        add_decisions(summary, 'play', [
+            dict(timestamp=datetime(2026, 3, 19), score=10.0, rating='optimal',
+                 tricks_cost=0, play_category='opening_lead'),
+            dict(timestamp=datetime(2026, 3, 19), score=0.0, rating='blunder',
+                 tricks_cost=2, play_category='opening_lead'),
+        ])
+        stats = play_feedback_stats(summary, TODAY)
+        lead = stats['category_breakdown']['opening_lead']
+        assert lead['attempts'] == 2
+        assert lead['blunder_rate'] == 50.0
+        assert lead['avg_tricks_cost'] == 1.0
+        assert lead['display_name'] == 'Opening Leads'
+        assert stats['total_tricks_lost'] == 2.0
+
+    def test_gameplay_stats(self):
+        summary = empty_summary()
+        for made, tricks in [(True, 10), (False, 8), (True, 9)]:
+            add_hand(summary, declarer_hand(made, tricks))
+        summary['hand']['recent_declarer_results'] = [True, False, True]
+        add_hand(summary, dict(contract_level=3, user_was_declarer=False,
+                               user_was_dummy=True, hand_score=0))
+        stats = gameplay_stats(summary)
+        assert stats['total_hands_played'] == 4
+        assert stats['hands_as_dummy'] == 1
+        assert stats['contracts_failed'] == 1
+        assert stats['avg_tricks_as_declarer'] == 9.0
+        assert stats['declarer_success_rate'] == pytest.approx(2 / 3)
+        assert stats['recent_declarer_success_rate'] == pytest.approx(2 / 3)
+
+    def test_bidding_analysis_percentages(self):
+        summary = empty_summary()
+        add_hand(summary, declarer_hand(True, 10, quadrant='Q1', bid_efficiency='optimal'))
+        add_hand(summary, declarer_hand(True, 10, quadrant='Q2', bid_efficiency='underbid',
+                                        points_left_on_table=250))
+        stats = bidding_analysis_stats(summary)
+        assert stats['quadrant_percentages']['Q1'] == 50.0
+        assert stats['efficiency_percentages']['underbid'] == 50.0
+        assert stats['avg_points_left_when_underbid'] == 250
+        assert stats['avg_tricks_vs_dd'] is None
+
+
+class TestDiffSummaries:
+
+    def test_identical_summaries_match(self):
+        summary = empty_summary()
+        add_hand(summary, declarer_hand(True, 10))
+        assert diff_summaries(summary, summary) == []
+
+    def test_reports_drift(self):
+        expected, actual = empty_summary(), empty_summary()
+        add_hand(expected, declarer_hand(True, 10))
+        add_decisions(actual, 'bidding', [
+            dict(timestamp=datetime(2026, 3, 19), score=9.0, correctness='optimal')])
+        problems = diff_summaries(expected, actual)
+        assert any(p.startswith('declarer_hands') for p in problems)
+        assert any(p.startswith('bidding/all/2026-03-19 decisions') for p in problems)
+
+    def test_missing_summary(self):
+        assert diff_summaries(empty_summary(), None) == ['summary missing']
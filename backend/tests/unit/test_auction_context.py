@@ -0,0 +1,130 @@
+"""
+Unit tests for per-auction bidding contexts.
+
+Tests that one BiddingEngineV2Schema can bid several auctions at once
+when each passes its own AuctionContext, giving the same bids as one
+engine per auction, and that the engine's default context behaves as
+before.
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from engine.hand import Hand
+from engine.v2 import AuctionContext, BiddingEngineV2Schema
+from utils.dealing import create_deck
+
+SEATS = ['North', 'East', 'South', 'West']
+
+
+def _deals(count, seed):
+    rng = random.Random(seed)
+    deals = []
+    for _ in range(count):
+        deck = create_deck()
+        rng.shuffle(deck)
+        deals.append({seat: Hand(deck[i * 13:(i + 1) * 13]) for i, seat in enumerate(SEATS)})
+    return deals
+
+
+def _bidder(engine, hands, dealer, context=None):
+    """Generator bidding one auction; yields after every call"""
+    auction = []
+    while len(auction) < 40 and not (len(auction) >= 4 and auction[-3:] == ['Pass'] * 3):
+        seat = SEATS[(SEATS.index(dealer) + len(auction)) % 4]
+        bid, _ = engine.get_next_bid(hands[seat], list(auction), seat,
+                                     dealer=dealer, context=context)
+        state = engine.get_forcing_state(context)
+        auction.append(bid)
+        yield bid, state['forcing_level']
+
+
+def _sequential(deals):
+    engine = BiddingEngineV2Schema()
+    results = []
+    for i, hands in enumerate(deals):
+        engine.new_deal()
+        results.append(list(_bidder(engine, hands, SEATS[i % 4])))
+    return results
+
+
+class TestSharedEngine:
+    """Test one engine serving several auctions"""
+
+    def test_interleaved_auctions_match_sequential(self):
+        deals = _deals(12, seed=4)
+        expected = _sequential(deals)
+
+        engine = BiddingEngineV2Schema()
+        bidders = [_bidder(engine, hands, SEATS[i % 4], AuctionContext())
+                   for i, hands in enumerate(deals)]
+        results = [[] for _ in deals]
+        live = set(range(len(deals)))
+        while live:
+            # Round-robin one bid from every unfinished auction
+            for i in sorted(live):
+                step = next(bidders[i], None)
+                if step is None:
+                    live.discard(i)
+                else:
+                    results[i].append(step)
+
+        assert results == expected
+
+    def test_threaded_auctions_match_sequential(self):
+        deals = _deals(12, seed=8)
+        expected = _sequential(deals)
+        engine = BiddingEngineV2Schema()
+
+        def run(i):
+            return list(_bidder(engine, deals[i], SEATS[i % 4], AuctionContext()))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(run, range(len(deals))))
+
+        assert results == expected
+
+    def test_context_does_not_touch_default_state(self):
+        engine = BiddingEngineV2Schema()
+        context = AuctionContext(last_auction=['1♠', 'Pass'])
+        context.forcing.update('GAME_FORCE', 'test_rule')
+        hand = Hand.from_pbn("AK5.KQ4.J962.K73")
+
+        engine.get_next_bid(hand, ['1♠', 'Pass', '2♣', 'Pass'], 'North',
+                            dealer='North', context=context)
+
+        assert engine.get_forcing_state(context)['is_game_forced']
+        assert not engine.get_forcing_state()['is_game_forced']
+        assert context.last_rule_id is not None
+        assert engine._last_rule_id is None
+
+
+class TestDefaultContext:
+    """Test the engine's own context"""
+
+    def test_tracks_last_decision(self):
+        engine = BiddingEngineV2Schema()
+        hand = Hand.from_pbn("AK5.KQ4.J962.K73")
+
+        engine.get_next_bid(hand, [], 'North', dealer='North')
+
+        assert engine._last_rule_id == engine.context.last_rule_id is not None
+        assert engine._last_priority == engine.context.last_priority
+
+    def test_shares_interpreter_forcing_state(self):
+        engine = BiddingEngineV2Schema()
+        engine.interpreter.update_forcing_state('GAME_FORCE', 'test_rule')
+        assert engine.get_forcing_state()['is_game_forced']
+
+        engine.new_deal()
+        assert not engine.interpreter.get_forcing_state()['is_game_forced']
+
+    def test_reset_starts_a_new_auction(self):
+        context = AuctionContext()
+        context.forcing.update('GAME_FORCE', 'test_rule')
+        context.last_auction = ['1♣', 'Pass']
+
+        context.reset()
+
+        assert not context.forcing.get_state()['is_game_forced']
+        assert context.last_auction is None
@@ -0,0 +1,131 @@
+"""
+Unit tests for batch bidding.
+
+Tests that bid_deals gives the same auctions as bidding each deal one
+call at a time, in-process and on a process pool, that it streams from
+unbounded deal generators, and that engine errors end only their own
+auction.
+"""
+
+import itertools
+import random
+
+from engine.hand import Hand
+from engine.v2 import BiddingEngineV2Schema, bid_deals
+from engine.v2.batch_bidding import bid_auction, is_auction_complete
+from engine.v2.features.enhanced_extractor import hand_to_pbn
+from utils.dealing import create_deck
+
+SEATS = ['North', 'East', 'South', 'West']
+
+
+def _deal(rng):
+    deck = create_deck()
+    rng.shuffle(deck)
+    return {seat: Hand(deck[i * 13:(i + 1) * 13]) for i, seat in enumerate(SEATS)}
+
+
+def _deals(count, seed):
+    rng = random.Random(seed)
+    return [_deal(rng) for _ in range(count)]
+
+
+def _one_at_a_time(hands, dealer, vulnerability):
+    """Auction driven by get_next_bid calls, as the simulation scripts did"""
+    engine = BiddingEngineV2Schema()
+    auction = []
+    while not is_auction_complete(auction):
+        seat = SEATS[(SEATS.index(dealer) + len(auction)) % 4]
+        bid, _ = engine.get_next_bid(hands[seat], list(auction), seat, vulnerability, dealer=dealer)
+        auction.append(bid)
+    return auction
+
+
+class TestBidDeals:
+    """Test batch results against one-bid-at-a-time bidding"""
+
+    def test_matches_single_bids(self):
+        deals = _deals(8, seed=3)
+        dealers = [SEATS[i % 4] for i in range(len(deals))]
+
+        results = list(bid_deals(deals, dealer=dealers, vulnerability='NS'))
+
+        assert [r.index for r in results] == list(range(len(deals)))
+        for result, hands, dealer in zip(results, deals, dealers):
+            assert result.complete
+            assert result.dealer == dealer
+            assert result.auction == _one_at_a_time(hands, dealer, 'NS')
+            assert len(result.explanations) == len(result.rule_ids) == len(result.auction)
+
+    def test_process_pool_matches_in_process(self):
+        deals = _deals(10, seed=5)
+
+        expected = [r.auction for r in bid_deals(deals, dealer='East')]
+        pooled = sorted(bid_deals(deals, dealer='East', workers=2, chunk_size=3),
+                        key=lambda r: r.index)
+
+        assert [r.auction for r in pooled] == expected
+
+    def test_accepts_pbn_strings_and_short_seats(self):
+        hands = _deals(1, seed=7)[0]
+        pbn_deal = {seat[0]: hand_to_pbn(hand) for seat, hand in hands.items()}
+
+        [from_pbn] = bid_deals([pbn_deal])
+        [from_hands] = bid_deals([hands])
+
+        assert from_pbn.auction == from_hands.auction
+
+    def test_engine_method_uses_engine(self):
+        engine = BiddingEngineV2Schema()
+        deals = _deals(2, seed=9)
+        assert [r.auction for r in engine.bid_deals(deals)] == [r.auction for r in bid_deals(deals)]
+
+
+class TestStreaming:
+    """Test that results stream from unbounded deal sources"""
+
+    def test_in_process_is_lazy(self):
+        rng = random.Random(11)
+        deals = (_deal(rng) for _ in itertools.count())
+
+        first = list(itertools.islice(bid_deals(deals), 3))
+
+        assert [r.index for r in first] == [0, 1, 2]
+
+    def test_pool_bounds_deals_in_flight(self):
+        rng = random.Random(13)
+        drawn = []
+
+        def deals():
+            for n in itertools.count():
+                drawn.append(n)
+                yield _deal(rng)
+
+        results = bid_deals(deals(), workers=2, chunk_size=2)
+        first = list(itertools.islice(results, 4))
+        results.close()
+
+        assert len(first) == 4
+        assert len(drawn) <= 2 * 2 * 2 + 2 * 2  # Initial chunks plus refills
+
+
+class TestErrors:
+    """Test that an engine error ends only its own auction"""
+
+    class FailingEngine(BiddingEngineV2Schema):
+        def get_next_bid(self, hand, auction_history, my_position, *args, **kwargs):
+            if len(auction_history) == 2:
+                raise ValueError('boom')
+            return super().get_next_bid(hand, auction_history, my_position, *args, **kwargs)
+
+    def test_error_recorded_with_partial_auction(self):
+        result = bid_auction(self.FailingEngine(), _deals(1, seed=15)[0], dealer='South')
+
+        assert not result.complete
+        assert len(result.auction) == 2
+        assert result.error == 'North at bid 3: ValueError: boom'
+
+    def test_other_deals_continue(self):
+        results = list(bid_deals(_deals(3, seed=17), engine=self.FailingEngine()))
+        assert [r.index for r in results] == [0, 1, 2]
+        assert all(r.error for r in results)
@@ -0,0 +1,126 @@
+"""
+Unit tests for the bitboard card representation.
+
+Tests the 52-bit hand layout, Hand round-trips, lookup-table suit
+lengths and HCP, follow-suit masks and trick winner on bit numbers.
+"""
+
+import random
+
+import pytest
+
+from engine.bitboard import (
+    SUITS, SUIT_MASK, FULL_DECK, CARD_BIT, BIT_CARD,
+    card_mask, cards_to_mask, mask_to_cards, suit_cards,
+    suit_length, suit_lengths, shape, card_count, hcp, suit_hcp,
+    legal_mask, legal_cards, highest_card, lowest_card, trick_winner_bit,
+)
+from engine.hand import Hand, Card
+
+
+def _deck():
+    return [Card(rank, suit) for suit in SUITS for rank in '23456789TJQKA']
+
+
+class TestLayout:
+    """Test bit numbering"""
+
+    def test_every_card_has_unique_bit(self):
+        bits = {CARD_BIT[card] for card in _deck()}
+        assert bits == set(range(52))
+
+    def test_bit_card_is_inverse(self):
+        for card in _deck():
+            assert BIT_CARD[CARD_BIT[card]] == card
+
+    def test_full_deck(self):
+        assert cards_to_mask(_deck()) == FULL_DECK
+
+    def test_ranks_increase_within_suit(self):
+        assert CARD_BIT[Card('A', '♠')] > CARD_BIT[Card('K', '♠')] > CARD_BIT[Card('2', '♠')]
+
+
+class TestHandConversion:
+    """Test Hand <-> bitmask round trips"""
+
+    def test_round_trip_preserves_hand_order(self):
+        hand = Hand.from_pbn("AKQJ.T987.654.32")
+        assert Hand.from_bitmask(hand.to_bitmask()).cards == hand.cards
+
+    def test_mask_to_cards_matches_hand_order(self):
+        deck = _deck()
+        random.Random(7).shuffle(deck)
+        hand = Hand(deck[:13])
+        assert mask_to_cards(hand.to_bitmask()) == hand.cards
+
+    def test_partial_hand(self):
+        hand = Hand.from_bitmask(card_mask(Card('A', '♠')) | card_mask(Card('2', '♣')),
+                                 _skip_validation=True)
+        assert hand.cards == [Card('A', '♠'), Card('2', '♣')]
+
+
+class TestLookupTables:
+    """Test popcount suit lengths and HCP tables against Hand"""
+
+    def test_matches_hand_properties(self):
+        rng = random.Random(11)
+        deck = _deck()
+        for _ in range(200):
+            rng.shuffle(deck)
+            hand = Hand(deck[:13])
+            mask = hand.to_bitmask()
+
+            assert hcp(mask) == hand.hcp
+            assert suit_lengths(mask) == hand.suit_lengths
+            assert card_count(mask) == 13
+            for suit in SUITS:
+                assert suit_length(mask, suit) == hand.suit_lengths[suit]
+                assert suit_hcp(mask, suit) == hand.suit_hcp[suit]
+
+    def test_shape_in_pbn_order(self):
+        mask = Hand.from_pbn("AKQJ.T987.654.32").to_bitmask()
+        assert shape(mask) == (4, 4, 3, 2)
+
+    def test_suit_cards_highest_first(self):
+        mask = Hand.from_pbn("AKQJ.T987.654.32").to_bitmask()
+        assert suit_cards(mask, '♦') == [Card('6', '♦'), Card('5', '♦'), Card('4', '♦')]
+        assert highest_card(mask, '♥') == Card('T', '♥')
+        assert lowest_card(mask, '♥') == Card('7', '♥')
+        assert highest_card(mask & ~SUIT_MASK['♣'], '♣') is None
+
+
+class TestLegalMoves:
+    """Test follow-suit masks"""
+
+    def test_must_follow_suit(self):
+        mask = Hand.from_pbn("AKQJ.T987.654.32").to_bitmask()
+        assert legal_mask(mask, '♦') == mask & SUIT_MASK['♦']
+
+    def test_void_allows_any_card(self):
+        mask = Hand.from_pbn("AKQJT.98765.432.").to_bitmask()
+        assert legal_mask(mask, '♣') == mask
+
+    def test_leading_allows_any_card(self):
+        mask = Hand.from_pbn("AKQJ.T987.654.32").to_bitmask()
+        assert legal_mask(mask, None) == mask
+
+    def test_legal_cards_preserves_list_order(self):
+        hand = Hand.from_pbn("AKQJ.T987.654.32")
+        trick = [(Card('A', '♥'), 'W')]
+        assert legal_cards(hand.cards, trick) == [c for c in hand.cards if c.suit == '♥']
+        assert legal_cards(hand.cards, []) == hand.cards
+
+
+class TestTrickWinner:
+    """Test trick winner on bit numbers"""
+
+    @pytest.mark.parametrize("trick,trump,expected", [
+        (['2♠', 'A♠', 'K♠', 'Q♠'], None, 1),
+        (['2♠', 'A♥', 'K♠', '3♠'], None, 2),
+        (['2♠', 'A♠', '2♥', 'K♠'], '♥', 2),
+        (['2♠', '3♥', '4♥', 'A♠'], '♥', 2),
+        (['A♥', 'K♥', 'Q♥', 'J♥'], '♥', 0),
+    ])
+    def test_winner(self, trick, trump, expected):
+        bits = [CARD_BIT[Card(c[0], c[1])] for c in trick]
+        assert trick_winner_bit(bits, trump) == expected
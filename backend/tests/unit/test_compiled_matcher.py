@@ -0,0 +1,108 @@
+"""
+Unit tests for compiled soft-match predicates.
+
+Differential test: every schema rule, compiled, must score exactly what
+SoftMatcher.calculate() scores, over the features of every saycbridge
+baseline case. Plus targeted checks of the operators and penalties.
+"""
+
+import pytest
+
+from engine.hand import Hand
+from engine.v2.bidding_engine_v2_schema import BiddingEngineV2Schema
+from engine.v2.compiled_matcher import compile_rule
+from engine.v2.features.enhanced_extractor import extract_flat_features
+from engine.v2.interpreters.rule_set import get_rule_set
+from engine.v2.soft_matcher import SoftMatcher
+from tests.sayc_baseline.sayc_baseline_parser import parse_baseline
+
+SEATS = ['North', 'East', 'South', 'West']
+
+
+def _baseline_features():
+    """Features as get_next_bid builds them, for each baseline case"""
+    engine = BiddingEngineV2Schema()
+    _, cases = parse_baseline()
+    for case in cases:
+        hand = Hand.from_pbn(case.hand)
+        position = SEATS[len(case.history) % 4]
+        features = extract_flat_features(hand, case.history, position, 'None', 'North')
+        features['forcing_level'] = 'NON_FORCING'
+        features['is_game_forced'] = False
+        yield case.test_id, engine._enhance_features(features, hand, case.history)
+
+
+class TestDifferential:
+    """Test compiled scores against SoftMatcher"""
+
+    def test_schema_rules_score_identically_on_baseline(self):
+        matcher = SoftMatcher()
+        rules = [rule for schema in get_rule_set().schemas.values()
+                 for rule in schema.get('rules', [])]
+        scorers = [compile_rule(rule) for rule in rules]
+
+        cases = 0
+        matched = 0
+        for test_id, features in _baseline_features():
+            cases += 1
+            for rule, scorer in zip(rules, scorers):
+                expected = matcher.calculate(rule, features).score
+                assert scorer(features) == expected, (test_id, rule.get('id'))
+                matched += expected > 0.0
+
+        assert cases > 200
+        assert matched > cases  # Not only hard fails
+
+    def test_rule_set_uses_compiled_scorers(self):
+        rule_set = get_rule_set()
+        for schema in rule_set.schemas.values():
+            for rule in schema.get('rules', []):
+                assert id(rule) in rule_set.scorers
+
+
+class TestOperators:
+    """Test compiled operators and penalties"""
+
+    FEATURES = {
+        'hcp': 14, 'spades_length': 5, 'hearts_length': 3, 'is_balanced': False,
+        'is_semi_balanced': True, 'suit_quality': 'good', 'partner_last_bid': '1♥',
+        'is_opening': True, 'auction_history': ['1♥', 'Pass'],
+    }
+
+    @pytest.mark.parametrize('rule', [
+        {'conditions': {'hcp': {'min': 15, 'max': 17}}},
+        {'conditions': {'hcp': {'min': 10, 'max': 12}}},
+        {'conditions': {'is_balanced': True}},
+        {'conditions': {'is_balanced': True, 'hcp': {'min': 15}}},
+        {'conditions': {'spades_length': {'min': 'hearts_length'}}},
+        {'conditions': {'partner_last_bid': {'in': ['1[HS]']}}},
+        {'conditions': {'partner_last_bid': {'not_in': ['1♥']}}},
+        {'conditions': {'suit_quality': {'min': 'fair', 'max': 'excellent'}}},
+        {'conditions': {'OR': [{'hcp': {'min': 20}}, {'hcp': {'min': 15}, 'is_opening': True}]}},
+        {'conditions': {'AND': [{'hcp': {'min': 15}}, {'is_balanced': True}]}},
+        {'conditions': {'NOT': {'spades_length': {'min': 5}}}},
+        {'conditions': {'hcp': {'min': 12}}, 'trigger': '1♥ - Pass - ?'},
+        {'conditions': {'hcp': {'min': 12}}, 'trigger': '1[CD] - Pass - ?'},
+        {'trigger': '1♥ - Pass'},
+        {'constraints': [
+            {'feature': 'hcp', 'min': 15, 'max': 17, 'constraint_type': 'SOFT'},
+            {'feature': 'spades_length', 'min': 6, 'constraint_type': 'SOFT', 'penalty_per_unit': 0.3},
+        ]},
+        {'constraints': [{'feature': 'hcp', 'max': 12, 'constraint_type': 'SOFT'}]},
+        {'constraints': [{'feature': 'suit_quality', 'min': 'excellent', 'constraint_type': 'SOFT'}]},
+        {'constraints': [{'feature': 'is_balanced', 'expected': True, 'constraint_type': 'HARD'}]},
+        {'constraints': [{'feature': 'OR', 'in': [{'hcp': {'min': 15}}, {'is_balanced': True}],
+                          'constraint_type': 'SOFT'}]},
+    ])
+    def test_matches_soft_matcher(self, rule):
+        assert compile_rule(rule)(self.FEATURES) == SoftMatcher().calculate(rule, self.FEATURES).score
+
+    def test_malformed_rule_fails_when_scored(self):
+        scorer = compile_rule({'conditions': None})
+        with pytest.raises(TypeError):
+            scorer(self.FEATURES)
+
+    def test_penalties(self):
+        assert compile_rule({'conditions': {'hcp': {'min': 15}}})(self.FEATURES) == pytest.approx(0.9)
+        assert compile_rule({'conditions': {'is_balanced': True}})(self.FEATURES) == pytest.approx(0.8)
+        assert compile_rule({'conditions': {'hcp': {'min': 16}}})(self.FEATURES) == 0.0
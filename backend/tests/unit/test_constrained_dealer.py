@@ -0,0 +1,112 @@
+"""
+Unit tests for the constrained hand dealer.
+
+Tests hand counting, dealing under shape/HCP constraints, up-front
+infeasibility reporting and the generate_hand_with_constraints wrappers.
+"""
+
+import random
+from math import comb
+
+import pytest
+
+from engine.constrained_dealer import (
+    InfeasibleConstraints, count_matching_hands, deal_constrained_hand,
+)
+from engine.hand_constructor import generate_hand_with_constraints
+from engine.learning import skill_hand_generators
+from utils.dealing import create_deck
+
+
+class TestCounting:
+    """Test exact hand counts"""
+
+    def test_unconstrained_counts_every_hand(self):
+        assert count_matching_hands({}, create_deck()) == comb(52, 13)
+
+    def test_top_hcp_counts(self):
+        deck = create_deck()
+        # AKQ in every suit plus one of the four jacks
+        assert count_matching_hands({'hcp_range': (37, 37)}, deck) == 4
+        assert count_matching_hands({'hcp_range': (38, 40)}, deck) == 0
+
+    def test_void_count(self):
+        # 13 cards from the other 39
+        assert count_matching_hands({'void_suit': '♣'}, create_deck()) == comb(39, 13)
+
+
+class TestDealing:
+    """Test dealt hands meet their constraints"""
+
+    @pytest.mark.parametrize('constraints, check', [
+        ({'hcp_range': (5, 10), 'suit_length_req': (['♠'], 6, 'any_of')},
+         lambda h: 5 <= h.hcp <= 10 and h.suit_lengths['♠'] >= 6),
+        ({'hcp_range': (15, 17), 'is_balanced': True},
+         lambda h: 15 <= h.hcp <= 17 and h.is_balanced),
+        ({'hcp_range': (12, 21), 'suit_length_req': (['♠', '♥'], 5, 'all_of')},
+         lambda h: h.suit_lengths['♠'] >= 5 and h.suit_lengths['♥'] >= 5),
+        ({'hcp_range': (10, 14), 'void_suit': '♦', 'min_longest_suit': 6},
+         lambda h: h.suit_lengths['♦'] == 0 and max(h.suit_lengths.values()) >= 6),
+        ({'singleton_suit': '♥', 'doubleton_suit': '♣', 'unique_longest_suit': True},
+         lambda h: h.suit_lengths['♥'] == 1 and h.suit_lengths['♣'] == 2
+         and list(h.suit_lengths.values()).count(max(h.suit_lengths.values())) == 1),
+        ({'hcp_range': (22, 40), 'max_suit_length': 4},
+         lambda h: h.hcp >= 22 and max(h.suit_lengths.values()) <= 4),
+        ({'is_balanced': True, 'short_suit_req': (['♠', '♥'], 3)},
+         lambda h: h.is_balanced and h.suit_lengths['♠'] <= 3 and h.suit_lengths['♥'] <= 3),
+    ])
+    def test_hands_meet_constraints(self, constraints, check):
+        rng = random.Random(5)
+        for _ in range(50):
+            hand, remaining = deal_constrained_hand(constraints, create_deck(), rng)
+            assert len(hand.cards) == 13
+            assert len(remaining) == 39
+            assert check(hand)
+
+    def test_deals_from_partial_deck(self):
+        deck = create_deck()
+        random.Random(1).shuffle(deck)
+        rest = deck[13:]
+        before = list(rest)
+
+        hand, remaining = deal_constrained_hand({'hcp_range': (12, 14)}, rest)
+
+        assert rest == before
+        assert all(card in rest for card in hand.cards)
+        assert len(remaining) == 26
+        assert not set(hand.cards) & set(remaining)
+
+    def test_seeded_deals_repeat(self):
+        constraints = {'hcp_range': (8, 10), 'suit_length_req': (['♥'], 6, 'any_of')}
+        first, _ = deal_constrained_hand(constraints, create_deck(), random.Random(9))
+        second, _ = deal_constrained_hand(constraints, create_deck(), random.Random(9))
+        assert first.cards == second.cards
+
+    def test_infeasible_constraints_raise(self):
+        with pytest.raises(InfeasibleConstraints):
+            deal_constrained_hand({'hcp_range': (38, 40)}, create_deck())
+        with pytest.raises(InfeasibleConstraints):
+            deal_constrained_hand({'is_balanced': True, 'void_suit': '♠'}, create_deck())
+
+
+class TestGenerators:
+    """Test the hand generator wrappers"""
+
+    def test_wrappers_return_none_when_infeasible(self):
+        deck = create_deck()
+        for generate in (generate_hand_with_constraints,
+                         skill_hand_generators.generate_hand_with_constraints):
+            hand, remaining = generate({'hcp_range': (12, 14), 'void_suit': '♠',
+                                        'is_balanced': True}, deck)
+            assert hand is None
+            assert remaining is deck
+
+    def test_every_skill_constraint_set_is_feasible(self):
+        deck = create_deck()
+        random.seed(3)
+        for skill_id in skill_hand_generators.get_available_skills():
+            # Generators pick a random variant when constructed
+            for _ in range(30):
+                generator = skill_hand_generators.get_skill_hand_generator(skill_id)
+                constraints = generator.get_constraints()
+                assert count_matching_hands(constraints, deck) > 0, (skill_id, constraints)
@@ -0,0 +1,307 @@
+"""
+Unit tests for the db connection pool and per-request connection scope.
+
+Uses fake connections, so no PostgreSQL server is needed; db still requires
+DATABASE_URL at import time.
+"""
+
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+if not os.environ.get('DATABASE_URL'):
+    pytest.skip("DATABASE_URL not set — requires PostgreSQL", allow_module_level=True)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+import db
+from db import ConnectionPool, PoolTimeoutError
+from psycopg2.extensions import (
+    TRANSACTION_STATUS_IDLE,
+    TRANSACTION_STATUS_INERROR,
+    TRANSACTION_STATUS_INTRANS,
+    TRANSACTION_STATUS_UNKNOWN,
+)
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, query, params=None):
+        if self.conn.broken:
+            raise RuntimeError("server closed the connection")
+        self.conn.queries.append(query)
+        self.conn.status = TRANSACTION_STATUS_INTRANS
+        command, _, name = query.rpartition(' ')
+        if command == 'SAVEPOINT':
+            self.conn.savepoints[name] = len(self.conn.pending)
+        elif command == 'ROLLBACK TO SAVEPOINT':
+            del self.conn.pending[self.conn.savepoints[name]:]
+        elif command == 'RELEASE SAVEPOINT':
+            del self.conn.savepoints[name]
+        else:
+            self.conn.pending.append(query)
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = 0
+        self.broken = False
+        self.status = TRANSACTION_STATUS_IDLE
+        self.queries = []
+        self.pending = []    # statements of the open transaction
+        self.committed = []
+        self.savepoints = {}
+        self.commits = 0
+        self.rollbacks = 0
+
+    def cursor(self, cursor_factory=None):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+        self.committed += self.pending
+        self.pending, self.savepoints = [], {}
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.pending, self.savepoints = [], {}
+        self.status = TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+    def get_transaction_status(self):
+        return self.status
+
+
+def make_pool(**kwargs):
+    opened = []
+
+    def connect(dsn):
+        conn = FakeConnection()
+        opened.append(conn)
+        return conn
+
+    kwargs.setdefault('max_size', 2)
+    kwargs.setdefault('timeout', 0.2)
+    return ConnectionPool('postgresql://fake', connect=connect, **kwargs), opened
+
+
+@pytest.fixture
+def patched_pool(monkeypatch):
+    """Route db.get_connection() through a fake pool."""
+    pool, opened = make_pool()
+    monkeypatch.setattr(db, '_pool', pool)
+    monkeypatch.setattr(db, 'DB_POOL_SIZE', pool.max_size)
+    return pool, opened
+
+
+class TestConnectionPool:
+
+    def test_released_connection_is_reused(self):
+        pool, opened = make_pool()
+        conn = pool.acquire()
+        pool.release(conn)
+        assert pool.acquire() is conn
+        assert len(opened) == 1
+
+    def test_bounded_and_times_out(self):
+        pool, _ = make_pool(max_size=1, timeout=0.05)
+        pool.acquire()
+        with pytest.raises(PoolTimeoutError):
+            pool.acquire()
+        stats = pool.stats()
+        assert stats['in_use'] == 1
+        assert stats['timeouts'] == 1
+
+    def test_waiter_gets_released_connection(self):
+        pool, _ = make_pool(max_size=1, timeout=2.0)
+        conn = pool.acquire()
+        got = []
+        waiter = threading.Thread(target=lambda: got.append(pool.acquire()))
+        waiter.start()
+        time.sleep(0.05)
+        assert pool.stats()['waiters'] == 1
+        pool.release(conn)
+        waiter.join(1.0)
+        assert got == [conn]
+        assert pool.stats()['wait_time_max_ms'] > 0
+
+    def test_open_transaction_rolled_back_on_release(self):
+        pool, _ = make_pool()
+        conn = pool.acquire()
+        conn.status = TRANSACTION_STATUS_INERROR
+        pool.release(conn)
+        assert conn.rollbacks == 1
+        assert pool.stats()['idle'] == 1
+
+    def test_unknown_state_is_discarded(self):
+        pool, _ = make_pool()
+        conn = pool.acquire()
+        conn.status = TRANSACTION_STATUS_UNKNOWN
+        pool.release(conn)
+        assert conn.closed
+        assert pool.stats()['size'] == 0
+
+    def test_idle_connections_recycled(self):
+        pool, opened = make_pool(max_idle=0.0)
+        conn = pool.acquire()
+        pool.release(conn)
+        time.sleep(0.01)
+        assert pool.acquire() is not conn
+        assert conn.closed
+        assert len(opened) == 2
+
+    def test_dead_connection_replaced_on_checkout(self):
+        pool, opened = make_pool(check_after=0.0)
+        conn = pool.acquire()
+        pool.release(conn)
+        conn.broken = True
+        fresh = pool.acquire()
+        assert fresh is not conn
+        assert conn.closed
+        assert pool.stats()['size'] == 1
+
+    def test_failed_connect_frees_slot(self):
+        def connect(dsn):
+            raise RuntimeError("connection refused")
+
+        pool = ConnectionPool('postgresql://fake', max_size=1, timeout=0.05, connect=connect)
+        for _ in range(2):
+            with pytest.raises(RuntimeError, match="refused"):
+                pool.acquire()
+        assert pool.stats()['size'] == 0
+
+
+class TestGetConnection:
+
+    def test_context_manager_returns_connection_to_pool(self, patched_pool):
+        pool, opened = patched_pool
+        with db.get_connection() as conn:
+            conn.cursor().execute("SELECT 1")
+        assert opened[0].commits == 1
+        stats = pool.stats()
+        assert stats['in_use'] == 0
+        assert stats['idle'] == 1
+
+    def test_double_close_is_noop(self, patched_pool):
+        pool, _ = patched_pool
+        conn = db.get_connection()
+        conn.close()
+        conn.close()
+        assert pool.stats()['idle'] == 1
+
+    def test_dropped_wrapper_frees_slot(self, patched_pool):
+        pool, _ = patched_pool
+        db.get_connection()  # never closed
+        assert pool.stats()['in_use'] == 0
+
+    def test_nested_checkout_shares_connection(self, patched_pool):
+        pool, opened = patched_pool
+        with db.get_connection() as outer:
+            # Deeper than max_size=2: separate checkouts would time out
+            with db.get_connection() as inner, db.get_connection() as innermost:
+                assert inner._conn is outer._conn is innermost._conn
+            assert pool.stats()['in_use'] == 1
+            outer.cursor().execute("SELECT 1")
+        assert len(opened) == 1
+        assert pool.stats()['in_use'] == 0
+
+    def test_nested_commit_leaves_outer_transaction_open(self, patched_pool):
+        _, opened = patched_pool
+        with db.get_connection() as outer:
+            outer.cursor().execute("UPDATE t SET v = 1")
+            with db.get_connection() as inner:
+                inner.cursor().execute("UPDATE t SET v = 2")
+            assert opened[0].commits == 0
+            assert opened[0].committed == []
+        assert opened[0].committed == ["UPDATE t SET v = 1", "UPDATE t SET v = 2"]
+
+    def test_failed_nested_helper_undoes_only_its_work(self, patched_pool):
+        _, opened = patched_pool
+
+        def helper():
+            with db.get_connection() as conn:
+                conn.cursor().execute("UPDATE t SET v = 2")
+                raise ValueError("helper failed")
+
+        with db.get_connection() as outer:
+            outer.cursor().execute("UPDATE t SET v = 1")
+            with pytest.raises(ValueError):
+                helper()
+            assert opened[0].rollbacks == 0
+            outer.cursor().execute("UPDATE t SET v = 3")
+        assert opened[0].committed == ["UPDATE t SET v = 1", "UPDATE t SET v = 3"]
+
+    def test_outer_failure_discards_nested_work(self, patched_pool):
+        _, opened = patched_pool
+        with pytest.raises(ValueError):
+            with db.get_connection() as outer:
+                with db.get_connection() as inner:
+                    inner.cursor().execute("UPDATE t SET v = 2")
+                raise ValueError("caller failed")
+        assert opened[0].committed == []
+
+    def test_other_threads_get_their_own_connection(self, patched_pool):
+        pool, opened = patched_pool
+        with db.get_connection():
+            thread = threading.Thread(target=lambda: db.get_connection().close())
+            thread.start()
+            thread.join()
+        assert len(opened) == 2
+
+
+class TestConnectionScope:
+
+    def test_one_connection_per_scope(self, patched_pool):
+        pool, opened = patched_pool
+        with db.connection_scope():
+            for _ in range(5):
+                with db.get_connection() as conn:
+                    conn.cursor().execute("SELECT 1")
+            assert pool.stats()['in_use'] == 1
+        assert len(opened) == 1
+        assert pool.stats()['in_use'] == 0
+
+    def test_scope_without_queries_checks_nothing_out(self, patched_pool):
+        pool, opened = patched_pool
+        with db.connection_scope():
+            pass
+        assert opened == []
+
+    def test_uncommitted_work_rolled_back_at_scope_end(self, patched_pool):
+        _, opened = patched_pool
+        with db.connection_scope():
+            conn = db.get_connection()
+            conn.cursor().execute("INSERT INTO t VALUES (1)")
+            conn.close()
+            assert opened[0].rollbacks == 0
+        assert opened[0].rollbacks == 1
+
+    def test_failed_query_does_not_poison_scope(self, patched_pool):
+        _, opened = patched_pool
+        with db.connection_scope():
+            conn = db.get_connection()
+            opened[0].status = TRANSACTION_STATUS_INERROR
+            conn.close()
+            assert opened[0].status == TRANSACTION_STATUS_IDLE
+
+    def test_scoped_connection_decorator(self, patched_pool):
+        pool, _ = patched_pool
+
+        @db.scoped_connection
+        def view():
+            first, second = db.get_connection(), db.get_connection()
+            return first._conn is second._conn
+
+        assert view() is True
+        assert pool.stats()['in_use'] == 0
@@ -0,0 +1,157 @@
+"""
+Unit tests for layered feature extraction.
+
+Tests that memoized hand and auction layers give exactly the features
+of a from-scratch extraction, that each hand is evaluated once per deal,
+that per-seat bids grow incrementally with the auction, and that saved
+time is counted, recorded into a PerformanceMonitor and reported by the
+bidding engine.
+"""
+
+import random
+
+import pytest
+
+from engine.ai.feature_cache import (
+    FeatureLayerCache, clear_feature_caches, get_feature_cache_stats, set_feature_monitor,
+)
+from engine.ai.feature_extractor import extract_features
+from engine.hand import Hand
+from engine.performance_monitor import PerformanceMonitor
+from engine.v2 import BiddingEngineV2Schema
+from engine.v2.features import enhanced_extractor
+from engine.v2.features.enhanced_extractor import extract_flat_features
+from utils.dealing import create_deck
+
+SEATS = ['North', 'East', 'South', 'West']
+
+# One auction, extracted for each seat to call as it grows bid by bid
+AUCTION = ['1♥', 'Pass', '2♣', '2♠', '3♥', 'Pass', '4NT', 'Pass', '5♦', 'Pass']
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_feature_caches()
+    yield
+    set_feature_monitor(None)
+    clear_feature_caches()
+
+
+def _hands(seed):
+    deck = create_deck()
+    random.Random(seed).shuffle(deck)
+    return {seat: Hand(deck[i * 13:(i + 1) * 13]) for i, seat in enumerate(SEATS)}
+
+
+def _calls(hands, dealer='North'):
+    start = SEATS.index(dealer)
+    for n in range(len(AUCTION) + 1):
+        seat = SEATS[(start + n) % 4]
+        yield hands[seat], AUCTION[:n], seat, dealer
+
+
+def _comparable(flat):
+    """Flat features without the object references kept for debugging"""
+    return {k: v for k, v in flat.items() if k not in ('_hand', '_nested_features')}
+
+
+class TestExactness:
+    """Test cached layers against from-scratch extraction"""
+
+    @pytest.mark.parametrize('seed,dealer', [(1, 'North'), (2, 'East'), (3, 'West')])
+    def test_warm_features_match_cold(self, seed, dealer):
+        hands = _hands(seed)
+
+        cold = []
+        for hand, auction, seat, dealer_ in _calls(hands, dealer):
+            clear_feature_caches()
+            cold.append(_comparable(extract_flat_features(hand, auction, seat, 'NS', dealer_)))
+
+        clear_feature_caches()
+        warm = [_comparable(extract_flat_features(hand, auction, seat, 'NS', dealer_))
+                for hand, auction, seat, dealer_ in _calls(hands, dealer)]
+
+        assert warm == cold
+
+    def test_nested_features_are_fresh_dicts(self):
+        hand = _hands(4)['South']
+        first = extract_features(hand, ['1♥', 'Pass'], 'South', 'None', 'North')
+        second = extract_features(hand, ['1♥', 'Pass'], 'South', 'None', 'North')
+
+        assert first['hand_features'] == second['hand_features']
+        assert first['auction_features'] == second['auction_features']
+        assert first['hand_features'] is not second['hand_features']
+        assert first['auction_features'] is not second['auction_features']
+
+
+class TestLayers:
+    """Test what each layer computes and when"""
+
+    def test_hand_layers_computed_once_per_hand(self):
+        hands = _hands(5)
+        for hand, auction, seat, dealer in _calls(hands):
+            extract_flat_features(hand, auction, seat, 'None', dealer)
+
+        stats = get_feature_cache_stats()
+        assert stats['hand_features']['misses'] == 4
+        assert stats['flat_hand_features']['misses'] == 4
+        assert stats['flat_hand_features']['hits'] == len(AUCTION) + 1 - 4
+
+    def test_seat_bids_extend_previous_auction(self):
+        for n in range(len(AUCTION) + 1):
+            enhanced_extractor._seat_bids(AUCTION[:n], 'East')
+        incremental = enhanced_extractor._seat_bids(AUCTION, 'East')
+
+        clear_feature_caches()
+        assert enhanced_extractor._seat_bids(AUCTION, 'East') == incremental
+        # East dealt: East, South, West, North
+        assert incremental[1] == ('1♥', '3♥', '5♦')
+        assert incremental[0] == ('2♠', 'Pass')
+
+    def test_unhashable_keys_are_computed_uncached(self):
+        cache = FeatureLayerCache('test_unhashable')
+        assert cache.get(['list'], lambda: 42) == 42
+        assert cache.stats()['misses'] == 0
+        assert cache.peek(['list']) is None
+
+
+class TestInstrumentation:
+    """Test time-saved accounting"""
+
+    def test_hits_credit_compute_time(self):
+        cache = FeatureLayerCache('test_credit')
+        cache.get('key', lambda: sum(range(10000)))
+        cache.get('key', lambda: pytest.fail('recomputed'))
+
+        stats = cache.stats()
+        assert stats['hits'] == stats['misses'] == 1
+        assert stats['hit_rate'] == 0.5
+        assert stats['saved_ms'] > 0.0
+
+    def test_monitor_records_layer_timings(self):
+        monitor = PerformanceMonitor()
+        set_feature_monitor(monitor)
+        hand = _hands(6)['South']
+
+        extract_flat_features(hand, [], 'South', 'None', 'South')
+        extract_flat_features(hand, ['1♣', 'Pass', '1♥', 'Pass'], 'South', 'None', 'South')
+
+        timings = monitor.get_stats()
+        assert timings['hand_features']['count'] == 1
+        assert timings['flat_hand_features_saved']['count'] == 1
+        assert timings['flat_hand_features_saved']['total'] == pytest.approx(
+            get_feature_cache_stats()['flat_hand_features']['saved_ms'])
+
+    def test_bid_updates_engine_counters(self):
+        engine = BiddingEngineV2Schema()
+        hand = _hands(7)['South']
+
+        engine.get_next_bid(hand, [], 'South', dealer='South')
+        first = engine.get_feature_cache_stats()
+        engine.get_next_bid(hand, ['1♣', 'Pass', '1♥', 'Pass'], 'South', dealer='South')
+        second = engine.get_feature_cache_stats()
+
+        assert first['hand_features']['misses'] == 1
+        assert second['hand_features']['misses'] == 1
+        assert second['flat_hand_features']['hits'] > first['flat_hand_features']['hits']
+        assert second['flat_hand_features']['saved_ms'] > 0.0
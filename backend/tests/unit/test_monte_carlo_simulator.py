@@ -0,0 +1,143 @@
+"""
+Unit tests for the Monte Carlo simulator used by ConflictResolver.
+
+Tests the trick estimator, auction-constrained dealing, result caching,
+and slam review through ConflictResolver.
+"""
+
+import pytest
+
+from engine.ai.bidding_state import BiddingStateBuilder
+from engine.bitboard import FULL_DECK, SUITS, hcp, suit_length
+from engine.hand import Hand
+from engine.v2.inference import ConflictResolver, MonteCarloSimulator
+from engine.v2.inference.monte_carlo import DDS_AVAILABLE, estimate_tricks
+
+
+def _mask(pbn):
+    return Hand.from_pbn(pbn).to_bitmask()
+
+
+class TestTrickEstimator:
+    """Test the fast trick estimator"""
+
+    def test_all_top_cards_take_thirteen(self):
+        a = _mask("AKQJ7.AKQ.AKQ.AK")
+        b = _mask("T98.JT98.JT9.JT9")
+        assert estimate_tricks(a, b, 'NT') == 13
+        assert estimate_tricks(a, b, '♠') >= 12
+
+    def test_weak_partnership_takes_few(self):
+        a = _mask("5432.432.432.432")
+        b = _mask("876.765.765.8765")
+        assert estimate_tricks(a, b, 'NT') == 0
+        assert estimate_tricks(a, b, '♠') < 3
+
+    def test_short_trump_fit_costs_tricks(self):
+        a = _mask("AK32.AK32.K32.32")
+        eight_card_fit = _mask("Q654.Q54.A54.A54")
+        six_card_fit = _mask("Q5.Q654.A654.A54")
+        assert estimate_tricks(a, six_card_fit, '♠') < estimate_tricks(a, eight_card_fit, '♠')
+
+
+class TestDealing:
+    """Test auction-constrained dealing"""
+
+    def test_deals_fit_seat_beliefs(self):
+        simulator = MonteCarloSimulator(seed=3)
+        hand = Hand.from_pbn("K85.QJ4.J962.K73")
+        history = ['Pass', '1NT', 'Pass']  # West to bid; partner opened 1NT
+
+        deals = simulator.sample_deals(hand, history, 30)
+        beliefs = BiddingStateBuilder().build(history, 'N')
+
+        assert len(deals) == 30
+        for deal in deals:
+            assert deal['W'] == hand.to_bitmask()
+            combined = 0
+            for seat, mask in deal.items():
+                assert combined & mask == 0
+                combined |= mask
+                belief = beliefs.seat(seat)
+                assert belief.hcp[0] <= hcp(mask) <= belief.hcp[1]
+                for suit in SUITS:
+                    lo, hi = belief.suits[suit]
+                    assert lo <= suit_length(mask, suit) <= hi
+            assert combined == FULL_DECK
+
+    def test_impossible_auction_raises(self):
+        simulator = MonteCarloSimulator(time_budget_ms=20)
+        # 20 HCP in our hand; the other three seats have shown 33+
+        hand = Hand.from_pbn("AKQ3.AK4.KQ2.432")
+        with pytest.raises(RuntimeError):
+            simulator.simulate_tricks(hand, ['Pass', '2♣', 'Pass', '2NT'])
+
+
+class TestSimulator:
+    """Test trick questions, caching and modes"""
+
+    def test_slam_hand_expects_many_tricks(self):
+        simulator = MonteCarloSimulator(seed=1)
+        hand = Hand.from_pbn("AKQ73.AK4.KQ2.32")
+
+        tricks = simulator.simulate_tricks(hand, ['1♠', 'Pass', '3♠', 'Pass'], strain='♠')
+
+        assert 10 <= tricks <= 13
+
+    def test_repeated_question_is_cached(self):
+        simulator = MonteCarloSimulator(seed=1)
+        hand = Hand.from_pbn("AKQ73.AK4.KQ2.32")
+        history = ['1♠', 'Pass', '3♠', 'Pass']
+
+        first = simulator.simulate_tricks(hand, history)
+        second = simulator.simulate_tricks(hand, history)
+
+        stats = simulator.get_stats()
+        assert first == second
+        assert stats['questions'] == 2
+        assert stats['cache_hits'] == 1
+        assert stats['deals_sampled'] == 50
+
+    def test_defense_needs_opponent_contract(self):
+        simulator = MonteCarloSimulator()
+        hand = Hand.from_pbn("AKQ73.AK4.KQ2.32")
+        with pytest.raises(ValueError):
+            simulator.simulate_defense(hand, ['Pass', 'Pass'])
+
+    def test_fast_mode_flag(self):
+        assert MonteCarloSimulator().is_fast_mode
+        assert MonteCarloSimulator(fast_mode=False).is_fast_mode == (not DDS_AVAILABLE)
+
+    @pytest.mark.skipif(not DDS_AVAILABLE, reason="DDS not available on this platform")
+    def test_full_mode_scores_with_dds(self):
+        simulator = MonteCarloSimulator(fast_mode=False, n_samples=4, seed=1)
+        hand = Hand.from_pbn("AKQ73.AK4.KQ2.32")
+
+        tricks = simulator.simulate_tricks(hand, ['1♠', 'Pass', '3♠', 'Pass'], n_sims=4)
+
+        assert 0 <= tricks <= 13
+        assert simulator.get_stats()['dds_tables'] == 4
+
+
+class TestConflictResolverIntegration:
+    """Test ConflictResolver with a real simulator"""
+
+    def test_vetoes_hopeless_slam(self):
+        resolver = ConflictResolver(MonteCarloSimulator(seed=2))
+        hand = Hand.from_pbn("QJ732.Q54.J32.32")
+        rule = {'bid': '6♠', 'priority': 100, 'explanation': 'test'}
+
+        bid, explanation = resolver.review_bid(rule, hand, ['Pass', 'Pass', '1♠', 'Pass'])
+
+        assert bid == '4♠'
+        assert explanation.startswith('VETO')
+        assert resolver.get_stats()['vetoes'] == 1
+
+    def test_keeps_cold_slam(self):
+        resolver = ConflictResolver(MonteCarloSimulator(seed=2))
+        hand = Hand.from_pbn("AKQJ73.AK4.AK2.2")
+        rule = {'bid': '6♠', 'priority': 100, 'explanation': 'test'}
+
+        bid, _ = resolver.review_bid(rule, hand, ['Pass', 'Pass', '1♥', 'Pass'])
+
+        assert bid == '6♠'
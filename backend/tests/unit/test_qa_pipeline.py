@@ -8,9 +8,11 @@ Tests:
 - QA harness bid comparison logic
 """
 
+import json
 import os
 import sys
 import tempfile
+from pathlib import Path
 import pytest
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -501,3 +503,125 @@ Pass Pass
         finally:
             os.unlink(pbn_path)
             os.unlink(json_path)
+
+class TestParallelResumableRuns:
+    """Sharded runs match serial runs; checkpoints let runs resume."""
+
+    PBN_CONTENT = '''[Event "Test"]
+[Board "1"]
+[Dealer "N"]
+[Vulnerable "None"]
+[Deal "N:AKQ32.KQ8.A95.74 J98.AT7.KQJ3.KQ8 T764.J65.T84.A53 5.9432.762.JT962"]
+[Auction "N"]
+1S Pass 2S Pass
+4S Pass Pass Pass
+
+[Event "Test"]
+[Board "2"]
+[Dealer "E"]
+[Vulnerable "NS"]
+[Deal "N:AKQ32.KQ8.A95.74 J98.AT7.KQJ3.KQ8 T764.J65.T84.A53 5.9432.762.JT962"]
+[Auction "E"]
+1NT Pass 2C Pass
+2S Pass Pass Pass
+
+[Event "Test"]
+[Board "3"]
+[Dealer "S"]
+[Vulnerable "EW"]
+[Deal "N:AKQ32.KQ8.A95.74 J98.AT7.KQJ3.KQ8 T764.J65.T84.A53 5.9432.762.JT962"]
+[Auction "S"]
+Pass Pass 1NT Pass
+3NT Pass Pass Pass
+'''
+
+    @pytest.fixture
+    def pbn_path(self, tmp_path):
+        path = tmp_path / 'boards.pbn'
+        path.write_text(self.PBN_CONTENT, encoding='utf-8')
+        return str(path)
+
+    @staticmethod
+    def _comparable(result):
+        boards = result.to_dict()['boards']
+        for b in boards:
+            b.pop('duration_seconds')
+        return boards
+
+    def test_workers_match_serial_in_board_order(self, pbn_path):
+        harness = BiddingQAHarness()
+        serial = harness.run_pbn_file(pbn_path)
+        sharded = harness.run_pbn_file(pbn_path, workers=2)
+        assert [b.board for b in sharded.board_results] == [1, 2, 3]
+        assert self._comparable(sharded) == self._comparable(serial)
+        assert sharded.total_bids_compared == serial.total_bids_compared
+
+    def test_checkpoint_records_every_board(self, pbn_path, tmp_path):
+        checkpoint = str(tmp_path / 'qa.jsonl')
+        harness = BiddingQAHarness()
+        result = harness.run_pbn_file(pbn_path, checkpoint=checkpoint)
+
+        with open(checkpoint) as f:
+            lines = [json.loads(line) for line in f]
+        assert [entry['index'] for entry in lines] == [0, 1, 2]
+        assert all(entry['source'].startswith(str(Path(pbn_path).resolve()) + '#')
+                   for entry in lines)
+        assert len(result.board_results) == 3
+
+    def test_resume_skips_checkpointed_boards(self, pbn_path, tmp_path):
+        checkpoint = str(tmp_path / 'qa.jsonl')
+        harness = BiddingQAHarness()
+        first = harness.run_pbn_file(pbn_path, max_boards=2, checkpoint=checkpoint)
+
+        # Simulate a crash that left a partial line behind
+        with open(checkpoint, 'a') as f:
+            f.write('{"source": "boards.pbn", "ind')
+
+        tested = []
+        original = harness._test_board
+
+        def recording_test_board(record, seats, include_features):
+            tested.append(record.board)
+            return original(record, seats, include_features)
+
+        harness._test_board = recording_test_board
+        resumed = harness.run_pbn_file(pbn_path, checkpoint=checkpoint)
+
+        assert tested == [3]
+        assert [b.board for b in resumed.board_results] == [1, 2, 3]
+        assert self._comparable(resumed)[:2] == self._comparable(first)
+
+        # The partial line was cut, not merged into the resumed board's line
+        with open(checkpoint) as f:
+            assert [json.loads(line)['index'] for line in f] == [0, 1, 2]
+
+    def test_checkpoint_keys_on_path_and_content(self, pbn_path, tmp_path):
+        checkpoint = str(tmp_path / 'qa.jsonl')
+        harness = BiddingQAHarness()
+        harness.run_pbn_file(pbn_path, max_boards=1, checkpoint=checkpoint)
+
+        # Same file name in another directory, and the same file edited
+        other = tmp_path / 'other'
+        other.mkdir()
+        (other / 'boards.pbn').write_text(self.PBN_CONTENT, encoding='utf-8')
+        tested = []
+        original = harness._test_board
+
+        def recording_test_board(record, seats, include_features):
+            tested.append(record.board)
+            return original(record, seats, include_features)
+
+        harness._test_board = recording_test_board
+        harness.run_pbn_file(str(other / 'boards.pbn'), max_boards=1, checkpoint=checkpoint)
+        assert tested == [1]
+
+        Path(pbn_path).write_text(self.PBN_CONTENT.replace('4S Pass', '3S Pass'), encoding='utf-8')
+        harness.run_pbn_file(pbn_path, max_boards=1, checkpoint=checkpoint)
+        assert tested == [1, 1]
+
+    def test_timing_histogram_counts_every_board(self, pbn_path):
+        result = BiddingQAHarness().run_pbn_file(pbn_path)
+        histogram = result.to_dict()['summary']['timing_histogram']
+        assert sum(histogram.values()) == 3
+        assert all(b.duration_seconds > 0 for b in result.board_results)
+        assert len(result.slowest_boards(2)) == 2
@@ -0,0 +1,135 @@
+"""
+Unit tests for the schema rule index.
+
+Tests the trigger trie and guard net on small inputs, and that the index
+is exact: over the features of every saycbridge baseline case, no rule
+left out of matching_rules() scores above zero.
+"""
+
+from engine.hand import Hand
+from engine.v2.bidding_engine_v2_schema import BiddingEngineV2Schema
+from engine.v2.compiled_matcher import rule_guards
+from engine.v2.interpreters.rule_index import GuardNet, TriggerTrie
+from engine.v2.interpreters.rule_set import get_rule_set
+from tests.unit.test_compiled_matcher import _baseline_features
+
+
+class TestTriggerTrie:
+    """Test trigger lookup by auction"""
+
+    def _trie(self, triggers):
+        trie = TriggerTrie()
+        for value, trigger in enumerate(triggers):
+            trie.add(trigger, value)
+        return trie
+
+    def test_literal_and_pattern_triggers(self):
+        trie = self._trie(['1♣ - Pass - ?', '1[CD] - Pass - ?', '1NT - ?', '?'])
+
+        assert sorted(trie.match(['1♣', 'Pass'])) == [0, 1]
+        assert trie.match(['1♦', 'Pass']) == [1]
+        assert trie.match(['1♥', 'Pass']) == []
+        assert trie.match(['1NT']) == [2]
+        assert trie.match([]) == [3]
+
+    def test_literals_are_normalized(self):
+        trie = self._trie(['1C - Pass - ?'])
+        assert trie.match(['1♣', 'Pass']) == [0]
+
+    def test_malformed_trigger_is_not_indexed(self):
+        trie = TriggerTrie()
+        assert not trie.add('1♣ - Pass', 0)
+        assert trie.match(['1♣', 'Pass']) == []
+        assert trie.size == 0
+
+
+class TestGuardNet:
+    """Test guard-based filtering of untriggered rules"""
+
+    RULES = [
+        {'conditions': {'is_opening': True, 'hcp': {'min': 12}}},
+        {'conditions': {'is_opening': True, 'is_balanced': True}},
+        {'conditions': {'is_opening': True, 'opening_bid': '1♥'}},
+        {'conditions': {'is_overcall': True}},
+        {'conditions': {'is_overcall': True, 'opening_bid': '1♥'}},
+        {'conditions': {'hcp': {'min': 12}}},
+        {'constraints': [{'feature': 'partner_last_bid', 'in': ['1♥', '1♠'],
+                          'constraint_type': 'HARD'}]},
+        {'constraints': [{'feature': 'partner_last_bid', 'expected': '1♠',
+                          'constraint_type': 'HARD'}]},
+    ]
+
+    def _net(self):
+        class SmallLeaves(GuardNet):
+            LEAF_SIZE = 1  # Force branching on this handful of rules
+
+        return SmallLeaves((i, rule_guards(rule)) for i, rule in enumerate(self.RULES))
+
+    def test_follows_guards_and_rest_branch(self):
+        net = self._net()
+
+        assert sorted(net.match({'is_opening': True, 'opening_bid': '1♥'})) == [0, 1, 2, 5]
+        assert sorted(net.match({'is_overcall': True, 'opening_bid': '1♥'})) == [3, 4, 5]
+        assert sorted(net.match({'partner_last_bid': '1♠'})) == [5, 6, 7]
+        assert sorted(net.match({'partner_last_bid': '1♥'})) == [5, 6]
+
+    def test_missing_flags_are_false(self):
+        assert sorted(self._net().match({})) == [5]
+
+    def test_unhashable_feature_matches_no_guard(self):
+        assert sorted(self._net().match({'partner_last_bid': ['1♥']})) == [5]
+
+
+class TestExactness:
+    """Test that the index only leaves out rules that score 0.0"""
+
+    def test_excluded_rules_hard_fail_on_baseline(self):
+        rule_set = get_rule_set()
+        cases = 0
+        for test_id, features in _baseline_features():
+            cases += 1
+            included = {id(rule) for _, rule in rule_set.matching_rules(features)}
+            assert len(included) < len(rule_set.rules)
+            for _, rule in rule_set.rules:
+                if id(rule) not in included:
+                    assert rule_set.scorers[id(rule)](features) == 0.0, (test_id, rule.get('id'))
+
+        assert cases > 200
+
+    def test_matching_rules_in_schema_order(self):
+        rule_set = get_rule_set()
+        position = {id(rule): i for i, (_, rule) in enumerate(rule_set.rules)}
+        _, features = next(_baseline_features())
+
+        order = [position[id(rule)] for _, rule in rule_set.matching_rules(features, schema_order=True)]
+
+        assert order == sorted(order)
+
+    def test_matching_rules_put_global_rules_first(self):
+        rule_set = get_rule_set()
+        for _, features in _baseline_features():
+            rules = [rule for _, rule in rule_set.matching_rules(features)]
+            triggered = ['trigger' in rule for rule in rules]
+
+            assert triggered == sorted(triggered)
+            assert {id(rule) for rule in rules} == \
+                {id(rule) for _, rule in rule_set.matching_rules(features, schema_order=True)}
+
+
+class TestCandidateStats:
+    """Test candidate-set statistics"""
+
+    def test_stats_track_candidate_sets(self):
+        engine = BiddingEngineV2Schema()
+        engine.interpreter.reset_candidate_stats()
+        hand = Hand.from_pbn("AK5.KQ4.J962.K73")
+
+        engine.get_next_bid(hand, [], 'North', dealer='North')
+        engine.get_next_bid(hand, ['1♠', 'Pass'], 'South', dealer='North')
+        stats = engine.get_candidate_stats()
+
+        assert stats['lookups'] >= 2
+        assert 0 < stats['avg_candidates'] <= stats['max_candidates'] < stats['total_rules']
+
+        engine.interpreter.reset_candidate_stats()
+        assert engine.get_candidate_stats()['lookups'] == 0
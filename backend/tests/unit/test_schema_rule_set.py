@@ -0,0 +1,115 @@
+"""
+Unit tests for the compiled, shared schema rule set.
+
+Tests that schemas are compiled once and shared by every interpreter,
+that the compiled form is read-only, and that candidate lookup through
+exact and pattern triggers finds the right rules.
+"""
+
+import copy
+import json
+
+import pytest
+
+from engine.hand import Hand
+from engine.v2.bidding_engine_v2_schema import BiddingEngineV2Schema
+from engine.v2.interpreters import SchemaInterpreter
+from engine.v2.interpreters.rule_set import CompiledRuleSet, get_rule_set
+
+
+def _write_schema(directory, rules):
+    (directory / 'test_rules.json').write_text(json.dumps({'category': 'test', 'rules': rules}))
+
+
+class TestSharing:
+    """Test one rule set per schema directory"""
+
+    def test_interpreters_share_rule_set(self):
+        first = SchemaInterpreter()
+        second = SchemaInterpreter()
+
+        assert first.rule_set is second.rule_set is get_rule_set()
+        assert first.schemas is second.schemas
+
+    def test_engines_keep_their_own_forcing_state(self):
+        first = BiddingEngineV2Schema()
+        second = BiddingEngineV2Schema()
+
+        first.interpreter.update_forcing_state('GAME_FORCE', 'test_rule')
+
+        assert first.interpreter.rule_set is second.interpreter.rule_set
+        assert first.get_forcing_state()['is_game_forced']
+        assert not second.get_forcing_state()['is_game_forced']
+
+    def test_compiled_form_is_read_only(self):
+        rule_set = get_rule_set()
+        with pytest.raises(TypeError):
+            rule_set.schemas['extra'] = {}
+        with pytest.raises(TypeError):
+            rule_set.trigger_index['1C'] = ()
+        assert isinstance(rule_set.global_rules, tuple)
+
+    def test_bidding_does_not_modify_rules(self):
+        rule_set = get_rule_set()
+        before = copy.deepcopy(dict(rule_set.schemas))
+        engine = BiddingEngineV2Schema()
+        hand = Hand.from_pbn("AK5.KQ4.J962.K73")
+
+        engine.get_next_bid(hand, [], 'South', dealer='South')
+        engine.get_next_bid(hand, ['Pass', '1♠', 'Pass'], 'South', dealer='East')
+        engine.get_next_bid(hand, ['1NT', '2♥'], 'South', dealer='North')
+
+        assert dict(rule_set.schemas) == before
+
+
+class TestCandidateRules:
+    """Test trigger lookup on a small schema directory"""
+
+    @pytest.fixture
+    def rule_set(self, tmp_path):
+        _write_schema(tmp_path, [
+            {'id': 'global', 'bid': 'Pass'},
+            {'id': 'exact', 'bid': '1♥', 'trigger': '1♣ - Pass - ?'},
+            {'id': 'pattern', 'bid': '1♠', 'trigger': '1[CD] - Pass - ?'},
+            {'id': 'malformed', 'bid': '2♣', 'trigger': '1♣ - Pass'},
+        ])
+        return CompiledRuleSet(tmp_path)
+
+    def _ids(self, rule_set, auction):
+        return [rule['id'] for _, rule in rule_set.candidate_rules(auction)]
+
+    def test_exact_and_pattern_triggers(self, rule_set):
+        assert self._ids(rule_set, ['1♣', 'Pass']) == ['global', 'malformed', 'exact', 'pattern']
+        assert self._ids(rule_set, ['1♦', 'Pass']) == ['global', 'malformed', 'pattern']
+
+    def test_non_matching_auctions_get_global_rules(self, rule_set):
+        assert self._ids(rule_set, ['1♥', 'Pass']) == ['global', 'malformed']
+        assert self._ids(rule_set, ['1♣']) == ['global', 'malformed']
+        assert self._ids(rule_set, []) == ['global', 'malformed']
+
+    def test_exact_trigger_before_earlier_pattern(self, tmp_path):
+        _write_schema(tmp_path, [
+            {'id': 'pattern', 'bid': '1♠', 'trigger': '1[CD] - Pass - ?'},
+            {'id': 'exact', 'bid': '1♥', 'trigger': '1♣ - Pass - ?'},
+            {'id': 'global', 'bid': 'Pass'},
+        ])
+        rule_set = CompiledRuleSet(tmp_path)
+        features = {'_auction_history': ['1♣', 'Pass']}
+
+        assert self._ids(rule_set, ['1♣', 'Pass']) == ['global', 'exact', 'pattern']
+        assert [rule['id'] for _, rule in rule_set.matching_rules(features)] == \
+            ['global', 'exact', 'pattern']
+        assert [rule['id'] for _, rule in rule_set.matching_rules(features, schema_order=True)] == \
+            ['pattern', 'exact', 'global']
+
+    def test_rule_lookup_by_id(self, rule_set, tmp_path):
+        interpreter = SchemaInterpreter(rule_set=rule_set)
+        assert interpreter.get_rule_by_id('pattern')['bid'] == '1♠'
+        assert interpreter.get_rule_by_id('missing') is None
+        assert interpreter.schema_dir == tmp_path
+
+    def test_schema_dir_is_compiled_once(self, tmp_path):
+        _write_schema(tmp_path, [{'id': 'only', 'bid': 'Pass'}])
+
+        assert get_rule_set(str(tmp_path)) is get_rule_set(tmp_path)
+        assert SchemaInterpreter(str(tmp_path)).rule_set is get_rule_set(tmp_path)
@@ -254,6 +254,7 @@ EnvironmentFile=$APP_DIR/backend/.env
 ExecStart=$APP_DIR/backend/venv/bin/gunicorn \
     --bind 127.0.0.1:5001 \
     --workers 2 \
+    --threads 32 \
     --timeout 120 \
     --access-logfile /var/log/bridge-backend/access.log \
     --error-logfile /var/log/bridge-backend/error.log \
@@ -261,6 +262,29 @@ ExecStart=$APP_DIR/backend/venv/bin/gunicorn \
 Restart=always
 RestartSec=5
 
+[Install]
+WantedBy=multi-user.target
+EOF
+
+    # Analysis job worker (post-game and tournament analysis, see core/job_worker.py)
+    log_info "Creating analysis worker service..."
+    sudo tee /etc/systemd/system/bridge-analysis-worker.service << EOF
+[Unit]
+Description=Bridge Bidding App Analysis Worker
+After=network.target postgresql.service
+
+[Service]
+User=$USER
+Group=$USER
+WorkingDirectory=$APP_DIR/backend
+Environment="PATH=$APP_DIR/backend/venv/bin"
+EnvironmentFile=$APP_DIR/backend/.env
+ExecStart=$APP_DIR/backend/venv/bin/python -m core.job_worker --concurrency 2
+KillSignal=SIGTERM
+TimeoutStopSec=120
+Restart=always
+RestartSec=5
+
 [Install]
 WantedBy=multi-user.target
 EOF
@@ -329,8 +353,8 @@ EOF
     # Enable and start services
     log_info "Starting services..."
     sudo systemctl daemon-reload
-    sudo systemctl enable bridge-backend nginx
-    sudo systemctl restart bridge-backend
+    sudo systemctl enable bridge-backend bridge-analysis-worker nginx
+    sudo systemctl restart bridge-backend bridge-analysis-worker
     sudo systemctl restart nginx
 
     # Wait for services to start
@@ -371,7 +395,7 @@ cd /opt/bridge-bidding-app
 git pull origin main
 cd backend && source venv/bin/activate && pip install -r requirements.txt && python3 database/init_all_tables.py
 cd ../frontend && npm install && npm run build
-sudo systemctl restart bridge-backend && sudo systemctl reload nginx
+sudo systemctl restart bridge-backend bridge-analysis-worker && sudo systemctl reload nginx
 echo "Update complete!"
 EOF
     chmod +x "$APP_DIR/update.sh"
@@ -404,6 +428,13 @@ verify_deployment() {
         echo "  ✗ Backend: Not running"
     fi
 
+    # Check analysis worker
+    if systemctl is-active --quiet bridge-analysis-worker; then
+        echo "  ✓ Analysis worker: Running"
+    else
+        echo "  ✗ Analysis worker: Not running"
+    fi
+
     # Check Nginx
     if systemctl is-active --quiet nginx; then
         echo "  ✓ Nginx: Running"
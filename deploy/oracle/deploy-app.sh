@@ -104,6 +104,7 @@ EnvironmentFile=$APP_DIR/backend/.env
 ExecStart=$APP_DIR/backend/venv/bin/gunicorn \
     --bind 127.0.0.1:5001 \
     --workers 2 \
+    --threads 32 \
     --timeout 120 \
     --access-logfile /var/log/bridge-backend/access.log \
     --error-logfile /var/log/bridge-backend/error.log \
@@ -115,14 +116,36 @@ RestartSec=5
 WantedBy=multi-user.target
 EOF
 
+# Analysis job worker (post-game and tournament analysis, see core/job_worker.py)
+sudo tee /etc/systemd/system/bridge-analysis-worker.service << EOF
+[Unit]
+Description=Bridge Bidding App Analysis Worker
+After=network.target postgresql.service
+
+[Service]
+User=$USER
+Group=$USER
+WorkingDirectory=$APP_DIR/backend
+Environment="PATH=$APP_DIR/backend/venv/bin"
+EnvironmentFile=$APP_DIR/backend/.env
+ExecStart=$APP_DIR/backend/venv/bin/python -m core.job_worker --concurrency 2
+KillSignal=SIGTERM
+TimeoutStopSec=120
+Restart=always
+RestartSec=5
+
+[Install]
+WantedBy=multi-user.target
+EOF
+
 # Create log directory
 sudo mkdir -p /var/log/bridge-backend
 sudo chown $USER:$USER /var/log/bridge-backend
 
 # Enable and start service
 sudo systemctl daemon-reload
-sudo systemctl enable bridge-backend
-sudo systemctl restart bridge-backend
+sudo systemctl enable bridge-backend bridge-analysis-worker
+sudo systemctl restart bridge-backend bridge-analysis-worker
 
 # Wait for service to start
 sleep 3
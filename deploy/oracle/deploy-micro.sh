@@ -169,7 +169,27 @@ After=network.target
 User=$USER
 WorkingDirectory=$APP_DIR/backend
 Environment="PATH=$APP_DIR/backend/venv/bin"
-ExecStart=$APP_DIR/backend/venv/bin/gunicorn --bind 127.0.0.1:5001 --workers 1 --timeout 120 server:app
+ExecStart=$APP_DIR/backend/venv/bin/gunicorn --bind 127.0.0.1:5001 --workers 1 --threads 32 --timeout 120 server:app
+Restart=always
+RestartSec=5
+
+[Install]
+WantedBy=multi-user.target
+EOF
+
+# Create systemd service for the analysis job worker (one process on a micro instance)
+cat > /etc/systemd/system/bridge-analysis-worker.service << EOF
+[Unit]
+Description=Bridge Bidding App Analysis Worker
+After=network.target
+
+[Service]
+User=$USER
+WorkingDirectory=$APP_DIR/backend
+Environment="PATH=$APP_DIR/backend/venv/bin"
+ExecStart=$APP_DIR/backend/venv/bin/python -m core.job_worker --concurrency 1
+KillSignal=SIGTERM
+TimeoutStopSec=120
 Restart=always
 RestartSec=5
 
@@ -207,8 +227,8 @@ rm -f /etc/nginx/conf.d/default.conf 2>/dev/null || true
 
 # Start services
 systemctl daemon-reload
-systemctl enable bridge-backend nginx
-systemctl restart bridge-backend
+systemctl enable bridge-backend bridge-analysis-worker nginx
+systemctl restart bridge-backend bridge-analysis-worker
 systemctl restart nginx
 
 echo "Services configured and started"
@@ -375,6 +375,10 @@ const ACBLImportModal = ({ isOpen, onClose, userId, onHandSelect }) => {
   const [error, setError] = useState(null);
   // Track pending BWS data for merging with next PBN import
   const [pendingBwsData, setPendingBwsData] = useState(null);
+  // Set on unmount to stop polling background analysis jobs
+  const stopPollingRef = useRef(false);
+
+  useEffect(() => () => { stopPollingRef.current = true; }, []);
 
   // Load tournaments on mount
   useEffect(() => {
@@ -546,9 +550,19 @@ const ACBLImportModal = ({ isOpen, onClose, userId, onHandSelect }) => {
       );
       const data = await response.json();
 
-      if (data.status === 'complete') {
-        alert(`Analysis complete! ${data.hands_analyzed} hands analyzed.`);
+      if (data.status === 'queued') {
+        // Analysis runs as a background job - show "Analyzing..." and poll
+        await loadTournaments();
+        setIsLoading(false);
+        const status = await pollAnalysisStatus(tournamentId);
+        if (status?.import_status === 'complete') {
+          alert(`Analysis complete! ${status.hands_analyzed} hands analyzed.`);
+        } else if (status?.job?.status === 'failed') {
+          setError(`Analysis failed: ${status.job.last_error || 'unknown error'}`);
+        }
         await loadTournaments();
+      } else if (data.error) {
+        setError(data.error);
       }
     } catch (err) {
       setError('Analysis failed');
@@ -558,6 +572,24 @@ const ACBLImportModal = ({ isOpen, onClose, userId, onHandSelect }) => {
     }
   };
 
+  // Poll import status until the analysis job finishes (or ~10 minutes pass)
+  const pollAnalysisStatus = async (tournamentId) => {
+    const deadline = Date.now() + 10 * 60 * 1000;
+    while (!stopPollingRef.current && Date.now() < deadline) {
+      await new Promise((resolve) => setTimeout(resolve, 2000));
+      try {
+        const response = await fetch(`${API_BASE}/api/import-status/${tournamentId}`);
+        const status = await response.json();
+        if (status.import_status === 'complete' || status.job?.status === 'failed') {
+          return status;
+        }
+      } catch (err) {
+        console.error('Import status error:', err);
+      }
+    }
+    return null;
+  };
+
   const handleDeleteTournament = async (tournamentId) => {
     try {
       await fetch(
@@ -17,10 +17,25 @@
  */
 
 import React, { createContext, useContext, useState, useCallback, useEffect, useRef } from 'react';
-import { getSessionHeaders, fetchWithSession } from '../utils/sessionHelper';
+import { getSessionHeaders, getSessionId, fetchWithSession } from '../utils/sessionHelper';
 
 const API_URL = process.env.REACT_APP_API_URL || 'http://localhost:5001';
 
+// Room updates come from long-polling /api/room/poll. With
+// REACT_APP_ROOM_STREAM=true they are pushed over /api/room/stream
+// (Server-Sent Events) instead, falling back to long-polling if that can't
+// connect. Only enable it when the backend serves streams from an async
+// worker or a separate process: on gthread workers each open stream holds a
+// request thread for good.
+const USE_ROOM_STREAM = process.env.REACT_APP_ROOM_STREAM === 'true';
+// Long-poll: the server holds /api/room/poll until the room changes or this many seconds pass
+const LONG_POLL_WAIT_S = 20;
+// Minimum gap between polls answered "unchanged" (servers without long-poll answer at once)
+const POLL_INTERVAL_MS = 1000;
+// Minimum gap after a poll that returned new state
+const POLL_MIN_GAP_MS = 100;
+const POLL_RETRY_MS = 2000;
+
 // Default context values
 const RoomContext = createContext({
   // Room state
@@ -140,6 +155,10 @@ export function RoomProvider({ children }) {
   const [isPolling, setIsPolling] = useState(false);
   const pollIntervalRef = useRef(null);
   const pollRoomRef = useRef(null);
+  const pollGenerationRef = useRef(0); // Bumped on start/stop so an open poll can't revive an old loop
+  const eventSourceRef = useRef(null);
+  // True once a full room snapshot arrived, so polls can wait for newer versions
+  const roomSyncedRef = useRef(false);
 
   // Invite link: detect /room/CODE in URL on mount
   const [pendingInviteCode, setPendingInviteCode] = useState(() => {
@@ -173,6 +192,7 @@ export function RoomProvider({ children }) {
       return;
     }
     roomVersionRef.current = room.version;
+    roomSyncedRef.current = true;
 
     setRoomData(room);
     setRoomCode(room.room_code);
@@ -343,6 +363,7 @@ export function RoomProvider({ children }) {
     setGamePhase('waiting');
     setRoomVersion(0);
     roomVersionRef.current = 0;
+    roomSyncedRef.current = false;
     setIsMyTurn(false);
     setInRoom(false);
     setRoomData(null);
@@ -607,8 +628,10 @@ export function RoomProvider({ children }) {
 
     try {
       const url = new URL(`${API_URL}/api/room/poll`);
-      if (roomVersion > 0) {
-        url.searchParams.set('version', roomVersion.toString());
+      if (roomSyncedRef.current) {
+        // Ref, not state: it already holds versions from action responses
+        url.searchParams.set('version', roomVersionRef.current.toString());
+        url.searchParams.set('wait', LONG_POLL_WAIT_S.toString());
       }
 
       const response = await fetch(url.toString(), {
@@ -652,25 +675,85 @@ export function RoomProvider({ children }) {
       setError(`Connection error: ${err.message}`);
       return { success: false, error: err.message };
     }
-  }, [inRoom, roomVersion, updateFromRoomData, error]);
+  }, [inRoom, updateFromRoomData, error]);
 
-  // Keep ref in sync so setInterval always calls the latest pollRoom
+  // Keep ref in sync so the poll loop always calls the latest pollRoom
   pollRoomRef.current = pollRoom;
 
-  // Start polling
+  // Start following room updates: long-poll, or the push stream if enabled
   const startPolling = useCallback(() => {
-    if (pollIntervalRef.current) return; // Already polling
+    if (pollIntervalRef.current || eventSourceRef.current) return; // Already polling
 
     setIsPolling(true);
-    pollIntervalRef.current = setInterval(() => {
-      pollRoomRef.current();
-    }, 1000); // Poll every 1 second
-  }, []);
+    const generation = ++pollGenerationRef.current;
+
+    // Long-poll: one poll at a time, re-issued as soon as it returns
+    const pollLoop = async () => {
+      const started = Date.now();
+      const result = await pollRoomRef.current();
+      if (pollGenerationRef.current !== generation) return; // Stopped while the poll was open
+
+      const elapsed = Date.now() - started;
+      let delay = Math.max(0, POLL_MIN_GAP_MS - elapsed);
+      if (!result.success) {
+        delay = POLL_RETRY_MS;
+      } else if (result.unchanged) {
+        delay = Math.max(0, POLL_INTERVAL_MS - elapsed);
+      }
+      pollIntervalRef.current = setTimeout(pollLoop, delay);
+    };
+    const startLongPoll = () => {
+      pollIntervalRef.current = setTimeout(pollLoop, 0);
+    };
+
+    if (!USE_ROOM_STREAM || typeof EventSource === 'undefined') {
+      startLongPoll();
+      return;
+    }
+
+    // EventSource can't send headers, so the session goes in the query string
+    const url = new URL(`${API_URL}/api/room/stream`);
+    url.searchParams.set('session_id', getSessionId());
+    if (roomSyncedRef.current) {
+      url.searchParams.set('version', roomVersionRef.current.toString());
+    }
+    const source = new EventSource(url.toString());
+    eventSourceRef.current = source;
+    let opened = false;
+
+    source.onopen = () => {
+      opened = true;
+      setError(null);
+    };
+    source.addEventListener('room', (event) => {
+      updateFromRoomData(JSON.parse(event.data));
+    });
+    source.addEventListener('closed', () => {
+      source.close();
+      eventSourceRef.current = null;
+      setError('Room has been closed.');
+    });
+    source.onerror = () => {
+      // A dropped stream reconnects by itself (resuming from Last-Event-ID).
+      // One that never opened, or was refused, falls back to long-polling.
+      if (opened && source.readyState !== EventSource.CLOSED) return;
+      source.close();
+      eventSourceRef.current = null;
+      if (pollGenerationRef.current === generation) {
+        startLongPoll();
+      }
+    };
+  }, [updateFromRoomData]);
 
   // Stop polling
   const stopPolling = useCallback(() => {
+    pollGenerationRef.current += 1;
+    if (eventSourceRef.current) {
+      eventSourceRef.current.close();
+      eventSourceRef.current = null;
+    }
     if (pollIntervalRef.current) {
-      clearInterval(pollIntervalRef.current);
+      clearTimeout(pollIntervalRef.current);
       pollIntervalRef.current = null;
     }
     setIsPolling(false);